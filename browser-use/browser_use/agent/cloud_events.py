@@ -155,7 +155,10 @@ class CreateAgentStepEvent(BaseEvent):
 		# Capture screenshot as base64 data URL if available
 		screenshot_url = None
 		if browser_state_summary.screenshot:
-			screenshot_url = f'data:image/png;base64,{browser_state_summary.screenshot}'
+			from browser_use.browser.screenshots import get_screenshot_media_type
+
+			media_type = get_screenshot_media_type(browser_state_summary.screenshot)
+			screenshot_url = f'data:{media_type};base64,{browser_state_summary.screenshot}'
 			import logging
 
 			logger = logging.getLogger(__name__)
@@ -4,6 +4,7 @@ import base64
 import logging
 from pathlib import Path
 
+from browser_use.browser.screenshots import get_screenshot_media_type
 from browser_use.llm.messages import (
 	BaseMessage,
 	ContentPartImageParam,
@@ -74,11 +75,13 @@ def construct_judge_messages(
 	for img_path in selected_screenshots:
 		encoded = _encode_image(img_path)
 		if encoded:
+			# Screenshots are stored in the configured screenshot_format
+			media_type = get_screenshot_media_type(encoded)
 			encoded_images.append(
 				ContentPartImageParam(
 					image_url=ImageURL(
-						url=f'data:image/png;base64,{encoded}',
-						media_type='image/png',
+						url=f'data:{media_type};base64,{encoded}',
+						media_type=media_type,
 					)
 				)
 			)
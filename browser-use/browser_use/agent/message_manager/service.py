@@ -20,9 +20,10 @@ from browser_use.llm.messages import (
 	ContentPartImageParam,
 	ContentPartTextParam,
 	SystemMessage,
+	UserMessage,
 )
 from browser_use.observability import observe_debug
-from browser_use.utils import match_url_with_domain_pattern, time_execution_sync
+from browser_use.utils import match_url_with_domain_pattern, sanitize_surrogates, time_execution_sync
 
 logger = logging.getLogger(__name__)
 
@@ -111,6 +112,8 @@ class MessageManager:
 		include_recent_events: bool = False,
 		sample_images: list[ContentPartTextParam | ContentPartImageParam] | None = None,
 		llm_screenshot_size: tuple[int, int] | None = None,
+		message_layout: Literal['single', 'prompt_cache'] = 'single',
+		skip_unchanged_screenshots: bool = False,
 	):
 		self.task = task
 		self.state = state
@@ -124,6 +127,11 @@ class MessageManager:
 		self.include_recent_events = include_recent_events
 		self.sample_images = sample_images
 		self.llm_screenshot_size = llm_screenshot_size
+		# 'single': one state message per step with history, agent state and browser state.
+		# 'prompt_cache': task and history in an append-only prefix message with a cache breakpoint, volatile state after it
+		self.message_layout = message_layout
+		# Send a short marker instead of the screenshot when it is perceptually identical to the last one sent
+		self.skip_unchanged_screenshots = skip_unchanged_screenshots
 
 		assert max_history_items is None or max_history_items > 5, 'max_history_items must be None or greater than 5'
 
@@ -165,6 +173,34 @@ class MessageManager:
 
 		return '\n'.join(items_to_include)
 
+	def _get_cacheable_history_items(self) -> list[str]:
+		"""
+		History entries for the prompt_cache layout.
+
+		Unlike agent_history_description, the omitted window advances in chunks of max_history_items // 2 steps, so the
+		prefix stays byte-stable between the jumps instead of changing every step.
+		"""
+		items = self.state.agent_history_items
+		if self.max_history_items is None or len(items) <= self.max_history_items:
+			return [item.to_string() for item in items]
+
+		chunk = self.max_history_items // 2
+		omitted_count = -(-(len(items) - self.max_history_items) // chunk) * chunk
+		return [
+			items[0].to_string(),
+			f'<sys>[... {omitted_count} previous steps omitted...]</sys>',
+			*(item.to_string() for item in items[1 + omitted_count :]),
+		]
+
+	def _create_history_message(self) -> UserMessage:
+		"""Task and agent history, one content part per entry so each step only appends to the previous prefix"""
+		content: list[ContentPartTextParam | ContentPartImageParam] = [
+			ContentPartTextParam(text=sanitize_surrogates(f'<user_request>\n{self.task}\n</user_request>\n<agent_history>'))
+		]
+		content.extend(ContentPartTextParam(text=sanitize_surrogates('\n' + item)) for item in self._get_cacheable_history_items())
+		# The cache breakpoint goes on the last history entry (Anthropic), OpenAI and Gemini cache the stable prefix implicitly
+		return UserMessage(content=content, cache=True)
+
 	def add_new_task(self, new_task: str) -> None:
 		new_task = '<follow_up_user_request> ' + new_task.strip() + ' </follow_up_user_request>'
 		if '<initial_user_request>' not in self.task:
@@ -340,18 +376,36 @@ class MessageManager:
 			include_screenshot = include_screenshot_requested
 		# else: use_vision is False, never include screenshot (include_screenshot stays False)
 
+		screenshot_unchanged_since_step = None
 		if include_screenshot and browser_state_summary.screenshot:
-			screenshots.append(browser_state_summary.screenshot)
+			screenshot_hash = browser_state_summary.screenshot_hash
+			if (
+				self.skip_unchanged_screenshots
+				and not include_screenshot_requested
+				and screenshot_hash is not None
+				and screenshot_hash == self.state.last_screenshot_hash
+				and self.state.last_screenshot_step is not None
+			):
+				screenshot_unchanged_since_step = self.state.last_screenshot_step
+				logger.debug(f'Screenshot unchanged since step {screenshot_unchanged_since_step}, not sending it again')
+			else:
+				screenshots.append(browser_state_summary.llm_screenshot or browser_state_summary.screenshot)
+				self.state.last_screenshot_hash = screenshot_hash
+				self.state.last_screenshot_step = step_info.step_number + 1 if step_info else None
 
 		# Use vision in the user message if screenshots are included
 		effective_use_vision = len(screenshots) > 0
 
+		history_in_prefix = self.message_layout == 'prompt_cache'
+		if history_in_prefix:
+			self._set_message_with_type(self._create_history_message(), 'history')
+
 		# Create single state message with all content
 		assert browser_state_summary
 		state_message = AgentMessagePrompt(
 			browser_state_summary=browser_state_summary,
 			file_system=self.file_system,
-			agent_history_description=self.agent_history_description,
+			agent_history_description=None if history_in_prefix else self.agent_history_description,
 			read_state_description=self.state.read_state_description,
 			task=self.task,
 			include_attributes=self.include_attributes,
@@ -366,6 +420,8 @@ class MessageManager:
 			read_state_images=self.state.read_state_images,
 			llm_screenshot_size=self.llm_screenshot_size,
 			unavailable_skills_info=unavailable_skills_info,
+			history_in_prefix=history_in_prefix,
+			screenshot_unchanged_since_step=screenshot_unchanged_since_step,
 		).get_user_message(effective_use_vision)
 
 		# Store state message text for history
@@ -420,13 +476,17 @@ class MessageManager:
 		self.last_input_messages = self.state.history.get_messages()
 		return self.last_input_messages
 
-	def _set_message_with_type(self, message: BaseMessage, message_type: Literal['system', 'state']) -> None:
+	def _set_message_with_type(self, message: BaseMessage, message_type: Literal['system', 'history', 'state']) -> None:
 		"""Replace a specific state message slot with a new message"""
 		# System messages don't need filtering - they only contain instructions/placeholders
-		# State messages need filtering - they include agent_history_description which contains
+		# History and state messages need filtering - they include agent history which contains
 		# action results with real sensitive values (after placeholder replacement during execution)
 		if message_type == 'system':
 			self.state.history.system_message = message
+		elif message_type == 'history':
+			if self.sensitive_data:
+				message = self._filter_sensitive_data(message)
+			self.state.history.history_message = message
 		elif message_type == 'state':
 			if self.sensitive_data:
 				message = self._filter_sensitive_data(message)
@@ -67,15 +67,19 @@ class MessageHistory(BaseModel):
 	"""History of messages"""
 
 	system_message: BaseMessage | None = None
+	# Task and agent history as an append-only, cacheable prefix (prompt_cache layout only)
+	history_message: BaseMessage | None = None
 	state_message: BaseMessage | None = None
 	context_messages: list[BaseMessage] = Field(default_factory=list)
 	model_config = ConfigDict(arbitrary_types_allowed=True)
 
 	def get_messages(self) -> list[BaseMessage]:
-		"""Get all messages in the correct order: system -> state -> contextual"""
+		"""Get all messages in the correct order: system -> history -> state -> contextual"""
 		messages = []
 		if self.system_message:
 			messages.append(self.system_message)
+		if self.history_message:
+			messages.append(self.history_message)
 		if self.state_message:
 			messages.append(self.state_message)
 		messages.extend(self.context_messages)
@@ -94,5 +98,8 @@ class MessageManagerState(BaseModel):
 	read_state_description: str = ''
 	# Images to include in the next state message (cleared after each step)
 	read_state_images: list[dict[str, Any]] = Field(default_factory=list)
+	# Perceptual hash and step number of the last screenshot sent to the LLM (skip_unchanged_screenshots)
+	last_screenshot_hash: int | None = None
+	last_screenshot_step: int | None = None
 
 	model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -1,7 +1,10 @@
+import functools
 import importlib.resources
+import logging
 from datetime import datetime
 from typing import TYPE_CHECKING, Literal, Optional
 
+from browser_use.browser.screenshots import get_screenshot_media_type, get_screenshot_size, resize_screenshot
 from browser_use.dom.views import NodeType, SimplifiedNode
 from browser_use.llm.messages import ContentPartImageParam, ContentPartTextParam, ImageURL, SystemMessage, UserMessage
 from browser_use.observability import observe_debug
@@ -13,6 +16,19 @@ if TYPE_CHECKING:
 	from browser_use.filesystem.file_system import FileSystem
 
 
+@functools.lru_cache(maxsize=8)
+def _resize_screenshot_cached(screenshot_b64: str, size: tuple[int, int]) -> str:
+	"""Resize a screenshot for the LLM, cached because the previous steps' screenshots are sent again every step."""
+	original_size = get_screenshot_size(screenshot_b64)
+	if original_size == size:
+		return screenshot_b64
+
+	logging.getLogger(__name__).info(
+		f'🔄 Resizing screenshot from {original_size[0]}x{original_size[1]} to {size[0]}x{size[1]} for LLM'
+	)
+	return resize_screenshot(screenshot_b64, size)
+
+
 class SystemPrompt:
 	def __init__(
 		self,
@@ -105,6 +121,8 @@ class AgentMessagePrompt:
 		read_state_images: list[dict] | None = None,
 		llm_screenshot_size: tuple[int, int] | None = None,
 		unavailable_skills_info: str | None = None,
+		history_in_prefix: bool = False,
+		screenshot_unchanged_since_step: int | None = None,
 	):
 		self.browser_state: 'BrowserStateSummary' = browser_state_summary
 		self.file_system: 'FileSystem | None' = file_system
@@ -124,6 +142,10 @@ class AgentMessagePrompt:
 		self.read_state_images = read_state_images or []
 		self.unavailable_skills_info: str | None = unavailable_skills_info
 		self.llm_screenshot_size = llm_screenshot_size
+		# Task and agent history are sent in a separate, cacheable prefix message (MessageManager prompt_cache layout)
+		self.history_in_prefix = history_in_prefix
+		# The screenshot is perceptually identical to the one sent at this step, so it is not attached again
+		self.screenshot_unchanged_since_step = screenshot_unchanged_since_step
 		assert self.browser_state
 
 	def _extract_page_statistics(self) -> dict[str, int]:
@@ -310,10 +332,13 @@ Available tabs:
 		if not len(_todo_contents):
 			_todo_contents = '[empty todo.md, fill it when applicable]'
 
-		agent_state = f"""
+		agent_state = ''
+		if not self.history_in_prefix:
+			agent_state += f"""
 <user_request>
 {self.task}
-</user_request>
+</user_request>"""
+		agent_state += f"""
 <file_system>
 {self.file_system.describe() if self.file_system else 'No file system available'}
 </file_system>
@@ -336,24 +361,8 @@ Available tabs:
 			return screenshot_b64
 
 		try:
-			import base64
-			import logging
-			from io import BytesIO
-
-			from PIL import Image
-
-			img = Image.open(BytesIO(base64.b64decode(screenshot_b64)))
-			if img.size == self.llm_screenshot_size:
-				return screenshot_b64
-
-			logging.getLogger(__name__).info(
-				f'🔄 Resizing screenshot from {img.size[0]}x{img.size[1]} to {self.llm_screenshot_size[0]}x{self.llm_screenshot_size[1]} for LLM'
-			)
-
-			img_resized = img.resize(self.llm_screenshot_size, Image.Resampling.LANCZOS)
-			buffer = BytesIO()
-			img_resized.save(buffer, format='PNG')
-			return base64.b64encode(buffer.getvalue()).decode('utf-8')
+			# The screenshot watchdog already captures at the LLM size, this only resizes screenshots taken otherwise
+			return _resize_screenshot_cached(screenshot_b64, self.llm_screenshot_size)
 		except Exception as e:
 			logging.getLogger(__name__).warning(f'Failed to resize screenshot: {e}, using original')
 			return screenshot_b64
@@ -371,13 +380,20 @@ Available tabs:
 			use_vision = False
 
 		# Build complete state description
-		state_description = (
-			'<agent_history>\n'
-			+ (self.agent_history_description.strip('\n') if self.agent_history_description else '')
-			+ '\n</agent_history>\n\n'
-		)
+		state_description = ''
+		if not self.history_in_prefix:
+			state_description += (
+				'<agent_history>\n'
+				+ (self.agent_history_description.strip('\n') if self.agent_history_description else '')
+				+ '\n</agent_history>\n\n'
+			)
 		state_description += '<agent_state>\n' + self._get_agent_state_description().strip('\n') + '\n</agent_state>\n'
 		state_description += '<browser_state>\n' + self._get_browser_state_description().strip('\n') + '\n</browser_state>\n'
+		if self.screenshot_unchanged_since_step is not None:
+			state_description += (
+				f'<screenshot>The page looks the same as in the screenshot of step {self.screenshot_unchanged_since_step}, '
+				'so it is not attached again.</screenshot>\n'
+			)
 		# Only add read_state if it has content
 		read_state_description = self.read_state_description.strip('\n').strip() if self.read_state_description else ''
 		if read_state_description:
@@ -420,11 +436,12 @@ Available tabs:
 				processed_screenshot = self._resize_screenshot(screenshot)
 
 				# Add the screenshot
+				media_type = get_screenshot_media_type(processed_screenshot)
 				content_parts.append(
 					ContentPartImageParam(
 						image_url=ImageURL(
-							url=f'data:image/png;base64,{processed_screenshot}',
-							media_type='image/png',
+							url=f'data:{media_type};base64,{processed_screenshot}',
+							media_type=media_type,
 							detail=self.vision_detail_level,
 						),
 					)
@@ -458,9 +475,9 @@ Available tabs:
 					)
 				)
 
-			return UserMessage(content=content_parts, cache=True)
+			return UserMessage(content=content_parts, cache=not self.history_in_prefix)
 
-		return UserMessage(content=state_description, cache=True)
+		return UserMessage(content=state_description, cache=not self.history_in_prefix)
 
 
 def get_rerun_summary_prompt(original_task: str, total_steps: int, success_count: int, error_count: int) -> str:
@@ -497,11 +514,12 @@ def get_rerun_summary_message(prompt: str, screenshot_b64: str | None = None) ->
 	"""
 	if screenshot_b64:
 		# With screenshot: use multi-part content
+		media_type = get_screenshot_media_type(screenshot_b64)
 		content_parts: list[ContentPartTextParam | ContentPartImageParam] = [
 			ContentPartTextParam(type='text', text=prompt),
 			ContentPartImageParam(
 				type='image_url',
-				image_url=ImageURL(url=f'data:image/png;base64,{screenshot_b64}'),
+				image_url=ImageURL(url=f'data:{media_type};base64,{screenshot_b64}', media_type=media_type),
 			),
 		]
 		return UserMessage(content=content_parts)
@@ -26,6 +26,7 @@ from browser_use.agent.cloud_events import (
 from browser_use.agent.message_manager.utils import save_conversation
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
+from browser_use.llm.http_pool import release_shared_http_clients, retain_shared_http_clients
 from browser_use.llm.messages import BaseMessage, ContentPartImageParam, ContentPartTextParam, UserMessage
 from browser_use.tokens.service import TokenCost
 
@@ -57,13 +58,14 @@ from browser_use.agent.views import (
 	BrowserStateHistory,
 	DetectedVariable,
 	JudgementResult,
+	RerunStepTiming,
 	StepMetadata,
 )
 from browser_use.browser.events import _get_timeout
 from browser_use.browser.session import DEFAULT_BROWSER_PROFILE
 from browser_use.browser.views import BrowserStateSummary
 from browser_use.config import CONFIG
-from browser_use.dom.views import DOMInteractedElement, MatchLevel
+from browser_use.dom.views import MATCH_ATTRIBUTES, DOMInteractedElement, MatchLevel
 from browser_use.filesystem.file_system import FileSystem
 from browser_use.observability import observe, observe_debug
 from browser_use.telemetry.service import ProductTelemetry
@@ -174,6 +176,9 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		flash_mode: bool = False,
 		demo_mode: bool | None = None,
 		max_history_items: int | None = None,
+		message_layout: Literal['single', 'prompt_cache'] = 'single',
+		skip_unchanged_screenshots: bool = False,
+		prefetch_browser_state: bool = False,
 		page_extraction_llm: BaseChatModel | None = None,
 		fallback_llm: BaseChatModel | None = None,
 		use_judge: bool = True,
@@ -373,6 +378,9 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			use_thinking=use_thinking,
 			flash_mode=flash_mode,
 			max_history_items=max_history_items,
+			message_layout=message_layout,
+			skip_unchanged_screenshots=skip_unchanged_screenshots,
+			prefetch_browser_state=prefetch_browser_state,
 			page_extraction_llm=page_extraction_llm,
 			calculate_cost=calculate_cost,
 			include_tool_call_examples=include_tool_call_examples,
@@ -394,6 +402,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 		# Initialize history
 		self.history = AgentHistoryList(history=[], usage=None)
+		# Wait/work time of each step of the last rerun_history call
+		self.rerun_step_timings: list[RerunStepTiming] = []
 
 		# Initialize agent directory
 		import time
@@ -446,6 +456,9 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 		# Store llm_screenshot_size in browser_session so tools can access it
 		self.browser_session.llm_screenshot_size = llm_screenshot_size
+		# Screenshots are only hashed for agents that skip unchanged ones
+		if self.settings.skip_unchanged_screenshots:
+			self.browser_session.hash_screenshots = True
 
 		# Check if LLM is ChatAnthropic instance
 		from browser_use.llm.anthropic.chat import ChatAnthropic
@@ -480,6 +493,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			include_recent_events=self.include_recent_events,
 			sample_images=self.sample_images,
 			llm_screenshot_size=llm_screenshot_size,
+			message_layout=self.settings.message_layout,
+			skip_unchanged_screenshots=self.settings.skip_unchanged_screenshots,
 		)
 
 		if self.sensitive_data:
@@ -1104,6 +1119,12 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		result = await self.multi_act(self.state.last_model_output.action)
 		self.state.last_result = result
 
+		# Capture the next step's state while this step is post-processed and finalized (history, callbacks, events)
+		if self.settings.prefetch_browser_state and self.browser_session and not (result and result[-1].is_done):
+			self.browser_session.prefetch_browser_state_summary(
+				include_screenshot=True, include_recent_events=self.include_recent_events
+			)
+
 	async def _post_process(self) -> None:
 		"""Handle post-action processing like download tracking and result logging"""
 		assert self.browser_session is not None, 'BrowserSession is not set up'
@@ -2178,6 +2199,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			exit_on_second_int=True,
 		)
 		signal_handler.register()
+		retain_shared_http_clients(self)
 
 		try:
 			await self._log_agent_run()
@@ -2711,6 +2733,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		summary_llm: BaseChatModel | None = None,
 		ai_step_llm: BaseChatModel | None = None,
 		wait_for_elements: bool = False,
+		fast_replay: bool = False,
+		ready_timeout: float = 15.0,
 	) -> list[ActionResult]:
 		"""
 		Rerun a saved history of actions with error handling and retry logic.
@@ -2728,6 +2752,11 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		                wait_for_elements: If True, wait for minimum number of elements before attempting element
 		                               matching. Useful for SPA pages where shadow DOM content loads dynamically.
 		                               Default is False.
+		                fast_replay: If True, replace the fixed delays between steps with readiness conditions: each
+		                               step runs as soon as the page is stable (navigation committed, network and DOM
+		                               quiet) and every element the step targets is found in the captured state.
+		                               The wait/work time of each step is logged and kept in `self.rerun_step_timings`.
+		                ready_timeout: With fast_replay, how long to wait for the step's elements before trying anyway
 
 		Returns:
 		                List of action results (including AI summary as the final result)
@@ -2737,8 +2766,10 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 		# Initialize browser session
 		await self.browser_session.start()
+		retain_shared_http_clients(self)
 
 		results = []
+		self.rerun_step_timings = []
 
 		# Track previous step for redundant retry detection
 		previous_item: AgentHistory | None = None
@@ -2751,7 +2782,10 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				step_name = 'Initial actions' if step_num == 0 else f'Step {step_num}'
 
 				# Determine step delay
-				if history_item.metadata and history_item.metadata.step_interval is not None:
+				if fast_replay:
+					step_delay = 0.0
+					delay_source = 'fast replay, waiting for the page and elements to be ready'
+				elif history_item.metadata and history_item.metadata.step_interval is not None:
 					# Cap the saved interval to max_step_interval (saved interval includes LLM time)
 					step_delay = min(history_item.metadata.step_interval, max_step_interval)
 					# Format delay nicely - show ms for values < 1s, otherwise show seconds
@@ -2813,12 +2847,23 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				retry_count = 0
 				step_succeeded = False
 				menu_reopened = False  # Track if we've already tried reopening the menu
-				# Exponential backoff: 5s base, doubling each retry, capped at 30s
-				base_retry_delay = 5.0
+				# Exponential backoff: 5s base (1s in fast replay, which already waits for elements), doubling each retry,
+				# capped at 30s
+				base_retry_delay = 1.0 if fast_replay else 5.0
 				max_retry_delay = 30.0
+				timing = RerunStepTiming(step_number=step_num)
+				self.rerun_step_timings.append(timing)
 				while retry_count < max_retries:
 					try:
-						result = await self._execute_history_step(history_item, step_delay, ai_step_llm, wait_for_elements)
+						timing.attempts += 1
+						result = await self._execute_history_step(
+							history_item,
+							step_delay,
+							ai_step_llm,
+							wait_for_elements,
+							ready_timeout=ready_timeout if fast_replay else None,
+							timing=timing,
+						)
 						results.extend(result)
 						step_succeeded = True
 						break
@@ -2848,7 +2893,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 									# Don't increment retry_count for the menu reopen attempt
 									# Retry immediately with minimal delay
 									retry_count -= 1
-									step_delay = 0.5  # Use short delay after reopening
+									step_delay = 0.0 if fast_replay else 0.5  # Use short delay after reopening
 									self.logger.info('🔄 Dropdown re-opened, retrying element match...')
 									continue
 
@@ -2867,11 +2912,23 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 								f'{step_name} failed (attempt {retry_count}/{max_retries}), retrying in {retry_delay}s...'
 							)
 							await asyncio.sleep(retry_delay)
+							timing.wait_seconds += retry_delay
+
+				self.logger.info(
+					f'⏱️ {step_name}: waited {timing.wait_seconds:.2f}s, worked {timing.work_seconds:.2f}s '
+					f'({timing.state_captures} state captures, {timing.attempts} attempts)'
+				)
 
 				# Update tracking for redundant retry detection
 				previous_item = history_item
 				previous_step_succeeded = step_succeeded
 
+			total_wait = sum(timing.wait_seconds for timing in self.rerun_step_timings)
+			total_work = sum(timing.work_seconds for timing in self.rerun_step_timings)
+			self.logger.info(
+				f'⏱️ Replayed {len(self.rerun_step_timings)} steps: waited {total_wait:.2f}s, worked {total_work:.2f}s'
+			)
+
 			# Generate AI summary of rerun completion
 			self.logger.info('🤖 Generating AI summary of rerun completion...')
 			summary_result = await self._generate_rerun_summary(self.task, results, summary_llm)
@@ -2974,6 +3031,48 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		self.logger.warning(f'⚠️ Timeout waiting for {min_elements} elements, proceeding with {last_count} elements')
 		return await self.browser_session.get_browser_state_summary(include_screenshot=False)
 
+	async def _wait_for_history_elements(
+		self,
+		history_item: AgentHistory,
+		timeout: float,
+		poll_interval: float = 0.25,
+	) -> tuple[BrowserStateSummary, int]:
+		"""Capture browser states until every element the history step targets is found, for at most `timeout` seconds.
+
+		Each capture already waits for the page to be stable (navigation committed, network and DOM quiet), so no fixed
+		delay is needed on top. Elements are matched with the same index as `_update_action_indices`, the state that
+		matched is reused to execute the step.
+
+		Returns:
+			The last captured state and the number of captures taken
+		"""
+		assert self.browser_session is not None, 'BrowserSession is not set up'
+
+		historical_elements: list[DOMInteractedElement] = []
+		if history_item.model_output and history_item.state:
+			interacted_elements = history_item.state.interacted_element
+			for i, action in enumerate(history_item.model_output.action):
+				historical_elem = interacted_elements[i] if i < len(interacted_elements) else None
+				if historical_elem is not None and action.get_index() is not None:
+					historical_elements.append(historical_elem)
+
+		deadline = time.monotonic() + timeout
+		captures = 0
+		while True:
+			state = await self.browser_session.get_browser_state_summary(include_screenshot=False)
+			captures += 1
+			if state.dom_state.selector_map:
+				missing = [elem for elem in historical_elements if state.dom_state.element_index.find(elem) is None]
+			else:
+				missing = historical_elements
+			if not missing:
+				return state, captures
+			if time.monotonic() >= deadline:
+				self.logger.warning(f'⚠️ {len(missing)} element(s) of the step still not found after {timeout}s, trying anyway')
+				return state, captures
+			self.logger.debug(f'⏳ Waiting for {len(missing)} element(s) of the step: {self._format_element_for_error(missing[0])}')
+			await asyncio.sleep(poll_interval)
+
 	def _count_expected_elements_from_history(self, history_item: AgentHistory) -> int:
 		"""Estimate the minimum number of elements expected based on history.
 
@@ -3002,6 +3101,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		delay: float,
 		ai_step_llm: BaseChatModel | None = None,
 		wait_for_elements: bool = False,
+		ready_timeout: float | None = None,
+		timing: RerunStepTiming | None = None,
 	) -> list[ActionResult]:
 		"""Execute a single step from history with element validation.
 
@@ -3012,13 +3113,19 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			delay: Delay before executing the step
 			ai_step_llm: Optional LLM to use for AI steps
 			wait_for_elements: If True, wait for minimum elements before element matching
+			ready_timeout: If set (fast replay), wait up to this long for the step's elements instead of counting elements
+			timing: Optional RerunStepTiming to add this attempt's wait and work time to
 		"""
 		assert self.browser_session is not None, 'BrowserSession is not set up'
 
+		wait_start = time.monotonic()
 		await asyncio.sleep(delay)
 
+		state_captures = 1
+		if ready_timeout is not None:
+			state, state_captures = await self._wait_for_history_elements(history_item, timeout=ready_timeout)
 		# Optionally wait for minimum elements before element matching (useful for SPAs)
-		if wait_for_elements:
+		elif wait_for_elements:
 			# Determine if we need to wait for elements (actions that interact with DOM elements)
 			needs_element_matching = False
 			if history_item.model_output:
@@ -3048,6 +3155,25 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		if not state or not history_item.model_output:
 			raise ValueError('Invalid state or model output')
 
+		if timing is not None:
+			timing.wait_seconds += time.monotonic() - wait_start
+			timing.state_captures += state_captures
+		work_start = time.monotonic()
+		try:
+			return await self._replay_history_actions(history_item, state, ai_step_llm)
+		finally:
+			if timing is not None:
+				timing.work_seconds += time.monotonic() - work_start
+
+	async def _replay_history_actions(
+		self,
+		history_item: AgentHistory,
+		state: BrowserStateSummary,
+		ai_step_llm: BaseChatModel | None = None,
+	) -> list[ActionResult]:
+		"""Execute the actions of a history step, with element indices updated against the given browser state."""
+		assert history_item.model_output is not None
+
 		results = []
 		pending_actions = []
 
@@ -3093,22 +3219,21 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 					# Find elements with same node_name for diagnostics
 					hist_node = historical_elem.node_name.lower() if historical_elem else ''
+					same_node_indices = state.dom_state.element_index.by_node_name.get(hist_node, []) if selector_map else []
 					similar_elements = []
 					if historical_elem and historical_elem.attributes:
-						hist_aria = historical_elem.attributes.get('aria-label', '')
-						for idx, elem in selector_map.items():
-							if elem.node_name.lower() == hist_node and elem.attributes:
-								elem_aria = elem.attributes.get('aria-label', '')
-								if elem_aria:
-									similar_elements.append(f'{idx}:{elem_aria[:30]}')
-									if len(similar_elements) >= 5:
-										break
+						for idx in same_node_indices:
+							elem_aria = (selector_map[idx].attributes or {}).get('aria-label', '')
+							if elem_aria:
+								similar_elements.append(f'{idx}:{elem_aria[:30]}')
+								if len(similar_elements) >= 5:
+									break
 
 					diagnostic = ''
 					if similar_elements:
 						diagnostic = f'\n  Available <{hist_node.upper()}> with aria-label: {similar_elements}'
 					elif hist_node:
-						same_node_count = sum(1 for e in selector_map.values() if e.node_name.lower() == hist_node)
+						same_node_count = len(same_node_indices)
 						diagnostic = (
 							f'\n  Found {same_node_count} <{hist_node.upper()}> elements (none with matching identifiers)'
 						)
@@ -3149,123 +3274,63 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			return action
 
 		selector_map = browser_state_summary.dom_state.selector_map
-		highlight_index: int | None = None
-		match_level: MatchLevel | None = None
+		element_index = browser_state_summary.dom_state.element_index
+		hist_name = historical_element.node_name.lower()
 
 		# Debug: log what we're looking for and what's available
 		self.logger.info(
 			f'🔍 Searching for element: <{historical_element.node_name}> '
 			f'hash={historical_element.element_hash} stable_hash={historical_element.stable_hash}'
 		)
-		# Log what elements are in selector_map for debugging
+		same_node_indices = element_index.by_node_name.get(hist_name, [])
 		if historical_element.node_name:
-			hist_name = historical_element.node_name.lower()
 			matching_nodes = [
-				(idx, elem.node_name, elem.attributes.get('name') if elem.attributes else None)
-				for idx, elem in selector_map.items()
-				if elem.node_name.lower() == hist_name
+				(idx, selector_map[idx].node_name, (selector_map[idx].attributes or {}).get('name'))
+				for idx in same_node_indices
 			]
 			self.logger.info(
 				f'🔍 Selector map has {len(selector_map)} elements, '
 				f'{len(matching_nodes)} are <{hist_name.upper()}>: {matching_nodes}'
 			)
 
-		# Level 1: EXACT hash match
-		for idx, elem in selector_map.items():
-			if elem.element_hash == historical_element.element_hash:
-				highlight_index = idx
-				match_level = MatchLevel.EXACT
-				break
-
-		if highlight_index is None:
-			self.logger.debug(f'EXACT hash match failed (checked {len(selector_map)} elements)')
-
-		# Level 2: STABLE hash match (dynamic classes filtered)
-		# Use stored stable_hash (computed at save time from EnhancedDOMTreeNode - single source of truth)
-		if highlight_index is None and historical_element.stable_hash is not None:
-			for idx, elem in selector_map.items():
-				if elem.compute_stable_hash() == historical_element.stable_hash:
-					highlight_index = idx
-					match_level = MatchLevel.STABLE
-					self.logger.info('Element matched at STABLE level (dynamic classes filtered)')
-					break
-			if highlight_index is None:
-				self.logger.debug('STABLE hash match failed')
-		elif highlight_index is None:
-			self.logger.debug('STABLE hash match skipped (no stable_hash in history)')
-
-		# Level 3: XPATH match
-		if highlight_index is None and historical_element.x_path:
-			for idx, elem in selector_map.items():
-				if elem.xpath == historical_element.x_path:
-					highlight_index = idx
-					match_level = MatchLevel.XPATH
-					self.logger.info(f'Element matched at XPATH level: {historical_element.x_path}')
-					break
-			if highlight_index is None:
-				self.logger.debug(f'XPATH match failed for: {historical_element.x_path[-60:]}')
-
-		# Level 4: ax_name (accessible name) match - robust for dynamic SPAs with menus
-		# This uses the accessible name from the accessibility tree which is stable
-		# even when DOM structure changes (e.g., dynamically generated menu items)
-		if highlight_index is None and historical_element.ax_name:
-			hist_name = historical_element.node_name.lower()
-			hist_ax_name = historical_element.ax_name
-			for idx, elem in selector_map.items():
-				# Match by node type and accessible name
-				elem_ax_name = elem.ax_node.name if elem.ax_node else None
-				if elem.node_name.lower() == hist_name and elem_ax_name == hist_ax_name:
-					highlight_index = idx
-					match_level = MatchLevel.AX_NAME
-					self.logger.info(f'Element matched at AX_NAME level: "{hist_ax_name}"')
-					break
-			if highlight_index is None:
-				# Log available ax_names for debugging
+		match = element_index.find(historical_element)
+		highlight_index, match_level = match if match else (None, None)
+
+		if match_level == MatchLevel.STABLE:
+			self.logger.info('Element matched at STABLE level (dynamic classes filtered)')
+		elif match_level == MatchLevel.XPATH:
+			self.logger.info(f'Element matched at XPATH level: {historical_element.x_path}')
+		elif match_level == MatchLevel.AX_NAME:
+			self.logger.info(f'Element matched at AX_NAME level: "{historical_element.ax_name}"')
+		elif match_level == MatchLevel.ATTRIBUTE:
+			hist_attrs = historical_element.attributes or {}
+			attr_key = next(key for key in MATCH_ATTRIBUTES if (hist_name, key, hist_attrs.get(key)) in element_index.by_attribute)
+			self.logger.info(f'Element matched via {attr_key} attribute: {hist_attrs[attr_key]}')
+		elif match_level is None:
+			same_node_elements = [(idx, selector_map[idx]) for idx in same_node_indices]
+			if historical_element.ax_name:
 				same_type_ax_names = [
-					(idx, elem.ax_node.name if elem.ax_node else None)
-					for idx, elem in selector_map.items()
-					if elem.node_name.lower() == hist_name and elem.ax_node and elem.ax_node.name
+					(idx, elem.ax_node.name) for idx, elem in same_node_elements if elem.ax_node and elem.ax_node.name
 				]
 				self.logger.debug(
-					f'AX_NAME match failed for <{hist_name.upper()}> ax_name="{hist_ax_name}". '
+					f'AX_NAME match failed for <{hist_name.upper()}> ax_name="{historical_element.ax_name}". '
 					f'Page has {len(same_type_ax_names)} <{hist_name.upper()}> with ax_names: '
 					f'{same_type_ax_names[:5]}{"..." if len(same_type_ax_names) > 5 else ""}'
 				)
-
-		# Level 5: Unique attribute fallback (for old history files without stable_hash)
-		if highlight_index is None and historical_element.attributes:
-			hist_attrs = historical_element.attributes
-			hist_name = historical_element.node_name.lower()
-
-			# Try matching by unique identifiers: name, id, or aria-label
-			for attr_key in ['name', 'id', 'aria-label']:
-				if attr_key in hist_attrs and hist_attrs[attr_key]:
-					for idx, elem in selector_map.items():
-						if (
-							elem.node_name.lower() == hist_name
-							and elem.attributes
-							and elem.attributes.get(attr_key) == hist_attrs[attr_key]
-						):
-							highlight_index = idx
-							match_level = MatchLevel.ATTRIBUTE
-							self.logger.info(f'Element matched via {attr_key} attribute: {hist_attrs[attr_key]}')
-							break
-					if highlight_index is not None:
-						break
-
-			if highlight_index is None:
-				tried_attrs = [k for k in ['name', 'id', 'aria-label'] if k in hist_attrs and hist_attrs[k]]
+			if historical_element.attributes:
+				hist_attrs = historical_element.attributes
+				tried_attrs = [k for k in MATCH_ATTRIBUTES if k in hist_attrs and hist_attrs[k]]
 				# Log what was tried and what's available on the page for debugging
-				same_node_elements = [
+				identifiers = [
 					(idx, elem.attributes.get('aria-label') or elem.attributes.get('id') or elem.attributes.get('name'))
-					for idx, elem in selector_map.items()
-					if elem.node_name.lower() == hist_name and elem.attributes
+					for idx, elem in same_node_elements
+					if elem.attributes
 				]
 				self.logger.info(
 					f'🔍 ATTRIBUTE match failed for <{hist_name.upper()}> '
 					f'(tried: {tried_attrs}, looking for: {[hist_attrs.get(k) for k in tried_attrs]}). '
-					f'Page has {len(same_node_elements)} <{hist_name.upper()}> elements with identifiers: '
-					f'{same_node_elements[:5]}{"..." if len(same_node_elements) > 5 else ""}'
+					f'Page has {len(identifiers)} <{hist_name.upper()}> elements with identifiers: '
+					f'{identifiers[:5]}{"..." if len(identifiers) > 5 else ""}'
 				)
 
 		if highlight_index is None:
@@ -3582,6 +3647,9 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			if self.skill_service is not None:
 				await self.skill_service.close()
 
+			# Close the shared LLM connection pools, unless other agents on this event loop still use them
+			await release_shared_http_clients(self)
+
 			# Force garbage collection
 			gc.collect()
 
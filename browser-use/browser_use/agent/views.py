@@ -47,6 +47,13 @@ class AgentSettings(BaseModel):
 	use_judge: bool = True
 	ground_truth: str | None = None  # Ground truth answer or criteria for judge validation
 	max_history_items: int | None = None
+	# 'prompt_cache' sends task and history as an append-only prefix ahead of the volatile browser state,
+	# so provider-side prompt caching covers the growing history instead of only the system prompt
+	message_layout: Literal['single', 'prompt_cache'] = 'single'
+	# Replace a screenshot that is visually identical (see compute_screenshot_hash) to the last one sent with a short text marker
+	skip_unchanged_screenshots: bool = False
+	# Start capturing the next step's browser state in the background as soon as the actions of a step are executed
+	prefetch_browser_state: bool = False
 
 	page_extraction_llm: BaseChatModel | None = None
 	calculate_cost: bool = False
@@ -88,6 +95,17 @@ class AgentStepInfo:
 		return self.step_number >= self.max_steps - 1
 
 
+@dataclass
+class RerunStepTiming:
+	"""Where the time of one replayed history step went (see `Agent.rerun_history`)"""
+
+	step_number: int
+	wait_seconds: float = 0.0  # fixed delays, readiness waits and state captures before acting, retry backoff
+	work_seconds: float = 0.0  # executing the step's actions
+	state_captures: int = 0  # browser state captures taken to match the step's elements
+	attempts: int = 0
+
+
 class JudgementResult(BaseModel):
 	"""LLM judgement of agent trace"""
 
@@ -0,0 +1,153 @@
+"""
+Fast JSON decoding of incoming CDP messages.
+
+`DOMSnapshot.captureSnapshot` and `DOM.getDocument` responses of big pages are tens of megabytes of JSON. cdp_use decodes
+every websocket message with `json.loads` on the event loop, after the websocket layer has already turned the frame into
+a `str`. `DecodingCDPClient` instead:
+- pauses the cyclic garbage collector while decoding large frames (the millions of containers they allocate otherwise
+  trigger repeated full collections, which cost more than the parsing itself). The pause is reference-counted across
+  threads, and a collector disabled by the application is left alone
+- with cdp_json_decoder='auto' (or an explicit decoder) and msgspec or orjson installed, receives the raw frame bytes and
+  decodes them directly (no intermediate `str` copy). The default stays on the standard library, measure with
+  tests/scripts/benchmark_cdp_decoding.py on recorded pages before switching
+
+cdp_use has no hook for the decode step alone, so `DecodingCDPClient._handle_messages` mirrors the loop of the pinned
+cdp_use version. tests/ci/test_cdp_decoding.py checks that both dispatch the same messages the same way.
+"""
+
+import gc
+import json
+import logging
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, Literal
+
+import websockets
+from cdp_use import CDPClient
+
+logger = logging.getLogger(__name__)
+
+CDPJsonDecoder = Literal['auto', 'orjson', 'msgspec', 'json']
+CDP_JSON_DECODERS: tuple[CDPJsonDecoder, ...] = ('auto', 'orjson', 'msgspec', 'json')
+
+# Frames from this size on are decoded with the garbage collector paused (decoding never creates reference cycles)
+GC_PAUSE_MIN_FRAME_SIZE = 256 * 1024
+
+_gc_pause_lock = threading.Lock()
+_gc_pause_count = 0  # decodes (in any thread) running with the collector paused by this module
+
+
+def get_cdp_json_loads(decoder: CDPJsonDecoder = 'json') -> tuple[Callable[[bytes | str], Any], bool]:
+	"""
+	Return `(loads, accepts_bytes)` for the given decoder.
+
+	'auto' picks msgspec, then orjson, then the standard library (orjson is as fast as msgspec, but builds an intermediate
+	document that roughly triples the peak memory of big snapshots). Explicitly requesting a decoder that isn't installed
+	raises ImportError.
+	"""
+	if decoder not in CDP_JSON_DECODERS:
+		raise ValueError(f'Unknown CDP JSON decoder {decoder!r}, expected one of {list(CDP_JSON_DECODERS)}')
+
+	if decoder in ('auto', 'msgspec'):
+		try:
+			import msgspec  # type: ignore[import-not-found]
+
+			return msgspec.json.Decoder().decode, True
+		except ImportError as e:
+			if decoder == 'msgspec':
+				raise ImportError('cdp_json_decoder="msgspec" requires msgspec: pip install msgspec') from e
+
+	if decoder in ('auto', 'orjson'):
+		try:
+			import orjson  # type: ignore[import-not-found]
+
+			return orjson.loads, True
+		except ImportError as e:
+			if decoder == 'orjson':
+				raise ImportError('cdp_json_decoder="orjson" requires orjson: pip install orjson') from e
+
+	# json.loads accepts bytes too, but decodes them to str internally first
+	return json.loads, False
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+	"""Pause the cyclic garbage collector, it is enabled again when the last concurrent pause (from any thread) ends."""
+	global _gc_pause_count
+	with _gc_pause_lock:
+		# Disabled by the application, not by a concurrent decode: leave it to the application
+		paused = _gc_pause_count > 0 or gc.isenabled()
+		if paused:
+			_gc_pause_count += 1
+			gc.disable()
+	try:
+		yield
+	finally:
+		if paused:
+			with _gc_pause_lock:
+				_gc_pause_count -= 1
+				if _gc_pause_count == 0:
+					gc.enable()
+
+
+def decode_cdp_message(raw: bytes | str, loads: Callable[[bytes | str], Any]) -> Any:
+	"""Decode a websocket frame, large frames with the garbage collector paused."""
+	if len(raw) < GC_PAUSE_MIN_FRAME_SIZE:
+		return loads(raw)
+	with _gc_paused():
+		return loads(raw)
+
+
+class DecodingCDPClient(CDPClient):
+	"""CDPClient that decodes incoming messages with the configured JSON decoder."""
+
+	def __init__(self, *args: Any, json_decoder: CDPJsonDecoder = 'json', **kwargs: Any):
+		super().__init__(*args, **kwargs)
+		self._json_loads, self._receive_bytes = get_cdp_json_loads(json_decoder)
+
+	async def _handle_messages(self):
+		"""Same dispatch as `CDPClient._handle_messages` (keep in sync when upgrading cdp_use), with the pluggable decoder."""
+		try:
+			while True:
+				if not self.ws:
+					break
+
+				raw = await self.ws.recv(decode=False) if self._receive_bytes else await self.ws.recv()
+				data = decode_cdp_message(raw, self._json_loads)
+
+				# Handle response messages (with id)
+				if 'id' in data and data['id'] in self.pending_requests:
+					future = self.pending_requests.pop(data['id'])
+					# Check if future is already done to avoid InvalidStateError
+					if not future.done():
+						if 'error' in data:
+							logger.debug(f'CDP Error for request {data["id"]}: {data["error"]}')
+							future.set_exception(RuntimeError(data['error']))
+						else:
+							future.set_result(data['result'])
+					else:
+						logger.warning(f'Received duplicate response for request {data["id"]} - ignoring')
+
+				# Handle event messages (without id, but with method)
+				elif 'method' in data:
+					await self._event_registry.handle_event(data['method'], data.get('params', {}), data.get('sessionId'))
+
+				# Handle unexpected messages
+				else:
+					logger.warning(f'Received unexpected message: {data}')
+
+		except websockets.exceptions.ConnectionClosed as e:
+			logger.debug(f'WebSocket connection closed: {e}')
+			# Connection closed, resolve all pending futures with an exception
+			for future in self.pending_requests.values():
+				if not future.done():
+					future.set_exception(ConnectionError('WebSocket connection closed'))
+			self.pending_requests.clear()
+		except Exception as e:
+			logger.error(f'Error in message handler: {e}')
+			# Handle other exceptions
+			for future in self.pending_requests.values():
+				if not future.done():
+					future.set_exception(e)
+			self.pending_requests.clear()
@@ -152,6 +152,7 @@ class TypeTextEvent(ElementSelectedEvent[dict | None]):
 	clear: bool = True
 	is_sensitive: bool = False  # Flag to indicate if text contains sensitive data
 	sensitive_key_name: str | None = None  # Name of the sensitive key being typed (e.g., 'username', 'password')
+	typing_strategy: Literal['human', 'pipelined', 'insert_text'] | None = None  # None uses BrowserProfile.typing_strategy
 
 	event_timeout: float | None = Field(default_factory=lambda: _get_timeout('TIMEOUT_TypeTextEvent', 60.0))  # seconds
 
@@ -187,6 +188,9 @@ class ScreenshotEvent(BaseEvent[str]):
 
 	full_page: bool = False
 	clip: dict[str, float] | None = None  # {x, y, width, height}
+	format: Literal['png', 'jpeg', 'webp'] = 'png'
+	quality: int | None = None  # jpeg/webp compression quality (0-100)
+	size: tuple[int, int] | None = None  # final (width, height) in pixels, rendered by Chrome when the aspect ratio allows
 
 	event_timeout: float | None = Field(default_factory=lambda: _get_timeout('TIMEOUT_ScreenshotEvent', 15.0))  # seconds
 
@@ -532,6 +536,8 @@ class FileDownloadedEvent(BaseEvent):
 	mime_type: str | None = None  # e.g., 'application/pdf'
 	from_cache: bool = False
 	auto_download: bool = False  # Whether this was an automatic download (e.g., PDF auto-download)
+	duration_ms: float | None = None  # Time from the start of the download until the file was complete on disk
+	throughput_bytes_per_second: float | None = None
 
 	event_timeout: float | None = Field(default_factory=lambda: _get_timeout('TIMEOUT_FileDownloadedEvent', 30.0))  # seconds
 
@@ -634,13 +634,39 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 		default=5,
 		description='Maximum depth for cross-origin iframe recursion (default: 5 levels deep).',
 	)
+	max_concurrent_iframes: int = Field(
+		ge=1,
+		default=4,
+		description='Maximum number of cross-origin iframe DOM trees fetched concurrently (across all nesting levels).',
+	)
+	cdp_json_decoder: Literal['auto', 'orjson', 'msgspec', 'json'] = Field(
+		default='json',
+		description='JSON decoder for incoming CDP messages (large DOM snapshots): "json" uses the standard library, "auto" uses msgspec or orjson when installed (pip install "browser-use[fast-json]") and falls back to the standard library.',
+	)
+	screenshot_format: Literal['png', 'jpeg', 'webp'] = Field(
+		default='png',
+		description='Image format of the page screenshots sent to the LLM. jpeg and webp are encoded much faster by Chrome and are several times smaller than png.',
+	)
+	screenshot_quality: int = Field(
+		default=80, ge=1, le=100, description='Compression quality (1-100) of jpeg and webp screenshots, ignored for png.'
+	)
 
 	# --- Page load/wait timings ---
 
 	minimum_wait_page_load_time: float = Field(default=0.25, description='Minimum time to wait before capturing page state.')
-	wait_for_network_idle_page_load_time: float = Field(default=0.5, description='Time to wait for network idle.')
+	wait_for_network_idle_page_load_time: float = Field(
+		default=0.5, description='Maximum time to wait for network idle before capturing page state.'
+	)
+	network_idle_quiet_time: float = Field(
+		default=0.1,
+		description='How long the page must have no relevant requests in flight and no DOM mutations to count as stable.',
+	)
 
 	wait_between_actions: float = Field(default=0.1, description='Time to wait between actions.')
+	typing_strategy: Literal['human', 'pipelined', 'insert_text'] = Field(
+		default='human',
+		description='How text is typed: "human" sends awaited key events with small delays per character, "pipelined" sends the same key events without waiting for each one, "insert_text" inserts the text at once with Input.insertText (much faster for long text, but no per-key events).',
+	)
 
 	# --- UI/viewport/DOM ---
 	highlight_elements: bool = Field(default=True, description='Highlight interactive elements on the page.')
@@ -651,6 +677,33 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 		default=True, description='Only show element IDs in highlights if llm_representation is less than 10 characters.'
 	)
 	paint_order_filtering: bool = Field(default=True, description='Enable paint order filtering. Slightly experimental.')
+	paint_order_engine: Literal['pure', 'grid'] = Field(
+		default='grid',
+		description='Occlusion engine for paint order filtering: "grid" (grid-indexed, same results) or "pure" (linear scan).',
+	)
+	dom_serializer_pipeline: Literal['fused', 'legacy'] = Field(
+		default='fused',
+		description='DOM serializer implementation: "fused" (two linear passes) or "legacy" (one tree recursion per step, same output).',
+	)
+	incremental_dom: bool = Field(
+		default=False,
+		description='Patch the cached DOM tree from CDP DOM mutation events between steps instead of rebuilding it from scratch. Falls back to a full rebuild on navigation, scrolling or large changes. Experimental.',
+	)
+	incremental_dom_max_dirty_ratio: float = Field(
+		default=0.1,
+		ge=0.0,
+		le=1.0,
+		description='Fraction of changed DOM nodes above which incremental_dom falls back to a full rebuild.',
+	)
+	dom_capture_scope: Literal['page', 'viewport'] = Field(
+		default='page',
+		description='Which accessibility data each DOM capture fetches: "page" (the full tree of every frame) or "viewport" (only the nodes laid out within the current viewport, extended by dom_viewport_margin). The DOM snapshot always covers the whole document.',
+	)
+	dom_viewport_margin: float = Field(
+		default=1000.0,
+		ge=0.0,
+		description='Pixels above and below the viewport in which elements count as visible (and are captured with dom_capture_scope="viewport").',
+	)
 	interaction_highlight_color: str = Field(
 		default='rgb(255, 127, 39)',
 		description='Color to use for highlighting elements during interactions (CSS color string).',
@@ -12,6 +12,7 @@ import os
 
 from PIL import Image, ImageDraw, ImageFont
 
+from browser_use.browser.screenshots import run_image_task
 from browser_use.dom.views import DOMSelectorMap, EnhancedDOMTreeNode
 from browser_use.observability import observe_debug
 from browser_use.utils import time_execution_async
@@ -404,28 +405,10 @@ def process_element_highlight(
 		logger.debug(f'Failed to draw highlight for element {element_id}: {e}')
 
 
-@observe_debug(ignore_input=True, ignore_output=True, name='create_highlighted_screenshot')
-@time_execution_async('create_highlighted_screenshot')
-async def create_highlighted_screenshot(
-	screenshot_b64: str,
-	selector_map: DOMSelectorMap,
-	device_pixel_ratio: float = 1.0,
-	viewport_offset_x: int = 0,
-	viewport_offset_y: int = 0,
-	filter_highlight_ids: bool = True,
+def _draw_highlighted_screenshot(
+	screenshot_b64: str, selector_map: DOMSelectorMap, device_pixel_ratio: float, filter_highlight_ids: bool
 ) -> str:
-	"""Create a highlighted screenshot with bounding boxes around interactive elements.
-
-	Args:
-	    screenshot_b64: Base64 encoded screenshot
-	    selector_map: Map of interactive elements with their positions
-	    device_pixel_ratio: Device pixel ratio for scaling coordinates
-	    viewport_offset_x: X offset for viewport positioning
-	    viewport_offset_y: Y offset for viewport positioning
-
-	Returns:
-	    Base64 encoded highlighted screenshot
-	"""
+	"""Blocking part of create_highlighted_screenshot (decode, draw, encode), run in the screenshot worker pool."""
 	try:
 		# Decode screenshot
 		screenshot_data = base64.b64decode(screenshot_b64)
@@ -467,6 +450,34 @@ async def create_highlighted_screenshot(
 		return screenshot_b64
 
 
+@observe_debug(ignore_input=True, ignore_output=True, name='create_highlighted_screenshot')
+@time_execution_async('create_highlighted_screenshot')
+async def create_highlighted_screenshot(
+	screenshot_b64: str,
+	selector_map: DOMSelectorMap,
+	device_pixel_ratio: float = 1.0,
+	viewport_offset_x: int = 0,
+	viewport_offset_y: int = 0,
+	filter_highlight_ids: bool = True,
+) -> str:
+	"""Create a highlighted screenshot with bounding boxes around interactive elements.
+
+	Args:
+	    screenshot_b64: Base64 encoded screenshot
+	    selector_map: Map of interactive elements with their positions
+	    device_pixel_ratio: Device pixel ratio for scaling coordinates
+	    viewport_offset_x: X offset for viewport positioning
+	    viewport_offset_y: Y offset for viewport positioning
+
+	Returns:
+	    Base64 encoded highlighted screenshot
+	"""
+	# Image decoding, drawing and encoding block for tens of milliseconds, keep them off the event loop
+	return await run_image_task(
+		_draw_highlighted_screenshot, screenshot_b64, selector_map, device_pixel_ratio, filter_highlight_ids
+	)
+
+
 async def get_viewport_info_from_cdp(cdp_session) -> tuple[float, int, int]:
 	"""Get viewport information from CDP session.
 
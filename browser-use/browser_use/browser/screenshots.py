@@ -0,0 +1,128 @@
+"""
+Screenshot pipeline helpers shared by the screenshot watchdog, the agent prompt and the highlight renderer.
+
+Screenshots travel as base64 strings end to end (CDP returns them that way and the LLM APIs take them that way), so they
+are only decoded to bytes where pixels are actually touched. That pixel work (resizing, highlight drawing) runs in a
+small worker pool instead of on the event loop, and whenever possible it is skipped altogether by letting Chrome
+render the screenshot at its final size (`Page.captureScreenshot` `clip.scale`) and in a lossy format.
+"""
+
+import asyncio
+import base64
+import functools
+import hashlib
+import io
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Literal, TypeVar
+
+ScreenshotFormat = Literal['png', 'jpeg', 'webp']
+ScreenshotMediaType = Literal['image/png', 'image/jpeg', 'image/webp']
+
+SCREENSHOT_MEDIA_TYPES: dict[ScreenshotFormat, ScreenshotMediaType] = {'png': 'image/png', 'jpeg': 'image/jpeg', 'webp': 'image/webp'}
+
+# Base64 prefixes of the PNG, JPEG and WebP ("RIFF") file signatures
+_BASE64_SIGNATURES: dict[str, ScreenshotFormat] = {'iVBORw0KGgo': 'png', '/9j/': 'jpeg', 'UklGR': 'webp'}
+
+# The screenshot hash covers a grayscale thumbnail of this size, quantized to 16 gray levels: one cell per 8x8 pixels of
+# a 1280x720 viewport is fine enough to notice a ticked checkbox or a typed character. Anything that changes a cell
+# counts as a change, so the hash errs on the side of sending a screenshot again
+SCREENSHOT_HASH_SIZE = (160, 90)
+
+# Maps each gray level to one of 16 levels, so compression noise within a level does not change the hash
+_GRAY_LEVELS = bytes(level >> 4 for level in range(256))
+
+# Chrome renders the viewport with a single scale factor, so the target size has to keep its aspect ratio (within 1%)
+MAX_CAPTURE_ASPECT_RATIO_DEVIATION = 0.01
+
+T = TypeVar('T')
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+	global _executor
+	if _executor is None:
+		_executor = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix='screenshot')
+	return _executor
+
+
+async def run_image_task(func: Callable[..., T], *args: Any) -> T:
+	"""Run PIL work in the screenshot worker pool (PIL releases the GIL while decoding, resizing and encoding)."""
+	return await asyncio.get_running_loop().run_in_executor(_get_executor(), functools.partial(func, *args))
+
+
+def get_screenshot_format(screenshot_b64: str) -> ScreenshotFormat:
+	"""Image format of a base64 screenshot, from its file signature (PNG when unknown)."""
+	for prefix, screenshot_format in _BASE64_SIGNATURES.items():
+		if screenshot_b64.startswith(prefix):
+			return screenshot_format
+	return 'png'
+
+
+def get_screenshot_media_type(screenshot_b64: str) -> ScreenshotMediaType:
+	return SCREENSHOT_MEDIA_TYPES[get_screenshot_format(screenshot_b64)]
+
+
+def get_capture_scale(
+	viewport_width: float, viewport_height: float, device_pixel_ratio: float, target_size: tuple[int, int]
+) -> float | None:
+	"""
+	`clip.scale` that makes Chrome render a viewport of the given CSS size directly at `target_size` pixels.
+
+	Returns None when the aspect ratios differ too much for a uniform scale, the screenshot is then resized afterwards.
+	"""
+	if viewport_width <= 0 or viewport_height <= 0 or device_pixel_ratio <= 0:
+		return None
+	target_width, target_height = target_size
+	scale_x = target_width / viewport_width
+	scale_y = target_height / viewport_height
+	if abs(scale_x - scale_y) / max(scale_x, scale_y) > MAX_CAPTURE_ASPECT_RATIO_DEVIATION:
+		return None
+	# The output has clip size * scale * device pixel ratio pixels
+	return scale_x / device_pixel_ratio
+
+
+def resize_screenshot(screenshot_b64: str, size: tuple[int, int], quality: int = 80) -> str:
+	"""Resize a base64 screenshot to `size` (LANCZOS), keeping its format. Blocking, run it through run_image_task."""
+	from PIL import Image
+
+	with Image.open(io.BytesIO(base64.b64decode(screenshot_b64))) as image:
+		if image.size == size:
+			return screenshot_b64
+		screenshot_format = get_screenshot_format(screenshot_b64)
+		resized = image.resize(size, Image.Resampling.LANCZOS)
+
+	buffer = io.BytesIO()
+	if screenshot_format == 'png':
+		resized.save(buffer, format='PNG')
+	else:
+		resized.convert('RGB').save(buffer, format=screenshot_format.upper(), quality=quality)
+	return base64.b64encode(buffer.getvalue()).decode('utf-8')
+
+
+def compute_screenshot_hash(screenshot_b64: str, hash_size: tuple[int, int] = SCREENSHOT_HASH_SIZE) -> int:
+	"""
+	Hash of the downscaled, quantized pixels of a base64 screenshot. Blocking, run it through run_image_task.
+
+	Equal hashes mean visually unchanged screenshots, e.g. re-captures of an idle page. Use it only where a false
+	"unchanged" is acceptable (skipping screenshots sent to the LLM), storage compares the exact bytes.
+	"""
+	from PIL import Image
+
+	with Image.open(io.BytesIO(base64.b64decode(screenshot_b64))) as image:
+		# JPEG decoders can downscale while decoding, other formats ignore the draft request
+		image.draft('L', (hash_size[0] * 2, hash_size[1] * 2))
+		thumbnail = image.convert('L').resize(hash_size, Image.Resampling.BOX)
+
+	digest = hashlib.blake2b(thumbnail.tobytes().translate(_GRAY_LEVELS), digest_size=8).digest()
+	return int.from_bytes(digest, 'big')
+
+
+def get_screenshot_size(screenshot_b64: str) -> tuple[int, int]:
+	"""Pixel size of a base64 screenshot (only the image header is parsed)."""
+	from PIL import Image
+
+	with Image.open(io.BytesIO(base64.b64decode(screenshot_b64))) as image:
+		return image.size
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import time
 from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, Self, Union, cast, overload
@@ -17,6 +18,7 @@ from cdp_use.cdp.target import AttachedToTargetEvent, SessionID, TargetID
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from uuid_extensions import uuid7str
 
+from browser_use.browser.cdp_decoding import DecodingCDPClient
 from browser_use.browser.cloud.cloud import CloudBrowserAuthError, CloudBrowserClient, CloudBrowserError
 
 # CDP logging is now handled by setup_logging() in logging_config.py
@@ -42,7 +44,7 @@ from browser_use.browser.events import (
 	TabCreatedEvent,
 )
 from browser_use.browser.profile import BrowserProfile, ProxySettings
-from browser_use.browser.views import BrowserStateSummary, TabInfo
+from browser_use.browser.views import BrowserStateSummary, CDPSessionLookupStats, TabInfo
 from browser_use.dom.views import DOMRect, EnhancedDOMTreeNode, TargetInfo
 from browser_use.observability import observe_debug
 from browser_use.utils import _log_pretty_url, create_task_with_error_handling, is_new_tab_page
@@ -375,6 +377,10 @@ class BrowserSession(BaseModel):
 		default=None,
 		description='Target size (width, height) to resize screenshots before sending to LLM. Coordinates from LLM will be scaled back to original viewport size.',
 	)
+	hash_screenshots: bool = Field(
+		default=False,
+		description='Compute BrowserStateSummary.screenshot_hash for each screenshot, used to skip visually unchanged LLM screenshots.',
+	)
 
 	# Cache of original viewport size for coordinate conversion (set when browser state is captured)
 	_original_viewport_size: tuple[int, int] | None = PrivateAttr(default=None)
@@ -423,6 +429,12 @@ class BrowserSession(BaseModel):
 	_cached_selector_map: dict[int, EnhancedDOMTreeNode] = PrivateAttr(default_factory=dict)
 	_downloaded_files: list[str] = PrivateAttr(default_factory=list)  # Track files downloaded during this session
 	_closed_popup_messages: list[str] = PrivateAttr(default_factory=list)  # Store messages from auto-closed JavaScript dialogs
+	_cdp_session_lookup_stats: CDPSessionLookupStats = PrivateAttr(default_factory=CDPSessionLookupStats)
+
+	# Background browser state capture started by prefetch_browser_state_summary()
+	_state_prefetch_task: 'asyncio.Task[tuple[BrowserStateSummary, float]] | None' = PrivateAttr(default=None)
+	_state_prefetch_target_id: TargetID | None = PrivateAttr(default=None)
+	_state_prefetch_include_screenshot: bool = PrivateAttr(default=True)
 
 	# Watchdogs
 	_crash_watchdog: Any | None = PrivateAttr(default=None)
@@ -436,6 +448,7 @@ class BrowserSession(BaseModel):
 	_screenshot_watchdog: Any | None = PrivateAttr(default=None)
 	_permissions_watchdog: Any | None = PrivateAttr(default=None)
 	_recording_watchdog: Any | None = PrivateAttr(default=None)
+	_network_idle_watchdog: Any | None = PrivateAttr(default=None)
 
 	_cloud_browser_client: CloudBrowserClient = PrivateAttr(default_factory=lambda: CloudBrowserClient())
 	_demo_mode: 'DemoMode | None' = PrivateAttr(default=None)
@@ -463,6 +476,11 @@ class BrowserSession(BaseModel):
 			str_id = port_number
 		return str_id
 
+	@property
+	def cdp_session_lookup_stats(self) -> CDPSessionLookupStats:
+		"""Counters of the fast path, slow path and attach waits of get_or_create_cdp_session."""
+		return self._cdp_session_lookup_stats
+
 	@property
 	def _tab_id_for_logs(self) -> str:
 		return self.agent_focus_target_id[-2:] if self.agent_focus_target_id else f'{red}--{reset}'
@@ -497,6 +515,7 @@ class BrowserSession(BaseModel):
 				self.logger.debug(f'Error closing CDP client during reset: {e}')
 
 		self._cdp_client_root = None  # type: ignore
+		self.cancel_browser_state_prefetch()
 		self._cached_browser_state_summary = None
 		self._cached_selector_map.clear()
 		self._downloaded_files.clear()
@@ -516,6 +535,7 @@ class BrowserSession(BaseModel):
 		self._screenshot_watchdog = None
 		self._permissions_watchdog = None
 		self._recording_watchdog = None
+		self._network_idle_watchdog = None
 		if self._demo_mode:
 			self._demo_mode.reset()
 			self._demo_mode = None
@@ -1230,6 +1250,18 @@ class BrowserSession(BaseModel):
 		"""
 		assert self._cdp_client_root is not None, 'Root CDP client not initialized'
 		assert self.session_manager is not None, 'SessionManager not initialized'
+		stats = self._cdp_session_lookup_stats
+
+		# Fast path: a session validated by an earlier call, as long as no session left the pool since then.
+		# Synchronous (no awaits, no CDP round trip), only taken when the agent focus doesn't change.
+		cached_target_id = target_id or self.agent_focus_target_id
+		if cached_target_id and (not focus or cached_target_id == self.agent_focus_target_id):
+			cached_session = self.session_manager.get_cached_session(cached_target_id)
+			if cached_session is not None:
+				stats.fast_path_hits += 1
+				return cached_session
+
+		stats.slow_path_calls += 1
 
 		# If no target_id specified, ensure current agent focus is valid and wait for recovery if needed
 		if target_id is None:
@@ -1249,6 +1281,7 @@ class BrowserSession(BaseModel):
 		if not session:
 			# Session not in pool yet - wait for attach event
 			self.logger.debug(f'[SessionManager] Waiting for target {target_id[:8]}... to attach...')
+			stats.attach_waits += 1
 
 			# Wait up to 2 seconds for the attach event
 			for attempt in range(20):
@@ -1260,6 +1293,7 @@ class BrowserSession(BaseModel):
 
 			if not session:
 				# Timeout - target doesn't exist
+				stats.attach_wait_timeouts += 1
 				raise ValueError(f'Target {target_id} not found - may have detached or never existed')
 
 		# Validate session is still active
@@ -1295,6 +1329,9 @@ class BrowserSession(BaseModel):
 			except Exception:
 				pass  # May fail if not waiting
 
+		# SessionManager already resumes targets that attach waiting for the debugger, so later lookups can skip the
+		# validation and the runIfWaitingForDebugger round trip until the pool changes
+		self.session_manager.cache_session(target_id, session)
 		return session
 
 	# endregion - ========== CDP-based ... ==========
@@ -1322,6 +1359,16 @@ class BrowserSession(BaseModel):
 				self.logger.debug('⚠️ Cached browser state has 0 interactive elements, fetching fresh state')
 				# Fall through to fetch fresh state
 
+		if self._state_prefetch_task is not None:
+			prefetched_state = await self._take_prefetched_browser_state(include_screenshot)
+			if prefetched_state is not None:
+				return prefetched_state
+
+		return await self._request_browser_state_summary(include_screenshot, include_recent_events)
+
+	async def _request_browser_state_summary(
+		self, include_screenshot: bool, include_recent_events: bool
+	) -> BrowserStateSummary:
 		# Dispatch the event and wait for result
 		event: BrowserStateRequestEvent = cast(
 			BrowserStateRequestEvent,
@@ -1339,6 +1386,95 @@ class BrowserSession(BaseModel):
 		assert result is not None and result.dom_state is not None
 		return result
 
+	def prefetch_browser_state_summary(self, include_screenshot: bool = True, include_recent_events: bool = False) -> None:
+		"""Start capturing the browser state in the background.
+
+		The next get_browser_state_summary() call returns the prefetched state (waiting for it if it is still being
+		captured), unless the focused page changed since it was captured (DOM mutation, navigation, other tab), in
+		which case the state is captured again.
+		"""
+		self.cancel_browser_state_prefetch()
+		self._state_prefetch_target_id = self.agent_focus_target_id
+		self._state_prefetch_include_screenshot = include_screenshot
+		self._state_prefetch_task = create_task_with_error_handling(
+			self._prefetch_browser_state(include_screenshot, include_recent_events),
+			name='prefetch_browser_state',
+			logger_instance=self.logger,
+			suppress_exceptions=True,
+		)
+
+	def cancel_browser_state_prefetch(self) -> None:
+		"""Drop a pending prefetch (e.g. before the session is reset)."""
+		if self._state_prefetch_task is not None:
+			self._state_prefetch_task.cancel()
+			self._state_prefetch_task = None
+
+	async def _prefetch_browser_state(
+		self, include_screenshot: bool, include_recent_events: bool
+	) -> tuple[BrowserStateSummary, float]:
+		state = await self._request_browser_state_summary(include_screenshot, include_recent_events)
+		# Changes made while the state was captured (incl. our own highlights) are part of it, only later ones make it stale
+		return state, time.monotonic()
+
+	async def _take_prefetched_browser_state(self, include_screenshot: bool) -> BrowserStateSummary | None:
+		"""Consume the pending prefetch, None if it failed or the page changed since it was captured."""
+		task = self._state_prefetch_task
+		assert task is not None
+		self._state_prefetch_task = None
+
+		try:
+			prefetched = await task
+		except asyncio.CancelledError:
+			# Only swallow the cancellation of the prefetch itself, not of the caller
+			current_task = asyncio.current_task()
+			if current_task is not None and current_task.cancelling():
+				raise
+			prefetched = None
+		if prefetched is None:
+			self.logger.debug('♻️ Browser state prefetch failed, capturing again')
+			return None
+
+		state, captured_at = prefetched
+		target_id = self._state_prefetch_target_id
+		stale_reason = None
+		if include_screenshot and not self._state_prefetch_include_screenshot:
+			stale_reason = 'captured without screenshot'
+		elif target_id != self.agent_focus_target_id or target_id is None:
+			stale_reason = 'agent focus changed'
+		elif state.url != await self.get_current_page_url():
+			stale_reason = 'page navigated'
+		elif self.session_manager and any(
+			self.session_manager.get_last_dom_mutation_time(cdp_session.session_id) > captured_at
+			for cdp_session in self.session_manager.get_all_sessions_for_target(target_id)
+		):
+			stale_reason = 'DOM changed'
+
+		if stale_reason:
+			self.logger.debug(f'♻️ Prefetched browser state is stale ({stale_reason}), capturing again')
+			return None
+		self.logger.debug(f'⚡ Using browser state prefetched {time.monotonic() - captured_at:.2f}s ago')
+		return state
+
+	async def get_browser_state_summaries(
+		self, target_ids: list[TargetID] | None = None, include_screenshot: bool = True
+	) -> dict[TargetID, BrowserStateSummary]:
+		"""Capture the state of several tabs concurrently, without switching the agent focus.
+
+		Each summary has its own selector map (indices are only valid for that tab), the agent's cached state is not
+		updated. Useful to compare tabs in one step at roughly the latency of a single capture.
+
+		Args:
+			target_ids: Targets to capture, defaults to all open pages.
+			include_screenshot: Whether to capture a screenshot of every tab.
+
+		Returns:
+			Mapping of target id to its BrowserStateSummary.
+		"""
+		assert self._dom_watchdog is not None, 'DOMWatchdog not initialized, is the browser session started?'
+		if target_ids is None:
+			target_ids = [target.target_id for target in self.get_page_targets()]
+		return await self._dom_watchdog.get_browser_state_summaries(target_ids, include_screenshot=include_screenshot)
+
 	async def get_state_as_text(self) -> str:
 		"""Get the browser state as text."""
 		state = await self.get_browser_state_summary()
@@ -1360,6 +1496,7 @@ class BrowserSession(BaseModel):
 		from browser_use.browser.watchdogs.dom_watchdog import DOMWatchdog
 		from browser_use.browser.watchdogs.downloads_watchdog import DownloadsWatchdog
 		from browser_use.browser.watchdogs.local_browser_watchdog import LocalBrowserWatchdog
+		from browser_use.browser.watchdogs.network_idle_watchdog import NetworkIdleWatchdog
 		from browser_use.browser.watchdogs.permissions_watchdog import PermissionsWatchdog
 		from browser_use.browser.watchdogs.popups_watchdog import PopupsWatchdog
 		from browser_use.browser.watchdogs.recording_watchdog import RecordingWatchdog
@@ -1468,6 +1605,11 @@ class BrowserSession(BaseModel):
 		# self.event_bus.on(ScreenshotEvent, self._screenshot_watchdog.on_ScreenshotEvent)
 		self._screenshot_watchdog.attach_to_session()
 
+		# Initialize NetworkIdleWatchdog (tracks in-flight requests per page so DOMWatchdog can wait for page stability)
+		NetworkIdleWatchdog.model_rebuild()
+		self._network_idle_watchdog = NetworkIdleWatchdog(event_bus=self.event_bus, browser_session=self)
+		self._network_idle_watchdog.attach_to_session()
+
 		# Initialize DOMWatchdog (handles building the DOM tree and detecting interactive elements, depends on ScreenshotWatchdog)
 		DOMWatchdog.model_rebuild()
 		self._dom_watchdog = DOMWatchdog(event_bus=self.event_bus, browser_session=self)
@@ -1531,10 +1673,11 @@ class BrowserSession(BaseModel):
 		try:
 			# Create and store the CDP client for direct CDP communication
 			headers = getattr(self.browser_profile, 'headers', None)
-			self._cdp_client_root = CDPClient(
+			self._cdp_client_root = DecodingCDPClient(
 				self.cdp_url,
 				additional_headers=headers,
 				max_ws_frame_size=200 * 1024 * 1024,  # Use 200MB limit to handle pages with very large DOMs
+				json_decoder=self.browser_profile.cdp_json_decoder,
 			)
 			assert self._cdp_client_root is not None
 			await self._cdp_client_root.start()
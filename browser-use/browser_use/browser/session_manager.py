@@ -5,7 +5,9 @@ events, ensuring the session pool always reflects the current browser state.
 """
 
 import asyncio
-from typing import TYPE_CHECKING
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
 from cdp_use.cdp.target import AttachedToTargetEvent, DetachedFromTargetEvent, SessionID, TargetID
 
@@ -14,6 +16,22 @@ from browser_use.utils import create_task_with_error_handling
 if TYPE_CHECKING:
 	from browser_use.browser.session import BrowserSession, CDPSession, Target
 
+# Signature: listener(event_name, event_params) - called synchronously from the CDP event loop
+DomMutationListener = Callable[[str, dict[str, Any]], None]
+
+# DOM domain events forwarded to registered DOM mutation listeners
+DOM_MUTATION_EVENTS = (
+	'childNodeInserted',
+	'childNodeRemoved',
+	'attributeModified',
+	'attributeRemoved',
+	'characterDataModified',
+	'setChildNodes',
+	'shadowRootPushed',
+	'shadowRootPopped',
+	'documentUpdated',
+)
+
 
 class SessionManager:
 	"""Event-driven CDP session manager.
@@ -53,6 +71,18 @@ class SessionManager:
 		self._recovery_complete_event: asyncio.Event | None = None
 		self._recovery_task: asyncio.Task | None = None
 
+		# DOM mutation listeners per session (used by incremental DOM tree maintenance)
+		self._dom_mutation_listeners: dict[SessionID, DomMutationListener] = {}
+		# Monotonic time of the last DOM mutation event per session (used by page stability detection)
+		self._last_dom_mutation: dict[SessionID, float] = {}
+
+		# Sessions already looked up by get_or_create_cdp_session, valid as long as the generation is unchanged.
+		# The generation is bumped whenever a session leaves the pool; attaching only adds sessions, so it never
+		# makes a cached session stale.
+		self._generation: int = 0
+		self._session_cache: dict[TargetID, 'CDPSession'] = {}
+		self._session_cache_generation: int = 0
+
 	async def start_monitoring(self) -> None:
 		"""Start monitoring Target attach/detach events.
 
@@ -106,11 +136,77 @@ class SessionManager:
 		cdp_client.register.Target.detachedFromTarget(on_detached)
 		cdp_client.register.Target.targetInfoChanged(on_target_info_changed)
 
+		# DOM mutation events are registered ONCE on the root client and routed per session,
+		# registering per consumer would replace the previous handler
+		for event_name in DOM_MUTATION_EVENTS:
+			getattr(cdp_client.register.DOM, event_name)(self._make_dom_mutation_handler(event_name))
+
 		self.logger.debug('[SessionManager] Event monitoring started')
 
 		# Discover and initialize ALL existing targets
 		await self._initialize_existing_targets()
 
+	def _make_dom_mutation_handler(self, event_name: str):
+		"""Create a synchronous CDP handler that forwards a DOM event to the listener of its session."""
+
+		def on_dom_mutation(event, session_id: SessionID | None = None):
+			if not session_id:
+				return
+			self._last_dom_mutation[session_id] = time.monotonic()
+			listener = self._dom_mutation_listeners.get(session_id)
+			if listener is None:
+				return
+			try:
+				listener(event_name, event)
+			except Exception as e:
+				self.logger.debug(f'[SessionManager] DOM mutation listener failed on {event_name}: {type(e).__name__}: {e}')
+
+		return on_dom_mutation
+
+	def register_dom_mutation_listener(self, session_id: SessionID, listener: DomMutationListener) -> None:
+		"""Route DOM mutation events of a session to a listener (replaces any previous listener for that session).
+
+		The DOM domain must be enabled on the session for Chrome to emit the events.
+		"""
+		self._dom_mutation_listeners[session_id] = listener
+
+	def unregister_dom_mutation_listener(self, session_id: SessionID, listener: DomMutationListener | None = None) -> None:
+		"""Stop routing DOM mutation events of a session (only if it is still routed to `listener` when given)."""
+		if listener is None or self._dom_mutation_listeners.get(session_id) is listener:
+			self._dom_mutation_listeners.pop(session_id, None)
+
+	def get_last_dom_mutation_time(self, session_id: SessionID) -> float:
+		"""Monotonic time of the last DOM mutation event of a session (0.0 if none was seen).
+
+		Chrome only emits DOM mutation events on sessions with the DOM domain enabled.
+		"""
+		return self._last_dom_mutation.get(session_id, 0.0)
+
+	@property
+	def generation(self) -> int:
+		"""Counter bumped every time a session is removed from the pool."""
+		return self._generation
+
+	def _invalidate_session_cache(self) -> None:
+		self._generation += 1
+		self._session_cache.clear()
+
+	def get_cached_session(self, target_id: TargetID) -> 'CDPSession | None':
+		"""Synchronous, lock-free lookup of a session cached by cache_session, None if the pool changed since.
+
+		Used by the fast path of browser_session.get_or_create_cdp_session().
+		"""
+		if self._session_cache_generation != self._generation:
+			return None
+		return self._session_cache.get(target_id)
+
+	def cache_session(self, target_id: TargetID, cdp_session: 'CDPSession') -> None:
+		"""Remember a validated session for get_cached_session until the next session is removed from the pool."""
+		if self._session_cache_generation != self._generation:
+			self._session_cache.clear()
+			self._session_cache_generation = self._generation
+		self._session_cache[target_id] = cdp_session
+
 	def _get_session_for_target(self, target_id: TargetID) -> 'CDPSession | None':
 		"""Internal: Get ANY valid session for a target (picks first available).
 
@@ -180,6 +276,9 @@ class SessionManager:
 			self._sessions.clear()
 			self._target_sessions.clear()
 			self._session_to_target.clear()
+			self._dom_mutation_listeners.clear()
+			self._last_dom_mutation.clear()
+			self._invalidate_session_cache()
 
 		self.logger.info('[SessionManager] Cleared all owned data (targets, sessions, mappings)')
 
@@ -560,6 +659,18 @@ class SessionManager:
 			if session_id in self._session_to_target:
 				del self._session_to_target[session_id]
 
+			self._invalidate_session_cache()
+
+			# Let a DOM mutation listener know its session is gone
+			dom_listener = self._dom_mutation_listeners.pop(session_id, None)
+			self._last_dom_mutation.pop(session_id, None)
+
+		if dom_listener is not None:
+			try:
+				dom_listener('detached', {})
+			except Exception as e:
+				self.logger.debug(f'[SessionManager] DOM mutation listener failed on detach: {type(e).__name__}: {e}')
+
 		# Dispatch TabClosedEvent only for page/tab targets that are fully removed (not iframes/workers or partial detaches)
 		if target_fully_removed:
 			if target_type in ('page', 'tab'):
@@ -4,6 +4,10 @@ import base64
 import io
 import logging
 import math
+import queue
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
@@ -21,6 +25,26 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Frames waiting for the encoder thread. When it falls behind, the oldest waiting frame is dropped so the video keeps
+# showing the latest state of the page instead of lagging further and further behind.
+DEFAULT_MAX_QUEUED_FRAMES = 8
+
+
+@dataclass
+class VideoRecordingStats:
+	"""Counters of the frame pipeline, to tell how well the encoder keeps up with the screencast."""
+
+	frames_received: int = 0
+	frames_encoded: int = 0
+	frames_dropped: int = 0  # dropped because the encoder queue was full
+	frames_deduplicated: int = 0  # identical to the previous frame, encoded without decoding it again
+	total_encoder_lag: float = 0.0  # seconds between receiving and encoding, summed over the encoded frames
+	max_encoder_lag: float = 0.0
+
+	@property
+	def average_encoder_lag(self) -> float:
+		return self.total_encoder_lag / self.frames_encoded if self.frames_encoded else 0.0
+
 
 def _get_padded_size(size: ViewportSize, macro_block_size: int = 16) -> ViewportSize:
 	"""Calculates the dimensions padded to the nearest multiple of macro_block_size."""
@@ -36,9 +60,14 @@ class VideoRecorderService:
 	This service captures individual frames from the CDP screencast, decodes them,
 	and appends them to a video file using a pip-installable ffmpeg backend.
 	It automatically resizes frames to match the target video dimensions.
+
+	Decoding, resizing and encoding happen on a dedicated encoder thread fed by a bounded
+	queue, so `add_frame` never blocks the caller (the asyncio loop handling CDP events).
 	"""
 
-	def __init__(self, output_path: Path, size: ViewportSize, framerate: int):
+	def __init__(
+		self, output_path: Path, size: ViewportSize, framerate: int, max_queued_frames: int = DEFAULT_MAX_QUEUED_FRAMES
+	):
 		"""
 		Initializes the video recorder.
 
@@ -46,6 +75,7 @@ class VideoRecorderService:
 		    output_path: The full path where the video will be saved.
 		    size: A ViewportSize object specifying the width and height of the video.
 		    framerate: The desired framerate for the output video.
+		    max_queued_frames: How many frames may wait for the encoder before the oldest ones are dropped.
 		"""
 		self.output_path = output_path
 		self.size = size
@@ -53,6 +83,9 @@ class VideoRecorderService:
 		self._writer: Optional['Format.Writer'] = None
 		self._is_active = False
 		self.padded_size = _get_padded_size(self.size)
+		self.stats = VideoRecordingStats()
+		self._queue: queue.Queue[tuple[str, float] | None] = queue.Queue(maxsize=max_queued_frames)
+		self._encoder_thread: threading.Thread | None = None
 
 	def start(self) -> None:
 		"""
@@ -79,61 +112,126 @@ class VideoRecorderService:
 				macro_block_size=None,
 			)
 			self._is_active = True
+			self._start_encoder_thread()
 			logger.debug(f'Video recorder started. Output will be saved to {self.output_path}')
 		except Exception as e:
 			logger.error(f'Failed to initialize video writer: {e}')
 			self._is_active = False
 
+	def _start_encoder_thread(self) -> None:
+		self._encoder_thread = threading.Thread(target=self._encode_frames, name='video-encoder', daemon=True)
+		self._encoder_thread.start()
+
+	@property
+	def pending_frames(self) -> int:
+		"""Number of frames waiting for the encoder thread."""
+		return self._queue.qsize()
+
 	def add_frame(self, frame_data_b64: str) -> None:
 		"""
-		Decodes a base64-encoded PNG frame, resizes it, pads it to be codec-compatible,
-		and appends it to the video.
+		Queues a base64-encoded frame (JPEG or PNG) for the encoder thread, without blocking.
+
+		If the queue is full, the oldest waiting frame is dropped to make room.
 
 		Args:
-		    frame_data_b64: A base64-encoded string of the PNG frame data.
+		    frame_data_b64: A base64-encoded string of the frame image data.
 		"""
 		if not self._is_active or not self._writer:
 			return
 
+		self.stats.frames_received += 1
+		item = (frame_data_b64, time.monotonic())
 		try:
-			frame_bytes = base64.b64decode(frame_data_b64)
-
-			# Use PIL to handle image processing in memory - much faster than spawning ffmpeg subprocess per frame
-			with Image.open(io.BytesIO(frame_bytes)) as img:
-				# 1. Resize if needed to target viewport size
-				if img.size != (self.size['width'], self.size['height']):
-					# Use BICUBIC as it's faster than LANCZOS and good enough for screen recordings
-					img = img.resize((self.size['width'], self.size['height']), Image.Resampling.BICUBIC)
-
-				# 2. Handle Padding (Macro block alignment for codecs)
-				# Check if padding is actually needed
-				if self.padded_size['width'] != self.size['width'] or self.padded_size['height'] != self.size['height']:
-					new_img = Image.new('RGB', (self.padded_size['width'], self.padded_size['height']), (0, 0, 0))
-					# Center the image
-					x_offset = (self.padded_size['width'] - self.size['width']) // 2
-					y_offset = (self.padded_size['height'] - self.size['height']) // 2
-					new_img.paste(img, (x_offset, y_offset))
-					img = new_img
-
-				# 3. Convert to numpy array for imageio
-				img_array = np.array(img)
-
-			self._writer.append_data(img_array)
-		except Exception as e:
-			logger.warning(f'Could not process and add video frame: {e}')
+			self._queue.put_nowait(item)
+		except queue.Full:
+			try:
+				self._queue.get_nowait()
+				self.stats.frames_dropped += 1
+			except queue.Empty:
+				pass  # the encoder thread just took it
+			try:
+				self._queue.put_nowait(item)
+			except queue.Full:
+				self.stats.frames_dropped += 1
+
+	def _encode_frames(self) -> None:
+		"""Encoder thread: decodes queued frames and appends them to the video until the stop sentinel."""
+		last_frame_data: str | None = None
+		last_frame: 'np.ndarray | None' = None
+		while True:
+			item = self._queue.get()
+			if item is None:  # stop sentinel
+				return
+			frame_data_b64, received_at = item
+			try:
+				if frame_data_b64 == last_frame_data and last_frame is not None:
+					# Unchanged screen (e.g. a caret blinking back): repeat the decoded frame to keep the timing
+					self.stats.frames_deduplicated += 1
+				else:
+					last_frame = self._decode_frame(frame_data_b64)
+					last_frame_data = frame_data_b64
+				assert self._writer is not None
+				self._writer.append_data(last_frame)
+			except Exception as e:
+				logger.warning(f'Could not process and add video frame: {e}')
+				continue
+
+			lag = time.monotonic() - received_at
+			self.stats.frames_encoded += 1
+			self.stats.total_encoder_lag += lag
+			self.stats.max_encoder_lag = max(self.stats.max_encoder_lag, lag)
+
+	def _decode_frame(self, frame_data_b64: str) -> 'np.ndarray':
+		"""Decodes a frame, resizes it and pads it to be codec-compatible."""
+		frame_bytes = base64.b64decode(frame_data_b64)
+		target_size = (self.size['width'], self.size['height'])
+
+		# Use PIL to handle image processing in memory - much faster than spawning ffmpeg subprocess per frame
+		with Image.open(io.BytesIO(frame_bytes)) as img:
+			# JPEG frames can be downscaled while decoding, which is much cheaper than a full decode + resize
+			img.draft('RGB', target_size)
+			img = img.convert('RGB')
+
+			# 1. Resize if needed to target viewport size
+			if img.size != target_size:
+				# Use BICUBIC as it's faster than LANCZOS and good enough for screen recordings
+				img = img.resize(target_size, Image.Resampling.BICUBIC)
+
+			# 2. Handle Padding (Macro block alignment for codecs)
+			# Check if padding is actually needed
+			if self.padded_size['width'] != self.size['width'] or self.padded_size['height'] != self.size['height']:
+				new_img = Image.new('RGB', (self.padded_size['width'], self.padded_size['height']), (0, 0, 0))
+				# Center the image
+				x_offset = (self.padded_size['width'] - self.size['width']) // 2
+				y_offset = (self.padded_size['height'] - self.size['height']) // 2
+				new_img.paste(img, (x_offset, y_offset))
+				img = new_img
+
+			# 3. Convert to numpy array for imageio
+			return np.array(img)
 
 	def stop_and_save(self) -> None:
 		"""
-		Finalizes the video file by closing the writer.
+		Encodes the frames still queued and finalizes the video file by closing the writer.
 
-		This method should be called when the recording session is complete.
+		This method should be called when the recording session is complete. It blocks
+		until the encoder thread is done, so call it from a worker thread in async code.
 		"""
 		if not self._is_active or not self._writer:
 			return
 
 		try:
+			if self._encoder_thread:
+				self._queue.put(None)
+				self._encoder_thread.join()
+				self._encoder_thread = None
 			self._writer.close()
-			logger.info(f'📹 Video recording saved successfully to: {self.output_path}')
+			stats = self.stats
+			logger.info(
+				f'📹 Video recording saved successfully to: {self.output_path} ({stats.frames_encoded} frames, '
+				f'{stats.frames_dropped} dropped, {stats.frames_deduplicated} deduplicated, '
+				f'encoder lag avg {stats.average_encoder_lag * 1000:.0f}ms / max {stats.max_encoder_lag * 1000:.0f}ms)'
+			)
 		except Exception as e:
 			logger.error(f'Failed to finalize and save video: {e}')
 		finally:
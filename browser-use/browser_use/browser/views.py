@@ -75,6 +75,16 @@ class NetworkRequest:
 	resource_type: str | None = None  # e.g., 'Document', 'Stylesheet', 'Image', 'Script', 'XHR', 'Fetch'
 
 
+@dataclass
+class CDPSessionLookupStats:
+	"""How often BrowserSession.get_or_create_cdp_session took each of its paths"""
+
+	fast_path_hits: int = 0  # served from the SessionManager session cache, no awaits
+	slow_path_calls: int = 0  # full lookup: focus validation, pool lookup, session validation
+	attach_waits: int = 0  # target was not in the pool yet, polled for its attach event (up to 2s)
+	attach_wait_timeouts: int = 0  # target never attached within the 2s
+
+
 @dataclass
 class PaginationButton:
 	"""Information about a pagination button detected on the page"""
@@ -97,6 +107,8 @@ class BrowserStateSummary:
 	title: str
 	tabs: list[TabInfo]
 	screenshot: str | None = field(default=None, repr=False)
+	llm_screenshot: str | None = field(default=None, repr=False)  # `screenshot` resized to llm_screenshot_size, if set
+	screenshot_hash: int | None = None  # Hash of the downscaled screenshot, to skip visually unchanged LLM screenshots
 	page_info: PageInfo | None = None  # Enhanced page information
 
 	# Keep legacy fields for backward compatibility
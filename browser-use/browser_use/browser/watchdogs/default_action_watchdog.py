@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+from typing import Literal
 
 from cdp_use.cdp.input.commands import DispatchKeyEventParameters
 
@@ -36,6 +37,11 @@ TypeTextEvent.model_rebuild()
 ScrollEvent.model_rebuild()
 UploadFileEvent.model_rebuild()
 
+TypingStrategy = Literal['human', 'pipelined', 'insert_text']
+
+# Key events in flight at once when typing with the 'pipelined' strategy (3 events per character)
+PIPELINED_KEY_EVENTS_WINDOW = 64
+
 
 class DefaultActionWatchdog(BaseWatchdog):
 	"""Handles default browser actions like click, type, and scroll using CDP."""
@@ -276,11 +282,12 @@ class DefaultActionWatchdog(BaseWatchdog):
 			# Use the provided node
 			element_node = event.node
 			index_for_logging = element_node.backend_node_id or 'unknown'
+			typing_strategy = event.typing_strategy or self.browser_session.browser_profile.typing_strategy
 
 			# Check if this is index 0 or a falsy index - type to the page (whatever has focus)
 			if not element_node.backend_node_id or element_node.backend_node_id == 0:
 				# Type to the page without focusing any specific element
-				await self._type_to_page(event.text)
+				await self._type_to_page(event.text, typing_strategy=typing_strategy)
 				# Log with sensitive data protection
 				if event.is_sensitive:
 					if event.sensitive_key_name:
@@ -298,6 +305,7 @@ class DefaultActionWatchdog(BaseWatchdog):
 						event.text,
 						clear=event.clear or (not event.text),
 						is_sensitive=event.is_sensitive,
+						typing_strategy=typing_strategy,
 					)
 					# Log with sensitive data protection
 					if event.is_sensitive:
@@ -316,7 +324,7 @@ class DefaultActionWatchdog(BaseWatchdog):
 						await asyncio.wait_for(self._click_element_node_impl(element_node), timeout=10.0)
 					except Exception as e:
 						pass
-					await self._type_to_page(event.text)
+					await self._type_to_page(event.text, typing_strategy=typing_strategy)
 					# Log with sensitive data protection
 					if event.is_sensitive:
 						if event.sensitive_key_name:
@@ -853,7 +861,7 @@ class DefaultActionWatchdog(BaseWatchdog):
 				long_term_memory=f'Failed to click at coordinates ({coordinate_x}, {coordinate_y}). The coordinates may be outside viewport or the page may have changed.',
 			)
 
-	async def _type_to_page(self, text: str):
+	async def _type_to_page(self, text: str, typing_strategy: TypingStrategy = 'human'):
 		"""
 		Type text to the page (whatever element currently has focus).
 		This is used when index is 0 or when an element can't be found.
@@ -862,6 +870,10 @@ class DefaultActionWatchdog(BaseWatchdog):
 			# Get CDP client and session
 			cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=None, focus=True)
 
+			if typing_strategy != 'human':
+				await self._type_text_fast(text, cdp_session, typing_strategy)
+				return
+
 			# Type the text character by character to the focused element
 			for char in text:
 				# Handle newline characters as Enter key
@@ -1442,12 +1454,18 @@ class DefaultActionWatchdog(BaseWatchdog):
 			raise
 
 	async def _input_text_element_node_impl(
-		self, element_node: EnhancedDOMTreeNode, text: str, clear: bool = True, is_sensitive: bool = False
+		self,
+		element_node: EnhancedDOMTreeNode,
+		text: str,
+		clear: bool = True,
+		is_sensitive: bool = False,
+		typing_strategy: TypingStrategy = 'human',
 	) -> dict | None:
 		"""
 		Input text into an element using pure CDP with improved focus fallbacks.
 
 		For date/time inputs, uses direct value assignment instead of typing.
+		The 'pipelined' and 'insert_text' strategies type without per-character delays (see `_type_text_fast`).
 		"""
 
 		try:
@@ -1545,9 +1563,14 @@ class DefaultActionWatchdog(BaseWatchdog):
 			if is_sensitive:
 				# Note: sensitive_key_name is not passed to this low-level method,
 				# but we could extend the signature if needed for more granular logging
-				self.logger.debug('🎯 Typing <sensitive> character by character')
+				self.logger.debug(f'🎯 Typing <sensitive> ({typing_strategy})')
 			else:
-				self.logger.debug(f'🎯 Typing text character by character: "{text}"')
+				self.logger.debug(f'🎯 Typing text ({typing_strategy}): "{text}"')
+
+			if typing_strategy != 'human':
+				await self._type_text_fast(text, cdp_session, typing_strategy)
+				await self._trigger_framework_events(object_id=object_id, cdp_session=cdp_session)
+				return input_coordinates
 
 			for i, char in enumerate(text):
 				# Handle newline characters as Enter key
@@ -1646,6 +1669,58 @@ class DefaultActionWatchdog(BaseWatchdog):
 			self.logger.error(f'Failed to input text via CDP: {type(e).__name__}: {e}')
 			raise BrowserError(f'Failed to input text into element: {repr(element_node)}')
 
+	def _get_key_events(self, char: str) -> list[DispatchKeyEventParameters]:
+		"""keyDown/char/keyUp events typing one character, with the same parameters as the human-like element typing."""
+		if char == '\n':
+			enter_key: DispatchKeyEventParameters = {
+				'type': 'keyDown',
+				'key': 'Enter',
+				'code': 'Enter',
+				'windowsVirtualKeyCode': 13,
+			}
+			return [enter_key, {'type': 'char', 'text': '\r', 'key': 'Enter'}, {**enter_key, 'type': 'keyUp'}]
+
+		modifiers, vk_code, base_key = self._get_char_modifiers_and_vk(char)
+		key_down: DispatchKeyEventParameters = {
+			'type': 'keyDown',
+			'key': base_key,
+			'code': self._get_key_code_for_char(base_key),
+			'modifiers': modifiers,
+			'windowsVirtualKeyCode': vk_code,
+		}
+		return [key_down, {'type': 'char', 'text': char, 'key': char}, {**key_down, 'type': 'keyUp'}]
+
+	async def _dispatch_key_events(self, key_events: list[DispatchKeyEventParameters], cdp_session) -> None:
+		"""Send key events without waiting for each response.
+
+		CDP commands are written to the websocket in call order and Chrome handles the input of a page in order, so only
+		windows of PIPELINED_KEY_EVENTS_WINDOW events are awaited, which keeps the number of pending commands bounded.
+		"""
+		for start in range(0, len(key_events), PIPELINED_KEY_EVENTS_WINDOW):
+			await asyncio.gather(
+				*(
+					cdp_session.cdp_client.send.Input.dispatchKeyEvent(params=key_event, session_id=cdp_session.session_id)
+					for key_event in key_events[start : start + PIPELINED_KEY_EVENTS_WINDOW]
+				)
+			)
+
+	async def _type_text_fast(self, text: str, cdp_session, typing_strategy: TypingStrategy) -> None:
+		"""Type text into the focused element without per-character delays.
+
+		'pipelined' sends the usual keyDown/char/keyUp events of every character back to back (see `_dispatch_key_events`).
+		'insert_text' inserts each line at once with Input.insertText, which fires beforeinput/input events but no key
+		events, and presses Enter between lines so forms and multi-line editors still see the line breaks.
+		"""
+		if typing_strategy == 'pipelined':
+			await self._dispatch_key_events([key_event for char in text for key_event in self._get_key_events(char)], cdp_session)
+			return
+
+		for line_number, line in enumerate(text.split('\n')):
+			if line_number:
+				await self._dispatch_key_events(self._get_key_events('\n'), cdp_session)
+			if line:
+				await cdp_session.cdp_client.send.Input.insertText(params={'text': line}, session_id=cdp_session.session_id)
+
 	async def _trigger_framework_events(self, object_id: str, cdp_session) -> None:
 		"""
 		Trigger framework-aware DOM events after text input completion.
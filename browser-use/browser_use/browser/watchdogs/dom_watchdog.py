@@ -4,12 +4,17 @@ import asyncio
 import time
 from typing import TYPE_CHECKING
 
+from cdp_use.cdp.target import TargetID
+from pydantic import PrivateAttr
+
 from browser_use.browser.events import (
 	BrowserErrorEvent,
 	BrowserStateRequestEvent,
 	ScreenshotEvent,
+	TabClosedEvent,
 	TabCreatedEvent,
 )
+from browser_use.browser.screenshots import compute_screenshot_hash, resize_screenshot, run_image_task
 from browser_use.browser.watchdog_base import BaseWatchdog
 from browser_use.dom.service import DomService
 from browser_use.dom.views import (
@@ -20,7 +25,7 @@ from browser_use.observability import observe_debug
 from browser_use.utils import create_task_with_error_handling, time_execution_async
 
 if TYPE_CHECKING:
-	from browser_use.browser.views import BrowserStateSummary, NetworkRequest, PageInfo, PaginationButton
+	from browser_use.browser.views import BrowserStateSummary, PageInfo, PaginationButton, TabInfo
 
 
 class DOMWatchdog(BaseWatchdog):
@@ -31,7 +36,7 @@ class DOMWatchdog(BaseWatchdog):
 	helper methods for other watchdogs.
 	"""
 
-	LISTENS_TO = [TabCreatedEvent, BrowserStateRequestEvent]
+	LISTENS_TO = [TabCreatedEvent, TabClosedEvent, BrowserStateRequestEvent]
 	EMITS = [BrowserErrorEvent]
 
 	# Public properties for other watchdogs
@@ -42,6 +47,10 @@ class DOMWatchdog(BaseWatchdog):
 	# Internal DOM service
 	_dom_service: DomService | None = None
 
+	# Per-target DOM services and last states of get_browser_state_summaries (independent of the agent focus state)
+	_target_dom_services: dict[TargetID, DomService] = PrivateAttr(default_factory=dict)
+	_target_dom_states: dict[TargetID, SerializedDOMState] = PrivateAttr(default_factory=dict)
+
 	# Network tracking - maps request_id to (url, start_time, method, resource_type)
 	_pending_requests: dict[str, tuple[str, float, str, str | None]] = {}
 
@@ -49,6 +58,13 @@ class DOMWatchdog(BaseWatchdog):
 		# self.logger.debug('Setting up init scripts in browser')
 		return None
 
+	async def on_TabClosedEvent(self, event: TabClosedEvent) -> None:
+		"""Drop the per-target DOM service of a closed tab."""
+		dom_service = self._target_dom_services.pop(event.target_id, None)
+		if dom_service:
+			dom_service.reset_incremental_state()
+		self._target_dom_states.pop(event.target_id, None)
+
 	def _get_recent_events_str(self, limit: int = 10) -> str | None:
 		"""Get the most recent events from the event bus as JSON.
 
@@ -88,156 +104,6 @@ class DOMWatchdog(BaseWatchdog):
 
 		return json.dumps([])  # Return empty JSON array on error
 
-	async def _get_pending_network_requests(self) -> list['NetworkRequest']:
-		"""Get list of currently pending network requests.
-
-		Uses document.readyState and performance API to detect pending requests.
-		Filters out ads, tracking, and other noise.
-
-		Returns:
-			List of NetworkRequest objects representing currently loading resources
-		"""
-		from browser_use.browser.views import NetworkRequest
-
-		try:
-			# get_or_create_cdp_session() now handles focus validation automatically
-			cdp_session = await self.browser_session.get_or_create_cdp_session(focus=True)
-
-			# Use performance API to get pending requests
-			js_code = """
-(function() {
-	const now = performance.now();
-	const resources = performance.getEntriesByType('resource');
-	const pending = [];
-
-	// Check document readyState
-	const docLoading = document.readyState !== 'complete';
-
-	// Common ad/tracking domains and patterns to filter out
-	const adDomains = [
-		// Standard ad/tracking networks
-		'doubleclick.net', 'googlesyndication.com', 'googletagmanager.com',
-		'facebook.net', 'analytics', 'ads', 'tracking', 'pixel',
-		'hotjar.com', 'clarity.ms', 'mixpanel.com', 'segment.com',
-		// Analytics platforms
-		'demdex.net', 'omtrdc.net', 'adobedtm.com', 'ensighten.com',
-		'newrelic.com', 'nr-data.net', 'google-analytics.com',
-		// Social media trackers
-		'connect.facebook.net', 'platform.twitter.com', 'platform.linkedin.com',
-		// CDN/image hosts (usually not critical for functionality)
-		'.cloudfront.net/image/', '.akamaized.net/image/',
-		// Common tracking paths
-		'/tracker/', '/collector/', '/beacon/', '/telemetry/', '/log/',
-		'/events/', '/eventBatch', '/track.', '/metrics/'
-	];
-
-	// Get resources that are still loading (responseEnd is 0)
-	let totalResourcesChecked = 0;
-	let filteredByResponseEnd = 0;
-	const allDomains = new Set();
-
-	for (const entry of resources) {
-		totalResourcesChecked++;
-
-		// Track all domains from recent resources (for logging)
-		try {
-			const hostname = new URL(entry.name).hostname;
-			if (hostname) allDomains.add(hostname);
-		} catch (e) {}
-
-		if (entry.responseEnd === 0) {
-			filteredByResponseEnd++;
-			const url = entry.name;
-
-			// Filter out ads and tracking
-			const isAd = adDomains.some(domain => url.includes(domain));
-			if (isAd) continue;
-
-			// Filter out data: URLs and very long URLs (often inline resources)
-			if (url.startsWith('data:') || url.length > 500) continue;
-
-			const loadingDuration = now - entry.startTime;
-
-			// Skip requests that have been loading for >10 seconds (likely stuck/polling)
-			if (loadingDuration > 10000) continue;
-
-			const resourceType = entry.initiatorType || 'unknown';
-
-			// Filter out non-critical resources (images, fonts, icons) if loading >3 seconds
-			const nonCriticalTypes = ['img', 'image', 'icon', 'font'];
-			if (nonCriticalTypes.includes(resourceType) && loadingDuration > 3000) continue;
-
-			// Filter out image URLs even if type is unknown
-			const isImageUrl = /\\.(jpg|jpeg|png|gif|webp|svg|ico)(\\?|$)/i.test(url);
-			if (isImageUrl && loadingDuration > 3000) continue;
-
-			pending.push({
-				url: url,
-				method: 'GET',
-				loading_duration_ms: Math.round(loadingDuration),
-				resource_type: resourceType
-			});
-		}
-	}
-
-	return {
-		pending_requests: pending,
-		document_loading: docLoading,
-		document_ready_state: document.readyState,
-		debug: {
-			total_resources: totalResourcesChecked,
-			with_response_end_zero: filteredByResponseEnd,
-			after_all_filters: pending.length,
-			all_domains: Array.from(allDomains)
-		}
-	};
-})()
-"""
-
-			result = await cdp_session.cdp_client.send.Runtime.evaluate(
-				params={'expression': js_code, 'returnByValue': True}, session_id=cdp_session.session_id
-			)
-
-			if result.get('result', {}).get('type') == 'object':
-				data = result['result'].get('value', {})
-				pending = data.get('pending_requests', [])
-				doc_state = data.get('document_ready_state', 'unknown')
-				doc_loading = data.get('document_loading', False)
-				debug_info = data.get('debug', {})
-
-				# Get all domains that had recent activity (from JS)
-				all_domains = debug_info.get('all_domains', [])
-				all_domains_str = ', '.join(sorted(all_domains)[:5]) if all_domains else 'none'
-				if len(all_domains) > 5:
-					all_domains_str += f' +{len(all_domains) - 5} more'
-
-				# Debug logging
-				self.logger.debug(
-					f'🔍 Network check: document.readyState={doc_state}, loading={doc_loading}, '
-					f'total_resources={debug_info.get("total_resources", 0)}, '
-					f'responseEnd=0: {debug_info.get("with_response_end_zero", 0)}, '
-					f'after_filters={len(pending)}, domains=[{all_domains_str}]'
-				)
-
-				# Convert to NetworkRequest objects
-				network_requests = []
-				for req in pending[:20]:  # Limit to 20 to avoid overwhelming the context
-					network_requests.append(
-						NetworkRequest(
-							url=req['url'],
-							method=req.get('method', 'GET'),
-							loading_duration_ms=req.get('loading_duration_ms', 0.0),
-							resource_type=req.get('resource_type'),
-						)
-					)
-
-				return network_requests
-
-		except Exception as e:
-			self.logger.debug(f'Failed to get pending network requests: {e}')
-
-		return []
-
 	@observe_debug(ignore_input=True, ignore_output=True, name='browser_state_request_event')
 	async def on_BrowserStateRequestEvent(self, event: BrowserStateRequestEvent) -> 'BrowserStateSummary':
 		"""Handle browser state request by coordinating DOM building and screenshot capture.
@@ -263,24 +129,25 @@ class DOMWatchdog(BaseWatchdog):
 		# check if we should skip DOM tree build for pointless pages
 		not_a_meaningful_website = page_url.lower().split(':', 1)[0] not in ('http', 'https')
 
-		# Check for pending network requests BEFORE waiting (so we can see what's loading)
-		pending_requests_before_wait = []
-		if not not_a_meaningful_website:
-			try:
-				pending_requests_before_wait = await self._get_pending_network_requests()
-				if pending_requests_before_wait:
-					self.logger.debug(f'🔍 Found {len(pending_requests_before_wait)} pending requests before stability wait')
-			except Exception as e:
-				self.logger.debug(f'Failed to get pending requests before wait: {e}')
-		pending_requests = pending_requests_before_wait
-		# Wait for page stability using browser profile settings (main branch pattern)
-		if not not_a_meaningful_website:
+		# Wait for page stability: event-driven network idle / DOM quiet tracking, capped by the profile's wait time
+		pending_requests = []
+		network_idle_watchdog = self.browser_session._network_idle_watchdog
+		target_id = self.browser_session.agent_focus_target_id
+		if not not_a_meaningful_website and network_idle_watchdog and target_id:
 			self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: ⏳ Waiting for page stability...')
 			try:
-				if pending_requests_before_wait:
-					# Reduced from 1s to 0.3s for faster DOM builds while still allowing critical resources to load
-					await asyncio.sleep(0.3)
-				self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: ✅ Page stability complete')
+				profile = self.browser_session.browser_profile
+				wait_start = time.time()
+				is_stable = await network_idle_watchdog.wait_for_stable(
+					target_id,
+					quiet_time=profile.network_idle_quiet_time,
+					timeout=profile.wait_for_network_idle_page_load_time,
+				)
+				pending_requests = network_idle_watchdog.get_pending_requests(target_id)
+				self.logger.debug(
+					f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: {"✅ Page stable" if is_stable else "⏱️ Page not stable"} '
+					f'after {time.time() - wait_start:.2f}s, {len(pending_requests)} pending requests'
+				)
 			except Exception as e:
 				self.logger.warning(
 					f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Network waiting failed: {e}, continuing anyway...'
@@ -317,20 +184,7 @@ class DOMWatchdog(BaseWatchdog):
 					page_info = await self._get_page_info()
 				except Exception as e:
 					self.logger.debug(f'Failed to get page info from CDP for empty page: {e}, using fallback')
-					# Use default viewport dimensions
-					viewport = self.browser_session.browser_profile.viewport or {'width': 1280, 'height': 720}
-					page_info = PageInfo(
-						viewport_width=viewport['width'],
-						viewport_height=viewport['height'],
-						page_width=viewport['width'],
-						page_height=viewport['height'],
-						scroll_x=0,
-						scroll_y=0,
-						pixels_above=0,
-						pixels_below=0,
-						pixels_left=0,
-						pixels_right=0,
-					)
+					page_info = self._get_fallback_page_info()
 
 				return BrowserStateSummary(
 					dom_state=content,
@@ -402,6 +256,11 @@ class DOMWatchdog(BaseWatchdog):
 					self.logger.warning(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Clean screenshot failed: {e}')
 					screenshot_b64 = None
 
+			# Hash the screenshot and resize the LLM copy in the worker pool while the rest of the page info is collected
+			screenshot_processing_task = None
+			if screenshot_b64 and (self.browser_session.hash_screenshots or self.browser_session.llm_screenshot_size):
+				screenshot_processing_task = asyncio.create_task(self._process_screenshot(screenshot_b64))
+
 			# Add browser-side highlights for user visibility
 			if content and content.selector_map and self.browser_session.browser_profile.dom_highlight_elements:
 				try:
@@ -437,20 +296,7 @@ class DOMWatchdog(BaseWatchdog):
 				self.logger.debug(
 					f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Failed to get page info from CDP: {e}, using fallback'
 				)
-				# Fallback to default viewport dimensions
-				viewport = self.browser_session.browser_profile.viewport or {'width': 1280, 'height': 720}
-				page_info = PageInfo(
-					viewport_width=viewport['width'],
-					viewport_height=viewport['height'],
-					page_width=viewport['width'],
-					page_height=viewport['height'],
-					scroll_x=0,
-					scroll_y=0,
-					pixels_above=0,
-					pixels_below=0,
-					pixels_left=0,
-					pixels_right=0,
-				)
+				page_info = self._get_fallback_page_info()
 
 			# Check for PDF viewer
 			is_pdf_viewer = page_url.endswith('.pdf') or '/pdf/' in page_url
@@ -470,12 +316,18 @@ class DOMWatchdog(BaseWatchdog):
 					'🔍 DOMWatchdog.on_BrowserStateRequestEvent: 📸 Creating BrowserStateSummary WITHOUT screenshot'
 				)
 
+			screenshot_hash, llm_screenshot = (None, None)
+			if screenshot_processing_task:
+				screenshot_hash, llm_screenshot = await screenshot_processing_task
+
 			browser_state = BrowserStateSummary(
 				dom_state=content,
 				url=page_url,
 				title=title,
 				tabs=tabs_info,
 				screenshot=screenshot_b64,
+				llm_screenshot=llm_screenshot,
+				screenshot_hash=screenshot_hash,
 				page_info=page_info,
 				pixels_above=0,
 				pixels_below=0,
@@ -531,6 +383,184 @@ class DOMWatchdog(BaseWatchdog):
 				else [],
 			)
 
+	def _create_dom_service(self) -> DomService:
+		profile = self.browser_session.browser_profile
+		return DomService(
+			browser_session=self.browser_session,
+			logger=self.logger,
+			cross_origin_iframes=profile.cross_origin_iframes,
+			paint_order_filtering=profile.paint_order_filtering,
+			paint_order_engine=profile.paint_order_engine,
+			serializer_pipeline=profile.dom_serializer_pipeline,
+			max_iframes=profile.max_iframes,
+			max_iframe_depth=profile.max_iframe_depth,
+			max_concurrent_iframes=profile.max_concurrent_iframes,
+			incremental_dom=profile.incremental_dom,
+			incremental_dom_max_dirty_ratio=profile.incremental_dom_max_dirty_ratio,
+			capture_scope=profile.dom_capture_scope,
+			viewport_margin=profile.dom_viewport_margin,
+		)
+
+	# ========== Multi-tab state capture ==========
+
+	async def get_browser_state_summaries(
+		self, target_ids: list[TargetID], include_screenshot: bool = True
+	) -> dict[TargetID, 'BrowserStateSummary']:
+		"""Capture the state (DOM + screenshot) of several tabs concurrently, without switching the agent focus.
+
+		Every target gets its own DomService (kept between calls, so incremental DOM updates apply per tab) and its own
+		selector map. Nothing is highlighted and the agent's cached state and selector map are left untouched.
+		"""
+		tabs_info = await self.browser_session.get_tabs()
+		summaries = await asyncio.gather(
+			*(self._capture_target_state(target_id, tabs_info, include_screenshot) for target_id in target_ids)
+		)
+		return dict(zip(target_ids, summaries))
+
+	async def _capture_target_state(
+		self, target_id: TargetID, tabs_info: list['TabInfo'], include_screenshot: bool
+	) -> 'BrowserStateSummary':
+		from browser_use.browser.views import BrowserStateSummary
+
+		target = self.browser_session.session_manager.get_target(target_id)
+		page_url = target.url if target else ''
+		title = target.title if target else ''
+
+		if page_url.lower().split(':', 1)[0] not in ('http', 'https'):
+			return BrowserStateSummary(
+				dom_state=SerializedDOMState(_root=None, selector_map={}),
+				url=page_url,
+				title='Empty Tab',
+				tabs=tabs_info,
+				page_info=self._get_fallback_page_info(),
+			)
+
+		# Wait for this page to settle, all targets wait concurrently
+		pending_requests = []
+		network_idle_watchdog = self.browser_session._network_idle_watchdog
+		if network_idle_watchdog:
+			profile = self.browser_session.browser_profile
+			try:
+				await network_idle_watchdog.wait_for_stable(
+					target_id,
+					quiet_time=profile.network_idle_quiet_time,
+					timeout=profile.wait_for_network_idle_page_load_time,
+				)
+				pending_requests = network_idle_watchdog.get_pending_requests(target_id)
+			except Exception as e:
+				self.logger.debug(f'🔍 DOMWatchdog._capture_target_state: Network waiting failed for {target_id[-4:]}: {e}')
+
+		screenshot_watchdog = self.browser_session._screenshot_watchdog
+		dom_result, screenshot_result, page_info_result = await asyncio.gather(
+			self._build_target_dom_state(target_id),
+			self._capture_target_screenshot(target_id) if include_screenshot and screenshot_watchdog else asyncio.sleep(0),
+			asyncio.wait_for(self._get_page_info(target_id), timeout=1.0),
+			return_exceptions=True,
+		)
+
+		browser_errors = []
+		if isinstance(dom_result, BaseException):
+			self.logger.warning(f'🔍 DOMWatchdog._capture_target_state: DOM build failed for {target_id[-4:]}: {dom_result}')
+			browser_errors.append(f'DOM build failed: {dom_result}')
+			dom_state = SerializedDOMState(_root=None, selector_map={})
+		else:
+			dom_state = dom_result
+
+		screenshot_b64 = screenshot_result if isinstance(screenshot_result, str) else None
+		if isinstance(screenshot_result, BaseException):
+			self.logger.warning(
+				f'🔍 DOMWatchdog._capture_target_state: Screenshot failed for {target_id[-4:]}: {screenshot_result}'
+			)
+		elif include_screenshot and screenshot_watchdog and screenshot_b64 is None:
+			self.logger.debug(f'🔍 DOMWatchdog._capture_target_state: Skipped screenshot of background tab {target_id[-4:]}')
+		screenshot_hash, llm_screenshot = await self._process_screenshot(screenshot_b64) if screenshot_b64 else (None, None)
+
+		page_info = page_info_result if not isinstance(page_info_result, BaseException) else self._get_fallback_page_info()
+
+		return BrowserStateSummary(
+			dom_state=dom_state,
+			url=page_url,
+			title=title,
+			tabs=tabs_info,
+			screenshot=screenshot_b64,
+			llm_screenshot=llm_screenshot,
+			screenshot_hash=screenshot_hash,
+			page_info=page_info,
+			browser_errors=browser_errors,
+			is_pdf_viewer=page_url.endswith('.pdf') or '/pdf/' in page_url,
+			pending_network_requests=pending_requests,
+			pagination_buttons=self._detect_pagination_buttons(dom_state.selector_map) if dom_state.selector_map else [],
+		)
+
+	async def _process_screenshot(self, screenshot_b64: str) -> tuple[int | None, str | None]:
+		"""Hash a screenshot (with hash_screenshots) and resize a copy of it to llm_screenshot_size, in the screenshot worker pool.
+
+		The screenshot itself keeps the viewport size, it is what gets stored, replayed in GIFs and synced.
+		"""
+		llm_screenshot_size = self.browser_session.llm_screenshot_size
+		hash_result, llm_screenshot_result = await asyncio.gather(
+			run_image_task(compute_screenshot_hash, screenshot_b64) if self.browser_session.hash_screenshots else asyncio.sleep(0),
+			run_image_task(resize_screenshot, screenshot_b64, llm_screenshot_size) if llm_screenshot_size else asyncio.sleep(0),
+			return_exceptions=True,
+		)
+		if isinstance(hash_result, BaseException):
+			self.logger.debug(f'🔍 DOMWatchdog._process_screenshot: Screenshot hash failed: {hash_result}')
+		if isinstance(llm_screenshot_result, BaseException):
+			# The prompt resizes the screenshot itself then
+			self.logger.debug(f'🔍 DOMWatchdog._process_screenshot: Resizing the LLM screenshot failed: {llm_screenshot_result}')
+		return (
+			hash_result if isinstance(hash_result, int) else None,
+			llm_screenshot_result if isinstance(llm_screenshot_result, str) else None,
+		)
+
+	async def _build_target_dom_state(self, target_id: TargetID) -> SerializedDOMState:
+		"""Serialize the DOM of a target with its own DomService (isolated from the agent focus DOM state)."""
+		dom_service = self._target_dom_services.get(target_id)
+		if dom_service is None:
+			dom_service = self._target_dom_services[target_id] = self._create_dom_service()
+		dom_state, _, _ = await dom_service.get_serialized_dom_tree(
+			previous_cached_state=self._target_dom_states.get(target_id), target_id=target_id
+		)
+		self._target_dom_states[target_id] = dom_state
+		return dom_state
+
+	async def _capture_target_screenshot(self, target_id: TargetID) -> str | None:
+		"""Screenshot a target in the configured format without focusing it.
+
+		A headful browser doesn't render background tabs, capturing one would stall until the timeout: None is returned
+		for them instead.
+		"""
+		profile = self.browser_session.browser_profile
+		screenshot_watchdog = self.browser_session._screenshot_watchdog
+		assert screenshot_watchdog is not None
+		if not profile.headless and await self._is_target_hidden(target_id):
+			return None
+		return await asyncio.wait_for(
+			screenshot_watchdog.capture_screenshot(
+				target_id,
+				format=profile.screenshot_format,
+				quality=profile.screenshot_quality,
+				focus=False,
+			),
+			timeout=10.0,
+		)
+
+	async def _is_target_hidden(self, target_id: TargetID) -> bool:
+		"""Whether the page of a target is not visible (document.visibilityState), False if that can't be determined."""
+		try:
+			cdp_session = await self.browser_session.get_or_create_cdp_session(target_id, focus=False)
+			result = await asyncio.wait_for(
+				cdp_session.cdp_client.send.Runtime.evaluate(
+					params={'expression': 'document.visibilityState', 'returnByValue': True},
+					session_id=cdp_session.session_id,
+				),
+				timeout=1.0,
+			)
+		except Exception as e:
+			self.logger.debug(f'🔍 DOMWatchdog._is_target_hidden: Visibility check failed for {target_id[-4:]}: {e}')
+			return False
+		return result.get('result', {}).get('value') == 'hidden'
+
 	@time_execution_async('build_dom_tree_without_highlights')
 	@observe_debug(ignore_input=True, ignore_output=True, name='build_dom_tree_without_highlights')
 	async def _build_dom_tree_without_highlights(self, previous_state: SerializedDOMState | None = None) -> SerializedDOMState:
@@ -540,14 +570,7 @@ class DOMWatchdog(BaseWatchdog):
 
 			# Create or reuse DOM service
 			if self._dom_service is None:
-				self._dom_service = DomService(
-					browser_session=self.browser_session,
-					logger=self.logger,
-					cross_origin_iframes=self.browser_session.browser_profile.cross_origin_iframes,
-					paint_order_filtering=self.browser_session.browser_profile.paint_order_filtering,
-					max_iframes=self.browser_session.browser_profile.max_iframes,
-					max_iframe_depth=self.browser_session.browser_profile.max_iframe_depth,
-				)
+				self._dom_service = self._create_dom_service()
 
 			# Get serialized DOM tree using the service
 			self.logger.debug('🔍 DOMWatchdog._build_dom_tree_without_highlights: Calling DomService.get_serialized_dom_tree...')
@@ -578,6 +601,11 @@ class DOMWatchdog(BaseWatchdog):
 				if snapshot_proc_ms > 0.01:
 					timing_lines.append(f'  │  └─ snapshot_processing: {snapshot_proc_ms:.2f}ms')
 
+			# incremental refresh (replaces get_all_trees and tree construction when the cached tree could be patched)
+			incremental_ms = timing_info.get('incremental_refresh_ms', 0)
+			if incremental_ms > 0:
+				timing_lines.append(f'  ├─ incremental_refresh: {incremental_ms:.2f}ms')
+
 			# build_ax_lookup
 			build_ax_ms = timing_info.get('build_ax_lookup_ms', 0)
 			if build_ax_ms > 0.01:
@@ -592,6 +620,15 @@ class DOMWatchdog(BaseWatchdog):
 			construct_tree_ms = timing_info.get('construct_enhanced_tree_ms', 0)
 			if construct_tree_ms > 0.01:
 				timing_lines.append(f'  ├─ construct_enhanced_tree: {construct_tree_ms:.2f}ms')
+				build_nodes_ms = timing_info.get('build_tree_nodes_ms', 0)
+				cross_origin_ms = timing_info.get('cross_origin_iframes_ms', 0)
+				if cross_origin_ms > 0.01:
+					timing_lines.append(f'  │  ├─ build_tree_nodes: {build_nodes_ms:.2f}ms')
+					timing_lines.append(f'  │  └─ cross_origin_iframes: {cross_origin_ms:.2f}ms')
+					# Per-frame fetch times (fetched concurrently, so they overlap)
+					for key, frame_ms in timing_info.items():
+						if key.startswith('cross_origin_iframe['):
+							timing_lines.append(f'  │     ├─ {key[: -len("_ms")]}: {frame_ms:.2f}ms')
 
 			# serialize_accessible_elements breakdown
 			serialize_total_ms = timing_info.get('serialize_accessible_elements_total_ms', 0)
@@ -686,7 +723,11 @@ class DOMWatchdog(BaseWatchdog):
 			handler_names = [getattr(h, '__name__', str(h)) for h in handlers]
 			self.logger.debug(f'📸 ScreenshotEvent handlers registered: {len(handlers)} - {handler_names}')
 
-			screenshot_event = self.event_bus.dispatch(ScreenshotEvent(full_page=False))
+			# Capture in the configured format at the viewport size, the LLM copy is resized from it separately
+			profile = self.browser_session.browser_profile
+			screenshot_event = self.event_bus.dispatch(
+				ScreenshotEvent(full_page=False, format=profile.screenshot_format, quality=profile.screenshot_quality)
+			)
 			self.logger.debug('📸 Dispatched ScreenshotEvent, waiting for event to complete...')
 
 			# Wait for the event itself to complete (this waits for all handlers)
@@ -741,11 +782,32 @@ class DOMWatchdog(BaseWatchdog):
 
 		return pagination_buttons_data
 
-	async def _get_page_info(self) -> 'PageInfo':
+	def _get_fallback_page_info(self) -> 'PageInfo':
+		"""PageInfo from the profile's viewport (or 1280x720), for when CDP can't provide it."""
+		from browser_use.browser.views import PageInfo
+
+		viewport = self.browser_session.browser_profile.viewport or {'width': 1280, 'height': 720}
+		return PageInfo(
+			viewport_width=viewport['width'],
+			viewport_height=viewport['height'],
+			page_width=viewport['width'],
+			page_height=viewport['height'],
+			scroll_x=0,
+			scroll_y=0,
+			pixels_above=0,
+			pixels_below=0,
+			pixels_left=0,
+			pixels_right=0,
+		)
+
+	async def _get_page_info(self, target_id: TargetID | None = None) -> 'PageInfo':
 		"""Get comprehensive page information using a single CDP call.
 
 		TODO: should we make this an event as well?
 
+		Args:
+			target_id: Page to inspect without focusing it, defaults to the current agent focus.
+
 		Returns:
 			PageInfo with all viewport, page dimensions, and scroll information
 		"""
@@ -754,7 +816,7 @@ class DOMWatchdog(BaseWatchdog):
 
 		# get_or_create_cdp_session() handles focus validation automatically
 		cdp_session = await self.browser_session.get_or_create_cdp_session(
-			target_id=self.browser_session.agent_focus_target_id, focus=True
+			target_id=target_id or self.browser_session.agent_focus_target_id, focus=target_id is None
 		)
 
 		# Get layout metrics which includes all the information we need
@@ -835,6 +897,8 @@ class DOMWatchdog(BaseWatchdog):
 		self.current_dom_state = None
 		self.enhanced_dom_tree = None
 		# Keep the DOM service instance to reuse its CDP client connection
+		if self._dom_service:
+			self._dom_service.reset_incremental_state()
 
 	def is_file_input(self, element: EnhancedDOMTreeNode) -> bool:
 		"""Check if element is a file input."""
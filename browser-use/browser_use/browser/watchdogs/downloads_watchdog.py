@@ -1,9 +1,11 @@
 """Downloads watchdog for monitoring and handling file downloads."""
 
 import asyncio
+import base64
 import json
 import os
 import tempfile
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
 from urllib.parse import urlparse
@@ -28,7 +30,13 @@ from browser_use.browser.watchdog_base import BaseWatchdog
 from browser_use.utils import create_task_with_error_handling
 
 if TYPE_CHECKING:
-	pass
+	from browser_use.browser.session import CDPSession
+
+# Streaming downloads: bytes per IO.read call (base64 in the CDP message), and how long one chunk may take
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_CHUNK_TIMEOUT = 30.0
+DOWNLOAD_PROGRESS_LOG_INTERVAL = 10 * 1024 * 1024
+MAX_CONCURRENT_DOWNLOADS = 4
 
 
 class DownloadsWatchdog(BaseWatchdog):
@@ -62,6 +70,8 @@ class DownloadsWatchdog(BaseWatchdog):
 	_network_monitored_targets: set[str] = PrivateAttr(default_factory=set)  # Track targets with network monitoring enabled
 	_detected_downloads: set[str] = PrivateAttr(default_factory=set)  # Track detected download URLs to avoid duplicates
 	_network_callback_registered: bool = PrivateAttr(default=False)  # Track if global network callback is registered
+	_in_flight_downloads: dict[str, asyncio.Task[str | None]] = PrivateAttr(default_factory=dict)  # URL -> download task
+	_download_semaphore: asyncio.Semaphore = PrivateAttr(default_factory=lambda: asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS))
 
 	async def on_BrowserLaunchEvent(self, event: BrowserLaunchEvent) -> None:
 		self.logger.debug(f'[DownloadsWatchdog] Received BrowserLaunchEvent, EventBus ID: {id(self.event_bus)}')
@@ -191,6 +201,7 @@ class DownloadsWatchdog(BaseWatchdog):
 					'url': event.get('url', ''),
 					'suggested_filename': suggested_filename,
 					'handled': False,
+					'started_at': time.monotonic(),
 				}
 			except (AssertionError, KeyError):
 				pass
@@ -214,7 +225,8 @@ class DownloadsWatchdog(BaseWatchdog):
 					if file_path:
 						self.logger.debug(f'[DownloadsWatchdog] Download completed: {file_path}')
 						# Track the download
-						self._track_download(file_path)
+						started_at = self._cdp_downloads_info.get(guid, {}).get('started_at')
+						self._track_download(file_path, duration=time.monotonic() - started_at if started_at else None)
 						# Mark as handled to prevent fallback duplicate dispatch
 						try:
 							if guid in self._cdp_downloads_info:
@@ -235,13 +247,17 @@ class DownloadsWatchdog(BaseWatchdog):
 						effective_path = file_path or str(Path(downloads_path) / suggested_filename)
 						file_name = Path(effective_path).name
 						file_ext = Path(file_name).suffix.lower().lstrip('.')
+						file_size = int(event.get('receivedBytes', 0))
+						duration = time.monotonic() - info['started_at'] if 'started_at' in info else None
 						self.event_bus.dispatch(
 							FileDownloadedEvent(
 								url=info.get('url', ''),
 								path=str(effective_path),
 								file_name=file_name,
-								file_size=0,
+								file_size=file_size,
 								file_type=file_ext if file_ext else None,
+								duration_ms=duration * 1000 if duration is not None else None,
+								throughput_bytes_per_second=file_size / duration if duration and file_size else None,
 							)
 						)
 						self.logger.debug(f'[DownloadsWatchdog] ✅ (remote) Download completed: {effective_path}')
@@ -490,6 +506,9 @@ class DownloadsWatchdog(BaseWatchdog):
 	) -> str | None:
 		"""Generic method to download any file from a URL.
 
+		The file is streamed to disk through CDP (Network.loadNetworkResource + IO.read) with the page's cookies, so memory
+		stays bounded by the chunk size. Concurrent calls for the same URL share one download.
+
 		Args:
 			url: The URL to download
 			target_id: The target ID for CDP session
@@ -509,131 +528,224 @@ class DownloadsWatchdog(BaseWatchdog):
 			self.logger.debug(f'[DownloadsWatchdog] File already downloaded in session: {existing_path}')
 			return existing_path
 
+		# Join a download of the same URL that is already running
+		task = self._in_flight_downloads.get(url)
+		if task is not None:
+			self.logger.debug(f'[DownloadsWatchdog] Download already in progress, waiting for it: {url[:100]}')
+		else:
+			task = asyncio.create_task(self._download_file(url, target_id, content_type, suggested_filename))
+			self._in_flight_downloads[url] = task
+			task.add_done_callback(lambda _: self._in_flight_downloads.pop(url, None))
+		# Shielded, so a cancelled caller doesn't cancel the download the other callers are waiting for
+		return await asyncio.shield(task)
+
+	async def _download_file(
+		self, url: str, target_id: TargetID, content_type: str | None, suggested_filename: str | None
+	) -> str | None:
+		"""Download a URL into the downloads directory and dispatch FileDownloadedEvent (see download_file_from_url)."""
+		download_path: Path | None = None
 		try:
-			# Get or create CDP session for this target
-			temp_session = await self.browser_session.get_or_create_cdp_session(target_id, focus=False)
+			async with self._download_semaphore:
+				# Get or create CDP session for this target
+				temp_session = await self.browser_session.get_or_create_cdp_session(target_id, focus=False)
 
-			# Determine filename
-			if suggested_filename:
-				filename = suggested_filename
-			else:
-				# Extract from URL
-				filename = os.path.basename(url.split('?')[0])  # Remove query params
-				if not filename or '.' not in filename:
-					# Fallback: use content type to determine extension
-					if content_type and 'pdf' in content_type:
-						filename = 'document.pdf'
-					else:
-						filename = 'download'
-
-			# Ensure downloads directory exists
-			downloads_dir = str(self.browser_session.browser_profile.downloads_path)
-			os.makedirs(downloads_dir, exist_ok=True)
+				# Determine filename
+				if suggested_filename:
+					filename = suggested_filename
+				else:
+					# Extract from URL
+					filename = os.path.basename(url.split('?')[0])  # Remove query params
+					if not filename or '.' not in filename:
+						# Fallback: use content type to determine extension
+						if content_type and 'pdf' in content_type:
+							filename = 'document.pdf'
+						else:
+							filename = 'download'
+
+				# Claim a unique file name (atomically, so concurrent downloads never pick the same one)
+				downloads_path = self.browser_session.browser_profile.downloads_path
+				assert downloads_path, 'Downloads path must be configured'
+				downloads_dir = Path(downloads_path).expanduser()
+				download_path = self._create_unique_file(downloads_dir, filename)
+				if download_path.name != filename:
+					self.logger.debug(f'[DownloadsWatchdog] File exists, using: {download_path.name}')
+
+				self.logger.debug(f'[DownloadsWatchdog] Downloading from: {url[:100]}...')
+				started_at = time.monotonic()
+				try:
+					file_size, response_content_type, from_cache = await self._stream_url_to_file(temp_session, url, download_path)
+				except Exception as e:
+					# e.g. Network.loadNetworkResource is unavailable for this target, fetch in the page instead
+					self.logger.debug(f'[DownloadsWatchdog] Streaming download failed ({type(e).__name__}: {e}), using page fetch')
+					file_size, response_content_type, from_cache = await self._fetch_url_to_file(temp_session, url, download_path)
+				duration = time.monotonic() - started_at
+
+			if file_size == 0:
+				self.logger.warning(f'[DownloadsWatchdog] No data received when downloading from {url}')
+				download_path.unlink(missing_ok=True)
+				return None
 
-			# Generate unique filename if file exists
-			final_filename = filename
-			existing_files = os.listdir(downloads_dir)
-			if filename in existing_files:
-				base, ext = os.path.splitext(filename)
-				counter = 1
-				while f'{base} ({counter}){ext}' in existing_files:
-					counter += 1
-				final_filename = f'{base} ({counter}){ext}'
-				self.logger.debug(f'[DownloadsWatchdog] File exists, using: {final_filename}')
+			throughput = file_size / duration if duration > 0 else None
+			self.logger.debug(
+				f'[DownloadsWatchdog] File written: {download_path} ({file_size:,} bytes in {duration:.2f}s'
+				+ (f', {throughput / 1024 / 1024:.1f} MB/s)' if throughput else ')')
+			)
 
-			self.logger.debug(f'[DownloadsWatchdog] Downloading from: {url[:100]}...')
+			# Determine file type
+			file_ext = download_path.suffix.lower().lstrip('.')
+			mime_type = content_type or response_content_type or f'application/{file_ext}'
 
-			# Download using JavaScript fetch to leverage browser cache
-			escaped_url = json.dumps(url)
+			# Store URL->path mapping for this session
+			self._session_pdf_urls[url] = str(download_path)
 
-			result = await asyncio.wait_for(
-				temp_session.cdp_client.send.Runtime.evaluate(
-					params={
-						'expression': f"""
-				(async () => {{
-					try {{
-						const response = await fetch({escaped_url}, {{
-							cache: 'force-cache'
-						}});
-						if (!response.ok) {{
-							throw new Error(`HTTP error! status: ${{response.status}}`);
-						}}
-						const blob = await response.blob();
-						const arrayBuffer = await blob.arrayBuffer();
-						const uint8Array = new Uint8Array(arrayBuffer);
-
-						return {{
-							data: Array.from(uint8Array),
-							responseSize: uint8Array.length
-						}};
-					}} catch (error) {{
-						throw new Error(`Fetch failed: ${{error.message}}`);
-					}}
-				}})()
-				""",
-						'awaitPromise': True,
-						'returnByValue': True,
-					},
-					session_id=temp_session.session_id,
-				),
-				timeout=15.0,  # 15 second timeout
+			# Emit file downloaded event
+			self.logger.debug(f'[DownloadsWatchdog] Dispatching FileDownloadedEvent for {download_path.name}')
+			self.event_bus.dispatch(
+				FileDownloadedEvent(
+					url=url,
+					path=str(download_path),
+					file_name=download_path.name,
+					file_size=file_size,
+					file_type=file_ext if file_ext else None,
+					mime_type=mime_type,
+					from_cache=from_cache,
+					auto_download=True,
+					duration_ms=duration * 1000,
+					throughput_bytes_per_second=throughput,
+				)
 			)
-
-			download_result = result.get('result', {}).get('value', {})
-
-			if download_result and download_result.get('data') and len(download_result['data']) > 0:
-				download_path = os.path.join(downloads_dir, final_filename)
-
-				# Save the file asynchronously
-				async with await anyio.open_file(download_path, 'wb') as f:
-					await f.write(bytes(download_result['data']))
-
-				# Verify file was written successfully
-				if os.path.exists(download_path):
-					actual_size = os.path.getsize(download_path)
-					self.logger.debug(f'[DownloadsWatchdog] File written: {download_path} ({actual_size} bytes)')
-
-					# Determine file type
-					file_ext = Path(final_filename).suffix.lower().lstrip('.')
-					mime_type = content_type or f'application/{file_ext}'
-
-					# Store URL->path mapping for this session
-					self._session_pdf_urls[url] = download_path
-
-					# Emit file downloaded event
-					self.logger.debug(f'[DownloadsWatchdog] Dispatching FileDownloadedEvent for {final_filename}')
-					self.event_bus.dispatch(
-						FileDownloadedEvent(
-							url=url,
-							path=download_path,
-							file_name=final_filename,
-							file_size=actual_size,
-							file_type=file_ext if file_ext else None,
-							mime_type=mime_type,
-							auto_download=True,
-						)
-					)
-
-					return download_path
-				else:
-					self.logger.error(f'[DownloadsWatchdog] Failed to write file: {download_path}')
-					return None
-			else:
-				self.logger.warning(f'[DownloadsWatchdog] No data received when downloading from {url}')
-				return None
+			return str(download_path)
 
 		except TimeoutError:
 			self.logger.warning(f'[DownloadsWatchdog] Download timed out: {url[:80]}...')
-			return None
 		except Exception as e:
 			self.logger.warning(f'[DownloadsWatchdog] Download failed: {type(e).__name__}: {e}')
-			return None
+		if download_path is not None:
+			download_path.unlink(missing_ok=True)
+		return None
 
-	def _track_download(self, file_path: str) -> None:
+	@staticmethod
+	def _create_unique_file(directory: Path, filename: str) -> Path:
+		"""Create an empty file named `filename` in `directory`, appending (1), (2), etc. if the name is taken."""
+		directory.mkdir(parents=True, exist_ok=True)
+		base, ext = os.path.splitext(filename)
+		counter = 0
+		while True:
+			path = directory / (f'{base} ({counter}){ext}' if counter else filename)
+			try:
+				# O_EXCL makes the existence check and the creation one atomic step
+				os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+				return path
+			except FileExistsError:
+				counter += 1
+
+	async def _stream_url_to_file(self, cdp_session: 'CDPSession', url: str, path: Path) -> tuple[int, str | None, bool]:
+		"""Stream a URL to `path` with Network.loadNetworkResource + IO.read (the page's cookies and HTTP cache apply).
+
+		Returns (bytes written, response content type, whether the response came from the HTTP cache).
+		"""
+		cdp_client = cdp_session.cdp_client
+		frame_tree = await cdp_client.send.Page.getFrameTree(session_id=cdp_session.session_id)
+		result = await asyncio.wait_for(
+			cdp_client.send.Network.loadNetworkResource(
+				params={
+					'frameId': frame_tree['frameTree']['frame']['id'],
+					'url': url,
+					'options': {'disableCache': False, 'includeCredentials': True},
+				},
+				session_id=cdp_session.session_id,
+			),
+			timeout=15.0,
+		)
+		resource = result['resource']
+		stream = resource.get('stream')
+		status = int(resource.get('httpStatusCode') or 0)
+		if not resource.get('success') or not stream or status >= 400:
+			if stream:
+				await cdp_client.send.IO.close(params={'handle': stream}, session_id=cdp_session.session_id)
+			raise RuntimeError(f'Loading failed: {resource.get("netErrorName") or f"HTTP error! status: {status}"}')
+
+		headers = {name.lower(): value for name, value in (resource.get('headers') or {}).items()}
+		file_size = 0
+		next_progress_log = DOWNLOAD_PROGRESS_LOG_INTERVAL
+		try:
+			async with await anyio.open_file(path, 'wb') as f:
+				while True:
+					chunk = await asyncio.wait_for(
+						cdp_client.send.IO.read(
+							params={'handle': stream, 'size': DOWNLOAD_CHUNK_SIZE}, session_id=cdp_session.session_id
+						),
+						timeout=DOWNLOAD_CHUNK_TIMEOUT,
+					)
+					data = base64.b64decode(chunk['data']) if chunk.get('base64Encoded') else chunk['data'].encode()
+					if data:
+						await f.write(data)
+						file_size += len(data)
+					if file_size >= next_progress_log:
+						self.logger.debug(f'[DownloadsWatchdog] Downloading {path.name}: {file_size / 1024 / 1024:.0f} MB received')
+						next_progress_log += DOWNLOAD_PROGRESS_LOG_INTERVAL
+					if chunk.get('eof'):
+						break
+		finally:
+			try:
+				await cdp_client.send.IO.close(params={'handle': stream}, session_id=cdp_session.session_id)
+			except Exception:
+				pass
+
+		# Same heuristic as the page fetch: cached responses carry an Age header or lack a Date header
+		from_cache = 'age' in headers or 'date' not in headers
+		return file_size, headers.get('content-type'), from_cache
+
+	async def _fetch_url_to_file(self, cdp_session: 'CDPSession', url: str, path: Path) -> tuple[int, str | None, bool]:
+		"""Fallback download with fetch() in the page, the body is returned base64-encoded in one piece."""
+		escaped_url = json.dumps(url)
+		result = await asyncio.wait_for(
+			cdp_session.cdp_client.send.Runtime.evaluate(
+				params={
+					'expression': f"""
+				(async () => {{
+					const response = await fetch({escaped_url}, {{
+						cache: 'force-cache'
+					}});
+					if (!response.ok) {{
+						throw new Error(`HTTP error! status: ${{response.status}}`);
+					}}
+					const blob = await response.blob();
+					const dataUrl = await new Promise((resolve, reject) => {{
+						const reader = new FileReader();
+						reader.onload = () => resolve(reader.result);
+						reader.onerror = () => reject(reader.error);
+						reader.readAsDataURL(blob);
+					}});
+					return {{
+						data: dataUrl.slice(dataUrl.indexOf(',') + 1),
+						contentType: response.headers.get('content-type'),
+						fromCache: response.headers.has('age') || !response.headers.has('date')
+					}};
+				}})()
+				""",
+					'awaitPromise': True,
+					'returnByValue': True,
+				},
+				session_id=cdp_session.session_id,
+			),
+			timeout=15.0,  # 15 second timeout
+		)
+		if 'exceptionDetails' in result:
+			raise RuntimeError(f'Fetch failed: {result["exceptionDetails"].get("exception", {}).get("description", "")}')
+
+		download_result = result.get('result', {}).get('value') or {}
+		data = base64.b64decode(download_result.get('data') or '')
+		async with await anyio.open_file(path, 'wb') as f:
+			await f.write(data)
+		return len(data), download_result.get('contentType'), bool(download_result.get('fromCache'))
+
+	def _track_download(self, file_path: str, duration: float | None = None) -> None:
 		"""Track a completed download and dispatch the appropriate event.
 
 		Args:
 			file_path: The path to the downloaded file
+			duration: Seconds from downloadWillBegin to completion, if known
 		"""
 		try:
 			# Get file info
@@ -651,6 +763,8 @@ class DownloadsWatchdog(BaseWatchdog):
 						path=str(path),
 						file_name=path.name,
 						file_size=file_size,
+						duration_ms=duration * 1000 if duration is not None else None,
+						throughput_bytes_per_second=file_size / duration if duration and file_size else None,
 					)
 				)
 			else:
@@ -1162,122 +1276,10 @@ class DownloadsWatchdog(BaseWatchdog):
 				self.logger.debug(f'[DownloadsWatchdog] PDF already downloaded in session: {existing_path}')
 				return existing_path
 
-			# Generate unique filename if file exists from previous run
-			downloads_dir = str(self.browser_session.browser_profile.downloads_path)
-			os.makedirs(downloads_dir, exist_ok=True)
-			final_filename = pdf_filename
-			existing_files = os.listdir(downloads_dir)
-			if pdf_filename in existing_files:
-				# Generate unique name with (1), (2), etc.
-				base, ext = os.path.splitext(pdf_filename)
-				counter = 1
-				while f'{base} ({counter}){ext}' in existing_files:
-					counter += 1
-				final_filename = f'{base} ({counter}){ext}'
-				self.logger.debug(f'[DownloadsWatchdog] File exists, using: {final_filename}')
-
-			self.logger.debug(f'[DownloadsWatchdog] Starting PDF download from: {pdf_url[:100]}...')
-
-			# Download using JavaScript fetch to leverage browser cache
-			try:
-				# Properly escape the URL to prevent JavaScript injection
-				escaped_pdf_url = json.dumps(pdf_url)
-
-				result = await asyncio.wait_for(
-					temp_session.cdp_client.send.Runtime.evaluate(
-						params={
-							'expression': f"""
-					(async () => {{
-						try {{
-							// Use fetch with cache: 'force-cache' to prioritize cached version
-							const response = await fetch({escaped_pdf_url}, {{
-								cache: 'force-cache'
-							}});
-							if (!response.ok) {{
-								throw new Error(`HTTP error! status: ${{response.status}}`);
-							}}
-							const blob = await response.blob();
-							const arrayBuffer = await blob.arrayBuffer();
-							const uint8Array = new Uint8Array(arrayBuffer);
-							
-							// Check if served from cache
-							const fromCache = response.headers.has('age') || 
-											 !response.headers.has('date');
-											 
-							return {{ 
-								data: Array.from(uint8Array),
-								fromCache: fromCache,
-								responseSize: uint8Array.length,
-								transferSize: response.headers.get('content-length') || 'unknown'
-							}};
-						}} catch (error) {{
-							throw new Error(`Fetch failed: ${{error.message}}`);
-						}}
-					}})()
-					""",
-							'awaitPromise': True,
-							'returnByValue': True,
-						},
-						session_id=temp_session.session_id,
-					),
-					timeout=10.0,  # 10 second timeout for download operation
-				)
-				download_result = result.get('result', {}).get('value', {})
-
-				if download_result and download_result.get('data') and len(download_result['data']) > 0:
-					# Ensure downloads directory exists
-					downloads_dir = str(self.browser_session.browser_profile.downloads_path)
-					os.makedirs(downloads_dir, exist_ok=True)
-					download_path = os.path.join(downloads_dir, final_filename)
-
-					# Save the PDF asynchronously
-					async with await anyio.open_file(download_path, 'wb') as f:
-						await f.write(bytes(download_result['data']))
-
-					# Verify file was written successfully
-					if os.path.exists(download_path):
-						actual_size = os.path.getsize(download_path)
-						self.logger.debug(
-							f'[DownloadsWatchdog] PDF file written successfully: {download_path} ({actual_size} bytes)'
-						)
-					else:
-						self.logger.error(f'[DownloadsWatchdog] ❌ Failed to write PDF file to: {download_path}')
-						return None
-
-					# Log cache information
-					cache_status = 'from cache' if download_result.get('fromCache') else 'from network'
-					response_size = download_result.get('responseSize', 0)
-					self.logger.debug(
-						f'[DownloadsWatchdog] ✅ Auto-downloaded PDF ({cache_status}, {response_size:,} bytes): {download_path}'
-					)
-
-					# Store URL->path mapping for this session
-					self._session_pdf_urls[pdf_url] = download_path
-
-					# Emit file downloaded event
-					self.logger.debug(f'[DownloadsWatchdog] Dispatching FileDownloadedEvent for {final_filename}')
-					self.event_bus.dispatch(
-						FileDownloadedEvent(
-							url=pdf_url,
-							path=download_path,
-							file_name=final_filename,
-							file_size=response_size,
-							file_type='pdf',
-							mime_type='application/pdf',
-							from_cache=download_result.get('fromCache', False),
-							auto_download=True,
-						)
-					)
-
-					# No need to detach - session is cached
-					return download_path
-				else:
-					self.logger.warning(f'[DownloadsWatchdog] No data received when downloading PDF from {pdf_url}')
-					return None
-
-			except Exception as e:
-				self.logger.warning(f'[DownloadsWatchdog] Failed to auto-download PDF from {pdf_url}: {type(e).__name__}: {e}')
-				return None
+			# Stream the PDF to disk (the browser's HTTP cache usually still has it from the viewer)
+			return await self.download_file_from_url(
+				pdf_url, target_id, content_type='application/pdf', suggested_filename=pdf_filename
+			)
 
 		except TimeoutError:
 			self.logger.debug('[DownloadsWatchdog] PDF download operation timed out')
@@ -0,0 +1,254 @@
+"""Network idle watchdog for tracking in-flight requests and page stability from CDP events."""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, ClassVar
+
+from bubus import BaseEvent
+from cdp_use.cdp.network.events import LoadingFailedEvent, LoadingFinishedEvent, RequestWillBeSentEvent
+from cdp_use.cdp.target import SessionID, TargetID
+from pydantic import PrivateAttr
+
+from browser_use.browser.events import BrowserConnectedEvent, BrowserStoppedEvent, TabClosedEvent
+from browser_use.browser.watchdog_base import BaseWatchdog
+from browser_use.browser.watchdogs.crash_watchdog import NetworkRequestTracker
+
+if TYPE_CHECKING:
+	from browser_use.browser.views import NetworkRequest
+
+# Common ad/tracking domains and URL patterns that never matter for page stability
+IGNORED_URL_PATTERNS = (
+	# Standard ad/tracking networks
+	'doubleclick.net',
+	'googlesyndication.com',
+	'googletagmanager.com',
+	'facebook.net',
+	'analytics',
+	'ads',
+	'tracking',
+	'pixel',
+	'hotjar.com',
+	'clarity.ms',
+	'mixpanel.com',
+	'segment.com',
+	# Analytics platforms
+	'demdex.net',
+	'omtrdc.net',
+	'adobedtm.com',
+	'ensighten.com',
+	'newrelic.com',
+	'nr-data.net',
+	'google-analytics.com',
+	# Social media trackers
+	'connect.facebook.net',
+	'platform.twitter.com',
+	'platform.linkedin.com',
+	# CDN/image hosts (usually not critical for functionality)
+	'.cloudfront.net/image/',
+	'.akamaized.net/image/',
+	# Common tracking paths
+	'/tracker/',
+	'/collector/',
+	'/beacon/',
+	'/telemetry/',
+	'/log/',
+	'/events/',
+	'/eventBatch',
+	'/track.',
+	'/metrics/',
+)
+
+# Long-lived or fire-and-forget requests that would keep the network busy forever
+IGNORED_RESOURCE_TYPES = {'EventSource', 'WebSocket', 'Ping', 'CSPViolationReport', 'Prefetch', 'Manifest', 'Preflight'}
+NON_CRITICAL_RESOURCE_TYPES = {'Image', 'Font', 'Media'}
+
+STUCK_REQUEST_SECONDS = 10.0  # likely long polling
+SLOW_NON_CRITICAL_REQUEST_SECONDS = 3.0
+
+
+class NetworkIdleWatchdog(BaseWatchdog):
+	"""Tracks in-flight requests per page from CDP Network events and waits for the page to become stable.
+
+	A page is stable once its document has reached DOMContentLoaded (Page.lifecycleEvent) and there were no relevant
+	requests in flight and no DOM mutations for a quiet window.
+	"""
+
+	# Event contracts
+	LISTENS_TO: ClassVar[list[type[BaseEvent]]] = [
+		BrowserConnectedEvent,
+		BrowserStoppedEvent,
+		TabClosedEvent,
+	]
+	EMITS: ClassVar[list[type[BaseEvent]]] = []
+
+	# Private state
+	_requests: dict[TargetID, dict[str, NetworkRequestTracker]] = PrivateAttr(default_factory=dict)
+	_last_activity: dict[TargetID, float] = PrivateAttr(default_factory=dict)  # target_id -> monotonic time
+	# One event per running wait_for_stable() call, so concurrent waiters don't clear each other's wake-ups
+	_activity_waiters: dict[TargetID, set[asyncio.Event]] = PrivateAttr(default_factory=dict)
+	_callbacks_registered: bool = PrivateAttr(default=False)
+
+	async def on_BrowserConnectedEvent(self, event: BrowserConnectedEvent) -> None:
+		"""Register the Network event handlers once on the root CDP client.
+
+		The Network domain is already enabled for every page by SessionManager, the handlers route events per target.
+		"""
+		if self._callbacks_registered:
+			return
+		cdp_client = self.browser_session.cdp_client
+		cdp_client.register.Network.requestWillBeSent(self._on_request_will_be_sent)
+		cdp_client.register.Network.loadingFinished(self._on_loading_finished)
+		cdp_client.register.Network.loadingFailed(self._on_loading_failed)
+		self._callbacks_registered = True
+		self.logger.debug('[NetworkIdleWatchdog] Registered network request tracking callbacks')
+
+	async def on_BrowserStoppedEvent(self, event: BrowserStoppedEvent) -> None:
+		"""Forget all tracked requests, the handlers are registered again on the next connection."""
+		self._requests.clear()
+		self._last_activity.clear()
+		self._callbacks_registered = False
+
+	async def on_TabClosedEvent(self, event: TabClosedEvent) -> None:
+		"""Forget the requests of a closed tab."""
+		self._requests.pop(event.target_id, None)
+		self._last_activity.pop(event.target_id, None)
+
+	def _get_target_id(self, session_id: SessionID | None) -> TargetID | None:
+		if not session_id:
+			return None
+		return self.browser_session.session_manager.get_target_id_from_session_id(session_id)
+
+	def _mark_activity(self, target_id: TargetID) -> None:
+		self._last_activity[target_id] = time.monotonic()
+		for activity_event in self._activity_waiters.get(target_id, ()):
+			activity_event.set()
+
+	def _on_request_will_be_sent(self, event: RequestWillBeSentEvent, session_id: SessionID | None = None) -> None:
+		target_id = self._get_target_id(session_id)
+		if target_id is None:
+			return
+		request = event.get('request', {})
+		# Redirects reuse the request id, the entry is simply replaced
+		self._requests.setdefault(target_id, {})[event['requestId']] = NetworkRequestTracker(
+			request_id=event['requestId'],
+			start_time=time.monotonic(),
+			url=request.get('url', ''),
+			method=request.get('method', 'GET'),
+			resource_type=event.get('type'),
+		)
+		self._mark_activity(target_id)
+
+	def _on_loading_finished(self, event: LoadingFinishedEvent, session_id: SessionID | None = None) -> None:
+		self._on_request_done(event['requestId'], session_id)
+
+	def _on_loading_failed(self, event: LoadingFailedEvent, session_id: SessionID | None = None) -> None:
+		self._on_request_done(event['requestId'], session_id)
+
+	def _on_request_done(self, request_id: str, session_id: SessionID | None) -> None:
+		target_id = self._get_target_id(session_id)
+		if target_id is None:
+			return
+		if self._requests.get(target_id, {}).pop(request_id, None) is not None:
+			self._mark_activity(target_id)
+
+	@staticmethod
+	def _is_relevant(request: NetworkRequestTracker, now: float) -> bool:
+		"""Whether an in-flight request should delay state capture (same filters as the former performance API scan)."""
+		if request.resource_type in IGNORED_RESOURCE_TYPES:
+			return False
+		url = request.url
+		if url.startswith('data:') or len(url) > 500 or any(pattern in url for pattern in IGNORED_URL_PATTERNS):
+			return False
+		loading_duration = now - request.start_time
+		if loading_duration > STUCK_REQUEST_SECONDS:
+			return False
+		if request.resource_type in NON_CRITICAL_RESOURCE_TYPES and loading_duration > SLOW_NON_CRITICAL_REQUEST_SECONDS:
+			return False
+		return True
+
+	def get_pending_requests(self, target_id: TargetID) -> list['NetworkRequest']:
+		"""Relevant requests currently in flight for a page, oldest first (at most 20, for the LLM context)."""
+		from browser_use.browser.views import NetworkRequest
+
+		now = time.monotonic()
+		target_requests = self._requests.get(target_id, {})
+		# Requests that never finish (long polling, streams) are ignored anyway, drop them so they don't accumulate
+		for request_id in [rid for rid, request in target_requests.items() if now - request.start_time > STUCK_REQUEST_SECONDS]:
+			del target_requests[request_id]
+
+		requests = sorted(
+			(request for request in target_requests.values() if self._is_relevant(request, now)),
+			key=lambda request: request.start_time,
+		)
+		return [
+			NetworkRequest(
+				url=request.url,
+				method=request.method,
+				loading_duration_ms=round((now - request.start_time) * 1000),
+				resource_type=request.resource_type,
+			)
+			for request in requests[:20]
+		]
+
+	def _is_document_loading(self, target_id: TargetID) -> bool:
+		"""Whether the latest navigation of the page has not reached DOMContentLoaded (SessionManager lifecycle events)."""
+		for cdp_session in self.browser_session.session_manager.get_all_sessions_for_target(target_id):
+			lifecycle_events = getattr(cdp_session, '_lifecycle_events', None)
+			if not lifecycle_events:
+				continue
+			latest_loader_id = None
+			for lifecycle_event in reversed(lifecycle_events):
+				if lifecycle_event['name'] == 'init':
+					latest_loader_id = lifecycle_event['loaderId']
+					break
+			if latest_loader_id is None:
+				return False
+			return not any(
+				lifecycle_event['name'] == 'DOMContentLoaded' and lifecycle_event['loaderId'] == latest_loader_id
+				for lifecycle_event in lifecycle_events
+			)
+		return False
+
+	def _get_quiet_since(self, target_id: TargetID) -> float:
+		"""Monotonic time of the last network activity or DOM mutation of the page."""
+		session_manager = self.browser_session.session_manager
+		last_activity = self._last_activity.get(target_id, 0.0)
+		for cdp_session in session_manager.get_all_sessions_for_target(target_id):
+			last_activity = max(last_activity, session_manager.get_last_dom_mutation_time(cdp_session.session_id))
+		return last_activity
+
+	async def wait_for_stable(self, target_id: TargetID, quiet_time: float, timeout: float) -> bool:
+		"""Wait until the page is stable (see class docstring) for `quiet_time` seconds, at most `timeout` seconds.
+
+		Returns whether the page became stable before the timeout.
+		"""
+		deadline = time.monotonic() + timeout
+		activity_event = asyncio.Event()
+		waiters = self._activity_waiters.setdefault(target_id, set())
+		waiters.add(activity_event)
+		try:
+			while True:
+				# Cleared before the check, so activity during the check still wakes the wait below
+				activity_event.clear()
+				now = time.monotonic()
+				busy = self._is_document_loading(target_id) or any(
+					self._is_relevant(request, now) for request in self._requests.get(target_id, {}).values()
+				)
+				# Sleep until the next network activity, the end of the quiet window or the deadline. While busy, recheck at
+				# least every 0.5s because slow non-critical requests stop counting after a while.
+				wake_in = 0.5
+				if not busy:
+					wake_in = self._get_quiet_since(target_id) + quiet_time - now
+					if wake_in <= 0:
+						return True
+				if now >= deadline:
+					return False
+
+				try:
+					await asyncio.wait_for(activity_event.wait(), timeout=min(wake_in, deadline - now))
+				except TimeoutError:
+					pass
+		finally:
+			waiters.discard(activity_event)
+			if not waiters and self._activity_waiters.get(target_id) is waiters:
+				del self._activity_waiters[target_id]
@@ -1,6 +1,7 @@
 """Recording Watchdog for Browser Use Sessions."""
 
 import asyncio
+import time
 from pathlib import Path
 from typing import Any, ClassVar
 
@@ -15,6 +16,11 @@ from browser_use.browser.video_recorder import VideoRecorderService
 from browser_use.browser.watchdog_base import BaseWatchdog
 from browser_use.utils import create_task_with_error_handling
 
+# Chrome only sends the next screencast frame once the previous ones are acknowledged, so holding back the ack while the
+# encoder queue is busy paces the screencast to the encoder throughput instead of dropping frames
+ACK_PACING_QUEUED_FRAMES = 2
+MAX_ACK_DELAY = 1.0
+
 
 class RecordingWatchdog(BaseWatchdog):
 	"""
@@ -59,8 +65,9 @@ class RecordingWatchdog(BaseWatchdog):
 
 		self.browser_session.cdp_client.register.Page.screencastFrame(self.on_screencastFrame)
 
+		# JPEG frames are much cheaper to transfer and decode than PNG, and the video is lossy anyway
 		self._screencast_params = {
-			'format': 'png',
+			'format': 'jpeg',
 			'quality': 90,
 			'maxWidth': size['width'],
 			'maxHeight': size['height'],
@@ -133,7 +140,7 @@ class RecordingWatchdog(BaseWatchdog):
 
 	def on_screencastFrame(self, event: ScreencastFrameEvent, session_id: str | None) -> None:
 		"""
-		Synchronous handler for incoming screencast frames.
+		Synchronous handler for incoming screencast frames, only queues the frame for the encoder thread.
 		"""
 		# Only process frames from the current session we intend to record
 		# This handles race conditions where old session might still send frames before stop completes
@@ -152,8 +159,13 @@ class RecordingWatchdog(BaseWatchdog):
 
 	async def _ack_screencast_frame(self, event: ScreencastFrameEvent, session_id: str | None) -> None:
 		"""
-		Asynchronously acknowledges a screencast frame.
+		Asynchronously acknowledges a screencast frame, once the encoder has caught up (at most MAX_ACK_DELAY later).
 		"""
+		recorder = self._recorder
+		if recorder:
+			deadline = time.monotonic() + MAX_ACK_DELAY
+			while recorder.pending_frames >= ACK_PACING_QUEUED_FRAMES and time.monotonic() < deadline:
+				await asyncio.sleep(1 / recorder.framerate)
 		try:
 			await self.browser_session.cdp_client.send.Page.screencastFrameAck(
 				params={'sessionId': event['sessionId']}, session_id=session_id
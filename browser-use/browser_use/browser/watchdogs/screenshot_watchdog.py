@@ -1,11 +1,13 @@
 """Screenshot watchdog for handling screenshot requests using CDP."""
 
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 from bubus import BaseEvent
-from cdp_use.cdp.page import CaptureScreenshotParameters
+from cdp_use.cdp.page import CaptureScreenshotParameters, Viewport
+from cdp_use.cdp.target import TargetID
 
 from browser_use.browser.events import ScreenshotEvent
+from browser_use.browser.screenshots import get_capture_scale, resize_screenshot, run_image_task
 from browser_use.browser.views import BrowserError
 from browser_use.browser.watchdog_base import BaseWatchdog
 from browser_use.observability import observe_debug
@@ -28,10 +30,10 @@ class ScreenshotWatchdog(BaseWatchdog):
 		"""Handle screenshot request using CDP.
 
 		Args:
-			event: ScreenshotEvent with optional full_page and clip parameters
+			event: ScreenshotEvent with optional full_page, clip, format/quality and size parameters
 
 		Returns:
-			Dict with 'screenshot' key containing base64-encoded screenshot or None
+			Base64-encoded screenshot in the requested format (and size)
 		"""
 		self.logger.debug('[ScreenshotWatchdog] Handler START - on_ScreenshotEvent called')
 		try:
@@ -50,21 +52,7 @@ class ScreenshotWatchdog(BaseWatchdog):
 					raise BrowserError('[ScreenshotWatchdog] No page targets available for screenshot')
 				target_id = page_targets[-1].target_id
 
-			cdp_session = await self.browser_session.get_or_create_cdp_session(target_id, focus=True)
-
-			# Prepare screenshot parameters
-			params = CaptureScreenshotParameters(format='png', captureBeyondViewport=False)
-
-			# Take screenshot using CDP
-			self.logger.debug(f'[ScreenshotWatchdog] Taking screenshot with params: {params}')
-			result = await cdp_session.cdp_client.send.Page.captureScreenshot(params=params, session_id=cdp_session.session_id)
-
-			# Return base64-encoded screenshot data
-			if result and 'data' in result:
-				self.logger.debug('[ScreenshotWatchdog] Screenshot captured successfully')
-				return result['data']
-
-			raise BrowserError('[ScreenshotWatchdog] Screenshot result missing data')
+			return await self.capture_screenshot(target_id, format=event.format, quality=event.quality, size=event.size)
 		except Exception as e:
 			self.logger.error(f'[ScreenshotWatchdog] Screenshot failed: {e}')
 			raise
@@ -74,3 +62,66 @@ class ScreenshotWatchdog(BaseWatchdog):
 				await self.browser_session.remove_highlights()
 			except Exception:
 				pass
+
+	async def capture_screenshot(
+		self,
+		target_id: TargetID,
+		format: Literal['png', 'jpeg', 'webp'] = 'png',
+		quality: int | None = None,
+		size: tuple[int, int] | None = None,
+		focus: bool = True,
+	) -> str:
+		"""Capture the viewport of a page target with CDP (see ScreenshotEvent for the parameters).
+
+		Called directly (focus=False) to capture background tabs concurrently, outside of the event bus queue.
+		"""
+		cdp_session = await self.browser_session.get_or_create_cdp_session(target_id, focus=focus)
+
+		# Prepare screenshot parameters
+		params = CaptureScreenshotParameters(format=format, captureBeyondViewport=False)
+		if format != 'png' and quality is not None:
+			params['quality'] = quality
+
+		# Let Chrome render the final size, resize afterwards only if the aspect ratio doesn't allow a uniform scale
+		resize_to = None
+		if size:
+			clip = await self._get_scaled_viewport_clip(cdp_session, size)
+			if clip:
+				params['clip'] = clip
+			else:
+				resize_to = size
+
+		# Take screenshot using CDP
+		self.logger.debug(f'[ScreenshotWatchdog] Taking screenshot of {target_id[-4:]} with params: {params}')
+		result = await cdp_session.cdp_client.send.Page.captureScreenshot(params=params, session_id=cdp_session.session_id)
+
+		# Return base64-encoded screenshot data
+		if result and 'data' in result:
+			self.logger.debug('[ScreenshotWatchdog] Screenshot captured successfully')
+			if resize_to:
+				return await run_image_task(resize_screenshot, result['data'], resize_to, quality or 80)
+			return result['data']
+
+		raise BrowserError('[ScreenshotWatchdog] Screenshot result missing data')
+
+	async def _get_scaled_viewport_clip(self, cdp_session, size: tuple[int, int]) -> Viewport | None:
+		"""Clip of the current viewport with the scale that renders it at `size` pixels, None if that needs a non-uniform scale."""
+		try:
+			metrics = await cdp_session.cdp_client.send.Page.getLayoutMetrics(session_id=cdp_session.session_id)
+		except Exception as e:
+			self.logger.debug(f'[ScreenshotWatchdog] Failed to get layout metrics for scaled capture: {e}')
+			return None
+
+		css_visual_viewport = metrics.get('cssVisualViewport', {})
+		width = css_visual_viewport.get('clientWidth', 0)
+		height = css_visual_viewport.get('clientHeight', 0)
+		device_width = metrics.get('visualViewport', {}).get('clientWidth', width)
+		device_pixel_ratio = device_width / width if width > 0 else 1.0
+
+		scale = get_capture_scale(width, height, device_pixel_ratio, size)
+		if scale is None:
+			return None
+		# Clip coordinates are document coordinates, so offset them by the scroll position
+		return Viewport(
+			x=css_visual_viewport.get('pageX', 0), y=css_visual_viewport.get('pageY', 0), width=width, height=height, scale=scale
+		)
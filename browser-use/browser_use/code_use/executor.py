@@ -0,0 +1,278 @@
+"""Execution backend for code cells: compile cache, persistent worker thread and per-cell resource accounting.
+
+Cells without `await` run in a persistent worker thread, so CPU-heavy (pandas, NumPy) or blocking code does not freeze
+the event loop that handles CDP events and the watchdogs. While such a cell runs, the async browser helpers of the
+namespace are replaced by blocking proxies that run the real helper on the event loop. Cells with `await` keep running
+on the event loop.
+"""
+
+import ast
+import asyncio
+import contextvars
+import ctypes
+import functools
+import inspect
+import io
+import logging
+import sys
+import threading
+import time
+from collections.abc import Callable, Coroutine
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from types import CodeType
+from typing import Any
+
+from .views import CellExecutionStats
+
+try:
+	import resource
+except ImportError:  # Windows
+	resource = None
+
+logger = logging.getLogger(__name__)
+
+# Filename of compiled cells, error reporting looks for it in tracebacks
+CELL_FILENAME = '<code>'
+
+# How long an interrupted worker thread gets to stop before it is abandoned
+WORKER_STOP_GRACE_PERIOD = 2.0
+
+_cell_output: contextvars.ContextVar[io.StringIO | None] = contextvars.ContextVar('code_cell_output', default=None)
+
+
+class CellInterrupted(Exception):
+	"""Raised inside the worker thread to stop a cell that timed out or was cancelled."""
+
+
+@dataclass(frozen=True)
+class ParsedCell:
+	"""What the execution needs to know about the source of a cell."""
+
+	has_await: bool
+	assigned_names: frozenset[str]
+	"""Names assigned at any depth (plain, augmented and annotated assignments, walrus)"""
+	user_global_names: frozenset[str]
+	"""Names of the user's explicit `global` declarations"""
+
+
+@functools.lru_cache(maxsize=256)
+def parse_cell(code: str) -> ParsedCell:
+	"""Parse a cell (cached per source). Raises SyntaxError for invalid code."""
+	tree = ast.parse(code, mode='exec')
+	has_await = False
+	assigned_names: set[str] = set()
+	user_global_names: set[str] = set()
+	for node in ast.walk(tree):
+		if isinstance(node, (ast.Await, ast.AsyncWith, ast.AsyncFor)):
+			has_await = True
+		elif isinstance(node, ast.Assign):
+			assigned_names.update(target.id for target in node.targets if isinstance(target, ast.Name))
+		elif isinstance(node, (ast.AugAssign, ast.AnnAssign, ast.NamedExpr)) and isinstance(node.target, ast.Name):
+			assigned_names.add(node.target.id)
+		elif isinstance(node, ast.Global):
+			user_global_names.update(node.names)
+	return ParsedCell(has_await, frozenset(assigned_names), frozenset(user_global_names))
+
+
+@functools.lru_cache(maxsize=256)
+def compile_cell(source: str) -> CodeType:
+	"""Compile a cell, or the async wrapper of a cell (cached per source)."""
+	return compile(source, CELL_FILENAME, 'exec')
+
+
+class _CellOutputRouter:
+	"""Stand-in for sys.stdout: output of a running cell goes to its buffer, everything else to the real stdout.
+
+	Unlike swapping sys.stdout for the duration of a cell, this leaves the output of other tasks and threads alone.
+	"""
+
+	def __init__(self, stdout: Any):
+		self._stdout = stdout
+
+	def write(self, text: str) -> int:
+		buffer = _cell_output.get()
+		return (buffer if buffer is not None else self._stdout).write(text)
+
+	def flush(self) -> None:
+		if _cell_output.get() is None:
+			self._stdout.flush()
+
+	def __getattr__(self, name: str) -> Any:
+		return getattr(self._stdout, name)
+
+
+def _peak_rss_bytes() -> int:
+	if resource is None:
+		return 0
+	max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	return max_rss if sys.platform == 'darwin' else max_rss * 1024  # bytes on macOS, kilobytes elsewhere
+
+
+class CodeCellExecutor:
+	"""Runs code cells against a namespace created by `create_namespace`, see the module docstring."""
+
+	def __init__(self, namespace: dict[str, Any], timeout: float | None = None):
+		"""
+		Args:
+			namespace: The persistent namespace the cells run in
+			timeout: Seconds a cell may run before it is interrupted (None for no limit)
+		"""
+		self.namespace = namespace
+		self.timeout = timeout
+		# Browser helpers to proxy back to the loop, user-defined async functions are left alone
+		self._async_helpers = {name: value for name, value in namespace.items() if inspect.iscoroutinefunction(value)}
+		self._worker = self._create_worker()
+		# Thread of the running worker cell, interrupts are only raised in it while the cell runs (guarded by the lock)
+		self._running_thread: threading.Thread | None = None
+		self._running_lock = threading.Lock()
+		# Worker thread of an interrupted cell that did not stop, no other cell runs until it has finished
+		self._abandoned_thread: threading.Thread | None = None
+		self._pending_loop_calls: set[Future] = set()
+
+	@staticmethod
+	def _create_worker() -> ThreadPoolExecutor:
+		return ThreadPoolExecutor(max_workers=1, thread_name_prefix='code-cell')
+
+	def capture_output(self) -> tuple[io.StringIO, contextvars.Token]:
+		"""Route the output of the current task (and the threads and tasks it starts) to a new buffer."""
+		if not isinstance(sys.stdout, _CellOutputRouter):
+			sys.stdout = _CellOutputRouter(sys.stdout)
+		buffer = io.StringIO()
+		return buffer, _cell_output.set(buffer)
+
+	@staticmethod
+	def stop_capturing_output(token: contextvars.Token) -> None:
+		_cell_output.reset(token)
+
+	async def run_sync(self, compiled: CodeType, stats: CellExecutionStats) -> None:
+		"""Execute a compiled cell without `await` in the worker thread."""
+		self._check_no_abandoned_cell()
+		loop = asyncio.get_running_loop()
+		stats.in_worker = True
+		start = time.monotonic()
+		peak_rss = _peak_rss_bytes()
+		proxied = self._install_loop_proxies(loop)
+		# The worker sees the output buffer of the calling task
+		context = contextvars.copy_context()
+		worker_future = loop.run_in_executor(self._worker, context.run, self._exec_in_worker, compiled, stats)
+		try:
+			await asyncio.wait_for(asyncio.shield(worker_future), timeout=self.timeout)
+		except TimeoutError:
+			stats.timed_out = True
+			await self._interrupt_worker(worker_future)
+			raise TimeoutError(f'Cell execution timed out after {self.timeout}s and was interrupted')
+		except asyncio.CancelledError:
+			await self._interrupt_worker(worker_future)
+			raise
+		finally:
+			stats.wall_seconds = time.monotonic() - start
+			stats.peak_memory_growth_bytes = _peak_rss_bytes() - peak_rss
+			self._remove_loop_proxies(proxied)
+
+	async def run_async(self, coro: Coroutine[Any, Any, Any], stats: CellExecutionStats) -> Any:
+		"""Await the coroutine of a cell with `await` on the event loop."""
+		try:
+			self._check_no_abandoned_cell()
+		except RuntimeError:
+			coro.close()
+			raise
+		start = time.monotonic()
+		cpu_start = time.thread_time()
+		peak_rss = _peak_rss_bytes()
+		try:
+			return await asyncio.wait_for(coro, timeout=self.timeout)
+		except TimeoutError:
+			stats.timed_out = True
+			raise TimeoutError(f'Cell execution timed out after {self.timeout}s and was cancelled')
+		finally:
+			stats.wall_seconds = time.monotonic() - start
+			stats.cpu_seconds = time.thread_time() - cpu_start
+			stats.peak_memory_growth_bytes = _peak_rss_bytes() - peak_rss
+
+	def _check_no_abandoned_cell(self) -> None:
+		"""Refuse to run a cell while an interrupted one keeps running in its abandoned thread and changing the namespace."""
+		if self._abandoned_thread is None:
+			return
+		if self._abandoned_thread.is_alive():
+			raise RuntimeError(
+				'The previous cell could not be interrupted and is still running, '
+				'no other cell can run until it has finished (it may be blocked in a long sleep or I/O call)'
+			)
+		self._abandoned_thread = None
+
+	def _exec_in_worker(self, compiled: CodeType, stats: CellExecutionStats) -> None:
+		thread = threading.current_thread()
+		with self._running_lock:
+			self._running_thread = thread
+		cpu_start = time.thread_time()
+		try:
+			exec(compiled, self.namespace, self.namespace)
+		finally:
+			with self._running_lock:
+				if self._running_thread is thread:
+					self._running_thread = None
+				# Drop an interrupt that came in after the last bytecode of the cell, raised in ThreadPoolExecutor's idle
+				# loop it would kill the worker thread
+				ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(thread.ident), None)
+			stats.cpu_seconds = time.thread_time() - cpu_start
+
+	def _install_loop_proxies(self, loop: asyncio.AbstractEventLoop) -> dict[str, Callable[..., Any]]:
+		"""Replace the async browser helpers by blocking proxies for the duration of a worker cell."""
+		proxied = {}
+		for name, helper in self._async_helpers.items():
+			if self.namespace.get(name) is helper:
+				proxied[name] = self._make_loop_proxy(helper, loop)
+				self.namespace[name] = proxied[name]
+		return proxied
+
+	def _remove_loop_proxies(self, proxied: dict[str, Callable[..., Any]]) -> None:
+		for name, proxy in proxied.items():
+			# The cell may have rebound the name, keep its value then
+			if self.namespace.get(name) is proxy:
+				self.namespace[name] = self._async_helpers[name]
+
+	def _make_loop_proxy(self, helper: Callable[..., Coroutine[Any, Any, Any]], loop: asyncio.AbstractEventLoop):
+		@functools.wraps(helper)
+		def call_on_loop(*args, **kwargs):
+			future = asyncio.run_coroutine_threadsafe(helper(*args, **kwargs), loop)
+			self._pending_loop_calls.add(future)
+			try:
+				return future.result()
+			finally:
+				self._pending_loop_calls.discard(future)
+
+		return call_on_loop
+
+	async def _interrupt_worker(self, worker_future: asyncio.Future) -> None:
+		"""Stop the cell running in the worker thread, or give up on the thread if it does not stop in time.
+
+		The exception is raised in the worker at its next bytecode, helper calls it waits for are cancelled so it
+		gets there. Code blocked in a C call (e.g. a long `time.sleep`) cannot be interrupted: the thread is left to
+		finish on its own and no other cell runs until it has. The worker is replaced after every interrupt.
+		"""
+		with self._running_lock:
+			running_thread = self._running_thread
+			if running_thread is not None:
+				ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(running_thread.ident), ctypes.py_object(CellInterrupted))
+		for future in list(self._pending_loop_calls):
+			future.cancel()
+
+		done, _ = await asyncio.wait({worker_future}, timeout=WORKER_STOP_GRACE_PERIOD)
+		if done:
+			worker_future.exception()  # retrieved, the interruption is reported by the caller
+		else:
+			logger.warning('Code cell did not stop after being interrupted, abandoning the worker thread')
+			self._abandoned_thread = running_thread
+			# Its CellInterrupted is raised once it returns from the blocking call, nobody is waiting for it then
+			worker_future.add_done_callback(lambda future: future.cancelled() or future.exception())
+
+		with self._running_lock:
+			self._running_thread = None
+		# A cell that had not started yet is cancelled
+		self._worker.shutdown(wait=False, cancel_futures=True)
+		self._worker = self._create_worker()
+
+	def close(self) -> None:
+		"""Stop the worker thread once the running cell (if any) is done."""
+		self._worker.shutdown(wait=False)
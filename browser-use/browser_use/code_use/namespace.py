@@ -7,9 +7,11 @@ similar to a Jupyter notebook environment.
 import asyncio
 import csv
 import datetime
+import io
 import json
 import logging
 import re
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any
 
@@ -19,6 +21,13 @@ from browser_use.browser import BrowserSession
 from browser_use.filesystem.file_system import FileSystem
 from browser_use.llm.base import BaseChatModel
 from browser_use.tools.service import CodeAgentTools, Tools
+from browser_use.tools.utils import (
+	REMOTE_ARRAY_CHUNK_SIZE,
+	REMOTE_ARRAY_SUBTYPES,
+	format_js_exception,
+	iter_remote_array_chunks,
+	release_remote_object,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +96,67 @@ def _strip_js_comments(js_code: str) -> str:
 	return js_code
 
 
+def _wrap_evaluate_code(code: str, variables: dict[str, Any] | None) -> str:
+	"""Inject `variables` as `params` into the code and wrap it in an IIFE if it is not wrapped yet."""
+	# Inject variables if provided
+	if variables:
+		vars_json = json.dumps(variables)
+		stripped = code.strip()
+
+		# Check if code is already a function expression expecting params
+		# Pattern: (function(params) { ... }) or (async function(params) { ... })
+		if re.match(r'\((?:async\s+)?function\s*\(\s*\w+\s*\)', stripped):
+			# Already expects params, wrap to call it with our variables
+			code = f'(function(){{ const params = {vars_json}; return {stripped}(params); }})()'
+		else:
+			# Not a parameterized function, inject params in scope
+			# Check if already wrapped in IIFE (including arrow function IIFEs)
+			is_wrapped = (
+				(stripped.startswith('(function()') and '})()' in stripped[-10:])
+				or (stripped.startswith('(async function()') and '})()' in stripped[-10:])
+				or (stripped.startswith('(() =>') and ')()' in stripped[-10:])
+				or (stripped.startswith('(async () =>') and ')()' in stripped[-10:])
+			)
+			if is_wrapped:
+				# Already wrapped, inject params at the start
+				# Try to match regular function IIFE
+				match = re.match(r'(\((?:async\s+)?function\s*\(\s*\)\s*\{)', stripped)
+				if match:
+					prefix = match.group(1)
+					rest = stripped[len(prefix) :]
+					code = f'{prefix} const params = {vars_json}; {rest}'
+				else:
+					# Try to match arrow function IIFE
+					# Patterns: (() => expr)() or (() => { ... })() or (async () => ...)()
+					arrow_match = re.match(r'(\((?:async\s+)?\(\s*\)\s*=>\s*\{)', stripped)
+					if arrow_match:
+						# Arrow function with block body: (() => { ... })()
+						prefix = arrow_match.group(1)
+						rest = stripped[len(prefix) :]
+						code = f'{prefix} const params = {vars_json}; {rest}'
+					else:
+						# Arrow function with expression body or fallback: wrap in outer function
+						code = f'(function(){{ const params = {vars_json}; return {stripped}; }})()'
+			else:
+				# Not wrapped, wrap with params
+				code = f'(function(){{ const params = {vars_json}; {code} }})()'
+
+	# Auto-wrap in IIFE if not already wrapped (and no variables were injected)
+	if not variables:
+		stripped = code.strip()
+		# Check for regular function IIFEs, async function IIFEs, and arrow function IIFEs
+		is_wrapped = (
+			(stripped.startswith('(function()') and '})()' in stripped[-10:])
+			or (stripped.startswith('(async function()') and '})()' in stripped[-10:])
+			or (stripped.startswith('(() =>') and ')()' in stripped[-10:])
+			or (stripped.startswith('(async () =>') and ')()' in stripped[-10:])
+		)
+		if not is_wrapped:
+			code = f'(function(){{{code}}})()'
+
+	return code
+
+
 class EvaluateError(Exception):
 	"""Special exception raised by evaluate() to stop Python execution immediately."""
 
@@ -209,25 +279,8 @@ async def evaluate(code: str, browser_session: BrowserSession) -> Any:
 
 		# Check for JavaScript execution errors
 		if result.get('exceptionDetails'):
-			exception = result['exceptionDetails']
-			error_text = exception.get('text', 'Unknown error')
-
-			# Try to get more details from the exception
-			error_details = []
-			if 'exception' in exception:
-				exc_obj = exception['exception']
-				if 'description' in exc_obj:
-					error_details.append(exc_obj['description'])
-				elif 'value' in exc_obj:
-					error_details.append(str(exc_obj['value']))
-
-			# Build comprehensive error message with full CDP context
-			error_msg = f'JavaScript execution error: {error_text}'
-			if error_details:
-				error_msg += f'\nDetails: {" | ".join(error_details)}'
-
 			# Raise special exception that will stop Python execution immediately
-			raise EvaluateError(error_msg)
+			raise EvaluateError(format_js_exception(result['exceptionDetails']))
 
 		# Get the result data
 		result_data = result.get('result', {})
@@ -253,6 +306,118 @@ async def evaluate(code: str, browser_session: BrowserSession) -> Any:
 		raise EvaluateError(f'Failed to execute JavaScript: {type(e).__name__}: {e}') from e
 
 
+async def evaluate_stream(
+	code: str, browser_session: BrowserSession, chunk_size: int = REMOTE_ARRAY_CHUNK_SIZE
+) -> AsyncIterator[Any]:
+	"""
+	Execute JavaScript code that returns an array and yield its items.
+
+	Unlike evaluate(), the array stays in the page and is read in chunks of `chunk_size` items, so results too large
+	for a single transfer (e.g. tens of thousands of scraped rows) can be processed.
+
+	Args:
+		code: JavaScript code to execute (must be wrapped in IIFE), must return an array
+		chunk_size: Number of items fetched from the page at a time
+
+	Raises:
+		EvaluateError: If JavaScript execution fails or the result is not an array.
+
+	Example:
+		async for row in evaluate_stream('''
+		(function(){
+			return Array.from(document.querySelectorAll('tr')).map(r => r.innerText)
+		})()
+		'''):
+			print(row)
+	"""
+	code = _strip_js_comments(code)
+
+	cdp_session = await browser_session.get_or_create_cdp_session()
+
+	try:
+		# Keep the result in the page, it is paged out below
+		result = await cdp_session.cdp_client.send.Runtime.evaluate(
+			params={'expression': code, 'returnByValue': False, 'awaitPromise': True},
+			session_id=cdp_session.session_id,
+		)
+	except Exception as e:
+		raise EvaluateError(f'Failed to execute JavaScript: {type(e).__name__}: {e}') from e
+	if result.get('exceptionDetails'):
+		raise EvaluateError(format_js_exception(result['exceptionDetails']))
+
+	remote_object = result.get('result', {})
+	object_id = remote_object.get('objectId')
+	if not object_id or remote_object.get('subtype') not in REMOTE_ARRAY_SUBTYPES:
+		if object_id:
+			await release_remote_object(cdp_session, object_id)
+		result_type = remote_object.get('subtype') or remote_object.get('type', 'undefined')
+		raise EvaluateError(f'evaluate_stream() expects the JavaScript code to return an array, got {result_type}')
+
+	chunks = iter_remote_array_chunks(cdp_session, object_id, chunk_size)
+	try:
+		while True:
+			try:
+				chunk = await anext(chunks)
+			except StopAsyncIteration:
+				break
+			except Exception as e:
+				raise EvaluateError(f'Failed to read JavaScript result: {type(e).__name__}: {e}') from e
+			for item in chunk:
+				yield item
+	finally:
+		await release_remote_object(cdp_session, object_id)
+
+
+async def evaluate_to_file(
+	code: str,
+	browser_session: BrowserSession,
+	file_system: FileSystem,
+	file_name: str,
+	chunk_size: int = REMOTE_ARRAY_CHUNK_SIZE,
+) -> int:
+	"""
+	Execute JavaScript code that returns an array and write its items to a JSONL or CSV file of the file system.
+
+	The items are read with evaluate_stream() and serialized chunk by chunk, only the file content is kept in memory.
+	CSV columns are the keys of the first item when the items are objects.
+
+	Args:
+		code: JavaScript code to execute (must be wrapped in IIFE), must return an array
+		file_system: The file system to write to
+		file_name: Name of the file, e.g. 'products.jsonl' or 'products.csv'
+		chunk_size: Number of items fetched from the page at a time
+
+	Returns:
+		The number of items written
+	"""
+	extension = file_name.rsplit('.', 1)[-1].lower() if '.' in file_name else ''
+	if extension not in ('jsonl', 'csv'):
+		raise ValueError(f"evaluate_to_file() writes .jsonl or .csv files, got '{file_name}'")
+
+	buffer = io.StringIO()
+	csv_writer: Any = None
+	count = 0
+	async for item in evaluate_stream(code, browser_session, chunk_size):
+		if extension == 'jsonl':
+			buffer.write(json.dumps(item, ensure_ascii=False) + '\n')
+		elif isinstance(item, dict):
+			if csv_writer is None:
+				csv_writer = csv.DictWriter(buffer, fieldnames=list(item.keys()), extrasaction='ignore')
+				csv_writer.writeheader()
+			csv_writer.writerow(item)
+		else:
+			if csv_writer is None:
+				csv_writer = csv.writer(buffer)
+			csv_writer.writerow(item if isinstance(item, list) else [item])
+		count += 1
+
+	# The file system keeps file contents in memory and rewrites the whole file on append, so write once
+	message = await file_system.write_file(file_name, buffer.getvalue())
+	if not message.startswith('Data written'):
+		raise ValueError(message)
+	return count
+
+
 def create_namespace(
 	browser_session: BrowserSession,
 	tools: Tools | None = None,
@@ -344,63 +509,7 @@ def create_namespace(
 		if not code:
 			raise ValueError('No JavaScript code provided to evaluate()')
 
-		# Inject variables if provided
-		if variables:
-			vars_json = json.dumps(variables)
-			stripped = code.strip()
-
-			# Check if code is already a function expression expecting params
-			# Pattern: (function(params) { ... }) or (async function(params) { ... })
-			if re.match(r'\((?:async\s+)?function\s*\(\s*\w+\s*\)', stripped):
-				# Already expects params, wrap to call it with our variables
-				code = f'(function(){{ const params = {vars_json}; return {stripped}(params); }})()'
-			else:
-				# Not a parameterized function, inject params in scope
-				# Check if already wrapped in IIFE (including arrow function IIFEs)
-				is_wrapped = (
-					(stripped.startswith('(function()') and '})()' in stripped[-10:])
-					or (stripped.startswith('(async function()') and '})()' in stripped[-10:])
-					or (stripped.startswith('(() =>') and ')()' in stripped[-10:])
-					or (stripped.startswith('(async () =>') and ')()' in stripped[-10:])
-				)
-				if is_wrapped:
-					# Already wrapped, inject params at the start
-					# Try to match regular function IIFE
-					match = re.match(r'(\((?:async\s+)?function\s*\(\s*\)\s*\{)', stripped)
-					if match:
-						prefix = match.group(1)
-						rest = stripped[len(prefix) :]
-						code = f'{prefix} const params = {vars_json}; {rest}'
-					else:
-						# Try to match arrow function IIFE
-						# Patterns: (() => expr)() or (() => { ... })() or (async () => ...)()
-						arrow_match = re.match(r'(\((?:async\s+)?\(\s*\)\s*=>\s*\{)', stripped)
-						if arrow_match:
-							# Arrow function with block body: (() => { ... })()
-							prefix = arrow_match.group(1)
-							rest = stripped[len(prefix) :]
-							code = f'{prefix} const params = {vars_json}; {rest}'
-						else:
-							# Arrow function with expression body or fallback: wrap in outer function
-							code = f'(function(){{ const params = {vars_json}; return {stripped}; }})()'
-				else:
-					# Not wrapped, wrap with params
-					code = f'(function(){{ const params = {vars_json}; {code} }})()'
-					# Skip auto-wrap below
-					return await evaluate(code, browser_session)
-
-		# Auto-wrap in IIFE if not already wrapped (and no variables were injected)
-		if not variables:
-			stripped = code.strip()
-			# Check for regular function IIFEs, async function IIFEs, and arrow function IIFEs
-			is_wrapped = (
-				(stripped.startswith('(function()') and '})()' in stripped[-10:])
-				or (stripped.startswith('(async function()') and '})()' in stripped[-10:])
-				or (stripped.startswith('(() =>') and ')()' in stripped[-10:])
-				or (stripped.startswith('(async () =>') and ')()' in stripped[-10:])
-			)
-			if not is_wrapped:
-				code = f'(function(){{{code}}})()'
+		code = _wrap_evaluate_code(code, variables)
 
 		# Execute and track failures
 		try:
@@ -443,6 +552,35 @@ def create_namespace(
 
 	namespace['evaluate'] = evaluate_wrapper
 
+	# Add streaming variants of evaluate() for large array results
+	def evaluate_stream_wrapper(
+		code: str, variables: dict[str, Any] | None = None, chunk_size: int = REMOTE_ARRAY_CHUNK_SIZE
+	) -> AsyncIterator[Any]:
+		if not code:
+			raise ValueError('No JavaScript code provided to evaluate_stream()')
+		return evaluate_stream(_wrap_evaluate_code(code, variables), browser_session, chunk_size)
+
+	async def evaluate_to_file_wrapper(
+		code: str, file_name: str, variables: dict[str, Any] | None = None, chunk_size: int = REMOTE_ARRAY_CHUNK_SIZE
+	) -> int:
+		if not code:
+			raise ValueError('No JavaScript code provided to evaluate_to_file()')
+		if file_system is None:
+			raise ValueError('evaluate_to_file() requires a file system')
+
+		try:
+			count = await evaluate_to_file(
+				_wrap_evaluate_code(code, variables), browser_session, file_system, file_name, chunk_size
+			)
+		except Exception as e:
+			namespace['_evaluate_failures'].append({'error': str(e), 'type': 'exception'})
+			raise
+		print(f'Wrote {count} items to {file_system.get_dir() / file_name}')
+		return count
+
+	namespace['evaluate_stream'] = evaluate_stream_wrapper
+	namespace['evaluate_to_file'] = evaluate_to_file_wrapper
+
 	# Add get_selector_from_index helper for code_use mode
 	async def get_selector_from_index_wrapper(index: int) -> str:
 		"""
@@ -475,8 +613,9 @@ def create_namespace(
 			logger.warning(f'⚠️ {msg}')
 			raise RuntimeError(msg)
 
-		# Check if element is in shadow DOM
+		# Check if element is in shadow DOM or in an iframe, in a single walk up the ancestors
 		shadow_hosts = []
+		in_iframe = False
 		current = node.parent_node
 		while current:
 			if current.shadow_root_type is not None:
@@ -485,15 +624,8 @@ def create_namespace(
 				host_id = current.attributes.get('id', '') if current.attributes else ''
 				host_desc = f'{host_tag}#{host_id}' if host_id else host_tag
 				shadow_hosts.insert(0, host_desc)
-			current = current.parent_node
-
-		# Check if in iframe
-		in_iframe = False
-		current = node.parent_node
-		while current:
 			if current.tag_name.lower() == 'iframe':
 				in_iframe = True
-				break
 			current = current.parent_node
 
 		# Use the robust selector generation function (now handles special chars in IDs)
@@ -8,15 +8,18 @@ import logging
 import re
 import traceback
 from pathlib import Path
+from types import CodeType
 from typing import Any
 
 from uuid_extensions import uuid7str
 
 from browser_use.browser import BrowserSession
 from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.screenshots import get_screenshot_media_type
 from browser_use.dom.service import DomService
 from browser_use.filesystem.file_system import FileSystem
 from browser_use.llm.base import BaseChatModel
+from browser_use.llm.http_pool import release_shared_http_clients, retain_shared_http_clients
 from browser_use.llm.messages import (
 	AssistantMessage,
 	BaseMessage,
@@ -33,10 +36,12 @@ from browser_use.tokens.views import UsageSummary
 from browser_use.tools.service import CodeAgentTools, Tools
 from browser_use.utils import get_browser_use_version
 
+from .executor import CodeCellExecutor, compile_cell, parse_cell
 from .formatting import format_browser_state_for_llm
 from .namespace import EvaluateError, create_namespace
 from .utils import detect_token_limit_issue, extract_code_blocks, extract_url_from_task, truncate_message_content
 from .views import (
+	CellExecutionStats,
 	CellType,
 	CodeAgentHistory,
 	CodeAgentHistoryList,
@@ -79,6 +84,7 @@ class CodeAgent:
 		use_vision: bool = True,
 		calculate_cost: bool = False,
 		demo_mode: bool | None = None,
+		cell_timeout: float | None = None,
 		**kwargs,
 	):
 		"""
@@ -100,6 +106,7 @@ class CodeAgent:
 			use_vision: Whether to include screenshots in LLM messages (default: True)
 			calculate_cost: Whether to calculate token costs (default: False)
 			demo_mode: Enable the in-browser demo panel for live logging (default: False)
+			cell_timeout: Maximum seconds a code cell may run before it is interrupted (default: None, no limit)
 			llm: Optional ChatBrowserUse LLM instance (will create default if not provided)
 			**kwargs: Additional keyword arguments for compatibility (ignored)
 		"""
@@ -157,9 +164,11 @@ class CodeAgent:
 		self.max_failures = max_failures
 		self.max_validations = max_validations
 		self.use_vision = use_vision
+		self.cell_timeout = cell_timeout
 
 		self.session = NotebookSession()
 		self.namespace: dict[str, Any] = {}
+		self._cell_executor: CodeCellExecutor | None = None  # Runs the cells, see _get_cell_executor
 		self._llm_messages: list[BaseMessage] = []  # Internal LLM conversation history
 		self.complete_history: list[CodeAgentHistory] = []  # Type-safe history with model_output and result
 		self.dom_service: DomService | None = None
@@ -213,6 +222,7 @@ class CodeAgent:
 		# Use override if provided, otherwise use value from __init__
 		steps_to_run = max_steps if max_steps is not None else self.max_steps
 		self.max_steps = steps_to_run
+		retain_shared_http_clients(self)
 		# Start browser if not provided
 		if self.browser_session is None:
 			assert self._browser_profile_for_init is not None
@@ -678,12 +688,13 @@ class CodeAgent:
 					ContentPartTextParam(text=self._last_browser_state_text)
 				]
 
-				# Add screenshot
+				# Add screenshot, captured in the configured screenshot_format
+				media_type = get_screenshot_media_type(self._last_screenshot)
 				content_parts.append(
 					ContentPartImageParam(
 						image_url=ImageURL(
-							url=f'data:image/png;base64,{self._last_screenshot}',
-							media_type='image/png',
+							url=f'data:{media_type};base64,{self._last_screenshot}',
+							media_type=media_type,
 							detail='auto',
 						),
 					)
@@ -824,14 +835,12 @@ class CodeAgent:
 		error = None
 		browser_state = None
 
+		executor = self._get_cell_executor()
+		stats = CellExecutionStats()
+		cell.execution_stats = stats
 		try:
-			# Capture output
-			import ast
-			import io
-			import sys
-
-			old_stdout = sys.stdout
-			sys.stdout = io.StringIO()
+			# Capture the output of this cell only (the output of other tasks and threads is left alone)
+			output_buffer, output_token = executor.capture_output()
 
 			try:
 				# Add asyncio to namespace if not already there
@@ -846,13 +855,15 @@ class CodeAgent:
 				# Check if code contains await expressions - if so, wrap in async function
 				# This mimics how Jupyter/IPython handles top-level await
 				try:
-					tree = ast.parse(code, mode='exec')
-					has_await = any(isinstance(node, (ast.Await, ast.AsyncWith, ast.AsyncFor)) for node in ast.walk(tree))
+					parsed_cell = parse_cell(code)
+					has_await = parsed_cell.has_await
 				except SyntaxError:
-					# If parse fails, let exec handle the error
+					# If parse fails, let compile handle the error
+					parsed_cell = None
 					has_await = False
 
 				if has_await:
+					assert parsed_cell is not None
 					# When code has await, we must wrap in async function
 					# To make variables persist naturally (like Jupyter without needing 'global'):
 					# 1. Extract all assigned variable names from the code
@@ -860,36 +871,17 @@ class CodeAgent:
 					# 3. Extract user's explicit global declarations and pre-define those vars
 					# 4. Return locals() so we can update namespace with new variables
 
-					# Find all variable names being assigned + user's explicit globals
-					try:
-						assigned_names = set()
-						user_global_names = set()
-
-						for node in ast.walk(tree):
-							if isinstance(node, ast.Assign):
-								for target in node.targets:
-									if isinstance(target, ast.Name):
-										assigned_names.add(target.id)
-							elif isinstance(node, ast.AugAssign) and isinstance(node.target, ast.Name):
-								assigned_names.add(node.target.id)
-							elif isinstance(node, (ast.AnnAssign, ast.NamedExpr)):
-								if hasattr(node, 'target') and isinstance(node.target, ast.Name):
-									assigned_names.add(node.target.id)
-							elif isinstance(node, ast.Global):
-								# Track user's explicit global declarations
-								user_global_names.update(node.names)
-
-						# Pre-define any user-declared globals that don't exist yet
-						# This prevents NameError when user writes "global foo" before "foo = ..."
-						for name in user_global_names:
-							if name not in self.namespace:
-								self.namespace[name] = None
-
-						# Filter to only existing namespace vars (like Jupyter does)
-						# Include both: assigned vars that exist + user's explicit globals
-						existing_vars = {name for name in (assigned_names | user_global_names) if name in self.namespace}
-					except Exception as e:
-						existing_vars = set()
+					# Pre-define any user-declared globals that don't exist yet
+					# This prevents NameError when user writes "global foo" before "foo = ..."
+					for name in parsed_cell.user_global_names:
+						if name not in self.namespace:
+							self.namespace[name] = None
+
+					# Filter to only existing namespace vars (like Jupyter does)
+					# Include both: assigned vars that exist + user's explicit globals
+					existing_vars = {
+						name for name in (parsed_cell.assigned_names | parsed_cell.user_global_names) if name in self.namespace
+					}
 
 					# Build global declaration if needed
 					global_decl = ''
@@ -911,13 +903,13 @@ __code_exec_coro__ = __code_exec__()
 					self.namespace['_has_global_decl'] = has_global_decl
 
 					# Compile and execute wrapper at module level
-					compiled_code = compile(wrapped_code, '<code>', 'exec')
+					compiled_code = self._compile_cell(wrapped_code, stats)
 					exec(compiled_code, self.namespace, self.namespace)
 
 					# Get and await the coroutine, then update namespace with new/modified variables
 					coro = self.namespace.get('__code_exec_coro__')
 					if coro:
-						result_locals = await coro
+						result_locals = await executor.run_async(coro, stats)
 						# Update namespace with all variables from the function's locals
 						# This makes variable assignments persist across cells
 						if result_locals:
@@ -932,24 +924,22 @@ __code_exec_coro__ = __code_exec__()
 				else:
 					# No await - execute directly at module level for natural variable scoping
 					# This means x = x + 10 will work without needing 'global x'
-
-					# Track variables before execution
-					vars_before = set(self.namespace.keys())
-
-					compiled_code = compile(code, '<code>', 'exec')
-					exec(compiled_code, self.namespace, self.namespace)
-
-					# Track newly created/modified variables (info shown in "Available" section)
-					vars_after = set(self.namespace.keys())
-					new_vars = vars_after - vars_before
+					# Runs in the worker thread so blocking or CPU-heavy code doesn't stall the event loop
+					compiled_code = self._compile_cell(code, stats)
+					await executor.run_sync(compiled_code, stats)
 
 				# Get output
-				output_value = sys.stdout.getvalue()
+				output_value = output_buffer.getvalue()
 				if output_value:
 					output = output_value
 
 			finally:
-				sys.stdout = old_stdout
+				executor.stop_capturing_output(output_token)
+				logger.debug(
+					f'Cell {cell.execution_count}: {stats.wall_seconds:.2f}s wall, {stats.cpu_seconds:.2f}s CPU, '
+					f'+{stats.peak_memory_growth_bytes / 1024 / 1024:.1f}MB peak RSS'
+					f'{" (worker thread)" if stats.in_worker else ""}{" (compile cache hit)" if stats.compile_cached else ""}'
+				)
 
 			# Wait 2 seconds for page to stabilize after code execution
 			await asyncio.sleep(0.5)
@@ -1084,6 +1074,21 @@ __code_exec_coro__ = __code_exec__()
 
 		return output, error, None
 
+	def _get_cell_executor(self) -> CodeCellExecutor:
+		"""The executor running the cells, created for the current namespace on first use."""
+		if self._cell_executor is None or self._cell_executor.namespace is not self.namespace:
+			if self._cell_executor is not None:
+				self._cell_executor.close()
+			self._cell_executor = CodeCellExecutor(self.namespace, timeout=self.cell_timeout)
+		return self._cell_executor
+
+	@staticmethod
+	def _compile_cell(source: str, stats: CellExecutionStats) -> CodeType:
+		hits = compile_cell.cache_info().hits
+		compiled_code = compile_cell(source)
+		stats.compile_cached = compile_cell.cache_info().hits > hits
+		return compiled_code
+
 	async def _get_browser_state(self) -> tuple[str, str | None]:
 		"""Get the current browser state as text with ultra-minimal DOM structure for code agents.
 
@@ -1419,7 +1424,11 @@ __code_exec_coro__ = __code_exec__()
 		return CodeAgentHistoryList(self.complete_history, self.usage_summary)
 
 	async def close(self) -> None:
-		"""Close the browser session."""
+		"""Close the browser session and the shared LLM connection pools (unless other agents still use them)."""
+		if self._cell_executor is not None:
+			self._cell_executor.close()
+			self._cell_executor = None
+		await release_shared_http_clients(self)
 		if self.browser_session:
 			# Check if we should close the browser based on keep_alive setting
 			if not self.browser_session.browser_profile.keep_alive:
@@ -29,6 +29,22 @@ class ExecutionStatus(str, Enum):
 	ERROR = 'error'
 
 
+class CellExecutionStats(BaseModel):
+	"""Resources used by the execution of a code cell."""
+
+	model_config = ConfigDict(extra='forbid')
+
+	wall_seconds: float = Field(default=0.0, description='Wall-clock time of the execution')
+	cpu_seconds: float = Field(
+		default=0.0,
+		description='CPU time of the thread that ran the cell (for async cells this is the event loop thread, other tasks included)',
+	)
+	peak_memory_growth_bytes: int = Field(default=0, description='How much the peak RSS of the process grew during the execution')
+	in_worker: bool = Field(default=False, description='Whether the cell ran in the worker thread (synchronous cells)')
+	compile_cached: bool = Field(default=False, description='Whether the compiled code came from the compile cache')
+	timed_out: bool = Field(default=False, description='Whether the cell was interrupted by the cell timeout')
+
+
 class CodeCell(BaseModel):
 	"""Represents a code cell in the notebook-like execution."""
 
@@ -42,6 +58,7 @@ class CodeCell(BaseModel):
 	status: ExecutionStatus = Field(default=ExecutionStatus.PENDING)
 	error: str | None = Field(default=None, description='Error message if execution failed')
 	browser_state: str | None = Field(default=None, description='Browser state after execution')
+	execution_stats: CellExecutionStats | None = Field(default=None, description='Resources used by the execution')
 
 
 class NotebookSession(BaseModel):
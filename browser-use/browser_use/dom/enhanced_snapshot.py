@@ -3,8 +3,16 @@ Enhanced snapshot processing for browser-use DOM tree extraction.
 
 This module provides stateless functions for parsing Chrome DevTools Protocol (CDP) DOMSnapshot data
 to extract visibility, clickability, cursor styles, and other layout information.
+
+The snapshot is kept in its columnar CDP form: only index maps are built upfront (with C-level dict/zip
+construction), and `EnhancedSnapshotNode` objects are materialized lazily for the backend node ids that are
+actually looked up.
 """
 
+import logging
+from collections.abc import Iterator, Mapping
+from itertools import repeat
+
 from cdp_use.cdp.domsnapshot.commands import CaptureSnapshotReturns
 from cdp_use.cdp.domsnapshot.types import (
 	LayoutTreeSnapshot,
@@ -30,9 +38,9 @@ REQUIRED_COMPUTED_STYLES = [
 ]
 
 
-def _parse_rare_boolean_data(rare_data: RareBooleanData, index: int) -> bool | None:
-	"""Parse rare boolean data from snapshot - returns True if index is in the rare data."""
-	return index in rare_data['index']
+def _parse_rare_boolean_data(rare_data: RareBooleanData) -> frozenset[int]:
+	"""Parse rare boolean data from snapshot into a set of the indices for which the value is true."""
+	return frozenset(rare_data['index'])
 
 
 def _parse_computed_styles(strings: list[str], style_indices: list[int]) -> dict[str, str]:
@@ -44,132 +52,201 @@ def _parse_computed_styles(strings: list[str], style_indices: list[int]) -> dict
 	return styles
 
 
+class _DocumentColumns:
+	"""Column references and index maps of a single snapshot document (no per-node work)."""
+
+	__slots__ = (
+		'layout_index_map',
+		'clickable',
+		'bounds',
+		'styles',
+		'paint_orders',
+		'client_rects',
+		'scroll_rects',
+		'stacking_contexts',
+	)
+
+	def __init__(self, nodes: NodeTreeSnapshot, layout: LayoutTreeSnapshot):
+		# Snapshot index -> layout index, FIRST occurrence wins for duplicates
+		# (built reversed so that earlier entries overwrite later ones)
+		node_index = layout.get('nodeIndex', []) if layout else []
+		self.layout_index_map: dict[int, int] = dict(zip(reversed(node_index), range(len(node_index) - 1, -1, -1)))
+		self.clickable: frozenset[int] | None = _parse_rare_boolean_data(nodes['isClickable']) if 'isClickable' in nodes else None
+		self.bounds = layout.get('bounds', []) if layout else []
+		self.styles = layout.get('styles', []) if layout else []
+		self.paint_orders = layout.get('paintOrders', []) if layout else []
+		self.client_rects = layout.get('clientRects', []) if layout else []
+		self.scroll_rects = layout.get('scrollRects', []) if layout else []
+		self.stacking_contexts = layout.get('stackingContexts', {}) if layout else {}
+
+
+class SnapshotLookup(Mapping[int, EnhancedSnapshotNode]):
+	"""Read-only backend node id -> `EnhancedSnapshotNode` mapping backed by the snapshot columns.
+
+	Nodes are materialized on first access and cached, so repeated lookups return the same object
+	(callers adjust `bounds` in place while computing visibility).
+	"""
+
+	def __init__(
+		self,
+		strings: list[str],
+		documents: list[_DocumentColumns],
+		locations: dict[int, tuple[int, int]],
+		device_pixel_ratio: float,
+	):
+		self._strings = strings
+		self._documents = documents
+		self._locations = locations
+		""" backend node id -> (document index, snapshot node index)"""
+		self._device_pixel_ratio = device_pixel_ratio
+		self._materialized: dict[int, EnhancedSnapshotNode] = {}
+
+	def __getitem__(self, backend_node_id: int) -> EnhancedSnapshotNode:
+		node = self._materialized.get(backend_node_id)
+		if node is None:
+			doc_idx, snapshot_index = self._locations[backend_node_id]
+			node = self._materialize(self._documents[doc_idx], snapshot_index)
+			self._materialized[backend_node_id] = node
+		return node
+
+	def get(self, backend_node_id: int, default=None):  # type: ignore[override]
+		# Avoid the KeyError round trip of Mapping.get, most DOM nodes are looked up exactly once
+		if backend_node_id in self._locations:
+			return self[backend_node_id]
+		return default
+
+	def __contains__(self, backend_node_id: object) -> bool:
+		return backend_node_id in self._locations
+
+	def __iter__(self) -> Iterator[int]:
+		return iter(self._locations)
+
+	def __len__(self) -> int:
+		return len(self._locations)
+
+	def count_with_bounds(self) -> int:
+		"""Count nodes that have a layout box, without materializing them."""
+		count = 0
+		for doc_idx, snapshot_index in self._locations.values():
+			document = self._documents[doc_idx]
+			layout_idx = document.layout_index_map.get(snapshot_index)
+			if layout_idx is not None and layout_idx < len(document.bounds) and len(document.bounds[layout_idx]) >= 4:
+				count += 1
+		return count
+
+	def _materialize(self, document: _DocumentColumns, snapshot_index: int) -> EnhancedSnapshotNode:
+		is_clickable = None
+		if document.clickable is not None:
+			is_clickable = snapshot_index in document.clickable
+
+		cursor_style = None
+		bounding_box = None
+		computed_styles = {}
+		paint_order = None
+		client_rects = None
+		scroll_rects = None
+		stacking_contexts = None
+
+		# Look for layout tree node that corresponds to this snapshot node
+		layout_idx = document.layout_index_map.get(snapshot_index)
+		if layout_idx is not None and layout_idx < len(document.bounds):
+			# Parse bounding box
+			bounds = document.bounds[layout_idx]
+			if len(bounds) >= 4:
+				# IMPORTANT: CDP coordinates are in device pixels, convert to CSS pixels
+				# by dividing by the device pixel ratio
+				device_pixel_ratio = self._device_pixel_ratio
+				bounding_box = DOMRect(
+					x=bounds[0] / device_pixel_ratio,
+					y=bounds[1] / device_pixel_ratio,
+					width=bounds[2] / device_pixel_ratio,
+					height=bounds[3] / device_pixel_ratio,
+				)
+
+			# Parse computed styles for this layout node
+			if layout_idx < len(document.styles):
+				computed_styles = _parse_computed_styles(self._strings, document.styles[layout_idx])
+				cursor_style = computed_styles.get('cursor')
+
+			# Extract paint order if available
+			if layout_idx < len(document.paint_orders):
+				paint_order = document.paint_orders[layout_idx]
+
+			# Extract client rects if available
+			if layout_idx < len(document.client_rects):
+				client_rect_data = document.client_rects[layout_idx]
+				if client_rect_data and len(client_rect_data) >= 4:
+					client_rects = DOMRect(
+						x=client_rect_data[0],
+						y=client_rect_data[1],
+						width=client_rect_data[2],
+						height=client_rect_data[3],
+					)
+
+			# Extract scroll rects if available
+			if layout_idx < len(document.scroll_rects):
+				scroll_rect_data = document.scroll_rects[layout_idx]
+				if scroll_rect_data and len(scroll_rect_data) >= 4:
+					scroll_rects = DOMRect(
+						x=scroll_rect_data[0],
+						y=scroll_rect_data[1],
+						width=scroll_rect_data[2],
+						height=scroll_rect_data[3],
+					)
+
+			# Extract stacking contexts if available
+			if layout_idx < len(document.stacking_contexts):
+				stacking_contexts = document.stacking_contexts.get('index', [])[layout_idx]
+
+		return EnhancedSnapshotNode(
+			is_clickable=is_clickable,
+			cursor_style=cursor_style,
+			bounds=bounding_box,
+			clientRects=client_rects,
+			scrollRects=scroll_rects,
+			computed_styles=computed_styles if computed_styles else None,
+			paint_order=paint_order,
+			stacking_contexts=stacking_contexts,
+		)
+
+
 def build_snapshot_lookup(
 	snapshot: CaptureSnapshotReturns,
 	device_pixel_ratio: float = 1.0,
-) -> dict[int, EnhancedSnapshotNode]:
-	"""Build a lookup table of backend node ID to enhanced snapshot data with everything calculated upfront."""
-	import logging
-
+) -> SnapshotLookup:
+	"""Build a lazy lookup table of backend node ID to enhanced snapshot data."""
 	logger = logging.getLogger('browser_use.dom.enhanced_snapshot')
-	snapshot_lookup: dict[int, EnhancedSnapshotNode] = {}
+	strings = snapshot['strings']
+	documents: list[_DocumentColumns] = []
+	locations: dict[int, tuple[int, int]] = {}
 
 	if not snapshot['documents']:
-		return snapshot_lookup
+		return SnapshotLookup(strings, documents, locations, device_pixel_ratio)
 
-	strings = snapshot['strings']
 	logger.debug(f'🔍 SNAPSHOT: Processing {len(snapshot["documents"])} documents with {len(strings)} strings')
 
 	for doc_idx, document in enumerate(snapshot['documents']):
 		nodes: NodeTreeSnapshot = document['nodes']
 		layout: LayoutTreeSnapshot = document['layout']
 
-		# Build backend node id to snapshot index lookup
-		backend_node_to_snapshot_index = {}
-		if 'backendNodeId' in nodes:
-			for i, backend_node_id in enumerate(nodes['backendNodeId']):
-				backend_node_to_snapshot_index[backend_node_id] = i
+		documents.append(_DocumentColumns(nodes, layout))
 
-		# Log document info
-		doc_url = strings[document.get('documentURL', 0)] if document.get('documentURL', 0) < len(strings) else 'N/A'
-		logger.debug(
-			f'🔍 SNAPSHOT doc[{doc_idx}]: url={doc_url[:80]}... has {len(backend_node_to_snapshot_index)} nodes, '
-			f'layout has {len(layout.get("nodeIndex", []))} entries'
-		)
+		# Backend node id -> (document, snapshot index), later documents win like before
+		backend_node_ids = nodes.get('backendNodeId', [])
+		locations.update(zip(backend_node_ids, zip(repeat(doc_idx), range(len(backend_node_ids)))))
 
-		# PERFORMANCE: Pre-build layout index map to eliminate O(n²) double lookups
-		# Preserve original behavior: use FIRST occurrence for duplicates
-		layout_index_map = {}
-		if layout and 'nodeIndex' in layout:
-			for layout_idx, node_index in enumerate(layout['nodeIndex']):
-				if node_index not in layout_index_map:  # Only store first occurrence
-					layout_index_map[node_index] = layout_idx
-
-		# Build snapshot lookup for each backend node id
-		for backend_node_id, snapshot_index in backend_node_to_snapshot_index.items():
-			is_clickable = None
-			if 'isClickable' in nodes:
-				is_clickable = _parse_rare_boolean_data(nodes['isClickable'], snapshot_index)
-
-			# Find corresponding layout node
-			cursor_style = None
-			is_visible = None
-			bounding_box = None
-			computed_styles = {}
-
-			# Look for layout tree node that corresponds to this snapshot node
-			paint_order = None
-			client_rects = None
-			scroll_rects = None
-			stacking_contexts = None
-			if snapshot_index in layout_index_map:
-				layout_idx = layout_index_map[snapshot_index]
-				if layout_idx < len(layout.get('bounds', [])):
-					# Parse bounding box
-					bounds = layout['bounds'][layout_idx]
-					if len(bounds) >= 4:
-						# IMPORTANT: CDP coordinates are in device pixels, convert to CSS pixels
-						# by dividing by the device pixel ratio
-						raw_x, raw_y, raw_width, raw_height = bounds[0], bounds[1], bounds[2], bounds[3]
-
-						# Apply device pixel ratio scaling to convert device pixels to CSS pixels
-						bounding_box = DOMRect(
-							x=raw_x / device_pixel_ratio,
-							y=raw_y / device_pixel_ratio,
-							width=raw_width / device_pixel_ratio,
-							height=raw_height / device_pixel_ratio,
-						)
-
-					# Parse computed styles for this layout node
-					if layout_idx < len(layout.get('styles', [])):
-						style_indices = layout['styles'][layout_idx]
-						computed_styles = _parse_computed_styles(strings, style_indices)
-						cursor_style = computed_styles.get('cursor')
-
-					# Extract paint order if available
-					if layout_idx < len(layout.get('paintOrders', [])):
-						paint_order = layout.get('paintOrders', [])[layout_idx]
-
-					# Extract client rects if available
-					client_rects_data = layout.get('clientRects', [])
-					if layout_idx < len(client_rects_data):
-						client_rect_data = client_rects_data[layout_idx]
-						if client_rect_data and len(client_rect_data) >= 4:
-							client_rects = DOMRect(
-								x=client_rect_data[0],
-								y=client_rect_data[1],
-								width=client_rect_data[2],
-								height=client_rect_data[3],
-							)
-
-					# Extract scroll rects if available
-					scroll_rects_data = layout.get('scrollRects', [])
-					if layout_idx < len(scroll_rects_data):
-						scroll_rect_data = scroll_rects_data[layout_idx]
-						if scroll_rect_data and len(scroll_rect_data) >= 4:
-							scroll_rects = DOMRect(
-								x=scroll_rect_data[0],
-								y=scroll_rect_data[1],
-								width=scroll_rect_data[2],
-								height=scroll_rect_data[3],
-							)
-
-					# Extract stacking contexts if available
-					if layout_idx < len(layout.get('stackingContexts', [])):
-						stacking_contexts = layout.get('stackingContexts', {}).get('index', [])[layout_idx]
-
-			snapshot_lookup[backend_node_id] = EnhancedSnapshotNode(
-				is_clickable=is_clickable,
-				cursor_style=cursor_style,
-				bounds=bounding_box,
-				clientRects=client_rects,
-				scrollRects=scroll_rects,
-				computed_styles=computed_styles if computed_styles else None,
-				paint_order=paint_order,
-				stacking_contexts=stacking_contexts,
+		if logger.isEnabledFor(logging.DEBUG):
+			doc_url = strings[document.get('documentURL', 0)] if document.get('documentURL', 0) < len(strings) else 'N/A'
+			logger.debug(
+				f'🔍 SNAPSHOT doc[{doc_idx}]: url={doc_url[:80]}... has {len(backend_node_ids)} nodes, '
+				f'layout has {len(layout.get("nodeIndex", []))} entries'
 			)
 
+	snapshot_lookup = SnapshotLookup(strings, documents, locations, device_pixel_ratio)
+
 	# Count how many have bounds (are actually visible/laid out)
-	with_bounds = sum(1 for n in snapshot_lookup.values() if n.bounds)
-	logger.debug(f'🔍 SNAPSHOT: Built lookup with {len(snapshot_lookup)} total entries, {with_bounds} have bounds')
+	if logger.isEnabledFor(logging.DEBUG):
+		logger.debug(
+			f'🔍 SNAPSHOT: Built lookup with {len(snapshot_lookup)} total entries, {snapshot_lookup.count_with_bounds()} have bounds'
+		)
 	return snapshot_lookup
@@ -0,0 +1,341 @@
+"""
+Incremental maintenance of the enhanced DOM tree from CDP DOM mutation events.
+
+After a full build, the tracker keeps a reference to the enhanced tree (the same object `DOMWatchdog` caches) and to the
+NodeId lookup it was built from, and patches both in place while `DOM.*` mutation events arrive. `DomService` then only
+has to refresh layout, styles and accessibility data for the dirty nodes instead of re-fetching the whole document.
+
+Anything the tracker cannot patch safely (navigation, unknown node ids, new iframes, shadow root changes, a detached
+session, too many dirty nodes) marks the tree as stale, and the next request falls back to a full rebuild.
+"""
+
+import logging
+from typing import Any
+
+from cdp_use.cdp.dom.types import Node
+from cdp_use.cdp.target import SessionID, TargetID
+
+from browser_use.dom.views import EnhancedDOMTreeNode, NodeType
+
+# Hard cap on dirty nodes - above this a full snapshot is cheaper than per-node layout refreshes
+MAX_INCREMENTAL_DIRTY_NODES = 500
+
+# Tags whose insertion requires a full rebuild (their content documents are not part of mutation events)
+_FRAME_TAGS = frozenset({'IFRAME', 'FRAME'})
+
+# Attributes that do not change layout (and are rarely used in selectors), only the element itself is refreshed
+_LAYOUT_NEUTRAL_ATTRIBUTES = frozenset(
+	{'href', 'title', 'tabindex', 'aria-label', 'aria-labelledby', 'aria-describedby', 'aria-controls', 'aria-live'}
+)
+
+
+class DomMutationTracker:
+	"""Patches a cached enhanced DOM tree in place from CDP DOM mutation events.
+
+	Handlers are synchronous (CDP requirement) and only touch in-memory state, anything that needs a CDP round trip
+	(layout refresh, AX data, child node requests) is collected here and performed by `DomService`.
+	"""
+
+	def __init__(self, logger: logging.Logger, max_dirty_ratio: float = 0.1):
+		self.logger = logger
+		self.max_dirty_ratio = max_dirty_ratio
+
+		self.target_id: TargetID | None = None
+		self.session_id: SessionID | None = None
+		self.root: EnhancedDOMTreeNode | None = None
+		self.node_lookup: dict[int, EnhancedDOMTreeNode] = {}
+		""" NodeId (NOT backend node id) -> enhanced dom tree node, same semantics as in `DomService.get_dom_tree`"""
+
+		self.dirty_node_ids: set[int] = set()
+		self.pending_child_requests: set[int] = set()
+		""" NodeIds inserted without their children, `DOM.requestChildNodes` must be called for them"""
+
+		self.page_metrics: tuple[float, ...] | None = None
+		"""Scroll position, viewport size and document size at the time of the last full build"""
+
+		self.stale_reason: str | None = 'not attached'
+		self.mutation_count = 0
+
+	# region - lifecycle
+
+	def attach(
+		self,
+		target_id: TargetID,
+		session_id: SessionID,
+		root: EnhancedDOMTreeNode,
+		node_lookup: dict[int, EnhancedDOMTreeNode],
+		page_metrics: tuple[float, ...] | None,
+	) -> None:
+		"""Start tracking a freshly built tree."""
+		self.target_id = target_id
+		self.session_id = session_id
+		self.root = root
+		self.node_lookup = node_lookup
+		self.page_metrics = page_metrics
+		self.dirty_node_ids = set()
+		self.pending_child_requests = set()
+		self.mutation_count = 0
+		self.stale_reason = None
+
+	def invalidate(self, reason: str) -> None:
+		"""Mark the tracked tree as unusable, the next request does a full rebuild."""
+		if self.stale_reason is None:
+			self.logger.debug(f'🔄 Incremental DOM: tree invalidated ({reason})')
+			self.stale_reason = reason
+		self.dirty_node_ids.clear()
+		self.pending_child_requests.clear()
+
+	def reset(self) -> None:
+		"""Drop all references to the tracked tree."""
+		self.invalidate('reset')
+		self.root = None
+		self.node_lookup = {}
+		self.page_metrics = None
+
+	@property
+	def dirty_ratio(self) -> float:
+		return len(self.dirty_node_ids) / max(len(self.node_lookup), 1)
+
+	def get_rebuild_reason(self, target_id: TargetID) -> str | None:
+		"""Return why the tracked tree cannot be reused for `target_id`, or None if it can be patched."""
+		if self.stale_reason is not None:
+			return self.stale_reason
+		if self.root is None or target_id != self.target_id:
+			return 'different target'
+		if len(self.dirty_node_ids) > MAX_INCREMENTAL_DIRTY_NODES:
+			return f'{len(self.dirty_node_ids)} dirty nodes > {MAX_INCREMENTAL_DIRTY_NODES}'
+		if self.dirty_ratio > self.max_dirty_ratio:
+			return f'dirty ratio {self.dirty_ratio:.2f} > {self.max_dirty_ratio:.2f}'
+		return None
+
+	def pop_dirty_nodes(self) -> list[EnhancedDOMTreeNode]:
+		"""Return the dirty nodes that are still part of the tree and reset the dirty set."""
+		dirty_nodes = [self.node_lookup[node_id] for node_id in self.dirty_node_ids if node_id in self.node_lookup]
+		self.dirty_node_ids.clear()
+		return dirty_nodes
+
+	# endregion - lifecycle
+
+	# region - CDP event handling
+
+	def handle_event(self, event_name: str, event: dict[str, Any]) -> None:
+		"""Entry point for `SessionManager.register_dom_mutation_listener`."""
+		if self.stale_reason is not None:
+			return
+		self.mutation_count += 1
+
+		if event_name == 'childNodeInserted':
+			self._on_child_node_inserted(event['parentNodeId'], event.get('previousNodeId', 0), event['node'])
+		elif event_name == 'childNodeRemoved':
+			self._on_child_node_removed(event['parentNodeId'], event['nodeId'])
+		elif event_name == 'attributeModified':
+			self._on_attribute_changed(event['nodeId'], event['name'], event.get('value', ''))
+		elif event_name == 'attributeRemoved':
+			self._on_attribute_changed(event['nodeId'], event['name'], None)
+		elif event_name == 'characterDataModified':
+			self._on_character_data_modified(event['nodeId'], event.get('characterData', ''))
+		elif event_name == 'setChildNodes':
+			self._on_set_child_nodes(event['parentId'], event.get('nodes', []))
+		elif event_name in ('documentUpdated', 'detached'):
+			self.invalidate(event_name)
+		elif event_name in ('shadowRootPushed', 'shadowRootPopped'):
+			self.invalidate(event_name)
+
+	def _get_known_node(self, node_id: int) -> EnhancedDOMTreeNode | None:
+		node = self.node_lookup.get(node_id)
+		if node is None:
+			self.invalidate(f'unknown node id {node_id}')
+		return node
+
+	def _on_child_node_inserted(self, parent_node_id: int, previous_node_id: int, node: Node) -> None:
+		parent = self._get_known_node(parent_node_id)
+		if parent is None:
+			return
+
+		new_node = self._build_subtree(node, parent)
+		if new_node is None:
+			return
+
+		if parent.children_nodes is None:
+			parent.children_nodes = []
+		position = 0
+		if previous_node_id:
+			for i, child in enumerate(parent.children_nodes):
+				if child.node_id == previous_node_id:
+					position = i + 1
+					break
+			else:
+				self.invalidate(f'unknown previous sibling {previous_node_id}')
+				return
+		parent.children_nodes.insert(position, new_node)
+		# Sibling positions (and with them the xpaths below the parent) may have shifted
+		parent.invalidate_memo(include_subtree_xpaths=True)
+		self._mark_layout_changed(parent)
+
+	def _on_child_node_removed(self, parent_node_id: int, node_id: int) -> None:
+		parent = self._get_known_node(parent_node_id)
+		node = self._get_known_node(node_id)
+		if parent is None or node is None:
+			return
+
+		# Compare by identity, dataclass equality would walk the parent chain
+		for siblings in (parent.children_nodes, parent.shadow_roots):
+			if siblings:
+				for i, sibling in enumerate(siblings):
+					if sibling is node:
+						del siblings[i]
+						break
+		parent.invalidate_memo(include_subtree_xpaths=True)
+		self._mark_layout_changed(parent)
+
+		# Forget the whole removed subtree so later events for its ids are treated as unknown
+		stack = [node]
+		while stack:
+			current = stack.pop()
+			self.node_lookup.pop(current.node_id, None)
+			self.dirty_node_ids.discard(current.node_id)
+			self.pending_child_requests.discard(current.node_id)
+			if current.children_nodes:
+				stack.extend(current.children_nodes)
+			if current.shadow_roots:
+				stack.extend(current.shadow_roots)
+			if current.content_document and current.content_document.target_id == self.target_id:
+				stack.append(current.content_document)
+
+	def _on_attribute_changed(self, node_id: int, name: str, value: str | None) -> None:
+		node = self._get_known_node(node_id)
+		if node is None:
+			return
+
+		if value is None:
+			node.attributes.pop(name, None)
+		else:
+			node.attributes[name] = value
+		node.invalidate_memo()
+
+		if name in _LAYOUT_NEUTRAL_ATTRIBUTES:
+			self.dirty_node_ids.add(node.node_id)
+		else:
+			# Styles (class, style, hidden, attribute selectors) can change the layout of the subtree and what follows it
+			self._mark_layout_changed(node)
+
+	def _on_character_data_modified(self, node_id: int, character_data: str) -> None:
+		node = self._get_known_node(node_id)
+		if node is None:
+			return
+		node.node_value = character_data
+		# The new text can be wider or taller, which moves the content around it
+		self._mark_layout_changed(node.parent_node or node)
+
+	def _on_set_child_nodes(self, parent_node_id: int, nodes: list[Node]) -> None:
+		parent = self._get_known_node(parent_node_id)
+		if parent is None:
+			return
+		self.pending_child_requests.discard(parent_node_id)
+
+		children: list[EnhancedDOMTreeNode] = []
+		for node in nodes:
+			child = self._build_subtree(node, parent)
+			if child is None:
+				return
+			children.append(child)
+		parent.children_nodes = children
+		parent.invalidate_memo(include_subtree_xpaths=True)
+		self._mark_layout_changed(parent)
+
+	def _mark_layout_changed(self, node: EnhancedDOMTreeNode) -> None:
+		"""Mark everything whose layout a change of `node`'s subtree can affect as dirty.
+
+		That is the subtree itself, the ancestors (whose size may change) and all content that follows in document
+		order (which may move), up to the document the node belongs to.
+		"""
+		self._mark_subtree_dirty(node)
+		current = node
+		while self.stale_reason is None and current.node_type != NodeType.DOCUMENT_NODE and current.parent_node is not None:
+			parent = current.parent_node
+			siblings = parent.children_nodes or []
+			# Shadow roots are not among the children, the host's children are all rendered relative to them
+			position = next((i for i, sibling in enumerate(siblings) if sibling is current), -1)
+			for sibling in siblings[position + 1 :]:
+				self._mark_subtree_dirty(sibling)
+			if self.stale_reason is None and parent.node_type != NodeType.DOCUMENT_NODE:
+				self.dirty_node_ids.add(parent.node_id)
+			current = parent
+
+	def _mark_subtree_dirty(self, node: EnhancedDOMTreeNode) -> None:
+		if self.stale_reason is not None:
+			return
+		stack = [node]
+		while stack:
+			current = stack.pop()
+			self.dirty_node_ids.add(current.node_id)
+			if len(self.dirty_node_ids) > MAX_INCREMENTAL_DIRTY_NODES:
+				# A full rebuild is cheaper, no need to keep walking the tree
+				self.invalidate(f'more than {MAX_INCREMENTAL_DIRTY_NODES} dirty nodes')
+				return
+			if current.children_nodes:
+				stack.extend(current.children_nodes)
+			if current.shadow_roots:
+				stack.extend(current.shadow_roots)
+
+	def _build_subtree(self, node: Node, parent: EnhancedDOMTreeNode) -> EnhancedDOMTreeNode | None:
+		"""Build enhanced nodes for an inserted CDP node (without layout or AX data, those are refreshed later)."""
+		if node['nodeName'].upper() in _FRAME_TAGS or node.get('contentDocument'):
+			self.invalidate(f'frame inserted ({node["nodeName"]})')
+			return None
+
+		attributes: dict[str, str] = {}
+		if node.get('attributes'):
+			for i in range(0, len(node['attributes']), 2):
+				attributes[node['attributes'][i]] = node['attributes'][i + 1]
+
+		enhanced_node = EnhancedDOMTreeNode(
+			node_id=node['nodeId'],
+			backend_node_id=node['backendNodeId'],
+			node_type=NodeType(node['nodeType']),
+			node_name=node['nodeName'],
+			node_value=node['nodeValue'],
+			attributes=attributes,
+			is_scrollable=node.get('isScrollable', None),
+			frame_id=node.get('frameId', None) or parent.frame_id,
+			session_id=self.session_id,
+			target_id=parent.target_id,
+			content_document=None,
+			shadow_root_type=node.get('shadowRootType', None),
+			shadow_roots=None,
+			parent_node=parent,
+			children_nodes=None,
+			ax_node=None,
+			snapshot_node=None,
+			is_visible=None,
+			absolute_position=None,
+		)
+		self.node_lookup[enhanced_node.node_id] = enhanced_node
+		self.dirty_node_ids.add(enhanced_node.node_id)
+
+		shadow_root_node_ids: set[int] = set()
+		if node.get('shadowRoots'):
+			enhanced_node.shadow_roots = []
+			for shadow_root in node['shadowRoots']:
+				shadow_root_node = self._build_subtree(shadow_root, enhanced_node)
+				if shadow_root_node is None:
+					return None
+				shadow_root_node_ids.add(shadow_root['nodeId'])
+				enhanced_node.shadow_roots.append(shadow_root_node)
+
+		if node.get('children'):
+			enhanced_node.children_nodes = []
+			for child in node['children']:
+				if child['nodeId'] in shadow_root_node_ids:
+					continue
+				child_node = self._build_subtree(child, enhanced_node)
+				if child_node is None:
+					return None
+				enhanced_node.children_nodes.append(child_node)
+		elif node.get('childNodeCount', 0) > 0:
+			# Chrome only sends the inserted node itself, the children have to be requested explicitly
+			self.pending_child_requests.add(enhanced_node.node_id)
+
+		return enhanced_node
+
+	# endregion - CDP event handling
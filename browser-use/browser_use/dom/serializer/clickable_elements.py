@@ -1,7 +1,83 @@
-from browser_use.dom.views import EnhancedDOMTreeNode, NodeType
+import re
+
+from browser_use.dom.views import AXInteractivity, EnhancedAXNode, EnhancedAXProperty, EnhancedDOMTreeNode, NodeType
+
+# Rule tables, built once at import instead of on every call
+
+SEARCH_INDICATORS = (
+	'search',
+	'magnify',
+	'glass',
+	'lookup',
+	'find',
+	'query',
+	'search-icon',
+	'search-btn',
+	'search-button',
+	'searchbox',
+)
+# Substring match of any indicator in a single scan (longest alternatives first, the match itself is not used)
+_SEARCH_INDICATOR_PATTERN = re.compile('|'.join(re.escape(indicator) for indicator in sorted(SEARCH_INDICATORS, key=len, reverse=True)))
+
+# Note: 'label' removed - labels are handled by other attribute checks below - other wise labels with "for" attribute can destroy the real clickable element on apartments.com
+INTERACTIVE_TAGS = frozenset({'button', 'input', 'select', 'textarea', 'a', 'details', 'summary', 'option', 'optgroup'})
+
+INTERACTIVE_ATTRIBUTES = frozenset({'onclick', 'onmousedown', 'onmouseup', 'onkeydown', 'onkeyup', 'tabindex'})
+
+INTERACTIVE_ROLES = frozenset(
+	{
+		'button',
+		'link',
+		'menuitem',
+		'option',
+		'radio',
+		'checkbox',
+		'tab',
+		'textbox',
+		'combobox',
+		'slider',
+		'spinbutton',
+		'search',
+		'searchbox',
+	}
+)
+
+INTERACTIVE_AX_ROLES = INTERACTIVE_ROLES | {'listbox'}
+
+# Small elements with these attributes are likely interactive icons
+ICON_ATTRIBUTES = frozenset({'class', 'role', 'onclick', 'data-action', 'aria-label'})
+
+# AX properties, in the order of the original checks: truthy blocking -> not interactive, truthy interactive or
+# present state -> interactive
+_AX_BLOCKING_PROPERTIES = frozenset({'disabled', 'hidden'})
+_AX_INTERACTIVE_PROPERTIES = frozenset({'focusable', 'editable', 'settable', 'required', 'autocomplete', 'keyshortcuts'})
+_AX_STATE_PROPERTIES = frozenset({'checked', 'expanded', 'pressed', 'selected'})
 
 
 class ClickableElementDetector:
+	@staticmethod
+	def get_ax_properties_interactivity(properties: list[EnhancedAXProperty] | None) -> AXInteractivity:
+		"""Verdict of the first AX property that decides interactivity on its own."""
+		for prop in properties or ():
+			try:
+				name = prop.name
+				# aria disabled / aria hidden
+				if name in _AX_BLOCKING_PROPERTIES:
+					if prop.value:
+						return AXInteractivity.NOT_INTERACTIVE
+				# Direct interactiveness indicators, form-related interactiveness and keyboard shortcuts
+				elif name in _AX_INTERACTIVE_PROPERTIES:
+					if prop.value:
+						return AXInteractivity.INTERACTIVE
+				# Interactive state properties (presence indicates interactive widget)
+				elif name in _AX_STATE_PROPERTIES:
+					# These properties only exist on interactive elements
+					return AXInteractivity.INTERACTIVE
+			except (AttributeError, ValueError):
+				# Skip properties we can't process
+				continue
+		return AXInteractivity.UNDECIDED
+
 	@staticmethod
 	def is_interactive(node: EnhancedDOMTreeNode) -> bool:
 		"""Check if this node is clickable/interactive using enhanced scoring."""
@@ -14,13 +90,15 @@ class ClickableElementDetector:
 		# if node.ax_node and node.ax_node.ignored:
 		# 	return False
 
+		tag_name = node.tag_name
+
 		# remove html and body nodes
-		if node.tag_name in {'html', 'body'}:
+		if tag_name in {'html', 'body'}:
 			return False
 
 		# IFRAME elements should be interactive if they're large enough to potentially need scrolling
 		# Small iframes (< 100px width or height) are unlikely to have scrollable content
-		if node.tag_name and node.tag_name.upper() == 'IFRAME' or node.tag_name.upper() == 'FRAME':
+		if tag_name == 'iframe' or tag_name == 'frame':
 			if node.snapshot_node and node.snapshot_node.bounds:
 				width = node.snapshot_node.bounds.width
 				height = node.snapshot_node.bounds.height
@@ -33,82 +111,37 @@ class ClickableElementDetector:
 		# Visibility is determined separately by CSS styles, not just bounding box size
 
 		# SEARCH ELEMENT DETECTION: Check for search-related classes and attributes
-		if node.attributes:
-			search_indicators = {
-				'search',
-				'magnify',
-				'glass',
-				'lookup',
-				'find',
-				'query',
-				'search-icon',
-				'search-btn',
-				'search-button',
-				'searchbox',
-			}
-
-			# Check class names for search indicators
-			class_list = node.attributes.get('class', '').lower().split()
-			if any(indicator in ' '.join(class_list) for indicator in search_indicators):
+		attributes = node.attributes
+		if attributes:
+			# Check class names for search indicators (no indicator contains whitespace, so the raw class string works)
+			class_names = attributes.get('class')
+			if class_names and _SEARCH_INDICATOR_PATTERN.search(class_names.lower()):
 				return True
 
 			# Check id for search indicators
-			element_id = node.attributes.get('id', '').lower()
-			if any(indicator in element_id for indicator in search_indicators):
+			element_id = attributes.get('id')
+			if element_id and _SEARCH_INDICATOR_PATTERN.search(element_id.lower()):
 				return True
 
 			# Check data attributes for search functionality
-			for attr_name, attr_value in node.attributes.items():
-				if attr_name.startswith('data-') and any(indicator in attr_value.lower() for indicator in search_indicators):
+			for attr_name, attr_value in attributes.items():
+				if attr_name.startswith('data-') and _SEARCH_INDICATOR_PATTERN.search(attr_value.lower()):
 					return True
 
 		# Enhanced accessibility property checks - direct clear indicators only
-		if node.ax_node and node.ax_node.properties:
-			for prop in node.ax_node.properties:
-				try:
-					# aria disabled
-					if prop.name == 'disabled' and prop.value:
-						return False
-
-					# aria hidden
-					if prop.name == 'hidden' and prop.value:
-						return False
-
-					# Direct interactiveness indicators
-					if prop.name in ['focusable', 'editable', 'settable'] and prop.value:
-						return True
-
-					# Interactive state properties (presence indicates interactive widget)
-					if prop.name in ['checked', 'expanded', 'pressed', 'selected']:
-						# These properties only exist on interactive elements
-						return True
-
-					# Form-related interactiveness
-					if prop.name in ['required', 'autocomplete'] and prop.value:
-						return True
-
-					# Elements with keyboard shortcuts are interactive
-					if prop.name == 'keyshortcuts' and prop.value:
-						return True
-				except (AttributeError, ValueError):
-					# Skip properties we can't process
-					continue
-
-				# ENHANCED TAG CHECK: Include truly interactive elements
-		# Note: 'label' removed - labels are handled by other attribute checks below - other wise labels with "for" attribute can destroy the real clickable element on apartments.com
-		interactive_tags = {
-			'button',
-			'input',
-			'select',
-			'textarea',
-			'a',
-			'details',
-			'summary',
-			'option',
-			'optgroup',
-		}
-		# Check with case-insensitive comparison
-		if node.tag_name and node.tag_name.lower() in interactive_tags:
+		ax_node = node.ax_node
+		if ax_node and ax_node.properties:
+			interactivity = ax_node.properties_interactivity
+			if interactivity is AXInteractivity.UNKNOWN:
+				interactivity = ClickableElementDetector.get_ax_properties_interactivity(ax_node.properties)
+				ax_node.properties_interactivity = interactivity
+			if interactivity is AXInteractivity.NOT_INTERACTIVE:
+				return False
+			if interactivity is AXInteractivity.INTERACTIVE:
+				return True
+
+		# ENHANCED TAG CHECK: Include truly interactive elements
+		if tag_name in INTERACTIVE_TAGS:
 			return True
 
 		# SVG elements need special handling - only interactive if they have explicit handlers
@@ -132,69 +165,95 @@ class ClickableElementDetector:
 		# 	return False
 
 		# Tertiary check: elements with interactive attributes
-		if node.attributes:
+		if attributes:
 			# Check for event handlers or interactive attributes
-			interactive_attributes = {'onclick', 'onmousedown', 'onmouseup', 'onkeydown', 'onkeyup', 'tabindex'}
-			if any(attr in node.attributes for attr in interactive_attributes):
+			if not INTERACTIVE_ATTRIBUTES.isdisjoint(attributes):
 				return True
 
 			# Check for interactive ARIA roles
-			if 'role' in node.attributes:
-				interactive_roles = {
-					'button',
-					'link',
-					'menuitem',
-					'option',
-					'radio',
-					'checkbox',
-					'tab',
-					'textbox',
-					'combobox',
-					'slider',
-					'spinbutton',
-					'search',
-					'searchbox',
-				}
-				if node.attributes['role'] in interactive_roles:
-					return True
+			if attributes.get('role') in INTERACTIVE_ROLES:
+				return True
 
 		# Quaternary check: accessibility tree roles
-		if node.ax_node and node.ax_node.role:
-			interactive_ax_roles = {
-				'button',
-				'link',
-				'menuitem',
-				'option',
-				'radio',
-				'checkbox',
-				'tab',
-				'textbox',
-				'combobox',
-				'slider',
-				'spinbutton',
-				'listbox',
-				'search',
-				'searchbox',
-			}
-			if node.ax_node.role in interactive_ax_roles:
-				return True
+		if ax_node and ax_node.role in INTERACTIVE_AX_ROLES:
+			return True
 
 		# ICON AND SMALL ELEMENT CHECK: Elements that might be icons
+		snapshot_node = node.snapshot_node
 		if (
-			node.snapshot_node
-			and node.snapshot_node.bounds
-			and 10 <= node.snapshot_node.bounds.width <= 50  # Icon-sized elements
-			and 10 <= node.snapshot_node.bounds.height <= 50
+			snapshot_node
+			and snapshot_node.bounds
+			and 10 <= snapshot_node.bounds.width <= 50  # Icon-sized elements
+			and 10 <= snapshot_node.bounds.height <= 50
 		):
 			# Check if this small element has interactive properties
-			if node.attributes:
-				# Small elements with these attributes are likely interactive icons
-				icon_attributes = {'class', 'role', 'onclick', 'data-action', 'aria-label'}
-				if any(attr in node.attributes for attr in icon_attributes):
-					return True
+			if attributes and not ICON_ATTRIBUTES.isdisjoint(attributes):
+				return True
 
 		# Final fallback: cursor style indicates interactivity (for cases Chrome missed)
-		if node.snapshot_node and node.snapshot_node.cursor_style and node.snapshot_node.cursor_style == 'pointer':
+		if snapshot_node and snapshot_node.cursor_style == 'pointer':
 			return True
 
 		return False
+
+
+class ClickableElementCache:
+	"""
+	`ClickableElementDetector.is_interactive` results keyed by backend node id, kept across steps.
+
+	Every entry stores a fingerprint of everything the detector looks at (tag, attributes, AX role and property verdict,
+	size, cursor), so a node rebuilt by a later DOM snapshot reuses its result only while those inputs are unchanged.
+	Entries of nodes that are not part of the latest tree are dropped when the next tree starts.
+	"""
+
+	def __init__(self):
+		self._entries: dict[int, tuple[tuple, bool]] = {}
+		self._previous_entries: dict[int, tuple[tuple, bool]] = {}
+		self.hits = 0
+		self.misses = 0
+
+	def start_tree(self) -> None:
+		"""Call once per serialized tree, before the first lookup."""
+		self._previous_entries = self._entries
+		self._entries = {}
+
+	def clear(self) -> None:
+		self._entries = {}
+		self._previous_entries = {}
+
+	@staticmethod
+	def _ax_interactivity(ax_node: EnhancedAXNode) -> AXInteractivity:
+		if ax_node.properties_interactivity is AXInteractivity.UNKNOWN:
+			ax_node.properties_interactivity = ClickableElementDetector.get_ax_properties_interactivity(ax_node.properties)
+		return ax_node.properties_interactivity
+
+	@staticmethod
+	def _fingerprint(node: EnhancedDOMTreeNode) -> tuple:
+		ax_node = node.ax_node
+		snapshot_node = node.snapshot_node
+		bounds = snapshot_node.bounds if snapshot_node else None
+		return (
+			node.node_type,
+			node.node_name,
+			tuple(node.attributes.items()) if node.attributes else None,
+			(ax_node.role, ClickableElementCache._ax_interactivity(ax_node)) if ax_node else None,
+			(bounds.width, bounds.height) if bounds else None,
+			snapshot_node.cursor_style if snapshot_node else None,
+		)
+
+	def is_interactive(self, node: EnhancedDOMTreeNode) -> bool:
+		if node.node_type != NodeType.ELEMENT_NODE:
+			return False
+
+		backend_node_id = node.backend_node_id
+		fingerprint = self._fingerprint(node)
+		entry = self._entries.get(backend_node_id) or self._previous_entries.get(backend_node_id)
+		if entry is not None and entry[0] == fingerprint:
+			self.hits += 1
+			self._entries[backend_node_id] = entry
+			return entry[1]
+
+		self.misses += 1
+		result = ClickableElementDetector.is_interactive(node)
+		self._entries[backend_node_id] = (fingerprint, result)
+		return result
@@ -1,5 +1,7 @@
 from collections import defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass
+from typing import Literal, Protocol
 
 from browser_use.dom.views import SimplifiedNode
 
@@ -128,15 +130,142 @@ class RectUnionPure:
 		return True
 
 
+class RectUnionGrid(RectUnionPure):
+	"""
+	`RectUnionPure` with a uniform grid index over the disjoint rectangles.
+
+	`contains`/`add` only subtract the rectangles registered in the grid cells touched by the query, in insertion
+	order. Rectangles outside those cells can neither intersect nor contain any piece of the query, so the result
+	(and the resulting set of disjoint rectangles) is identical to `RectUnionPure`, without scanning every rectangle.
+	"""
+
+	__slots__ = ('_cell_size', '_grid', '_oversized')
+
+	# Rectangles spanning more cells than this are kept in a list that every query scans
+	MAX_CELLS_PER_RECT = 1024
+
+	def __init__(self, cell_size: float = 256.0):
+		super().__init__()
+		self._cell_size = cell_size
+		self._grid: dict[tuple[int, int], list[int]] = {}
+		self._oversized: list[int] = []
+
+	def _cells(self, r: Rect) -> list[tuple[int, int]] | None:
+		"""Grid cells touched by r (closed bounds), or None if r spans too many cells to index."""
+		size = self._cell_size
+		try:
+			x_lo, x_hi = int(r.x1 // size), int(r.x2 // size)
+			y_lo, y_hi = int(r.y1 // size), int(r.y2 // size)
+		except (ValueError, OverflowError):  # NaN or infinite bounds
+			return None
+		if (x_hi - x_lo + 1) * (y_hi - y_lo + 1) > self.MAX_CELLS_PER_RECT:
+			return None
+		return [(cx, cy) for cx in range(x_lo, x_hi + 1) for cy in range(y_lo, y_hi + 1)]
+
+	def _candidates(self, r: Rect) -> list[Rect]:
+		"""Rectangles whose cells overlap r, in insertion order."""
+		cells = self._cells(r)
+		if cells is None:
+			return self._rects
+
+		grid = self._grid
+		indices: set[int] = set(self._oversized)
+		for cell in cells:
+			bucket = grid.get(cell)
+			if bucket:
+				indices.update(bucket)
+		return [self._rects[i] for i in sorted(indices)]
+
+	# -----------------------------------------------------------------
+	def contains(self, r: Rect) -> bool:
+		"""
+		True iff r is fully covered by the current union.
+		"""
+		if not self._rects:
+			return False
+
+		stack = [r]
+		for s in self._candidates(r):
+			new_stack = []
+			for piece in stack:
+				if s.contains(piece):
+					# piece completely gone
+					continue
+				if piece.intersects(s):
+					new_stack.extend(self._split_diff(piece, s))
+				else:
+					new_stack.append(piece)
+			if not new_stack:  # everything eaten – covered
+				return True
+			stack = new_stack
+		return False  # something survived
+
+	# -----------------------------------------------------------------
+	def add(self, r: Rect) -> bool:
+		"""
+		Insert r unless it is already covered.
+		Returns True if the union grew.
+		"""
+		if self.contains(r):
+			return False
+
+		pending = [r]
+		for s in self._candidates(r):
+			new_pending = []
+			for piece in pending:
+				if piece.intersects(s):
+					new_pending.extend(self._split_diff(piece, s))
+				else:
+					new_pending.append(piece)
+			pending = new_pending
+
+		# Any left‑over pieces are new, non‑overlapping areas
+		for piece in pending:
+			index = len(self._rects)
+			self._rects.append(piece)
+			cells = self._cells(piece)
+			if cells is None:
+				self._oversized.append(index)
+				continue
+			for cell in cells:
+				self._grid.setdefault(cell, []).append(index)
+		return True
+
+
+class RectUnion(Protocol):
+	"""Occlusion engine interface used by `PaintOrderRemover`."""
+
+	def contains(self, r: Rect) -> bool: ...
+
+	def add(self, r: Rect) -> bool: ...
+
+
+PaintOrderEngine = Literal['pure', 'grid']
+
+PAINT_ORDER_ENGINES: dict[str, type[RectUnionPure]] = {
+	'pure': RectUnionPure,
+	'grid': RectUnionGrid,
+}
+
+
 class PaintOrderRemover:
 	"""
 	Calculates which elements should be removed based on the paint order parameter.
 	"""
 
-	def __init__(self, root: SimplifiedNode):
+	def __init__(self, root: SimplifiedNode, engine: PaintOrderEngine = 'grid'):
 		self.root = root
+		if engine not in PAINT_ORDER_ENGINES:
+			raise ValueError(f'Unknown paint order engine {engine!r}, expected one of {list(PAINT_ORDER_ENGINES)}')
+		self.engine = engine
+
+	def calculate_paint_order(self, nodes: Iterable[SimplifiedNode] | None = None) -> None:
+		"""
+		Mark nodes hidden behind opaque elements painted later as `ignored_by_paint_order`.
 
-	def calculate_paint_order(self) -> None:
+		`nodes` are all nodes of the tree in pre-order, for callers that already collected them while building the tree.
+		Defaults to walking `self.root`.
+		"""
 		all_simplified_nodes_with_paint_order: list[SimplifiedNode] = []
 
 		def collect_paint_order(node: SimplifiedNode) -> None:
@@ -150,7 +279,16 @@ class PaintOrderRemover:
 			for child in node.children:
 				collect_paint_order(child)
 
-		collect_paint_order(self.root)
+		if nodes is None:
+			collect_paint_order(self.root)
+		else:
+			all_simplified_nodes_with_paint_order = [
+				node
+				for node in nodes
+				if node.original_node.snapshot_node
+				and node.original_node.snapshot_node.paint_order is not None
+				and node.original_node.snapshot_node.bounds is not None
+			]
 
 		grouped_by_paint_order: defaultdict[int, list[SimplifiedNode]] = defaultdict(list)
 
@@ -158,7 +296,7 @@ class PaintOrderRemover:
 			if node.original_node.snapshot_node and node.original_node.snapshot_node.paint_order is not None:
 				grouped_by_paint_order[node.original_node.snapshot_node.paint_order].append(node)
 
-		rect_union = RectUnionPure()
+		rect_union: RectUnion = PAINT_ORDER_ENGINES[self.engine]()
 
 		for paint_order, nodes in sorted(grouped_by_paint_order.items(), key=lambda x: -x[0]):
 			rects_to_add = []
@@ -1,9 +1,11 @@
 # @file purpose: Serializes enhanced DOM trees to string format for LLM consumption
 
-from typing import Any
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Any, Literal
 
-from browser_use.dom.serializer.clickable_elements import ClickableElementDetector
-from browser_use.dom.serializer.paint_order import PaintOrderRemover
+from browser_use.dom.serializer.clickable_elements import ClickableElementCache, ClickableElementDetector
+from browser_use.dom.serializer.paint_order import PaintOrderEngine, PaintOrderRemover
 from browser_use.dom.utils import cap_text_length
 from browser_use.dom.views import (
 	DOMRect,
@@ -37,6 +39,26 @@ SVG_ELEMENTS = {
 	'tspan',
 }
 
+SerializerPipeline = Literal['fused', 'legacy']
+
+SERIALIZER_PIPELINES: tuple[SerializerPipeline, ...] = ('fused', 'legacy')
+
+
+@dataclass(slots=True)
+class _FusedBuildFrame:
+	"""A node of the fused first pass whose children are still being visited."""
+
+	node: EnhancedDOMTreeNode
+	children: Iterator[EnhancedDOMTreeNode]
+	simplified: SimplifiedNode | None = None  # None for document nodes, they are replaced by their first child
+	created_index: int = -1
+	keep_without_children: bool = False  # visible/scrollable elements, shadow roots and iframes
+	is_scrollable: bool = False
+	has_children: bool = False  # any child kept by step 1 (before tree optimization)
+	has_interactive_descendants: bool = False
+	document_result: tuple[bool, SimplifiedNode | None, bool] | None = None
+	optimized_children: list[SimplifiedNode] = field(default_factory=list)
+
 
 class DOMTreeSerializer:
 	"""Serializes enhanced DOM trees to string format."""
@@ -54,6 +76,9 @@ class DOMTreeSerializer:
 		# {'tag': 'div', 'role': 'link'},     # <div role="link">
 		# {'tag': 'span', 'role': 'link'},    # <span role="link">
 	]
+	# PROPAGATING_ELEMENTS as lookup tables: tags that propagate with any role, and exact (tag, role) pairs
+	_PROPAGATING_TAGS = frozenset(pattern['tag'] for pattern in PROPAGATING_ELEMENTS if pattern['role'] is None)
+	_PROPAGATING_TAG_ROLES = frozenset((pattern['tag'], pattern['role']) for pattern in PROPAGATING_ELEMENTS if pattern['role'])
 	DEFAULT_CONTAINMENT_THRESHOLD = 0.99  # 99% containment by default
 
 	def __init__(
@@ -64,20 +89,35 @@ class DOMTreeSerializer:
 		containment_threshold: float | None = None,
 		paint_order_filtering: bool = True,
 		session_id: str | None = None,
+		paint_order_engine: PaintOrderEngine = 'grid',
+		pipeline: SerializerPipeline = 'fused',
+		clickable_cache: ClickableElementCache | None = None,
 	):
+		if pipeline not in SERIALIZER_PIPELINES:
+			raise ValueError(f'Unknown serializer pipeline {pipeline!r}, expected one of {list(SERIALIZER_PIPELINES)}')
 		self.root_node = root_node
+		self.pipeline = pipeline
 		self._interactive_counter = 1
 		self._selector_map: DOMSelectorMap = {}
 		self._previous_cached_selector_map = previous_cached_state.selector_map if previous_cached_state else None
+		# Backend ids of the previous selector map, used to mark new elements (built once instead of per element)
+		self._previous_backend_node_ids = (
+			{node.backend_node_id for node in self._previous_cached_selector_map.values()}
+			if self._previous_cached_selector_map
+			else None
+		)
 		# Add timing tracking
 		self.timing_info: dict[str, float] = {}
 		# Cache for clickable element detection to avoid redundant calls
 		self._clickable_cache: dict[int, bool] = {}
+		# Optional detection results kept across serializations by the caller (keyed by backend node id)
+		self.clickable_element_cache = clickable_cache
 		# Bounding box filtering configuration
 		self.enable_bbox_filtering = enable_bbox_filtering
 		self.containment_threshold = containment_threshold or self.DEFAULT_CONTAINMENT_THRESHOLD
 		# Paint order filtering configuration
 		self.paint_order_filtering = paint_order_filtering
+		self.paint_order_engine = paint_order_engine
 		# Session ID for session-specific exclude attribute
 		self.session_id = session_id
 
@@ -107,6 +147,13 @@ class DOMTreeSerializer:
 		self._selector_map = {}
 		self._semantic_groups = []
 		self._clickable_cache = {}  # Clear cache for new serialization
+		if self.clickable_element_cache is not None:
+			self.clickable_element_cache.start_tree()
+
+		if self.pipeline == 'fused':
+			filtered_tree = self._serialize_fused()
+			self.timing_info['serialize_accessible_elements_total'] = time.time() - start_total
+			return SerializedDOMState(_root=filtered_tree, selector_map=self._selector_map), self.timing_info
 
 		# Step 1: Create simplified tree (includes clickable element detection)
 		start_step1 = time.time()
@@ -117,7 +164,7 @@ class DOMTreeSerializer:
 		# Step 2: Remove elements based on paint order
 		start_step3 = time.time()
 		if self.paint_order_filtering and simplified_tree:
-			PaintOrderRemover(simplified_tree).calculate_paint_order()
+			PaintOrderRemover(simplified_tree, engine=self.paint_order_engine).calculate_paint_order()
 		end_step3 = time.time()
 		self.timing_info['calculate_paint_order'] = end_step3 - start_step3
 
@@ -149,6 +196,9 @@ class DOMTreeSerializer:
 
 	def _add_compound_components(self, simplified: SimplifiedNode, node: EnhancedDOMTreeNode) -> None:
 		"""Enhance compound controls with information from their child components."""
+		# Cached trees (incremental DOM mode) are serialized again every step, start from scratch each time
+		node._compound_children = []
+
 		# Only process elements that might have compound components
 		if node.tag_name not in ['input', 'select', 'details', 'audio', 'video']:
 			return
@@ -421,7 +471,10 @@ class DOMTreeSerializer:
 			import time
 
 			start_time = time.time()
-			result = ClickableElementDetector.is_interactive(node)
+			if self.clickable_element_cache is not None:
+				result = self.clickable_element_cache.is_interactive(node)
+			else:
+				result = ClickableElementDetector.is_interactive(node)
 			end_time = time.time()
 
 			if 'clickable_detection_time' not in self.timing_info:
@@ -457,27 +510,7 @@ class DOMTreeSerializer:
 			return simplified if simplified.children else SimplifiedNode(original_node=node, children=[])
 
 		elif node.node_type == NodeType.ELEMENT_NODE:
-			# Skip non-content elements
-			if node.node_name.lower() in DISABLED_ELEMENTS:
-				return None
-
-			# Skip SVG child elements entirely (path, rect, g, circle, etc.)
-			if node.node_name.lower() in SVG_ELEMENTS:
-				return None
-
-			attributes = node.attributes or {}
-			# Check for session-specific exclude attribute first, then fall back to legacy attribute
-			exclude_attr = None
-			attr_type = None
-			if self.session_id:
-				session_specific_attr = f'data-browser-use-exclude-{self.session_id}'
-				exclude_attr = attributes.get(session_specific_attr)
-				if exclude_attr:
-					attr_type = 'session-specific'
-			# Fall back to legacy attribute if session-specific not found
-			if not exclude_attr:
-				exclude_attr = attributes.get('data-browser-use-exclude')
-			if isinstance(exclude_attr, str) and exclude_attr.lower() == 'true':
+			if self._is_skipped_element(node):
 				return None
 
 			if node.node_name == 'IFRAME' or node.node_name == 'FRAME':
@@ -489,27 +522,13 @@ class DOMTreeSerializer:
 							simplified.children.append(simplified_child)
 					return simplified
 
-			is_visible = node.is_visible
+			is_visible = self._is_visible_for_simplified_tree(node)
 			is_scrollable = node.is_actually_scrollable
 			has_shadow_content = bool(node.children_and_shadow_roots)
 
 			# ENHANCED SHADOW DOM DETECTION: Include shadow hosts even if not visible
 			is_shadow_host = any(child.node_type == NodeType.DOCUMENT_FRAGMENT_NODE for child in node.children_and_shadow_roots)
 
-			# Override visibility for elements with validation attributes
-			if not is_visible and node.attributes:
-				has_validation_attrs = any(attr.startswith(('aria-', 'pseudo')) for attr in node.attributes.keys())
-				if has_validation_attrs:
-					is_visible = True  # Force visibility for validation elements
-
-			# EXCEPTION: File inputs are often hidden with opacity:0 but are still functional
-			# Bootstrap and other frameworks use this pattern with custom-styled file pickers
-			is_file_input = (
-				node.tag_name and node.tag_name.lower() == 'input' and node.attributes and node.attributes.get('type') == 'file'
-			)
-			if not is_visible and is_file_input:
-				is_visible = True  # Force visibility for file inputs
-
 			# Include if visible, scrollable, has children, or is shadow host
 			if is_visible or is_scrollable or has_shadow_content or is_shadow_host:
 				simplified = SimplifiedNode(original_node=node, children=[], is_shadow_host=is_shadow_host)
@@ -553,27 +572,59 @@ class DOMTreeSerializer:
 
 		node.children = optimized_children
 
-		# Keep meaningful nodes
-		is_visible = node.original_node.snapshot_node and node.original_node.is_visible
+		return node if self._is_meaningful_after_optimization(node) else None
 
-		# EXCEPTION: File inputs are often hidden with opacity:0 but are still functional
-		is_file_input = (
-			node.original_node.tag_name
-			and node.original_node.tag_name.lower() == 'input'
-			and node.original_node.attributes
-			and node.original_node.attributes.get('type') == 'file'
-		)
+	def _is_meaningful_after_optimization(self, node: SimplifiedNode) -> bool:
+		"""Whether a node survives tree optimization (its children must already be optimized)."""
+		is_visible = node.original_node.snapshot_node and node.original_node.is_visible
 
-		if (
+		return bool(
 			is_visible  # Keep all visible nodes
 			or node.original_node.is_actually_scrollable
 			or node.original_node.node_type == NodeType.TEXT_NODE
 			or node.children
-			or is_file_input  # Keep file inputs even if not visible
-		):
-			return node
+			# EXCEPTION: File inputs are often hidden with opacity:0 but are still functional
+			or self._is_file_input(node.original_node)  # Keep file inputs even if not visible
+		)
 
-		return None
+	@staticmethod
+	def _is_file_input(node: EnhancedDOMTreeNode) -> bool:
+		return bool(
+			node.tag_name and node.tag_name.lower() == 'input' and node.attributes and node.attributes.get('type') == 'file'
+		)
+
+	def _is_skipped_element(self, node: EnhancedDOMTreeNode) -> bool:
+		"""Non-content elements, decorative SVG children and elements excluded via data-browser-use-exclude."""
+		# Skip non-content elements
+		if node.node_name.lower() in DISABLED_ELEMENTS:
+			return True
+
+		# Skip SVG child elements entirely (path, rect, g, circle, etc.)
+		if node.node_name.lower() in SVG_ELEMENTS:
+			return True
+
+		attributes = node.attributes or {}
+		# Check for session-specific exclude attribute first, then fall back to legacy attribute
+		exclude_attr = None
+		if self.session_id:
+			exclude_attr = attributes.get(f'data-browser-use-exclude-{self.session_id}')
+		# Fall back to legacy attribute if session-specific not found
+		if not exclude_attr:
+			exclude_attr = attributes.get('data-browser-use-exclude')
+		return isinstance(exclude_attr, str) and exclude_attr.lower() == 'true'
+
+	def _is_visible_for_simplified_tree(self, node: EnhancedDOMTreeNode) -> bool:
+		"""Element visibility, forced for elements with validation attributes and for file inputs."""
+		if node.is_visible:
+			return True
+
+		# Override visibility for elements with validation attributes
+		if node.attributes and any(attr.startswith(('aria-', 'pseudo')) for attr in node.attributes.keys()):
+			return True  # Force visibility for validation elements
+
+		# EXCEPTION: File inputs are often hidden with opacity:0 but are still functional
+		# Bootstrap and other frameworks use this pattern with custom-styled file pickers
+		return self._is_file_input(node)
 
 	def _collect_interactive_elements(self, node: SimplifiedNode, elements: list[SimplifiedNode]) -> None:
 		"""Recursively collect interactive elements that are also visible."""
@@ -619,6 +670,16 @@ class DOMTreeSerializer:
 		if not node:
 			return
 
+		self._assign_interactive_index(node, self._has_interactive_descendants)
+
+		# Process children
+		for child in node.children:
+			self._assign_interactive_indices_and_mark_new_nodes(child)
+
+	def _assign_interactive_index(
+		self, node: SimplifiedNode, has_interactive_descendants: Callable[[SimplifiedNode], bool]
+	) -> None:
+		"""Add a single node to the selector map if it should be interactive (its children are not visited)."""
 		# Skip assigning index to excluded nodes, or ignored by paint order
 		if not node.excluded_by_parent and not node.ignored_by_paint_order:
 			# Regular interactive element assignment (including enhanced compound controls)
@@ -651,12 +712,7 @@ class DOMTreeSerializer:
 
 			# EXCEPTION: File inputs are often hidden with opacity:0 but are still functional
 			# Bootstrap and other frameworks use this pattern with custom-styled file pickers
-			is_file_input = (
-				node.original_node.tag_name
-				and node.original_node.tag_name.lower() == 'input'
-				and node.original_node.attributes
-				and node.original_node.attributes.get('type') == 'file'
-			)
+			is_file_input = self._is_file_input(node.original_node)
 
 			# EXCEPTION: Shadow DOM form elements may not have snapshot layout data from CDP's
 			# DOMSnapshot.captureSnapshot, but they're still functional/interactive.
@@ -674,7 +730,7 @@ class DOMTreeSerializer:
 			should_make_interactive = False
 			if is_scrollable:
 				# For scrollable elements, check if they have interactive children
-				has_interactive_desc = self._has_interactive_descendants(node)
+				has_interactive_desc = has_interactive_descendants(node)
 
 				# Only make scrollable container interactive if it has NO interactive descendants
 				if not has_interactive_desc:
@@ -694,16 +750,11 @@ class DOMTreeSerializer:
 				# Mark compound components as new for visibility
 				if node.is_compound_component:
 					node.is_new = True
-				elif self._previous_cached_selector_map:
+				elif self._previous_backend_node_ids is not None:
 					# Check if node is new for regular elements
-					previous_backend_node_ids = {node.backend_node_id for node in self._previous_cached_selector_map.values()}
-					if node.original_node.backend_node_id not in previous_backend_node_ids:
+					if node.original_node.backend_node_id not in self._previous_backend_node_ids:
 						node.is_new = True
 
-		# Process children
-		for child in node.children:
-			self._assign_interactive_indices_and_mark_new_nodes(child)
-
 	def _apply_bounding_box_filtering(self, node: SimplifiedNode | None) -> SimplifiedNode | None:
 		"""Filter children contained within propagating parent bounds."""
 		if not node:
@@ -733,7 +784,17 @@ class DOMTreeSerializer:
 			# Important: Still check if this node starts NEW propagation
 
 		# Check if this node starts new propagation (even if excluded!)
-		new_bounds = None
+		new_bounds = self._get_propagating_bounds(node, depth)
+
+		# Propagate to ALL children
+		# Use new_bounds if this node starts propagation, otherwise continue with active_bounds
+		propagate_bounds = new_bounds if new_bounds else active_bounds
+
+		for child in node.children:
+			self._filter_tree_recursive(child, propagate_bounds, depth + 1)
+
+	def _get_propagating_bounds(self, node: SimplifiedNode, depth: int) -> PropagatingBounds | None:
+		"""Bounds this node propagates to ALL its descendants, if it matches a propagating element pattern."""
 		tag = node.original_node.tag_name.lower()
 		role = node.original_node.attributes.get('role') if node.original_node.attributes else None
 		attributes = {
@@ -744,19 +805,13 @@ class DOMTreeSerializer:
 		if self._is_propagating_element(attributes):
 			# This node propagates bounds to ALL its descendants
 			if node.original_node.snapshot_node and node.original_node.snapshot_node.bounds:
-				new_bounds = PropagatingBounds(
+				return PropagatingBounds(
 					tag=tag,
 					bounds=node.original_node.snapshot_node.bounds,
 					node_id=node.original_node.node_id,
 					depth=depth,
 				)
-
-		# Propagate to ALL children
-		# Use new_bounds if this node starts propagation, otherwise continue with active_bounds
-		propagate_bounds = new_bounds if new_bounds else active_bounds
-
-		for child in node.children:
-			self._filter_tree_recursive(child, propagate_bounds, depth + 1)
+		return None
 
 	def _should_exclude_child(self, node: SimplifiedNode, active_bounds: PropagatingBounds) -> bool:
 		"""
@@ -848,14 +903,208 @@ class DOMTreeSerializer:
 		Check if an element should propagate bounds based on attributes.
 		If the element satisfies one of the patterns, it propagates bounds to all its children.
 		"""
-		keys_to_check = ['tag', 'role']
-		for pattern in self.PROPAGATING_ELEMENTS:
-			# Check if the element satisfies the pattern
-			check = [pattern.get(key) is None or pattern.get(key) == attributes.get(key) for key in keys_to_check]
-			if all(check):
-				return True
+		tag = attributes.get('tag')
+		return tag in self._PROPAGATING_TAGS or (tag, attributes.get('role')) in self._PROPAGATING_TAG_ROLES
 
-		return False
+	# region - fused pipeline
+
+	def _serialize_fused(self) -> SimplifiedNode | None:
+		"""
+		Same result as the legacy steps 1-4 in two linear, iterative passes over the tree.
+
+		Pass 1 (post-order) creates and optimizes the simplified tree and computes which nodes have interactive
+		descendants, pass 2 (pre-order) applies bounding box filtering and assigns interactive indices. Paint order
+		filtering runs in between on the node list collected by pass 1.
+		"""
+		import time
+
+		start = time.time()
+		simplified_tree, created_nodes, interactive_descendants = self._build_fused_tree()
+		self.timing_info['create_simplified_tree'] = time.time() - start
+
+		start = time.time()
+		# Paint order runs on the tree before optimization, i.e. on every node step 1 kept, in pre-order
+		paint_order_nodes = [node for node in created_nodes if node is not None]
+		if self.paint_order_filtering and paint_order_nodes:
+			PaintOrderRemover(paint_order_nodes[0], engine=self.paint_order_engine).calculate_paint_order(paint_order_nodes)
+		self.timing_info['calculate_paint_order'] = time.time() - start
+
+		start = time.time()
+		if simplified_tree:
+			self._filter_and_assign_fused(simplified_tree, interactive_descendants)
+		self.timing_info['assign_interactive_indices'] = time.time() - start
+
+		return simplified_tree
+
+	def _build_fused_tree(self) -> tuple[SimplifiedNode | None, list[SimplifiedNode | None], dict[int, bool]]:
+		"""
+		Pass 1: `_create_simplified_tree` and `_optimize_tree` in one post-order pass.
+
+		Returns the optimized tree, every simplified node step 1 kept in pre-order (`None` for discarded ones) and
+		whether the scrollable nodes of the optimized tree have interactive descendants (keyed by `id()` of the
+		simplified node, only scrollable containers ask for it).
+		"""
+		created_nodes: list[SimplifiedNode | None] = []
+		interactive_descendants: dict[int, bool] = {}
+		stack: list[_FusedBuildFrame] = []
+		scrollable_ancestors = 0
+
+		def finish_node(
+			simplified: SimplifiedNode, has_interactive_descendants: bool
+		) -> tuple[bool, SimplifiedNode | None, bool]:
+			if not self._is_meaningful_after_optimization(simplified):
+				return True, None, False
+			interactive_descendants[id(simplified)] = has_interactive_descendants
+			# Clickable detection is only needed here if a scrollable container above asks for interactive descendants
+			is_interactive = scrollable_ancestors > 0 and self._is_interactive_cached(simplified.original_node)
+			return True, simplified, is_interactive or has_interactive_descendants
+
+		def visit(node: EnhancedDOMTreeNode) -> _FusedBuildFrame | tuple[bool, SimplifiedNode | None, bool]:
+			"""Start a node: either a frame to visit its children, or the final (kept by step 1, optimized node,
+			subtree has interactive nodes) result for nodes without children to visit."""
+			if node.node_type == NodeType.DOCUMENT_NODE:
+				return _FusedBuildFrame(node=node, children=iter(node.children_and_shadow_roots))
+
+			if node.node_type == NodeType.DOCUMENT_FRAGMENT_NODE:
+				# ENHANCED shadow DOM processing - always include shadow content
+				simplified = SimplifiedNode(original_node=node, children=[])
+				created_nodes.append(simplified)
+				return _FusedBuildFrame(
+					node=node,
+					children=iter(node.children_and_shadow_roots),
+					simplified=simplified,
+					created_index=len(created_nodes) - 1,
+					keep_without_children=True,
+					is_scrollable=node.is_actually_scrollable,
+				)
+
+			if node.node_type == NodeType.ELEMENT_NODE:
+				if self._is_skipped_element(node):
+					return False, None, False
+
+				if (node.node_name == 'IFRAME' or node.node_name == 'FRAME') and node.content_document:
+					simplified = SimplifiedNode(original_node=node, children=[])
+					created_nodes.append(simplified)
+					return _FusedBuildFrame(
+						node=node,
+						children=iter(node.content_document.children_nodes or []),
+						simplified=simplified,
+						created_index=len(created_nodes) - 1,
+						keep_without_children=True,
+						is_scrollable=node.is_actually_scrollable,
+					)
+
+				is_visible = self._is_visible_for_simplified_tree(node)
+				is_scrollable = node.is_actually_scrollable
+				children = node.children_and_shadow_roots
+				is_shadow_host = any(child.node_type == NodeType.DOCUMENT_FRAGMENT_NODE for child in children)
+				if not (is_visible or is_scrollable or children or is_shadow_host):
+					return False, None, False
+
+				simplified = SimplifiedNode(original_node=node, children=[], is_shadow_host=is_shadow_host)
+				created_nodes.append(simplified)
+				if not children:
+					# Leaf element (visible or scrollable, otherwise it was skipped above), no frame needed
+					self._add_compound_components(simplified, node)
+					return finish_node(simplified, False)
+				return _FusedBuildFrame(
+					node=node,
+					children=iter(children),
+					simplified=simplified,
+					created_index=len(created_nodes) - 1,
+					keep_without_children=bool(is_visible or is_scrollable),
+					is_scrollable=is_scrollable,
+				)
+
+			if node.node_type == NodeType.TEXT_NODE:
+				# Include meaningful text nodes
+				is_visible = node.snapshot_node and node.is_visible
+				if is_visible and node.node_value and node.node_value.strip() and len(node.node_value.strip()) > 1:
+					simplified = SimplifiedNode(original_node=node, children=[])
+					created_nodes.append(simplified)
+					return finish_node(simplified, False)
+
+			return False, None, False
+
+		root_result = visit(self.root_node)
+		if not isinstance(root_result, _FusedBuildFrame):
+			return root_result[1], created_nodes, interactive_descendants
+
+		stack.append(root_result)
+		scrollable_ancestors += root_result.is_scrollable
+		while True:
+			frame = stack[-1]
+			child = next(frame.children, None)
+			if child is not None:
+				child_result = visit(child)
+				if isinstance(child_result, _FusedBuildFrame):
+					stack.append(child_result)
+					scrollable_ancestors += child_result.is_scrollable
+					continue
+			else:
+				# All children visited: decide about the node itself
+				stack.pop()
+				scrollable_ancestors -= frame.is_scrollable
+				simplified = frame.simplified
+				if simplified is None:
+					child_result = frame.document_result or (False, None, False)
+				else:
+					simplified.children = frame.optimized_children
+					if frame.node.node_type == NodeType.ELEMENT_NODE:
+						# COMPOUND CONTROL PROCESSING: Add virtual components for compound controls (no-op for iframes)
+						self._add_compound_components(simplified, frame.node)
+					if frame.keep_without_children or frame.has_children:
+						child_result = finish_node(simplified, frame.has_interactive_descendants)
+					else:
+						created_nodes[frame.created_index] = None
+						child_result = (False, None, False)
+				if not stack:
+					return child_result[1], created_nodes, interactive_descendants
+				frame = stack[-1]
+
+			# Hand the finished child over to its parent
+			kept, optimized, has_interactive = child_result
+			if frame.simplified is None:
+				# Document nodes are replaced by their first child kept by step 1
+				if kept:
+					frame.document_result = child_result
+					frame.children = iter(())
+			elif kept:
+				frame.has_children = True
+				if optimized is not None:
+					frame.optimized_children.append(optimized)
+					frame.has_interactive_descendants = frame.has_interactive_descendants or has_interactive
+
+	def _filter_and_assign_fused(self, root: SimplifiedNode, interactive_descendants: dict[int, bool]) -> None:
+		"""Pass 2: `_apply_bounding_box_filtering` and `_assign_interactive_indices_and_mark_new_nodes` in one pre-order pass."""
+
+		def has_interactive_descendants(node: SimplifiedNode) -> bool:
+			return interactive_descendants.get(id(node), False)
+
+		excluded_count = 0
+		stack: list[tuple[SimplifiedNode, PropagatingBounds | None, int]] = [(root, None, 0)]
+		while stack:
+			node, active_bounds, depth = stack.pop()
+
+			if self.enable_bbox_filtering:
+				# Check if this node should be excluded by active bounds
+				if active_bounds and self._should_exclude_child(node, active_bounds):
+					node.excluded_by_parent = True
+					excluded_count += 1
+				# Bounds propagate to ALL descendants until overridden (even by excluded nodes)
+				active_bounds = self._get_propagating_bounds(node, depth) or active_bounds
+
+			self._assign_interactive_index(node, has_interactive_descendants)
+
+			for child in reversed(node.children):
+				stack.append((child, active_bounds, depth + 1))
+
+		if excluded_count > 0:
+			import logging
+
+			logging.debug(f'BBox filtering excluded {excluded_count} nodes')
+
+	# endregion - fused pipeline
 
 	@staticmethod
 	def serialize_tree(node: SimplifiedNode | None, include_attributes: list[str], depth: int = 0) -> str:
@@ -1,23 +1,28 @@
 import asyncio
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 from cdp_use.cdp.accessibility.commands import GetFullAXTreeReturns
 from cdp_use.cdp.accessibility.types import AXNode
 from cdp_use.cdp.dom.types import Node
+from cdp_use.cdp.domsnapshot.commands import CaptureSnapshotReturns
 from cdp_use.cdp.target import TargetID
 
 from browser_use.dom.enhanced_snapshot import (
 	REQUIRED_COMPUTED_STYLES,
 	build_snapshot_lookup,
 )
-from browser_use.dom.serializer.serializer import DOMTreeSerializer
+from browser_use.dom.incremental import DomMutationTracker
+from browser_use.dom.serializer.clickable_elements import ClickableElementCache, ClickableElementDetector
+from browser_use.dom.serializer.paint_order import PaintOrderEngine
+from browser_use.dom.serializer.serializer import DOMTreeSerializer, SerializerPipeline
 from browser_use.dom.views import (
 	DOMRect,
 	EnhancedAXNode,
 	EnhancedAXProperty,
 	EnhancedDOMTreeNode,
+	EnhancedSnapshotNode,
 	NodeType,
 	SerializedDOMState,
 	TargetAllTrees,
@@ -30,6 +35,76 @@ if TYPE_CHECKING:
 
 # Note: iframe limits are now configurable via BrowserProfile.max_iframes and BrowserProfile.max_iframe_depth
 
+DomCaptureScope = Literal['page', 'viewport']
+
+# Pixels above and below the viewport in which elements still count as visible
+DEFAULT_VIEWPORT_MARGIN = 1000.0
+
+# Object group for remote objects resolved during incremental refreshes (released after each refresh)
+_INCREMENTAL_OBJECT_GROUP = 'browser_use_incremental_dom'
+
+# Layout data for a single node, in the same coordinate space the full build ends up with
+# (viewport of the top frame, after `is_element_visible_according_to_all_parents` adjusted for scroll and iframe offsets)
+_NODE_LAYOUT_JS = """
+function(styleNames, viewportMargin) {
+	const node = this;
+	if (!node.isConnected) return null;
+	const isElement = node.nodeType === 1;
+	const element = isElement ? node : node.parentElement;
+	const win = node.ownerDocument && node.ownerDocument.defaultView;
+	if (!element || !win) return null;
+
+	const computed = win.getComputedStyle(element);
+	const styles = {};
+	for (const name of styleNames) styles[name] = computed.getPropertyValue(name);
+
+	let rect = null;
+	if (isElement) {
+		if (element.getClientRects().length > 0) rect = element.getBoundingClientRect();
+	} else {
+		const range = node.ownerDocument.createRange();
+		range.selectNodeContents(node);
+		if (range.getClientRects().length > 0) rect = range.getBoundingClientRect();
+	}
+
+	let bounds = null;
+	let inViewport = false;
+	if (rect) {
+		let x = rect.x, y = rect.y, frameWindow = win;
+		inViewport = true;
+		while (true) {
+			const root = frameWindow.document.documentElement;
+			if (!(x < root.clientWidth && x + rect.width > 0 && y < root.clientHeight + viewportMargin && y + rect.height > -viewportMargin)) {
+				inViewport = false;
+			}
+			const frameElement = frameWindow.frameElement;
+			if (!frameElement) break;
+			const frameRect = frameElement.getBoundingClientRect();
+			x += frameRect.x;
+			y += frameRect.y;
+			frameWindow = frameWindow.parent;
+		}
+		bounds = [x, y, rect.width, rect.height];
+	}
+
+	return {
+		bounds,
+		inViewport,
+		styles,
+		clientRects: isElement ? [element.clientLeft, element.clientTop, element.clientWidth, element.clientHeight] : null,
+		scrollRects: isElement ? [element.scrollLeft, element.scrollTop, element.scrollWidth, element.scrollHeight] : null,
+	};
+}
+"""
+
+# Scroll position, viewport size and document size - any change means cached layout of untouched nodes is stale
+_PAGE_METRICS_JS = """
+(() => {
+	const root = document.documentElement;
+	return [window.scrollX, window.scrollY, window.innerWidth, window.innerHeight, root ? root.scrollWidth : 0, root ? root.scrollHeight : 0];
+})()
+"""
+
 
 class DomService:
 	"""
@@ -50,19 +125,45 @@ class DomService:
 		paint_order_filtering: bool = True,
 		max_iframes: int = 100,
 		max_iframe_depth: int = 5,
+		max_concurrent_iframes: int = 4,
+		incremental_dom: bool = False,
+		incremental_dom_max_dirty_ratio: float = 0.1,
+		paint_order_engine: PaintOrderEngine = 'grid',
+		serializer_pipeline: SerializerPipeline = 'fused',
+		capture_scope: DomCaptureScope = 'page',
+		viewport_margin: float = DEFAULT_VIEWPORT_MARGIN,
 	):
 		self.browser_session = browser_session
 		self.logger = logger or browser_session.logger
 		self.cross_origin_iframes = cross_origin_iframes
 		self.paint_order_filtering = paint_order_filtering
+		self.paint_order_engine = paint_order_engine
+		self.serializer_pipeline = serializer_pipeline
 		self.max_iframes = max_iframes
 		self.max_iframe_depth = max_iframe_depth
+		self.max_concurrent_iframes = max_concurrent_iframes
+		self.incremental_dom = incremental_dom
+		# 'viewport': accessibility data is only fetched and built for nodes laid out within the viewport +- viewport_margin
+		self.capture_scope = capture_scope
+		self.viewport_margin = viewport_margin
+		self._capture_range: tuple[float, float, float, float] | None = None
+		""" (left, top, right, bottom) in viewport coordinates of the top frame, None for the whole page"""
+
+		# Incremental mode: patches the last full tree from DOM mutation events instead of rebuilding it
+		self._mutation_tracker: DomMutationTracker | None = (
+			DomMutationTracker(self.logger, max_dirty_ratio=incremental_dom_max_dirty_ratio) if incremental_dom else None
+		)
+		self._last_node_lookup: dict[int, EnhancedDOMTreeNode] = {}
+		self._last_cross_origin_documents = 0
+		# Clickable detection results of unchanged nodes are reused by the next serialization
+		self.clickable_element_cache = ClickableElementCache()
 
 	async def __aenter__(self):
 		return self
 
 	async def __aexit__(self, exc_type, exc_value, traceback):
-		pass  # no need to cleanup anything, browser_session auto handles cleaning up session cache
+		self.reset_incremental_state()  # browser_session auto handles cleaning up session cache
+		self.clickable_element_cache.clear()
 
 	def _build_enhanced_ax_node(self, ax_node: AXNode) -> EnhancedAXNode:
 		properties: list[EnhancedAXProperty] | None = None
@@ -89,6 +190,7 @@ class DomService:
 			description=ax_node.get('description', {}).get('value', None),
 			properties=properties,
 			child_ids=ax_node.get('childIds', []) if ax_node.get('childIds') else None,
+			properties_interactivity=ClickableElementDetector.get_ax_properties_interactivity(properties),
 		)
 		return enhanced_ax_node
 
@@ -123,7 +225,7 @@ class DomService:
 
 	@classmethod
 	def is_element_visible_according_to_all_parents(
-		cls, node: EnhancedDOMTreeNode, html_frames: list[EnhancedDOMTreeNode]
+		cls, node: EnhancedDOMTreeNode, html_frames: list[EnhancedDOMTreeNode], viewport_margin: float = DEFAULT_VIEWPORT_MARGIN
 	) -> bool:
 		"""Check if the element is visible according to all its parent HTML frames."""
 
@@ -193,8 +295,8 @@ class DomService:
 				frame_intersects = (
 					adjusted_x < viewport_right
 					and adjusted_x + current_bounds.width > viewport_left
-					and adjusted_y < viewport_bottom + 1000
-					and adjusted_y + current_bounds.height > viewport_top - 1000
+					and adjusted_y < viewport_bottom + viewport_margin
+					and adjusted_y + current_bounds.height > viewport_top - viewport_margin
 				)
 
 				if not frame_intersects:
@@ -245,6 +347,68 @@ class DomService:
 
 		return {'nodes': merged_nodes}
 
+	async def _get_ax_tree_in_capture_range(
+		self, cdp_session, snapshot: CaptureSnapshotReturns, capture_viewport: DOMRect
+	) -> GetFullAXTreeReturns:
+		"""Fetch the accessibility nodes of the nodes laid out within the viewport +- margin, one partial tree per node.
+
+		Layout bounds come from the snapshot, so nothing is requested for off-range nodes or for frames whose owner
+		element is off range (frames nested in a skipped frame are skipped too).
+		"""
+		margin = self.viewport_margin
+		documents = snapshot['documents']
+		backend_node_ids: list[int] = []
+
+		# (document index, offset of its layout bounds in viewport coordinates), child documents follow their owner iframe
+		pending_documents: list[tuple[int, float, float]] = [(0, -capture_viewport.x, -capture_viewport.y)] if documents else []
+		captured_documents = 0
+		while pending_documents:
+			document_index, offset_x, offset_y = pending_documents.pop()
+			document = documents[document_index]
+			captured_documents += 1
+			nodes = document['nodes']
+			layout = document['layout']
+			content_document_index = nodes.get('contentDocumentIndex') or {'index': [], 'value': []}
+			content_documents = dict(zip(content_document_index['index'], content_document_index['value']))
+
+			for node_index, bounds in zip(layout['nodeIndex'], layout['bounds']):
+				x, y, width, height = bounds[0] + offset_x, bounds[1] + offset_y, bounds[2], bounds[3]
+				if x + width < -margin or y + height < -margin:
+					continue
+				if x > capture_viewport.width + margin or y > capture_viewport.height + margin:
+					continue
+				backend_node_ids.append(nodes['backendNodeId'][node_index])
+
+				child_index = content_documents.get(node_index)
+				if child_index is not None and child_index < len(documents):
+					child = documents[child_index]
+					pending_documents.append(
+						(child_index, x - child.get('scrollOffsetX', 0), y - child.get('scrollOffsetY', 0))
+					)
+
+		ax_trees = await asyncio.gather(
+			*(
+				cdp_session.cdp_client.send.Accessibility.getPartialAXTree(
+					params={'backendNodeId': backend_node_id, 'fetchRelatives': False}, session_id=cdp_session.session_id
+				)
+				for backend_node_id in backend_node_ids
+			),
+			return_exceptions=True,
+		)
+
+		# Nodes detached since the snapshot have no accessibility data, the rest is merged like the full trees
+		merged_nodes: list[AXNode] = []
+		for ax_tree in ax_trees:
+			if not isinstance(ax_tree, BaseException):
+				merged_nodes.extend(ax_tree['nodes'])
+
+		skipped_documents = len(documents) - captured_documents
+		self.logger.debug(
+			f'Fetched accessibility data of {len(backend_node_ids)} nodes in the capture range '
+			f'(skipped {skipped_documents} frames outside of it)'
+		)
+		return {'nodes': merged_nodes}
+
 	async def _get_all_trees(self, target_id: TargetID) -> TargetAllTrees:
 		cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=target_id, focus=False)
 
@@ -322,9 +486,13 @@ class DomService:
 		tasks = {
 			'snapshot': create_task_with_error_handling(create_snapshot_request(), name='get_snapshot'),
 			'dom_tree': create_task_with_error_handling(create_dom_tree_request(), name='get_dom_tree'),
-			'ax_tree': create_task_with_error_handling(self._get_ax_tree_for_all_frames(target_id), name='get_ax_tree'),
 			'device_pixel_ratio': create_task_with_error_handling(self._get_viewport_ratio(target_id), name='get_viewport_ratio'),
 		}
+		# Viewport scope: the AX nodes to fetch follow from the snapshot and the viewport, measured alongside it
+		if self.capture_scope == 'viewport':
+			tasks['page_metrics'] = create_task_with_error_handling(self._get_page_metrics(cdp_session), name='get_page_metrics')
+		else:
+			tasks['ax_tree'] = create_task_with_error_handling(self._get_ax_tree_for_all_frames(target_id), name='get_ax_tree')
 
 		# Wait for all tasks with timeout
 		done, pending = await asyncio.wait(tasks.values(), timeout=10.0)
@@ -336,20 +504,23 @@ class DomService:
 
 			# Retry mapping for pending tasks
 			retry_map = {
-				tasks['snapshot']: lambda: create_task_with_error_handling(create_snapshot_request(), name='get_snapshot_retry'),
-				tasks['dom_tree']: lambda: create_task_with_error_handling(create_dom_tree_request(), name='get_dom_tree_retry'),
-				tasks['ax_tree']: lambda: create_task_with_error_handling(
+				'snapshot': lambda: create_task_with_error_handling(create_snapshot_request(), name='get_snapshot_retry'),
+				'dom_tree': lambda: create_task_with_error_handling(create_dom_tree_request(), name='get_dom_tree_retry'),
+				'ax_tree': lambda: create_task_with_error_handling(
 					self._get_ax_tree_for_all_frames(target_id), name='get_ax_tree_retry'
 				),
-				tasks['device_pixel_ratio']: lambda: create_task_with_error_handling(
+				'page_metrics': lambda: create_task_with_error_handling(
+					self._get_page_metrics(cdp_session), name='get_page_metrics_retry'
+				),
+				'device_pixel_ratio': lambda: create_task_with_error_handling(
 					self._get_viewport_ratio(target_id), name='get_viewport_ratio_retry'
 				),
 			}
 
 			# Create new tasks only for the ones that didn't complete
 			for key, task in tasks.items():
-				if task in pending and task in retry_map:
-					tasks[key] = retry_map[task]()
+				if task in pending:
+					tasks[key] = retry_map[key]()
 
 			# Wait again with shorter timeout
 			done2, pending2 = await asyncio.wait([t for t in tasks.values() if not t.done()], timeout=2.0)
@@ -378,7 +549,6 @@ class DomService:
 
 		snapshot = results['snapshot']
 		dom_tree = results['dom_tree']
-		ax_tree = results['ax_tree']
 		device_pixel_ratio = results['device_pixel_ratio']
 		end_cdp_calls = time.time()
 		cdp_calls_ms = (end_cdp_calls - start_cdp_calls) * 1000
@@ -407,6 +577,22 @@ class DomService:
 
 		snapshot_processing_ms = (time.time() - start_snapshot_processing) * 1000
 
+		# Viewport scope: AX data only for the nodes laid out around the viewport (the whole page if it can't be measured)
+		capture_viewport: DOMRect | None = None
+		cdp_timing: dict[str, float] = {}
+		if 'ax_tree' in results:
+			ax_tree = results['ax_tree']
+		else:
+			start_ax_tree = time.time()
+			page_metrics = results['page_metrics']
+			if page_metrics is not None:
+				scroll_x, scroll_y, viewport_width, viewport_height = page_metrics[:4]
+				capture_viewport = DOMRect(x=scroll_x, y=scroll_y, width=viewport_width, height=viewport_height)
+				ax_tree = await self._get_ax_tree_in_capture_range(cdp_session, snapshot, capture_viewport)
+			else:
+				ax_tree = await self._get_ax_tree_for_all_frames(target_id)
+			cdp_timing['viewport_ax_tree_ms'] = (time.time() - start_ax_tree) * 1000
+
 		# Return with detailed timing breakdown
 		return TargetAllTrees(
 			snapshot=snapshot,
@@ -414,10 +600,12 @@ class DomService:
 			ax_tree=ax_tree,
 			device_pixel_ratio=device_pixel_ratio,
 			cdp_timing={
+				**cdp_timing,
 				'iframe_scroll_detection_ms': iframe_scroll_ms,
 				'cdp_parallel_calls_ms': cdp_calls_ms,
 				'snapshot_processing_ms': snapshot_processing_ms,
 			},
+			capture_viewport=capture_viewport,
 		)
 
 	@observe_debug(ignore_input=True, ignore_output=True, name='get_dom_tree')
@@ -428,6 +616,7 @@ class DomService:
 		initial_html_frames: list[EnhancedDOMTreeNode] | None = None,
 		initial_total_frame_offset: DOMRect | None = None,
 		iframe_depth: int = 0,
+		iframe_semaphore: asyncio.Semaphore | None = None,
 	) -> tuple[EnhancedDOMTreeNode, dict[str, float]]:
 		"""Get the DOM tree for a specific target.
 
@@ -437,6 +626,7 @@ class DomService:
 			initial_html_frames: List of HTML frame nodes encountered so far
 			initial_total_frame_offset: Accumulated coordinate offset
 			iframe_depth: Current depth of iframe nesting to prevent infinite recursion
+			iframe_semaphore: Bounds the concurrent iframe captures, shared by all nesting levels of a top-level call
 
 		Returns:
 			Tuple of (enhanced_dom_tree_node, timing_info)
@@ -444,9 +634,15 @@ class DomService:
 		timing_info: dict[str, float] = {}
 		timing_start_total = time.time()
 
+		# One limit for the whole iframe tree, created by the top-level call
+		if iframe_semaphore is None:
+			iframe_semaphore = asyncio.Semaphore(self.max_concurrent_iframes)
+
 		# Get all trees from CDP (snapshot, DOM, AX, viewport ratio)
 		start_get_trees = time.time()
-		trees = await self._get_all_trees(target_id)
+		# Only the capture holds a slot, so nested iframes don't wait on the slots of their parents
+		async with iframe_semaphore:
+			trees = await self._get_all_trees(target_id)
 		get_trees_ms = (time.time() - start_get_trees) * 1000
 		timing_info.update(trees.cdp_timing)
 		timing_info['get_all_trees_total_ms'] = get_trees_ms
@@ -465,50 +661,36 @@ class DomService:
 
 		enhanced_dom_tree_node_lookup: dict[int, EnhancedDOMTreeNode] = {}
 		""" NodeId (NOT backend node id) -> enhanced dom tree node"""  # way to get the parent/content node
+		if iframe_depth == 0:
+			# Kept for incremental mode, which patches this lookup from DOM mutation events
+			self._last_node_lookup = enhanced_dom_tree_node_lookup
+			self._last_cross_origin_documents = 0
+			# Nested cross-origin iframe builds share the range of the top frame. Absolute positions are relative to
+			# the viewport (the scroll offset of the HTML frame is subtracted below), so the range is too
+			viewport = trees.capture_viewport
+			margin = self.viewport_margin
+			self._capture_range = (-margin, -margin, viewport.width + margin, viewport.height + margin) if viewport else None
+		capture_range = self._capture_range
 
 		# Parse snapshot data with everything calculated upfront
 		start_snapshot = time.time()
 		snapshot_lookup = build_snapshot_lookup(snapshot, device_pixel_ratio)
 		timing_info['build_snapshot_lookup_ms'] = (time.time() - start_snapshot) * 1000
 
-		async def _construct_enhanced_node(
-			node: Node,
-			html_frames: list[EnhancedDOMTreeNode] | None,
-			total_frame_offset: DOMRect | None,
-			all_frames: dict | None,
-		) -> EnhancedDOMTreeNode:
-			"""
-			Recursively construct enhanced DOM tree nodes.
-
-			Args:
-				node: The DOM node to construct
-				html_frames: List of HTML frame nodes encountered so far
-				total_frame_offset: Accumulated coordinate translation from parent iframes (includes scroll corrections)
-				all_frames: Pre-fetched frame hierarchy to avoid redundant CDP calls
-			"""
-
-			# Initialize lists if not provided
-			if html_frames is None:
-				html_frames = []
-
-			# to get rid of the pointer references
-			if total_frame_offset is None:
-				total_frame_offset = DOMRect(x=0.0, y=0.0, width=0.0, height=0.0)
-			else:
-				total_frame_offset = DOMRect(
-					total_frame_offset.x, total_frame_offset.y, total_frame_offset.width, total_frame_offset.height
-				)
-
-			# memoize the mf (I don't know if some nodes are duplicated)
-			if node['nodeId'] in enhanced_dom_tree_node_lookup:
-				return enhanced_dom_tree_node_lookup[node['nodeId']]
-
-			ax_node = ax_tree_lookup.get(node['backendNodeId'])
-			if ax_node:
-				enhanced_ax_node = self._build_enhanced_ax_node(ax_node)
-			else:
-				enhanced_ax_node = None
-
+		# Resolve the session once per target (it is the same for every node of this target)
+		try:
+			session = await self.browser_session.get_or_create_cdp_session(target_id, focus=False)
+			session_id = session.session_id
+		except ValueError:
+			# Target may have detached during DOM construction
+			session_id = None
+
+		# Cross-origin iframes found while building, resolved in a separate async phase:
+		# (iframe node, CDP node, total frame offset at the iframe)
+		cross_origin_iframes: list[tuple[EnhancedDOMTreeNode, Node, tuple[float, float]]] = []
+
+		def _create_enhanced_node(node: Node, frame_offset: tuple[float, float]) -> EnhancedDOMTreeNode:
+			"""Create a single enhanced node (without children) and register it in the lookup."""
 			# To make attributes more readable
 			attributes: dict[str, str] | None = None
 			if 'attributes' in node and node['attributes']:
@@ -528,17 +710,14 @@ class DomService:
 
 			# DIAGNOSTIC: Log when interactive elements don't have snapshot data
 			if not snapshot_data and node['nodeName'].upper() in ['INPUT', 'BUTTON', 'SELECT', 'TEXTAREA', 'A']:
-				parent_has_shadow = False
 				parent_info = ''
 				if 'parentId' in node and node['parentId'] in enhanced_dom_tree_node_lookup:
 					parent = enhanced_dom_tree_node_lookup[node['parentId']]
 					if parent.shadow_root_type:
-						parent_has_shadow = True
 						parent_info = f'parent={parent.tag_name}(shadow={parent.shadow_root_type})'
 				attr_str = ''
-				if 'attributes' in node and node['attributes']:
-					attrs_dict = {node['attributes'][i]: node['attributes'][i + 1] for i in range(0, len(node['attributes']), 2)}
-					attr_str = f'name={attrs_dict.get("name", "N/A")} id={attrs_dict.get("id", "N/A")}'
+				if attributes:
+					attr_str = f'name={attributes.get("name", "N/A")} id={attributes.get("id", "N/A")}'
 				self.logger.debug(
 					f'🔍 NO SNAPSHOT DATA for <{node["nodeName"]}> backendNodeId={node["backendNodeId"]} '
 					f'{attr_str} {parent_info} (snapshot_lookup has {len(snapshot_lookup)} entries)'
@@ -547,18 +726,30 @@ class DomService:
 			absolute_position = None
 			if snapshot_data and snapshot_data.bounds:
 				absolute_position = DOMRect(
-					x=snapshot_data.bounds.x + total_frame_offset.x,
-					y=snapshot_data.bounds.y + total_frame_offset.y,
+					x=snapshot_data.bounds.x + frame_offset[0],
+					y=snapshot_data.bounds.y + frame_offset[1],
 					width=snapshot_data.bounds.width,
 					height=snapshot_data.bounds.height,
 				)
 
-			try:
-				session = await self.browser_session.get_or_create_cdp_session(target_id, focus=False)
-				session_id = session.session_id
-			except ValueError:
-				# Target may have detached during DOM construction
-				session_id = None
+			ax_node = ax_tree_lookup.get(node['backendNodeId'])
+			# Viewport scope: elements laid out entirely outside the captured range get no accessibility data
+			if (
+				ax_node
+				and capture_range
+				and absolute_position
+				and (
+					absolute_position.x + absolute_position.width < capture_range[0]
+					or absolute_position.y + absolute_position.height < capture_range[1]
+					or absolute_position.x > capture_range[2]
+					or absolute_position.y > capture_range[3]
+				)
+			):
+				ax_node = None
+			if ax_node:
+				enhanced_ax_node = self._build_enhanced_ax_node(ax_node)
+			else:
+				enhanced_ax_node = None
 
 			dom_tree_node = EnhancedDOMTreeNode(
 				node_id=node['nodeId'],
@@ -589,67 +780,13 @@ class DomService:
 					node['parentId']
 				]  # parents should always be in the lookup
 
-			# Check if this is an HTML frame node and add it to the list
-			updated_html_frames = html_frames.copy()
-			if node['nodeType'] == NodeType.ELEMENT_NODE.value and node['nodeName'] == 'HTML' and node.get('frameId') is not None:
-				updated_html_frames.append(dom_tree_node)
-
-				# and adjust the total frame offset by scroll
-				if snapshot_data and snapshot_data.scrollRects:
-					total_frame_offset.x -= snapshot_data.scrollRects.x
-					total_frame_offset.y -= snapshot_data.scrollRects.y
-					# DEBUG: Log iframe scroll information
-					self.logger.debug(
-						f'🔍 DEBUG: HTML frame scroll - scrollY={snapshot_data.scrollRects.y}, scrollX={snapshot_data.scrollRects.x}, frameId={node.get("frameId")}, nodeId={node["nodeId"]}'
-					)
-
-			# Calculate new iframe offset for content documents, accounting for iframe scroll
-			if (
-				(node['nodeName'].upper() == 'IFRAME' or node['nodeName'].upper() == 'FRAME')
-				and snapshot_data
-				and snapshot_data.bounds
-			):
-				if snapshot_data.bounds:
-					updated_html_frames.append(dom_tree_node)
-
-					total_frame_offset.x += snapshot_data.bounds.x
-					total_frame_offset.y += snapshot_data.bounds.y
-
-			if 'contentDocument' in node and node['contentDocument']:
-				dom_tree_node.content_document = await _construct_enhanced_node(
-					node['contentDocument'], updated_html_frames, total_frame_offset, all_frames
-				)
-				dom_tree_node.content_document.parent_node = dom_tree_node
-				# forcefully set the parent node to the content document node (helps traverse the tree)
-
-			if 'shadowRoots' in node and node['shadowRoots']:
-				dom_tree_node.shadow_roots = []
-				for shadow_root in node['shadowRoots']:
-					shadow_root_node = await _construct_enhanced_node(
-						shadow_root, updated_html_frames, total_frame_offset, all_frames
-					)
-					# forcefully set the parent node to the shadow root node (helps traverse the tree)
-					shadow_root_node.parent_node = dom_tree_node
-					dom_tree_node.shadow_roots.append(shadow_root_node)
-
-			if 'children' in node and node['children']:
-				dom_tree_node.children_nodes = []
-				# Build set of shadow root node IDs to filter them out from children
-				shadow_root_node_ids = set()
-				if 'shadowRoots' in node and node['shadowRoots']:
-					for shadow_root in node['shadowRoots']:
-						shadow_root_node_ids.add(shadow_root['nodeId'])
-
-				for child in node['children']:
-					# Skip shadow roots - they should only be in shadow_roots list
-					if child['nodeId'] in shadow_root_node_ids:
-						continue
-					dom_tree_node.children_nodes.append(
-						await _construct_enhanced_node(child, updated_html_frames, total_frame_offset, all_frames)
-					)
+			return dom_tree_node
 
-			# Set visibility using the collected HTML frames
-			dom_tree_node.is_visible = self.is_element_visible_according_to_all_parents(dom_tree_node, updated_html_frames)
+		def _finish_enhanced_node(dom_tree_node: EnhancedDOMTreeNode, node: Node, html_frames: list[EnhancedDOMTreeNode]) -> None:
+			"""Post-order step: visibility needs the unadjusted bounds of the node's frames, so it runs after the children."""
+			dom_tree_node.is_visible = self.is_element_visible_according_to_all_parents(
+				dom_tree_node, html_frames, self.viewport_margin
+			)
 
 			# DEBUG: Log visibility info for form elements in iframes
 			if dom_tree_node.tag_name and dom_tree_node.tag_name.upper() in ['INPUT', 'SELECT', 'TEXTAREA', 'LABEL']:
@@ -668,92 +805,228 @@ class DomService:
 						f"🔍 DEBUG: Form element {dom_tree_node.tag_name} id='{elem_id}' name='{elem_name}' - visible={dom_tree_node.is_visible}, bounds={dom_tree_node.snapshot_node.bounds if dom_tree_node.snapshot_node else 'NO_SNAPSHOT'}"
 					)
 
-			# handle cross origin iframe (just recursively call the main function with the proper target if it exists in iframes)
-			# only do this if the iframe is visible (otherwise it's not worth it)
+		def _build_enhanced_tree(
+			root: Node, root_html_frames: list[EnhancedDOMTreeNode], root_frame_offset: tuple[float, float]
+		) -> EnhancedDOMTreeNode:
+			"""
+			Construct the enhanced DOM tree with an explicit stack (no recursion, no coroutines).
 
-			if (
-				# TODO: hacky way to disable cross origin iframes for now
-				self.cross_origin_iframes and node['nodeName'].upper() == 'IFRAME' and node.get('contentDocument', None) is None
-			):  # None meaning there is no content
-				# Check iframe depth to prevent infinite recursion
-				if iframe_depth >= self.max_iframe_depth:
-					self.logger.debug(
-						f'Skipping iframe at depth {iframe_depth} to prevent infinite recursion (max depth: {self.max_iframe_depth})'
-					)
+			Visit order matches the DOM: content document, then shadow roots, then children.
+			`html_frames` lists and frame offsets are shared between nodes and only copied where a frame changes them.
+			"""
+			root_slot: list[EnhancedDOMTreeNode] = []
+			# Entries: (node, parent, slot, html_frames, frame_offset) to visit, or (node, enhanced_node, html_frames) to finish
+			# slot: 'root' | 'content_document' | 'shadow_root' | 'child'
+			stack: list[tuple] = [(root, None, 'root', root_html_frames, root_frame_offset)]
+
+			while stack:
+				entry = stack.pop()
+				if len(entry) == 3:
+					_finish_enhanced_node(*entry)
+					continue
+
+				node, parent, slot, html_frames, frame_offset = entry
+
+				# memoize the mf (I don't know if some nodes are duplicated)
+				existing_node = enhanced_dom_tree_node_lookup.get(node['nodeId'])
+				dom_tree_node = existing_node or _create_enhanced_node(node, frame_offset)
+
+				if slot == 'root':
+					root_slot.append(dom_tree_node)
+				elif slot == 'content_document':
+					parent.content_document = dom_tree_node
+					# forcefully set the parent node to the content document node (helps traverse the tree)
+					dom_tree_node.parent_node = parent
+				elif slot == 'shadow_root':
+					# forcefully set the parent node to the shadow root node (helps traverse the tree)
+					dom_tree_node.parent_node = parent
+					parent.shadow_roots.append(dom_tree_node)
 				else:
-					# Check if iframe is visible and large enough (>= 50px in both dimensions)
-					should_process_iframe = False
-
-					# First check if the iframe element itself is visible
-					if dom_tree_node.is_visible:
-						# Check iframe dimensions
-						if dom_tree_node.snapshot_node and dom_tree_node.snapshot_node.bounds:
-							bounds = dom_tree_node.snapshot_node.bounds
-							width = bounds.width
-							height = bounds.height
-
-							# Only process if iframe is at least 50px in both dimensions
-							if width >= 50 and height >= 50:
-								should_process_iframe = True
-								self.logger.debug(f'Processing cross-origin iframe: visible=True, width={width}, height={height}')
-							else:
-								self.logger.debug(
-									f'Skipping small cross-origin iframe: width={width}, height={height} (needs >= 50px)'
-								)
-						else:
-							self.logger.debug('Skipping cross-origin iframe: no bounds available')
-					else:
-						self.logger.debug('Skipping invisible cross-origin iframe')
-
-					if should_process_iframe:
-						# Lazy fetch all_frames only when actually needed (for cross-origin iframes)
-						if all_frames is None:
-							all_frames, _ = await self.browser_session.get_all_frames()
-
-						# Use pre-fetched all_frames to find the iframe's target (no redundant CDP call)
-						frame_id = node.get('frameId', None)
-						if frame_id:
-							frame_info = all_frames.get(frame_id)
-							iframe_document_target = None
-							if frame_info and frame_info.get('frameTargetId'):
-								iframe_target_id = frame_info['frameTargetId']
-								iframe_target = self.browser_session.session_manager.get_target(iframe_target_id)
-								if iframe_target:
-									iframe_document_target = {
-										'targetId': iframe_target.target_id,
-										'url': iframe_target.url,
-										'title': iframe_target.title,
-										'type': iframe_target.target_type,
-									}
-						else:
-							iframe_document_target = None
-						# if target actually exists in one of the frames, just recursively build the dom tree for it
-						if iframe_document_target:
-							self.logger.debug(
-								f'Getting content document for iframe {node.get("frameId", None)} at depth {iframe_depth + 1}'
-							)
-							content_document, _ = await self.get_dom_tree(
-								target_id=iframe_document_target['targetId'],
-								all_frames=all_frames,
-								# TODO: experiment with this values -> not sure whether the whole cross origin iframe should be ALWAYS included as soon as some part of it is visible or not.
-								# Current config: if the cross origin iframe is AT ALL visible, then just include everything inside of it!
-								# initial_html_frames=updated_html_frames,
-								initial_total_frame_offset=total_frame_offset,
-								iframe_depth=iframe_depth + 1,
-							)
-
-							dom_tree_node.content_document = content_document
-							dom_tree_node.content_document.parent_node = dom_tree_node
+					parent.children_nodes.append(dom_tree_node)
 
-			return dom_tree_node
+				if existing_node is not None:
+					continue
 
-		# Build enhanced DOM tree recursively
-		# Note: all_frames stays None and will be lazily fetched inside _construct_enhanced_node
-		# only if/when a cross-origin iframe is encountered
+				snapshot_data = dom_tree_node.snapshot_node
+
+				# Check if this is an HTML frame node and add it to the list
+				updated_html_frames = html_frames
+				if (
+					node['nodeType'] == NodeType.ELEMENT_NODE.value
+					and node['nodeName'] == 'HTML'
+					and node.get('frameId') is not None
+				):
+					updated_html_frames = html_frames + [dom_tree_node]
+
+					# and adjust the total frame offset by scroll
+					if snapshot_data and snapshot_data.scrollRects:
+						frame_offset = (
+							frame_offset[0] - snapshot_data.scrollRects.x,
+							frame_offset[1] - snapshot_data.scrollRects.y,
+						)
+						# DEBUG: Log iframe scroll information
+						self.logger.debug(
+							f'🔍 DEBUG: HTML frame scroll - scrollY={snapshot_data.scrollRects.y}, scrollX={snapshot_data.scrollRects.x}, frameId={node.get("frameId")}, nodeId={node["nodeId"]}'
+						)
+
+				# Calculate new iframe offset for content documents, accounting for iframe scroll
+				if (
+					(node['nodeName'].upper() == 'IFRAME' or node['nodeName'].upper() == 'FRAME')
+					and snapshot_data
+					and snapshot_data.bounds
+				):
+					updated_html_frames = updated_html_frames + [dom_tree_node]
+					frame_offset = (frame_offset[0] + snapshot_data.bounds.x, frame_offset[1] + snapshot_data.bounds.y)
+
+				# Finish after all descendants (pushed first, popped last)
+				stack.append((dom_tree_node, node, updated_html_frames))
+
+				# handle cross origin iframe (resolved after the synchronous build, see below)
+				if (
+					# TODO: hacky way to disable cross origin iframes for now
+					self.cross_origin_iframes
+					and node['nodeName'].upper() == 'IFRAME'
+					and node.get('contentDocument', None) is None
+				):  # None meaning there is no content
+					cross_origin_iframes.append((dom_tree_node, node, frame_offset))
+
+				# Push in reverse so that content document, shadow roots and children are visited in DOM order
+				if 'children' in node and node['children']:
+					dom_tree_node.children_nodes = []
+					# Skip shadow roots - they should only be in shadow_roots list
+					shadow_root_node_ids = {shadow_root['nodeId'] for shadow_root in node.get('shadowRoots') or []}
+					for child in reversed(node['children']):
+						if child['nodeId'] in shadow_root_node_ids:
+							continue
+						stack.append((child, dom_tree_node, 'child', updated_html_frames, frame_offset))
+
+				if 'shadowRoots' in node and node['shadowRoots']:
+					dom_tree_node.shadow_roots = []
+					for shadow_root in reversed(node['shadowRoots']):
+						stack.append((shadow_root, dom_tree_node, 'shadow_root', updated_html_frames, frame_offset))
+
+				if 'contentDocument' in node and node['contentDocument']:
+					stack.append((node['contentDocument'], dom_tree_node, 'content_document', updated_html_frames, frame_offset))
+
+			return root_slot[0]
+
+		def _should_process_cross_origin_iframe(dom_tree_node: EnhancedDOMTreeNode) -> bool:
+			"""Check if the iframe is visible and large enough (>= 50px in both dimensions) to fetch its target."""
+			# First check if the iframe element itself is visible
+			if not dom_tree_node.is_visible:
+				self.logger.debug('Skipping invisible cross-origin iframe')
+				return False
+
+			# Check iframe dimensions
+			if not dom_tree_node.snapshot_node or not dom_tree_node.snapshot_node.bounds:
+				self.logger.debug('Skipping cross-origin iframe: no bounds available')
+				return False
+
+			bounds = dom_tree_node.snapshot_node.bounds
+			width = bounds.width
+			height = bounds.height
+
+			# Only process if iframe is at least 50px in both dimensions
+			if width >= 50 and height >= 50:
+				self.logger.debug(f'Processing cross-origin iframe: visible=True, width={width}, height={height}')
+				return True
+			self.logger.debug(f'Skipping small cross-origin iframe: width={width}, height={height} (needs >= 50px)')
+			return False
+
+		def _get_iframe_target_id(node: Node, all_frames: dict) -> TargetID | None:
+			"""Use pre-fetched all_frames to find the iframe's target (no redundant CDP call)."""
+			frame_id = node.get('frameId', None)
+			if not frame_id:
+				return None
+			frame_info = all_frames.get(frame_id)
+			if not frame_info or not frame_info.get('frameTargetId'):
+				return None
+			iframe_target = self.browser_session.session_manager.get_target(frame_info['frameTargetId'])
+			return iframe_target.target_id if iframe_target else None
+
+		async def _fetch_cross_origin_iframe(
+			iframe_target_id: TargetID,
+			node: Node,
+			frame_offset: tuple[float, float],
+			all_frames: dict,
+		) -> tuple[EnhancedDOMTreeNode, float]:
+			"""Recursively build the DOM tree of a cross-origin iframe target, returns it with the fetch time in ms."""
+			self.logger.debug(f'Getting content document for iframe {node.get("frameId", None)} at depth {iframe_depth + 1}')
+			start_fetch = time.time()
+			content_document, _ = await self.get_dom_tree(
+				target_id=iframe_target_id,
+				all_frames=all_frames,
+				# TODO: experiment with this values -> not sure whether the whole cross origin iframe should be ALWAYS included as soon as some part of it is visible or not.
+				# Current config: if the cross origin iframe is AT ALL visible, then just include everything inside of it!
+				# initial_html_frames=updated_html_frames,
+				initial_total_frame_offset=DOMRect(x=frame_offset[0], y=frame_offset[1], width=0.0, height=0.0),
+				iframe_depth=iframe_depth + 1,
+				iframe_semaphore=iframe_semaphore,
+			)
+			return content_document, (time.time() - start_fetch) * 1000
+
+		async def _attach_cross_origin_iframes(
+			iframes: list[tuple[EnhancedDOMTreeNode, Node, tuple[float, float]]],
+			all_frames: dict | None,
+		) -> None:
+			"""Fetch the iframe targets concurrently (bounded by max_concurrent_iframes), then stitch them in document order."""
+			if not iframes:
+				return
+
+			# Lazy fetch all_frames only when actually needed (for cross-origin iframes)
+			if all_frames is None:
+				all_frames, _ = await self.browser_session.get_all_frames()
+
+			# if target actually exists in one of the frames, just recursively build the dom tree for it
+			fetches: list[tuple[EnhancedDOMTreeNode, Node, TargetID, tuple[float, float]]] = []
+			for iframe_node, iframe_cdp_node, iframe_frame_offset in iframes:
+				iframe_target_id = _get_iframe_target_id(iframe_cdp_node, all_frames)
+				if iframe_target_id:
+					fetches.append((iframe_node, iframe_cdp_node, iframe_target_id, iframe_frame_offset))
+			if not fetches:
+				return
+
+			results = await asyncio.gather(
+				*(
+					_fetch_cross_origin_iframe(iframe_target_id, iframe_cdp_node, iframe_frame_offset, all_frames)
+					for _, iframe_cdp_node, iframe_target_id, iframe_frame_offset in fetches
+				),
+				return_exceptions=True,
+			)
+			# Like the sequential fetch, a failing iframe fails the whole tree (but only after the other fetches finished)
+			for result in results:
+				if isinstance(result, BaseException):
+					raise result
+
+			for (iframe_node, iframe_cdp_node, _, _), (content_document, fetch_ms) in zip(fetches, results):  # type: ignore[misc]
+				iframe_node.content_document = content_document
+				content_document.parent_node = iframe_node
+				self._last_cross_origin_documents += 1
+				timing_info[f'cross_origin_iframe[{iframe_cdp_node.get("frameId")}]_ms'] = fetch_ms
+
+		# Phase 1: build the enhanced DOM tree synchronously
 		start_construct = time.time()
-		enhanced_dom_tree_node = await _construct_enhanced_node(
-			dom_tree['root'], initial_html_frames, initial_total_frame_offset, all_frames
+		initial_frame_offset = (
+			(initial_total_frame_offset.x, initial_total_frame_offset.y) if initial_total_frame_offset else (0.0, 0.0)
 		)
+		enhanced_dom_tree_node = _build_enhanced_tree(dom_tree['root'], list(initial_html_frames or []), initial_frame_offset)
+		timing_info['build_tree_nodes_ms'] = (time.time() - start_construct) * 1000
+
+		# Phase 2: resolve cross-origin iframes (separate targets, needs CDP round trips)
+		# Note: all_frames stays None and is lazily fetched only if/when a cross-origin iframe is processed
+		if cross_origin_iframes:
+			start_cross_origin = time.time()
+			if iframe_depth >= self.max_iframe_depth:
+				# Check iframe depth to prevent infinite recursion
+				self.logger.debug(
+					f'Skipping {len(cross_origin_iframes)} iframes at depth {iframe_depth} to prevent infinite recursion (max depth: {self.max_iframe_depth})'
+				)
+			else:
+				await _attach_cross_origin_iframes(
+					[iframe for iframe in cross_origin_iframes if _should_process_cross_origin_iframe(iframe[0])], all_frames
+				)
+			timing_info['cross_origin_iframes_ms'] = (time.time() - start_cross_origin) * 1000
+
 		timing_info['construct_enhanced_tree_ms'] = (time.time() - start_construct) * 1000
 
 		# Calculate total time for get_dom_tree
@@ -775,10 +1048,14 @@ class DomService:
 
 	@observe_debug(ignore_input=True, ignore_output=True, name='get_serialized_dom_tree')
 	async def get_serialized_dom_tree(
-		self, previous_cached_state: SerializedDOMState | None = None
+		self, previous_cached_state: SerializedDOMState | None = None, target_id: TargetID | None = None
 	) -> tuple[SerializedDOMState, EnhancedDOMTreeNode, dict[str, float]]:
 		"""Get the serialized DOM tree representation for LLM consumption.
 
+		Args:
+			previous_cached_state: State of the previous build of the same page, to mark new elements.
+			target_id: Page to serialize, defaults to the current agent focus.
+
 		Returns:
 			Tuple of (serialized_dom_state, enhanced_dom_tree_root, timing_info)
 		"""
@@ -786,16 +1063,26 @@ class DomService:
 		start_total = time.time()
 
 		# Use current target (None means use current)
-		assert self.browser_session.agent_focus_target_id is not None
+		if target_id is None:
+			assert self.browser_session.agent_focus_target_id is not None
+			target_id = self.browser_session.agent_focus_target_id
 
 		session_id = self.browser_session.id
 
-		# Build DOM tree (includes CDP calls for snapshot, DOM, AX tree)
-		# Note: all_frames is fetched lazily inside get_dom_tree only if cross-origin iframes need it
-		enhanced_dom_tree, dom_tree_timing = await self.get_dom_tree(
-			target_id=self.browser_session.agent_focus_target_id,
-			all_frames=None,  # Lazy - will fetch if needed
-		)
+		# Incremental mode: patch the previous tree if the mutations since the last build allow it
+		incremental_result = await self._get_incremental_dom_tree(target_id) if self._mutation_tracker else None
+
+		if incremental_result is not None:
+			enhanced_dom_tree, dom_tree_timing = incremental_result
+		else:
+			# Build DOM tree (includes CDP calls for snapshot, DOM, AX tree)
+			# Note: all_frames is fetched lazily inside get_dom_tree only if cross-origin iframes need it
+			enhanced_dom_tree, dom_tree_timing = await self.get_dom_tree(
+				target_id=target_id,
+				all_frames=None,  # Lazy - will fetch if needed
+			)
+			if self._mutation_tracker:
+				await self._start_incremental_tracking(target_id, enhanced_dom_tree)
 
 		# Add sub-timings from DOM tree construction
 		timing_info.update(dom_tree_timing)
@@ -804,7 +1091,13 @@ class DomService:
 		start_serialize = time.time()
 
 		serialized_dom_state, serializer_timing = DOMTreeSerializer(
-			enhanced_dom_tree, previous_cached_state, paint_order_filtering=self.paint_order_filtering, session_id=session_id
+			enhanced_dom_tree,
+			previous_cached_state,
+			paint_order_filtering=self.paint_order_filtering,
+			session_id=session_id,
+			paint_order_engine=self.paint_order_engine,
+			pipeline=self.serializer_pipeline,
+			clickable_cache=self.clickable_element_cache,
 		).serialize_accessible_elements()
 		total_serialization_ms = (time.time() - start_serialize) * 1000
 
@@ -830,6 +1123,196 @@ class DomService:
 
 		return serialized_dom_state, enhanced_dom_tree, timing_info
 
+	def reset_incremental_state(self) -> None:
+		"""Forget the tracked tree, the next request does a full rebuild."""
+		tracker = self._mutation_tracker
+		if tracker is None:
+			return
+		if tracker.session_id:
+			self.browser_session.session_manager.unregister_dom_mutation_listener(tracker.session_id, tracker.handle_event)
+		tracker.reset()
+		self._last_node_lookup = {}
+
+	async def _get_page_metrics(self, cdp_session) -> tuple[float, ...] | None:
+		try:
+			result = await cdp_session.cdp_client.send.Runtime.evaluate(
+				params={'expression': _PAGE_METRICS_JS, 'returnByValue': True}, session_id=cdp_session.session_id
+			)
+			return tuple(result['result']['value'])
+		except Exception as e:
+			self.logger.debug(f'Failed to get page metrics: {type(e).__name__}: {e}')
+			return None
+
+	async def _start_incremental_tracking(self, target_id: TargetID, root: EnhancedDOMTreeNode) -> None:
+		"""Attach the mutation tracker to a freshly built tree."""
+		tracker = self._mutation_tracker
+		assert tracker is not None
+		node_lookup = self._last_node_lookup
+		self.reset_incremental_state()
+
+		if self._last_cross_origin_documents:
+			# Mutations inside cross-origin iframes arrive on other sessions, always rebuild such pages
+			tracker.invalidate('cross-origin iframe content')
+			return
+
+		try:
+			cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=target_id, focus=False)
+			# DOM domain must be enabled for Chrome to emit mutation events
+			await cdp_session.cdp_client.send.DOM.enable(session_id=cdp_session.session_id)
+			page_metrics = await self._get_page_metrics(cdp_session)
+		except Exception as e:
+			self.logger.debug(f'Incremental DOM tracking not started: {type(e).__name__}: {e}')
+			return
+
+		if page_metrics is None:
+			return
+
+		tracker.attach(target_id, cdp_session.session_id, root, node_lookup, page_metrics)
+		self.browser_session.session_manager.register_dom_mutation_listener(cdp_session.session_id, tracker.handle_event)
+
+	async def _get_incremental_dom_tree(self, target_id: TargetID) -> tuple[EnhancedDOMTreeNode, dict[str, float]] | None:
+		"""Patch the tracked tree and refresh the dirty nodes, or return None if a full rebuild is needed."""
+		tracker = self._mutation_tracker
+		assert tracker is not None
+
+		rebuild_reason = tracker.get_rebuild_reason(target_id)
+		if rebuild_reason is not None:
+			self.logger.debug(f'🔄 Incremental DOM: full rebuild ({rebuild_reason})')
+			return None
+		assert tracker.root is not None
+
+		start = time.time()
+		try:
+			cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=target_id, focus=False)
+			cdp_client = cdp_session.cdp_client
+			if cdp_session.session_id != tracker.session_id:
+				tracker.invalidate('session changed')
+				return None
+
+			# Node ids are re-assigned whenever anyone calls DOM.getDocument on this session
+			described = await cdp_client.send.DOM.describeNode(
+				params={'nodeId': tracker.root.node_id}, session_id=cdp_session.session_id
+			)
+			if described['node']['backendNodeId'] != tracker.root.backend_node_id:
+				tracker.invalidate('node ids were reset')
+				return None
+
+			# Layout of untouched nodes is reused, so it must not have moved
+			if await self._get_page_metrics(cdp_session) != tracker.page_metrics:
+				tracker.invalidate('scroll position or page size changed')
+				return None
+
+			# Inserted subtrees arrive without children, their setChildNodes events are delivered before the responses
+			requested_node_ids = list(tracker.pending_child_requests)
+			tracker.pending_child_requests.clear()
+			if requested_node_ids:
+				await asyncio.gather(
+					*[
+						cdp_client.send.DOM.requestChildNodes(
+							params={'nodeId': node_id, 'depth': -1, 'pierce': True}, session_id=cdp_session.session_id
+						)
+						for node_id in requested_node_ids
+					]
+				)
+				await asyncio.sleep(0)
+				for node_id in requested_node_ids:
+					node = tracker.node_lookup.get(node_id)
+					if node is not None and node.children_nodes is None:
+						tracker.invalidate('requested child nodes were not delivered')
+						break
+
+			# Requested children count as dirty too
+			rebuild_reason = tracker.get_rebuild_reason(target_id)
+			if rebuild_reason is not None:
+				self.logger.debug(f'🔄 Incremental DOM: full rebuild ({rebuild_reason})')
+				return None
+
+			dirty_nodes = tracker.pop_dirty_nodes()
+			if dirty_nodes:
+				await asyncio.gather(*[self._refresh_dirty_node(cdp_session, node) for node in dirty_nodes])
+				await cdp_client.send.Runtime.releaseObjectGroup(
+					params={'objectGroup': _INCREMENTAL_OBJECT_GROUP}, session_id=cdp_session.session_id
+				)
+		except Exception as e:
+			tracker.invalidate(f'refresh failed: {type(e).__name__}: {e}')
+			return None
+
+		refresh_ms = (time.time() - start) * 1000
+		self.logger.debug(
+			f'🔄 Incremental DOM: refreshed {len(dirty_nodes)} dirty nodes of {len(tracker.node_lookup)} '
+			f'after {tracker.mutation_count} mutations in {refresh_ms:.2f}ms'
+		)
+		tracker.mutation_count = 0
+		return tracker.root, {'incremental_refresh_ms': refresh_ms, 'get_dom_tree_total_ms': refresh_ms}
+
+	async def _refresh_dirty_node(self, cdp_session, node: EnhancedDOMTreeNode) -> None:
+		"""Re-read layout, computed styles and AX data of a single node (replaces its snapshot data)."""
+		if node.node_type not in (NodeType.ELEMENT_NODE, NodeType.TEXT_NODE):
+			return
+
+		cdp_client = cdp_session.cdp_client
+		resolved = await cdp_client.send.DOM.resolveNode(
+			params={'backendNodeId': node.backend_node_id, 'objectGroup': _INCREMENTAL_OBJECT_GROUP},
+			session_id=cdp_session.session_id,
+		)
+		object_id = resolved['object'].get('objectId')
+		if not object_id:
+			return
+
+		layout_result, ax_result = await asyncio.gather(
+			cdp_client.send.Runtime.callFunctionOn(
+				params={
+					'functionDeclaration': _NODE_LAYOUT_JS,
+					'objectId': object_id,
+					'arguments': [{'value': REQUIRED_COMPUTED_STYLES}, {'value': self.viewport_margin}],
+					'returnByValue': True,
+				},
+				session_id=cdp_session.session_id,
+			),
+			cdp_client.send.Accessibility.getPartialAXTree(
+				params={'backendNodeId': node.backend_node_id, 'fetchRelatives': False}, session_id=cdp_session.session_id
+			),
+			return_exceptions=True,
+		)
+
+		if not isinstance(ax_result, BaseException):
+			node.ax_node = None
+			for ax_node in ax_result.get('nodes', []):
+				if ax_node.get('backendDOMNodeId') == node.backend_node_id:
+					node.ax_node = self._build_enhanced_ax_node(ax_node)
+					break
+			# The accessible name is part of the element hash
+			node.invalidate_memo()
+
+		if isinstance(layout_result, BaseException):
+			raise layout_result
+		layout = layout_result.get('result', {}).get('value')
+		if not layout:
+			node.snapshot_node = None
+			node.absolute_position = None
+			node.is_visible = False
+			return
+
+		# Paint order, clickability and stacking contexts only come from DOMSnapshot, keep what the last full build had
+		previous = node.snapshot_node
+		bounds = DOMRect(*layout['bounds']) if layout['bounds'] else None
+		computed_styles = {name: value for name, value in layout['styles'].items() if value}
+		node.snapshot_node = EnhancedSnapshotNode(
+			is_clickable=previous.is_clickable if previous else None,
+			cursor_style=computed_styles.get('cursor'),
+			bounds=bounds,
+			clientRects=DOMRect(*layout['clientRects']) if layout['clientRects'] else None,
+			scrollRects=DOMRect(*layout['scrollRects']) if layout['scrollRects'] else None,
+			computed_styles=computed_styles or None,
+			paint_order=previous.paint_order if previous else None,
+			stacking_contexts=previous.stacking_contexts if previous else None,
+		)
+		node.absolute_position = DOMRect(bounds.x, bounds.y, bounds.width, bounds.height) if bounds else None
+		# Bounds are already frame- and scroll-adjusted, so only the style checks of the full build apply
+		node.is_visible = bool(layout['inViewport']) and self.is_element_visible_according_to_all_parents(
+			node, [], self.viewport_margin
+		)
+
 	@staticmethod
 	def detect_pagination_buttons(selector_map: dict[int, EnhancedDOMTreeNode]) -> list[dict[str, str | int | bool]]:
 		"""Detect pagination buttons from the selector map.
@@ -1,6 +1,7 @@
 import hashlib
 from dataclasses import asdict, dataclass, field
 from enum import Enum
+from functools import cached_property
 from typing import Any
 
 from cdp_use.cdp.accessibility.commands import GetFullAXTreeReturns
@@ -196,6 +197,8 @@ class TargetAllTrees:
 	ax_tree: GetFullAXTreeReturns
 	device_pixel_ratio: float
 	cdp_timing: dict[str, float]
+	capture_viewport: 'DOMRect | None' = None
+	"""Viewport in document coordinates (CSS pixels) when only the area around it was captured"""
 
 
 @dataclass(slots=True)
@@ -300,6 +303,15 @@ class EnhancedAXProperty:
 	# related_nodes: list[EnhancedAXRelatedNode] | None
 
 
+class AXInteractivity(int, Enum):
+	"""What the AX properties of a node say about its interactivity (see `ClickableElementDetector`)."""
+
+	UNKNOWN = -1  # not computed yet
+	UNDECIDED = 0  # no property decides, the detector falls through to tag/attribute/role checks
+	INTERACTIVE = 1
+	NOT_INTERACTIVE = 2  # disabled or hidden
+
+
 @dataclass(slots=True)
 class EnhancedAXNode:
 	ax_node_id: str
@@ -313,6 +325,9 @@ class EnhancedAXNode:
 	properties: list[EnhancedAXProperty] | None
 	child_ids: list[str] | None
 
+	properties_interactivity: AXInteractivity = field(default=AXInteractivity.UNKNOWN, compare=False)
+	"""Verdict of the first decisive property, computed once when the node is built (or on first use)"""
+
 
 @dataclass(slots=True)
 class EnhancedSnapshotNode:
@@ -363,6 +378,20 @@ class EnhancedSnapshotNode:
 # 	element_index: int | None
 
 
+@dataclass(slots=True)
+class _NodeMemo:
+	"""Lazily computed, structure-derived values of an EnhancedDOMTreeNode (see `EnhancedDOMTreeNode.invalidate_memo`)."""
+
+	branch_path: str | None = None
+	"""Tag names of the element ancestors (including the node itself), joined by '/'"""
+	position: int | None = None
+	"""Result of `_get_element_position`"""
+	xpath: str | None = None
+	hash: int | None = None
+	stable_hash: int | None = None
+	parent_branch_hash: int | None = None
+
+
 @dataclass(slots=True)
 class EnhancedDOMTreeNode:
 	"""
@@ -439,6 +468,9 @@ class EnhancedDOMTreeNode:
 
 	uuid: str = field(default_factory=uuid7str)
 
+	# Memoized branch path, xpath, sibling position and hashes, filled on first access
+	_memo: _NodeMemo | None = field(default=None, repr=False, compare=False)
+
 	@property
 	def parent(self) -> 'EnhancedDOMTreeNode | None':
 		return self.parent_node
@@ -465,51 +497,73 @@ class EnhancedDOMTreeNode:
 	@property
 	def xpath(self) -> str:
 		"""Generate XPath for this DOM node, stopping at shadow boundaries or iframes."""
-		segments = []
-		current_element = self
+		memo = self._get_memo()
+		if memo.xpath is not None:
+			return memo.xpath
+
+		# Walk up to the first ancestor whose xpath is known (or where the path starts), then fill in top-down so
+		# that computing the xpath of every node in a tree is O(n) instead of O(n * depth)
+		chain: list['EnhancedDOMTreeNode'] = []
+		current_element: 'EnhancedDOMTreeNode | None' = self
+		prefix = ''
+		while current_element is not None:
+			current_memo = current_element._memo
+			if current_memo is not None and current_memo.xpath is not None:
+				prefix = current_memo.xpath
+				break
 
-		while current_element and (
-			current_element.node_type == NodeType.ELEMENT_NODE or current_element.node_type == NodeType.DOCUMENT_FRAGMENT_NODE
-		):
 			# just pass through shadow roots
 			if current_element.node_type == NodeType.DOCUMENT_FRAGMENT_NODE:
+				chain.append(current_element)
 				current_element = current_element.parent_node
 				continue
 
-			# stop ONLY if we hit iframe
-			if current_element.parent_node and current_element.parent_node.node_name.lower() == 'iframe':
+			# stop ONLY if we hit iframe (or leave the element tree)
+			if current_element.node_type != NodeType.ELEMENT_NODE or (
+				current_element.parent_node and current_element.parent_node.node_name.lower() == 'iframe'
+			):
+				current_element._get_memo().xpath = ''
 				break
 
-			position = self._get_element_position(current_element)
-			tag_name = current_element.node_name.lower()
-			xpath_index = f'[{position}]' if position > 0 else ''
-			segments.insert(0, f'{tag_name}{xpath_index}')
-
+			chain.append(current_element)
 			current_element = current_element.parent_node
 
-		return '/'.join(segments)
+		for node in reversed(chain):
+			if node.node_type == NodeType.ELEMENT_NODE:
+				position = self._get_element_position(node)
+				xpath_index = f'[{position}]' if position > 0 else ''
+				segment = f'{node.node_name.lower()}{xpath_index}'
+				prefix = f'{prefix}/{segment}' if prefix else segment
+			node._get_memo().xpath = prefix
+
+		return prefix
 
 	def _get_element_position(self, element: 'EnhancedDOMTreeNode') -> int:
 		"""Get the position of an element among its siblings with the same tag name.
 		Returns 0 if it's the only element of its type, otherwise returns 1-based index."""
+		memo = element._get_memo()
+		if memo.position is not None:
+			return memo.position
+
+		memo.position = 0
 		if not element.parent_node or not element.parent_node.children_nodes:
 			return 0
 
-		same_tag_siblings = [
-			child
-			for child in element.parent_node.children_nodes
-			if child.node_type == NodeType.ELEMENT_NODE and child.node_name.lower() == element.node_name.lower()
-		]
+		# Number all siblings in one pass, they are almost always asked for next
+		same_tag_siblings: dict[str, list['EnhancedDOMTreeNode']] = {}
+		for child in element.parent_node.children_nodes:
+			if child.node_type == NodeType.ELEMENT_NODE:
+				same_tag_siblings.setdefault(child.node_name.lower(), []).append(child)
 
-		if len(same_tag_siblings) <= 1:
-			return 0  # No index needed if it's the only one
+		for siblings in same_tag_siblings.values():
+			if len(siblings) <= 1:
+				siblings[0]._get_memo().position = 0  # No index needed if it's the only one
+				continue
+			for i, sibling in enumerate(siblings):
+				# XPath is 1-indexed
+				sibling._get_memo().position = i + 1
 
-		try:
-			# XPath is 1-indexed
-			position = same_tag_siblings.index(element) + 1
-			return position
-		except ValueError:
-			return 0
+		return memo.position
 
 	def __json__(self) -> dict:
 		"""Serializes the node and its descendants to a dictionary, omitting parent references."""
@@ -807,8 +861,11 @@ class EnhancedDOMTreeNode:
 		More stable across sessions than element_hash since it excludes
 		transient CSS state classes like focus, hover, animation, etc.
 		"""
-		parent_branch_path = self._get_parent_branch_path()
-		parent_branch_path_string = '/'.join(parent_branch_path)
+		memo = self._get_memo()
+		if memo.stable_hash is not None:
+			return memo.stable_hash
+
+		parent_branch_path_string = self._get_parent_branch_path_string()
 
 		# Filter dynamic classes before building attributes string
 		filtered_attrs: dict[str, str] = {}
@@ -829,7 +886,8 @@ class EnhancedDOMTreeNode:
 
 		combined_string = f'{parent_branch_path_string}|{attributes_string}{ax_name}'
 		hash_hex = hashlib.sha256(combined_string.encode()).hexdigest()
-		return int(hash_hex[:16], 16)
+		memo.stable_hash = int(hash_hex[:16], 16)
+		return memo.stable_hash
 
 	def __str__(self) -> str:
 		return f'[<{self.tag_name}>#{self.frame_id[-4:] if self.frame_id else "?"}:{self.backend_node_id}]'
@@ -840,10 +898,12 @@ class EnhancedDOMTreeNode:
 
 		TODO: migrate this to use only backendNodeId + current SessionId
 		"""
+		memo = self._get_memo()
+		if memo.hash is not None:
+			return memo.hash
 
 		# Get parent branch path
-		parent_branch_path = self._get_parent_branch_path()
-		parent_branch_path_string = '/'.join(parent_branch_path)
+		parent_branch_path_string = self._get_parent_branch_path_string()
 
 		attributes_string = ''.join(
 			f'{k}={v}' for k, v in sorted((k, v) for k, v in self.attributes.items() if k in STATIC_ATTRIBUTES)
@@ -860,30 +920,76 @@ class EnhancedDOMTreeNode:
 		element_hash = hashlib.sha256(combined_string.encode()).hexdigest()
 
 		# Convert to int for __hash__ return type - use first 16 chars and convert from hex to int
-		return int(element_hash[:16], 16)
+		memo.hash = int(element_hash[:16], 16)
+		return memo.hash
 
 	def parent_branch_hash(self) -> int:
 		"""
 		Hash the element based on its parent branch path and attributes.
 		"""
-		parent_branch_path = self._get_parent_branch_path()
-		parent_branch_path_string = '/'.join(parent_branch_path)
-		element_hash = hashlib.sha256(parent_branch_path_string.encode()).hexdigest()
-
-		return int(element_hash[:16], 16)
+		memo = self._get_memo()
+		if memo.parent_branch_hash is None:
+			parent_branch_path_string = self._get_parent_branch_path_string()
+			element_hash = hashlib.sha256(parent_branch_path_string.encode()).hexdigest()
+			memo.parent_branch_hash = int(element_hash[:16], 16)
+		return memo.parent_branch_hash
 
 	def _get_parent_branch_path(self) -> list[str]:
 		"""Get the parent branch path as a list of tag names from root to current element."""
-		parents: list['EnhancedDOMTreeNode'] = []
-		current_element: 'EnhancedDOMTreeNode | None' = self
+		parent_branch_path_string = self._get_parent_branch_path_string()
+		return parent_branch_path_string.split('/') if parent_branch_path_string else []
 
+	def _get_parent_branch_path_string(self) -> str:
+		"""Memoized '/'.join(self._get_parent_branch_path()), filled top-down from the nearest memoized ancestor."""
+		memo = self._get_memo()
+		if memo.branch_path is not None:
+			return memo.branch_path
+
+		chain: list['EnhancedDOMTreeNode'] = []
+		current_element: 'EnhancedDOMTreeNode | None' = self
+		prefix = ''
 		while current_element is not None:
-			if current_element.node_type == NodeType.ELEMENT_NODE:
-				parents.append(current_element)
+			current_memo = current_element._memo
+			if current_memo is not None and current_memo.branch_path is not None:
+				prefix = current_memo.branch_path
+				break
+			chain.append(current_element)
 			current_element = current_element.parent_node
 
-		parents.reverse()
-		return [parent.tag_name for parent in parents]
+		for node in reversed(chain):
+			if node.node_type == NodeType.ELEMENT_NODE:
+				prefix = f'{prefix}/{node.tag_name}' if prefix else node.tag_name
+			node._get_memo().branch_path = prefix
+
+		return prefix
+
+	def _get_memo(self) -> _NodeMemo:
+		if self._memo is None:
+			self._memo = _NodeMemo()
+		return self._memo
+
+	def invalidate_memo(self, include_subtree_xpaths: bool = False) -> None:
+		"""
+		Drop memoized values that depend on mutable node data.
+
+		Call it after changing `attributes` or `ax_node` of this node (hashes), and with `include_subtree_xpaths=True`
+		on the parent after inserting or removing children (sibling positions and xpaths of the whole subtree).
+		"""
+		if self._memo is not None:
+			self._memo.hash = None
+			self._memo.stable_hash = None
+
+		if include_subtree_xpaths:
+			stack: list['EnhancedDOMTreeNode'] = [self]
+			while stack:
+				node = stack.pop()
+				if node._memo is not None:
+					node._memo.xpath = None
+					node._memo.position = None
+				if node.children_nodes:
+					stack.extend(node.children_nodes)
+				if node.shadow_roots:
+					stack.extend(node.shadow_roots)
 
 
 DOMSelectorMap = dict[int, EnhancedDOMTreeNode]
@@ -896,6 +1002,11 @@ class SerializedDOMState:
 
 	selector_map: DOMSelectorMap
 
+	@cached_property
+	def element_index(self) -> 'DOMSelectorMapIndex':
+		"""Lookup tables to match historical elements against `selector_map`, built on first use."""
+		return DOMSelectorMapIndex.from_selector_map(self.selector_map)
+
 	@observe_debug(ignore_input=True, ignore_output=True, name='llm_representation')
 	def llm_representation(
 		self,
@@ -1002,3 +1113,84 @@ class DOMInteractedElement:
 			stable_hash=enhanced_dom_tree.compute_stable_hash(),  # Compute from source for single source of truth
 			ax_name=ax_name,
 		)
+
+
+# Unique identifiers used by the ATTRIBUTE match level, in order of preference
+MATCH_ATTRIBUTES = ('name', 'id', 'aria-label')
+
+
+@dataclass
+class DOMSelectorMapIndex:
+	"""
+	Lookup tables over a selector map, to find the element matching a `DOMInteractedElement` without scanning the map.
+
+	Built once per serialized DOM state (see `SerializedDOMState.element_index`). Where several elements share a key,
+	the one with the lowest position in the selector map comes first, like a scan of the map would find it. The stable
+	hash and xpath tables walk the ancestors of every element, they are only built when a lookup gets to them.
+	"""
+
+	selector_map: DOMSelectorMap = field(default_factory=dict, repr=False)
+	by_hash: dict[int, int] = field(default_factory=dict)
+	by_node_name: dict[str, list[int]] = field(default_factory=dict)
+	"""Lowercase tag name -> indices"""
+	by_ax_name: dict[tuple[str, str], list[int]] = field(default_factory=dict)
+	"""(lowercase tag name, accessible name) -> indices"""
+	by_attribute: dict[tuple[str, str, str], list[int]] = field(default_factory=dict)
+	"""(lowercase tag name, attribute in MATCH_ATTRIBUTES, value) -> indices"""
+
+	@classmethod
+	def from_selector_map(cls, selector_map: DOMSelectorMap) -> 'DOMSelectorMapIndex':
+		index = cls(selector_map=selector_map)
+		for highlight_index, node in selector_map.items():
+			node_name = node.node_name.lower()
+			index.by_hash.setdefault(node.element_hash, highlight_index)
+			index.by_node_name.setdefault(node_name, []).append(highlight_index)
+			if node.ax_node and node.ax_node.name:
+				index.by_ax_name.setdefault((node_name, node.ax_node.name), []).append(highlight_index)
+			if node.attributes:
+				for attr_key in MATCH_ATTRIBUTES:
+					value = node.attributes.get(attr_key)
+					if value:
+						index.by_attribute.setdefault((node_name, attr_key, value), []).append(highlight_index)
+		return index
+
+	@cached_property
+	def by_stable_hash(self) -> dict[int, int]:
+		by_stable_hash: dict[int, int] = {}
+		for highlight_index, node in self.selector_map.items():
+			by_stable_hash.setdefault(node.compute_stable_hash(), highlight_index)
+		return by_stable_hash
+
+	@cached_property
+	def by_xpath(self) -> dict[str, int]:
+		by_xpath: dict[str, int] = {}
+		for highlight_index, node in self.selector_map.items():
+			by_xpath.setdefault(node.xpath, highlight_index)
+		return by_xpath
+
+	def find(self, element: DOMInteractedElement) -> tuple[int, MatchLevel] | None:
+		"""
+		Index of the element matching a historical element, and the level it matched at.
+
+		Tries each level in order: EXACT hash, STABLE hash, XPATH, AX_NAME (same tag), then ATTRIBUTE (same tag and
+		name, id or aria-label).
+		"""
+		if element.element_hash in self.by_hash:
+			return self.by_hash[element.element_hash], MatchLevel.EXACT
+		if element.stable_hash is not None and element.stable_hash in self.by_stable_hash:
+			return self.by_stable_hash[element.stable_hash], MatchLevel.STABLE
+		if element.x_path and element.x_path in self.by_xpath:
+			return self.by_xpath[element.x_path], MatchLevel.XPATH
+
+		node_name = element.node_name.lower()
+		if element.ax_name:
+			indices = self.by_ax_name.get((node_name, element.ax_name))
+			if indices:
+				return indices[0], MatchLevel.AX_NAME
+		if element.attributes:
+			for attr_key in MATCH_ATTRIBUTES:
+				value = element.attributes.get(attr_key)
+				indices = self.by_attribute.get((node_name, attr_key, value)) if value else None
+				if indices:
+					return indices[0], MatchLevel.ATTRIBUTE
+		return None
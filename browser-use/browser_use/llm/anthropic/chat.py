@@ -22,6 +22,7 @@ from pydantic import BaseModel
 from browser_use.llm.anthropic.serializer import AnthropicMessageSerializer
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
+from browser_use.llm.http_pool import get_shared_http_client
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.schema import SchemaOptimizer
 from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
@@ -77,6 +78,9 @@ class ChatAnthropic(BaseChatModel):
 			if v is not None and v is not NotGiven():
 				client_params[k] = v
 
+		if self.http_client is None:
+			client_params['http_client'] = get_shared_http_client(self.provider, self.base_url, self.api_key or self.auth_token)
+
 		return client_params
 
 	def _get_client_params_for_invoke(self):
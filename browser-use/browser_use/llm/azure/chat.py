@@ -10,6 +10,7 @@ from openai.types.shared import ChatModel
 from pydantic import BaseModel
 
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
+from browser_use.llm.http_pool import get_shared_http_client
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.openai.like import ChatOpenAILike
 from browser_use.llm.openai.responses_serializer import ResponsesAPIMessageSerializer
@@ -108,9 +109,12 @@ class ChatAzureOpenAI(ChatOpenAILike):
 		if self.http_client:
 			_client_params['http_client'] = self.http_client
 		else:
-			# Create a new async HTTP client with custom limits
-			_client_params['http_client'] = httpx.AsyncClient(
-				limits=httpx.Limits(max_connections=20, max_keepalive_connections=6)
+			# Share the connection pool with the other Azure clients of this endpoint and key, with custom limits
+			_client_params['http_client'] = get_shared_http_client(
+				self.provider,
+				self.azure_endpoint or self.base_url,
+				self.api_key or self.azure_ad_token,
+				limits=httpx.Limits(max_connections=20, max_keepalive_connections=6),
 			)
 
 		self.client = AsyncAzureOpenAIClient(**_client_params)
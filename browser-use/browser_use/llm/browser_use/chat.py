@@ -16,6 +16,7 @@ from pydantic import BaseModel
 
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
+from browser_use.llm.http_pool import get_shared_http_client
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.views import ChatInvokeCompletion
 from browser_use.observability import observe
@@ -250,17 +251,18 @@ class ChatBrowserUse(BaseChatModel):
 
 	async def _make_request(self, payload: dict) -> dict:
 		"""Make a single API request."""
-		async with httpx.AsyncClient(timeout=self.timeout) as client:
-			response = await client.post(
-				f'{self.base_url}/v1/chat/completions',
-				json=payload,
-				headers={
-					'Authorization': f'Bearer {self.api_key}',
-					'Content-Type': 'application/json',
-				},
-			)
-			response.raise_for_status()
-			return response.json()
+		client = get_shared_http_client(self.provider, self.base_url, self.api_key)
+		response = await client.post(
+			f'{self.base_url}/v1/chat/completions',
+			json=payload,
+			headers={
+				'Authorization': f'Bearer {self.api_key}',
+				'Content-Type': 'application/json',
+			},
+			timeout=self.timeout,
+		)
+		response.raise_for_status()
+		return response.json()
 
 	def _raise_http_error(self, e: httpx.HTTPStatusError) -> None:
 		"""Raise appropriate ModelProviderError for HTTP errors."""
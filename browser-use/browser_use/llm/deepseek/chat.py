@@ -18,6 +18,7 @@ from pydantic import BaseModel
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.deepseek.serializer import DeepSeekMessageSerializer
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
+from browser_use.llm.http_pool import get_shared_http_client
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.schema import SchemaOptimizer
 from browser_use.llm.views import ChatInvokeCompletion
@@ -48,11 +49,13 @@ class ChatDeepSeek(BaseChatModel):
 		return 'deepseek'
 
 	def _client(self) -> AsyncOpenAI:
+		client_params = {'http_client': get_shared_http_client(self.provider, self.base_url, self.api_key)}
+		client_params.update(self.client_params or {})
 		return AsyncOpenAI(
 			api_key=self.api_key,
 			base_url=self.base_url,
 			timeout=self.timeout,
-			**(self.client_params or {}),
+			**client_params,
 		)
 
 	@property
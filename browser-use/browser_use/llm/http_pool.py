@@ -0,0 +1,199 @@
+"""
+Process-wide registry of pooled httpx clients for the LLM adapters.
+
+The provider SDKs open a fresh connection pool for every client they construct, so an adapter that builds its SDK client
+per call pays a DNS lookup and TLS handshake on every step. The adapters instead hand the SDKs a shared
+`httpx.AsyncClient` from this registry, keyed by provider, base URL and a fingerprint of the credentials, with HTTP/2
+(when `h2` is installed), keep-alive and bounded pool sizes.
+
+httpx connections are bound to the event loop that opened them, so clients are additionally scoped to the running loop
+and dropped once that loop is closed. Agents retain the pools of their loop while they run and close them when the last
+one is closed.
+"""
+
+import asyncio
+import hashlib
+import importlib.util
+import logging
+import threading
+import weakref
+from typing import Any
+
+import httpx
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0)
+
+_HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+
+class HTTPPoolStats(BaseModel):
+	"""Utilisation of one shared LLM connection pool"""
+
+	provider: str
+	base_url: str
+	http2: bool
+	requests: int
+	active_requests: int
+	max_active_requests: int
+	open_connections: int
+	idle_connections: int
+	max_connections: int | None
+
+
+class _PooledTransport(httpx.AsyncHTTPTransport):
+	"""AsyncHTTPTransport that counts requests (until the response headers arrive) for the pool statistics."""
+
+	def __init__(self, **kwargs: Any):
+		super().__init__(**kwargs)
+		self.requests = 0
+		self.active_requests = 0
+		self.max_active_requests = 0
+
+	async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+		self.requests += 1
+		self.active_requests += 1
+		self.max_active_requests = max(self.max_active_requests, self.active_requests)
+		try:
+			return await super().handle_async_request(request)
+		finally:
+			self.active_requests -= 1
+
+	def connection_counts(self) -> tuple[int, int]:
+		"""(open, idle) connections of the underlying httpcore pool."""
+		connections = list(getattr(self._pool, 'connections', []))
+		idle = sum(1 for connection in connections if connection.is_idle())
+		return len(connections), idle
+
+
+class _PoolEntry:
+	def __init__(self, provider: str, base_url: str, transport: _PooledTransport, limits: httpx.Limits):
+		self.provider = provider
+		self.base_url = base_url
+		self.client = httpx.AsyncClient(transport=transport, follow_redirects=True)
+		self.transport = transport
+		self.limits = limits
+
+	def stats(self) -> HTTPPoolStats:
+		open_connections, idle_connections = self.transport.connection_counts()
+		return HTTPPoolStats(
+			provider=self.provider,
+			base_url=self.base_url,
+			http2=_HTTP2_AVAILABLE,
+			requests=self.transport.requests,
+			active_requests=self.transport.active_requests,
+			max_active_requests=self.transport.max_active_requests,
+			open_connections=open_connections,
+			idle_connections=idle_connections,
+			max_connections=self.limits.max_connections,
+		)
+
+
+_lock = threading.Lock()
+# id(event loop) -> (event loop, pool key -> entry). Open connections reference their loop, so a WeakKeyDictionary
+# would never release it; pools of closed loops are pruned instead.
+_pools: dict[int, tuple['weakref.ref[asyncio.AbstractEventLoop]', dict[tuple[str, str, str, int], _PoolEntry]]] = {}
+# id(event loop) -> ids of the agents running on it, the pools are closed when the last one is released
+_pool_users: dict[int, set[int]] = {}
+
+
+def _credentials_fingerprint(credentials: str | None) -> str:
+	if not credentials:
+		return ''
+	return hashlib.sha256(credentials.encode()).hexdigest()[:16]
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+	try:
+		return asyncio.get_running_loop()
+	except RuntimeError:
+		return None
+
+
+def _get_loop_pools(loop: asyncio.AbstractEventLoop) -> dict[tuple[str, str, str, int], _PoolEntry]:
+	"""Pools of `loop`, called with `_lock` held."""
+	for loop_id, (loop_ref, _) in list(_pools.items()):
+		other_loop = loop_ref()
+		if other_loop is None or other_loop.is_closed():
+			del _pools[loop_id]
+			_pool_users.pop(loop_id, None)
+
+	if id(loop) not in _pools:
+		_pools[id(loop)] = (weakref.ref(loop), {})
+	return _pools[id(loop)][1]
+
+
+def get_shared_http_client(
+	provider: str,
+	base_url: str | httpx.URL | None = None,
+	credentials: str | None = None,
+	connect_retries: int = 0,
+	limits: httpx.Limits = DEFAULT_POOL_LIMITS,
+) -> httpx.AsyncClient:
+	"""
+	Return the pooled httpx client for `provider` + `base_url` + `credentials` on the running event loop.
+
+	The credentials are only hashed into the key, so tenants with different API keys never share connections. Timeouts are
+	left to the SDKs (or passed per request), so adapters with different timeouts share a pool. Called outside a running
+	loop, an unshared client is returned.
+	"""
+	key = (provider, str(base_url or ''), _credentials_fingerprint(credentials), connect_retries)
+	loop = _running_loop()
+
+	with _lock:
+		loop_pools = _get_loop_pools(loop) if loop is not None else {}
+		entry = loop_pools.get(key)
+		if entry is None or entry.client.is_closed:
+			transport = _PooledTransport(http2=_HTTP2_AVAILABLE, limits=limits, retries=connect_retries)
+			entry = _PoolEntry(provider, key[1], transport, limits)
+			loop_pools[key] = entry
+			logger.debug(f'Opened shared HTTP pool for {provider} {key[1] or "(default base URL)"} (http2={_HTTP2_AVAILABLE})')
+		return entry.client
+
+
+def get_http_pool_stats() -> list[HTTPPoolStats]:
+	"""Statistics of the open shared pools of the running event loop (of all loops when called outside one)."""
+	loop = _running_loop()
+	with _lock:
+		if loop is not None:
+			entries = list(_get_loop_pools(loop).values())
+		else:
+			entries = [entry for _, loop_pools in _pools.values() for entry in loop_pools.values()]
+	return [entry.stats() for entry in entries if not entry.client.is_closed]
+
+
+async def aclose_shared_http_clients() -> None:
+	"""Close the shared pools of the running event loop, e.g. on application shutdown."""
+	loop = _running_loop()
+	with _lock:
+		loop_pools = _pools.pop(id(loop), (None, {}))[1] if loop is not None else {}
+	for entry in loop_pools.values():
+		try:
+			await entry.client.aclose()
+		except Exception as e:
+			logger.debug(f'Error closing shared HTTP pool for {entry.provider}: {type(e).__name__}: {e}')
+
+
+def retain_shared_http_clients(owner: object) -> None:
+	"""Register `owner` (e.g. a running agent) as a user of the shared pools of the running event loop."""
+	loop = _running_loop()
+	if loop is None:
+		return
+	with _lock:
+		_pool_users.setdefault(id(loop), set()).add(id(owner))
+
+
+async def release_shared_http_clients(owner: object) -> None:
+	"""Unregister `owner` and close the shared pools of the running event loop once no other user is left."""
+	loop = _running_loop()
+	if loop is None:
+		return
+	with _lock:
+		users = _pool_users.get(id(loop), set())
+		users.discard(id(owner))
+		if users:
+			return
+		_pool_users.pop(id(loop), None)
+	await aclose_shared_http_clients()
@@ -13,6 +13,7 @@ from pydantic import BaseModel
 
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
+from browser_use.llm.http_pool import get_shared_http_client
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.openai.serializer import OpenAIMessageSerializer
 from browser_use.llm.schema import SchemaOptimizer
@@ -100,9 +101,11 @@ class ChatOpenAI(BaseChatModel):
 		# Create client_params dict with non-None values
 		client_params = {k: v for k, v in base_params.items() if v is not None}
 
-		# Add http_client if provided
+		# Add http_client if provided, the shared connection pool otherwise
 		if self.http_client is not None:
 			client_params['http_client'] = self.http_client
+		else:
+			client_params['http_client'] = get_shared_http_client(self.provider, self.base_url, self.api_key)
 
 		return client_params
 
@@ -14,6 +14,7 @@ from pydantic import BaseModel
 
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
+from browser_use.llm.http_pool import get_shared_http_client
 from browser_use.llm.messages import BaseMessage, ContentPartTextParam, SystemMessage
 from browser_use.llm.schema import SchemaOptimizer
 from browser_use.llm.vercel.serializer import VercelMessageSerializer
@@ -243,6 +244,8 @@ class ChatVercel(BaseChatModel):
 
 		if self.http_client is not None:
 			client_params['http_client'] = self.http_client
+		else:
+			client_params['http_client'] = get_shared_http_client(self.provider, self.base_url, self.api_key)
 
 		return client_params
 
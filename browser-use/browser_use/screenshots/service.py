@@ -3,10 +3,12 @@ Screenshot storage service for browser-use agents.
 """
 
 import base64
+import hashlib
 from pathlib import Path
 
 import anyio
 
+from browser_use.browser.screenshots import get_screenshot_format
 from browser_use.observability import observe_debug
 
 
@@ -21,10 +23,22 @@ class ScreenshotService:
 		self.screenshots_dir = self.agent_directory / 'screenshots'
 		self.screenshots_dir.mkdir(parents=True, exist_ok=True)
 
+		# (digest, path) of the last stored screenshot, reused when the next screenshot has exactly the same bytes
+		self._last_stored: tuple[bytes, Path] | None = None
+
 	@observe_debug(ignore_input=True, ignore_output=True, name='store_screenshot')
 	async def store_screenshot(self, screenshot_b64: str, step_number: int) -> str:
-		"""Store screenshot to disk and return the full path as string"""
-		screenshot_filename = f'step_{step_number}.png'
+		"""Store screenshot to disk and return the full path as string
+
+		When the screenshot is identical to the previously stored one, its path is returned instead of writing a copy.
+		"""
+		digest = hashlib.sha1(screenshot_b64.encode()).digest()
+		if self._last_stored is not None:
+			last_digest, last_path = self._last_stored
+			if last_digest == digest and last_path.exists():
+				return str(last_path)
+
+		screenshot_filename = f'step_{step_number}.{get_screenshot_format(screenshot_b64)}'
 		screenshot_path = self.screenshots_dir / screenshot_filename
 
 		# Decode base64 and save to disk
@@ -33,6 +47,7 @@ class ScreenshotService:
 		async with await anyio.open_file(screenshot_path, 'wb') as f:
 			await f.write(screenshot_data)
 
+		self._last_stored = (digest, screenshot_path)
 		return str(screenshot_path)
 
 	@observe_debug(ignore_input=True, ignore_output=True, name='get_screenshot_from_disk')
@@ -16,6 +16,7 @@ import httpx
 from dotenv import load_dotenv
 
 from browser_use.llm.base import BaseChatModel
+from browser_use.llm.http_pool import get_http_pool_stats
 from browser_use.llm.views import ChatInvokeUsage
 from browser_use.tokens.custom_pricing import CUSTOM_MODEL_PRICING
 from browser_use.tokens.mappings import MODEL_TO_LITELLM
@@ -395,6 +396,7 @@ class TokenCost:
 				total_tokens=0,
 				total_cost=0.0,
 				entry_count=0,
+				http_pools=get_http_pool_stats(),
 			)
 
 		# Calculate totals
@@ -416,6 +418,7 @@ class TokenCost:
 
 			stats = model_stats[entry.model]
 			stats.prompt_tokens += entry.usage.prompt_tokens
+			stats.prompt_cached_tokens += entry.usage.prompt_cached_tokens or 0
 			stats.completion_tokens += entry.usage.completion_tokens
 			stats.total_tokens += entry.usage.prompt_tokens + entry.usage.completion_tokens
 			stats.invocations += 1
@@ -439,12 +442,14 @@ class TokenCost:
 			total_prompt_cost=total_prompt_cost,
 			total_prompt_cached_tokens=total_prompt_cached,
 			total_prompt_cached_cost=total_prompt_cached_cost,
+			prompt_cache_hit_ratio=total_prompt_cached / total_prompt if total_prompt else 0.0,
 			total_completion_tokens=total_completion,
 			total_completion_cost=total_completion_cost,
 			total_tokens=total_tokens,
 			total_cost=total_prompt_cost + total_completion_cost + total_prompt_cached_cost,
 			entry_count=len(filtered_usage),
 			by_model=model_stats,
+			http_pools=get_http_pool_stats(),
 		)
 
 	def _format_tokens(self, tokens: int) -> str:
@@ -495,6 +500,7 @@ class TokenCost:
 			cost_logger.debug(
 				f'💲 {C_BOLD}Total Usage Summary{C_RESET}: {C_BLUE}{total_tokens_fmt} tokens{C_RESET}{total_cost_part} | '
 				f'⬅️ {C_YELLOW}{prompt_tokens_fmt}{prompt_cost_part}{C_RESET} | ➡️ {C_GREEN}{completion_tokens_fmt}{completion_cost_part}{C_RESET}'
+				+ (f' | 🗄️ {summary.prompt_cache_hit_ratio:.0%} cached' if summary.total_prompt_cached_tokens else '')
 			)
 
 		for model, stats in summary.by_model.items():
@@ -503,6 +509,7 @@ class TokenCost:
 			model_prompt_fmt = self._format_tokens(stats.prompt_tokens)
 			model_completion_fmt = self._format_tokens(stats.completion_tokens)
 			avg_tokens_fmt = self._format_tokens(int(stats.average_tokens_per_invocation))
+			cache_part = f' | 🗄️ {stats.prompt_cached_tokens / stats.prompt_tokens:.0%} cached' if stats.prompt_cached_tokens else ''
 
 			# Format cost display (only if cost tracking is enabled)
 			if self.include_cost:
@@ -537,7 +544,14 @@ class TokenCost:
 			cost_logger.debug(
 				f'  🤖 {C_CYAN}{model}{C_RESET}: {C_BLUE}{model_total_fmt} tokens{C_RESET}{cost_part} | '
 				f'⬅️ {prompt_part} | ➡️ {completion_part} | '
-				f'📞 {stats.invocations} calls | 📈 {avg_tokens_fmt}/call'
+				f'📞 {stats.invocations} calls | 📈 {avg_tokens_fmt}/call{cache_part}'
+			)
+
+		for pool in summary.http_pools:
+			cost_logger.debug(
+				f'  🔌 {pool.provider} {pool.base_url or "(default)"}: {pool.requests} requests | '
+				f'{pool.open_connections} open / {pool.idle_connections} idle connections | '
+				f'peak {pool.max_active_requests}/{pool.max_connections} concurrent{" | http2" if pool.http2 else ""}'
 			)
 
 	async def get_cost_by_model(self) -> dict[str, ModelUsageStats]:
@@ -3,6 +3,7 @@ from typing import Any, TypeVar
 
 from pydantic import BaseModel, Field
 
+from browser_use.llm.http_pool import HTTPPoolStats
 from browser_use.llm.views import ChatInvokeUsage
 
 T = TypeVar('T', bound=BaseModel)
@@ -73,6 +74,7 @@ class ModelUsageStats(BaseModel):
 
 	model: str
 	prompt_tokens: int = 0
+	prompt_cached_tokens: int = 0
 	completion_tokens: int = 0
 	total_tokens: int = 0
 	cost: float = 0.0
@@ -98,6 +100,7 @@ class UsageSummary(BaseModel):
 
 	total_prompt_cached_tokens: int
 	total_prompt_cached_cost: float
+	prompt_cache_hit_ratio: float = 0.0  # share of prompt tokens read from the provider's prompt cache
 
 	total_completion_tokens: int
 	total_completion_cost: float
@@ -106,3 +109,4 @@ class UsageSummary(BaseModel):
 	entry_count: int
 
 	by_model: dict[str, ModelUsageStats] = Field(default_factory=dict)
+	http_pools: list[HTTPPoolStats] = Field(default_factory=list)
@@ -2,7 +2,7 @@ import asyncio
 import json
 import logging
 import os
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 try:
 	from lmnr import Laminar  # type: ignore
@@ -33,7 +33,13 @@ from browser_use.llm.base import BaseChatModel
 from browser_use.llm.messages import SystemMessage, UserMessage
 from browser_use.observability import observe_debug
 from browser_use.tools.registry.service import Registry
-from browser_use.tools.utils import get_click_description
+from browser_use.tools.utils import (
+	REMOTE_ARRAY_SUBTYPES,
+	call_on_remote_object,
+	get_click_description,
+	iter_remote_array_chunks,
+	release_remote_object,
+)
 from browser_use.tools.views import (
 	ClickElementAction,
 	ClickElementActionIndexOnly,
@@ -65,6 +71,9 @@ UploadFileEvent.model_rebuild()
 
 Context = TypeVar('Context')
 
+# Characters of an evaluate result shown to the model, longer results are truncated
+EVALUATE_RESULT_MAX_LENGTH = 20000
+
 T = TypeVar('T', bound=BaseModel)
 
 
@@ -1106,7 +1115,7 @@ You will be given a query and the markdown of a webpage that has been filtered t
 
 				# Always use awaitPromise=True - it's ignored for non-promises
 				result = await cdp_session.cdp_client.send.Runtime.evaluate(
-					params={'expression': validated_code, 'returnByValue': True, 'awaitPromise': True},
+					params={'expression': validated_code, 'returnByValue': False, 'awaitPromise': True},
 					session_id=cdp_session.session_id,
 				)
 
@@ -1135,6 +1144,14 @@ Validated Code (after quote fixing):
 					logger.debug(msg)
 					return ActionResult(error=msg)
 
+				# Objects are kept in the page and read by value from there
+				object_id = result_data.get('objectId')
+				if object_id:
+					try:
+						result_data = {'value': await self._read_evaluate_result(cdp_session, result_data)}
+					finally:
+						await release_remote_object(cdp_session, object_id)
+
 				# Get the actual value
 				value = result_data.get('value')
 
@@ -1171,8 +1188,8 @@ Validated Code (after quote fixing):
 					result_text = modified_text
 
 				# Apply length limit with better truncation (after image extraction)
-				if len(result_text) > 20000:
-					result_text = result_text[:19950] + '\n... [Truncated after 20000 characters]'
+				if len(result_text) > EVALUATE_RESULT_MAX_LENGTH:
+					result_text = result_text[: EVALUATE_RESULT_MAX_LENGTH - 50] + '\n... [Truncated after 20000 characters]'
 
 				# Don't log the code - it's already visible in the user's cell
 				logger.debug(f'JavaScript executed successfully, result length: {len(result_text)}')
@@ -1201,6 +1218,25 @@ Validated Code (after quote fixing):
 				logger.debug(f'JavaScript code that failed: {code[:200]}...')
 				return ActionResult(error=error_msg)
 
+	async def _read_evaluate_result(self, cdp_session, remote_object: dict[str, Any]) -> Any:
+		"""Read the value of an evaluate result that was kept in the page.
+
+		Arrays are paged out in chunks, and only until they are longer than the text shown to the model, so a huge
+		result does not have to cross the CDP socket as a single value (which fails for very large results).
+		"""
+		object_id = remote_object['objectId']
+		if remote_object.get('subtype') not in REMOTE_ARRAY_SUBTYPES:
+			return await call_on_remote_object(cdp_session, object_id, 'function() { return this; }')
+
+		items: list[Any] = []
+		text_length = 0
+		async for chunk in iter_remote_array_chunks(cdp_session, object_id):
+			items.extend(chunk)
+			text_length += len(json.dumps(chunk, ensure_ascii=False))
+			if text_length > EVALUATE_RESULT_MAX_LENGTH:
+				break
+		return items
+
 	def _validate_and_fix_javascript(self, code: str) -> str:
 		"""Validate and fix common JavaScript issues before execution"""
 
@@ -1,7 +1,25 @@
 """Utility functions for browser tools."""
 
+import logging
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
+
 from browser_use.dom.service import EnhancedDOMTreeNode
 
+if TYPE_CHECKING:
+	from browser_use.browser.session import CDPSession
+
+logger = logging.getLogger(__name__)
+
+# Number of items fetched per CDP call when paging out a JavaScript array
+REMOTE_ARRAY_CHUNK_SIZE = 1000
+
+# RemoteObject subtypes that can be paged out with iter_remote_array_chunks()
+REMOTE_ARRAY_SUBTYPES = ('array', 'typedarray')
+
+_ARRAY_LENGTH_JS = 'function() { return this.length; }'
+_ARRAY_SLICE_JS = 'function(start, end) { return Array.prototype.slice.call(this, start, end); }'
+
 
 def get_click_description(node: EnhancedDOMTreeNode) -> str:
 	"""Get a brief description of the clicked element for memory."""
@@ -80,3 +98,53 @@ def get_click_description(node: EnhancedDOMTreeNode) -> str:
 			parts.append(f'{attr}={node.attributes[attr][:20]}')
 
 	return ' '.join(parts)
+
+
+def format_js_exception(exception_details: dict[str, Any]) -> str:
+	"""Build an error message from the `exceptionDetails` of a failed Runtime call."""
+	error_msg = f'JavaScript execution error: {exception_details.get("text", "Unknown error")}'
+	exception = exception_details.get('exception', {})
+	if 'description' in exception:
+		error_msg += f'\nDetails: {exception["description"]}'
+	elif 'value' in exception:
+		error_msg += f'\nDetails: {exception["value"]}'
+	return error_msg
+
+
+async def call_on_remote_object(cdp_session: 'CDPSession', object_id: str, function_declaration: str, *args: Any) -> Any:
+	"""Call a function with `this` bound to a remote object and return its result by value."""
+	result = await cdp_session.cdp_client.send.Runtime.callFunctionOn(
+		params={
+			'functionDeclaration': function_declaration,
+			'objectId': object_id,
+			'arguments': [{'value': arg} for arg in args],
+			'returnByValue': True,
+		},
+		session_id=cdp_session.session_id,
+	)
+	if result.get('exceptionDetails'):
+		raise RuntimeError(format_js_exception(result['exceptionDetails']))
+	return result.get('result', {}).get('value')
+
+
+async def iter_remote_array_chunks(
+	cdp_session: 'CDPSession', object_id: str, chunk_size: int = REMOTE_ARRAY_CHUNK_SIZE
+) -> AsyncIterator[list[Any]]:
+	"""Page a JavaScript array that stays in the page out in slices of `chunk_size` items, each returned by value.
+
+	Only one slice crosses the CDP socket at a time, so arrays too large for a single `returnByValue` result can be read.
+	The length is read once: items added to the array afterwards are not returned.
+	"""
+	if chunk_size < 1:
+		raise ValueError(f'chunk_size must be at least 1, got {chunk_size}')
+	length = await call_on_remote_object(cdp_session, object_id, _ARRAY_LENGTH_JS)
+	for start in range(0, length or 0, chunk_size):
+		yield await call_on_remote_object(cdp_session, object_id, _ARRAY_SLICE_JS, start, min(start + chunk_size, length))
+
+
+async def release_remote_object(cdp_session: 'CDPSession', object_id: str) -> None:
+	"""Let the page garbage collect a remote object (best effort, e.g. the page may have navigated away)."""
+	try:
+		await cdp_session.cdp_client.send.Runtime.releaseObject(params={'objectId': object_id}, session_id=cdp_session.session_id)
+	except Exception as e:
+		logger.debug(f'Failed to release remote object {object_id}: {type(e).__name__}: {e}')
@@ -525,6 +525,31 @@ class TestDOMSerializer:
 		print('   ✓ Truly nested structure works: Open Shadow → Closed Shadow → Iframe')
 
 
+	async def test_fused_and_legacy_pipelines_produce_identical_output(self, browser_session, base_url):
+		"""The fused serializer pipeline must match the legacy one on real pages (shadow DOM, iframes, stacked layers)."""
+		from browser_use.dom.serializer.serializer import DOMTreeSerializer
+		from browser_use.dom.service import DomService
+		from browser_use.dom.views import SerializedDOMState
+
+		dom_service = DomService(browser_session)
+		for path in ('/dom-test-main', '/stacked-test'):
+			await browser_session.navigate_to(f'{base_url}{path}')
+			target_id = browser_session.agent_focus_target_id
+
+			previous_state: SerializedDOMState | None = None
+			for _ in range(2):
+				outputs = {}
+				for pipeline in ('legacy', 'fused'):
+					# Serialization annotates the enhanced tree, so every pipeline gets a freshly built one
+					enhanced_tree, _ = await dom_service.get_dom_tree(target_id)
+					state, _ = DOMTreeSerializer(enhanced_tree, previous_state, pipeline=pipeline).serialize_accessible_elements()
+					outputs[pipeline] = (state.llm_representation(), list(state.selector_map))
+				assert outputs['fused'] == outputs['legacy'], path
+				assert outputs['fused'][1], f'no interactive elements on {path}'
+				# Second round: half of the elements were "seen before", the rest must be marked as new
+				selector_map = dict(list(state.selector_map.items())[::2])
+				previous_state = SerializedDOMState(_root=None, selector_map=selector_map)
+
 if __name__ == '__main__':
 	"""Run test in debug mode with manual fixture setup."""
 	import asyncio
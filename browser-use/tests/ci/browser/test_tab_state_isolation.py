@@ -0,0 +1,91 @@
+"""
+Test that the concurrent multi-tab state capture keeps the state of real tabs apart.
+
+Usage:
+	uv run pytest tests/ci/browser/test_tab_state_isolation.py -v -s
+"""
+
+import asyncio
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.browser.events import NavigateToUrlEvent
+
+PAGES = {
+	'/shop-a': '<button id="a-add">Add to cart</button><button id="a-checkout">Checkout</button>',
+	'/shop-b': '<input id="b-search" placeholder="Search"><a id="b-next" href="#next">Next page</a>',
+}
+BACKGROUNDS = {'/shop-a': '#d03030', '/shop-b': '#3050d0'}
+
+
+@pytest.fixture(scope='function')
+async def browser_session():
+	session = BrowserSession(browser_profile=BrowserProfile(headless=True, user_data_dir=None, keep_alive=True))
+	await session.start()
+	yield session
+	await session.kill()
+
+
+def _serve_pages(httpserver: HTTPServer) -> dict[str, str]:
+	urls = {}
+	for path, body in PAGES.items():
+		httpserver.expect_request(path).respond_with_data(
+			f'<html><head><title>{path}</title></head><body style="background: {BACKGROUNDS[path]}">{body}</body></html>',
+			content_type='text/html',
+		)
+		urls[path] = httpserver.url_for(path)
+	return urls
+
+
+async def _wait_for_target_url(browser_session: BrowserSession, target_id: str, url: str) -> None:
+	for _ in range(50):
+		target = browser_session.session_manager.get_target(target_id)
+		if target and target.url == url:
+			return
+		await asyncio.sleep(0.1)
+	raise AssertionError(f'Tab {target_id} did not load {url}')
+
+
+async def test_tab_states_do_not_leak_into_each_other(browser_session: BrowserSession, httpserver: HTTPServer):
+	urls = _serve_pages(httpserver)
+	await browser_session.event_bus.dispatch(NavigateToUrlEvent(url=urls['/shop-a'], new_tab=False))
+	target_a = browser_session.agent_focus_target_id
+	assert target_a is not None
+	target_b = await browser_session._cdp_create_new_page(urls['/shop-b'], background=True)
+	await _wait_for_target_url(browser_session, target_b, urls['/shop-b'])
+
+	dom_watchdog = browser_session._dom_watchdog
+	assert dom_watchdog is not None
+	agent_selector_map = dom_watchdog.selector_map
+	cached_state = browser_session._cached_browser_state_summary
+
+	summaries = await dom_watchdog.get_browser_state_summaries([target_a, target_b])
+
+	ids = {
+		target_id: {node.attributes.get('id') for node in summary.dom_state.selector_map.values()}
+		for target_id, summary in summaries.items()
+	}
+	assert ids == {target_a: {'a-add', 'a-checkout'}, target_b: {'b-search', 'b-next'}}
+	assert summaries[target_a].url == urls['/shop-a'] and summaries[target_b].url == urls['/shop-b']
+
+	# Every tab is serialized by its own DOM service
+	dom_services = dom_watchdog._target_dom_services
+	assert dom_services[target_a] is not dom_services[target_b]
+	assert dom_services[target_a] is not dom_watchdog._dom_service
+
+	# The background tab is captured without being focused, with its own content
+	assert summaries[target_a].screenshot and summaries[target_b].screenshot
+	assert summaries[target_a].screenshot != summaries[target_b].screenshot
+	assert browser_session.agent_focus_target_id == target_a
+
+	# The agent's own DOM state is not touched
+	assert dom_watchdog.selector_map is agent_selector_map
+	assert browser_session._cached_browser_state_summary is cached_state
+
+	# A second capture reuses the services and still keeps the tabs apart
+	services_before = dict(dom_services)
+	summaries = await dom_watchdog.get_browser_state_summaries([target_b, target_a])
+	assert all(dom_services[target_id] is service for target_id, service in services_before.items())
+	assert {node.attributes.get('id') for node in summaries[target_b].dom_state.selector_map.values()} == ids[target_b]
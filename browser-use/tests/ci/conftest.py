@@ -20,6 +20,7 @@ socketserver.ThreadingMixIn.block_on_close = False
 socketserver.ThreadingMixIn.daemon_threads = True
 
 from browser_use.agent.views import AgentOutput
+from browser_use.dom.views import EnhancedAXNode, EnhancedDOMTreeNode, NodeType
 from browser_use.llm import BaseChatModel
 from browser_use.llm.views import ChatInvokeCompletion
 from browser_use.tools.service import Tools
@@ -154,6 +155,49 @@ def create_mock_llm(actions: list[str] | None = None) -> BaseChatModel:
 	return llm
 
 
+# not a fixture, a helper for the tests that build enhanced DOM trees by hand (no browser needed)
+def create_dom_node(
+	node_id: int,
+	node_name: str = 'DIV',
+	parent: EnhancedDOMTreeNode | None = None,
+	node_type: NodeType = NodeType.ELEMENT_NODE,
+	node_value: str = '',
+	attributes: dict[str, str] | None = None,
+	ax_node: EnhancedAXNode | None = None,
+) -> EnhancedDOMTreeNode:
+	"""Create a visible node of target-1 (backend node id `node_id + 1000`) and append it to `parent`.
+
+	Document fragments are attached as shadow roots of `parent`, other nodes as its children.
+	"""
+	node = EnhancedDOMTreeNode(
+		node_id=node_id,
+		backend_node_id=node_id + 1000,
+		node_type=node_type,
+		node_name=node_name,
+		node_value=node_value,
+		attributes=attributes if attributes is not None else {},
+		is_scrollable=None,
+		is_visible=True,
+		absolute_position=None,
+		target_id='target-1',
+		frame_id=None,
+		session_id='session-1',
+		content_document=None,
+		shadow_root_type=None,
+		shadow_roots=None,
+		parent_node=parent,
+		children_nodes=None,
+		ax_node=ax_node,
+		snapshot_node=None,
+	)
+	if parent is not None:
+		if node_type == NodeType.DOCUMENT_FRAGMENT_NODE:
+			parent.shadow_roots = (parent.shadow_roots or []) + [node]
+		else:
+			parent.children_nodes = (parent.children_nodes or []) + [node]
+	return node
+
+
 @pytest.fixture(scope='module')
 async def browser_session():
 	"""Create a real browser session for testing"""
@@ -0,0 +1,131 @@
+"""Tests for the pluggable JSON decoding of incoming CDP messages (`BrowserProfile.cdp_json_decoder`)."""
+
+import asyncio
+import gc
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+from cdp_use import CDPClient
+from websockets.exceptions import ConnectionClosed
+
+from browser_use.browser.cdp_decoding import GC_PAUSE_MIN_FRAME_SIZE, DecodingCDPClient, decode_cdp_message, get_cdp_json_loads
+
+
+def test_decoders_agree_with_the_standard_library():
+	frame = json.dumps({'id': 7, 'result': {'strings': ['ä', ' ', '𝄞'], 'nodes': [1, 2.5, None, True]}}).encode()
+
+	assert get_cdp_json_loads('json') == (json.loads, False)
+	loads, accepts_bytes = get_cdp_json_loads('auto')
+	assert decode_cdp_message(frame if accepts_bytes else frame.decode(), loads) == json.loads(frame)
+
+	with pytest.raises(ValueError):
+		get_cdp_json_loads('simdjson')  # type: ignore[arg-type]
+
+
+def test_large_frames_are_decoded_with_the_garbage_collector_paused():
+	gc_states = []
+
+	def loads(raw):
+		gc_states.append(gc.isenabled())
+		return json.loads(raw)
+
+	assert gc.isenabled()
+	decode_cdp_message(b'{"id": 1}', loads)
+	decode_cdp_message(json.dumps({'id': 2, 'result': 'x' * GC_PAUSE_MIN_FRAME_SIZE}).encode(), loads)
+	with pytest.raises(json.JSONDecodeError):
+		decode_cdp_message(b'{' * GC_PAUSE_MIN_FRAME_SIZE, loads)
+
+	assert gc_states == [True, False, False]
+	assert gc.isenabled()
+
+
+def test_concurrent_decodes_only_enable_the_garbage_collector_once_all_are_done():
+	frame = json.dumps({'id': 1, 'result': 'x' * GC_PAUSE_MIN_FRAME_SIZE}).encode()
+	started, release = threading.Event(), threading.Event()
+
+	def blocking_loads(raw):
+		started.set()
+		release.wait(timeout=5)
+		return json.loads(raw)
+
+	thread = threading.Thread(target=decode_cdp_message, args=(frame, blocking_loads))
+	thread.start()
+	try:
+		assert started.wait(timeout=5)
+		# The decode of this thread ends first, the one of the other thread is still running
+		decode_cdp_message(frame, json.loads)
+		assert not gc.isenabled()
+	finally:
+		release.set()
+		thread.join()
+	assert gc.isenabled()
+
+
+def test_a_garbage_collector_disabled_by_the_application_stays_disabled():
+	gc.disable()
+	try:
+		decode_cdp_message(json.dumps({'id': 1, 'result': 'x' * GC_PAUSE_MIN_FRAME_SIZE}).encode(), json.loads)
+		assert not gc.isenabled()
+	finally:
+		gc.enable()
+
+
+class _ScriptedWebSocket:
+	"""Replays text frames (as bytes when asked for undecoded frames), then reports the connection as closed."""
+
+	def __init__(self, frames: list[dict]):
+		self.frames = [json.dumps(frame) for frame in frames]
+
+	async def recv(self, decode: bool | None = None) -> str | bytes:
+		if not self.frames:
+			raise ConnectionClosed(None, None)
+		frame = self.frames.pop(0)
+		return frame.encode() if decode is False else frame
+
+
+async def _dispatch_outcome(client: CDPClient) -> dict:
+	"""Run the message loop of the client over a fixed conversation and record what it resolved and dispatched."""
+	loop = asyncio.get_running_loop()
+	futures = {request_id: loop.create_future() for request_id in (1, 2, 3)}
+	client.pending_requests = dict(futures)
+	events = []
+
+	async def handle_event(method, params, session_id):
+		events.append((method, params, session_id))
+		return True
+
+	client._event_registry = SimpleNamespace(handle_event=handle_event)  # type: ignore[assignment]
+	client.ws = _ScriptedWebSocket(  # type: ignore[assignment]
+		[
+			{'id': 1, 'result': {'frameTree': {'frame': {'id': 'main'}}}},
+			{'id': 2, 'error': {'code': -32000, 'message': 'No node with given id found'}},
+			{'id': 1, 'result': {}},  # duplicate
+			{'method': 'Page.frameNavigated', 'params': {'frame': {'id': 'main'}}, 'sessionId': 'session-1'},
+			{'method': 'Target.targetDestroyed'},
+			{'unexpected': True},
+		]
+	)
+	await client._handle_messages()
+
+	def outcome(future: asyncio.Future):
+		exception = future.exception()
+		return (type(exception).__name__, str(exception)) if exception else future.result()
+
+	return {
+		'futures': {request_id: outcome(future) for request_id, future in futures.items()},
+		'events': events,
+		'pending': dict(client.pending_requests),
+	}
+
+
+@pytest.mark.parametrize('json_decoder', ['json', 'auto'])
+async def test_message_loop_dispatches_like_the_pinned_cdp_use(json_decoder):
+	"""`DecodingCDPClient._handle_messages` mirrors the loop of cdp_use, this fails if the two drift apart."""
+	expected = await _dispatch_outcome(CDPClient('ws://unused'))
+
+	assert await _dispatch_outcome(DecodingCDPClient('ws://unused', json_decoder=json_decoder)) == expected
+	assert expected['futures'][1] == {'frameTree': {'frame': {'id': 'main'}}}
+	assert expected['futures'][3] == ('ConnectionError', 'WebSocket connection closed')
+	assert [method for method, _, _ in expected['events']] == ['Page.frameNavigated', 'Target.targetDestroyed']
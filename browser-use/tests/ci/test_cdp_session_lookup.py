@@ -0,0 +1,60 @@
+"""Tests for the cached fast path of BrowserSession.get_or_create_cdp_session (no browser needed)."""
+
+import asyncio
+
+from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.browser.session import CDPSession, Target
+from browser_use.browser.session_manager import SessionManager
+
+TARGET_ID = 'target-1'
+
+
+def _make_browser_session() -> BrowserSession:
+	browser_session = BrowserSession(browser_profile=BrowserProfile(headless=True))
+	browser_session._cdp_client_root = object()  # type: ignore[assignment]  # only checked for presence here
+	browser_session.session_manager = SessionManager(browser_session)
+	return browser_session
+
+
+def _attach(browser_session: BrowserSession, session_id: str, target_id: str = TARGET_ID) -> CDPSession:
+	"""Add a session to the pool the way SessionManager._handle_target_attached does."""
+	session_manager = browser_session.session_manager
+	cdp_session = CDPSession.model_construct(cdp_client=None, target_id=target_id, session_id=session_id)
+	session_manager._targets.setdefault(target_id, Target(target_id=target_id, target_type='iframe'))
+	session_manager._target_sessions.setdefault(target_id, set()).add(session_id)
+	session_manager._session_to_target[session_id] = target_id
+	session_manager._sessions[session_id] = cdp_session
+	return cdp_session
+
+
+async def test_repeated_lookups_take_the_fast_path_until_a_session_detaches():
+	browser_session = _make_browser_session()
+	first_session = _attach(browser_session, 'session-1')
+	stats = browser_session.cdp_session_lookup_stats
+
+	for _ in range(5):
+		assert await browser_session.get_or_create_cdp_session(TARGET_ID, focus=False) is first_session
+	assert (stats.slow_path_calls, stats.fast_path_hits) == (1, 4)
+
+	# Attaching another session keeps the cached one, detaching it invalidates the cache
+	second_session = _attach(browser_session, 'session-2')
+	assert await browser_session.get_or_create_cdp_session(TARGET_ID, focus=False) is first_session
+	await browser_session.session_manager._handle_target_detached({'sessionId': 'session-1', 'targetId': TARGET_ID})
+	assert await browser_session.get_or_create_cdp_session(TARGET_ID, focus=False) is second_session
+	assert (stats.slow_path_calls, stats.fast_path_hits) == (2, 5)
+
+
+async def test_waiting_for_a_target_to_attach_is_counted():
+	browser_session = _make_browser_session()
+
+	async def attach_later():
+		await asyncio.sleep(0.15)
+		_attach(browser_session, 'session-1')
+
+	attach_task = asyncio.create_task(attach_later())
+	cdp_session = await browser_session.get_or_create_cdp_session(TARGET_ID, focus=False)
+	await attach_task
+
+	assert cdp_session.session_id == 'session-1'
+	stats = browser_session.cdp_session_lookup_stats
+	assert (stats.attach_waits, stats.attach_wait_timeouts) == (1, 0)
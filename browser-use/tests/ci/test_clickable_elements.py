@@ -0,0 +1,52 @@
+"""Tests for the precompiled ClickableElementDetector rules and the cross-step ClickableElementCache."""
+
+from browser_use.dom.serializer.clickable_elements import ClickableElementCache, ClickableElementDetector
+from browser_use.dom.views import AXInteractivity, EnhancedAXNode, EnhancedAXProperty
+from tests.ci.conftest import create_dom_node
+
+
+def _ax_node(*properties: tuple[str, str | bool | None], role: str | None = None) -> EnhancedAXNode:
+	return EnhancedAXNode(
+		'ax-1', False, role, None, None, [EnhancedAXProperty(name=name, value=value) for name, value in properties], None  # type: ignore[arg-type]
+	)
+
+
+def test_search_indicators_match_as_substrings():
+	assert ClickableElementDetector.is_interactive(create_dom_node(1, attributes={'class': 'nav\tSiteSearchBox'}))
+	assert ClickableElementDetector.is_interactive(create_dom_node(2, attributes={'id': 'MagnifyingGlass'}))
+	assert ClickableElementDetector.is_interactive(create_dom_node(3, attributes={'data-role': 'quick-find'}))
+	assert not ClickableElementDetector.is_interactive(create_dom_node(4, attributes={'class': 'card', 'title': 'search'}))
+
+
+def test_first_decisive_ax_property_wins():
+	get_verdict = ClickableElementDetector.get_ax_properties_interactivity
+	assert get_verdict(None) is AXInteractivity.UNDECIDED
+	assert get_verdict([EnhancedAXProperty(name='disabled', value=False)]) is AXInteractivity.UNDECIDED  # type: ignore[arg-type]
+	assert get_verdict(_ax_node(('focusable', True), ('disabled', True)).properties) is AXInteractivity.INTERACTIVE
+	assert get_verdict(_ax_node(('hidden', True), ('focusable', True)).properties) is AXInteractivity.NOT_INTERACTIVE
+	assert get_verdict(_ax_node(('expanded', None)).properties) is AXInteractivity.INTERACTIVE
+
+	# A disabled AX node hides an interactive tag, the verdict is filled on first use
+	button = create_dom_node(1, 'BUTTON', ax_node=_ax_node(('disabled', True)))
+	assert not ClickableElementDetector.is_interactive(button)
+	assert button.ax_node is not None and button.ax_node.properties_interactivity is AXInteractivity.NOT_INTERACTIVE
+
+
+def test_cache_reuses_results_of_unchanged_nodes_across_trees():
+	cache = ClickableElementCache()
+	cache.start_tree()
+	assert cache.is_interactive(create_dom_node(10, 'A'))
+	assert not cache.is_interactive(create_dom_node(11, attributes={'class': 'card'}))
+	assert (cache.hits, cache.misses) == (0, 2)
+
+	# Next step: the DOM snapshot rebuilds the nodes, unchanged ones hit and changed ones are detected again
+	cache.start_tree()
+	assert cache.is_interactive(create_dom_node(10, 'A'))
+	assert cache.is_interactive(create_dom_node(11, attributes={'class': 'card', 'onclick': 'open()'}))
+	assert (cache.hits, cache.misses) == (1, 3)
+
+	# Node 10 was not part of the last tree, so its entry is gone
+	cache.start_tree()
+	cache.start_tree()
+	assert cache.is_interactive(create_dom_node(10, 'A'))
+	assert cache.misses == 4
@@ -0,0 +1,120 @@
+"""Tests for the execution backend of code-agent cells (no browser needed)."""
+
+import asyncio
+import threading
+
+import pytest
+
+from browser_use.code_use import executor as executor_module
+from browser_use.code_use.executor import CodeCellExecutor, compile_cell, parse_cell
+from browser_use.code_use.views import CellExecutionStats
+
+
+async def test_sync_cell_runs_in_worker_without_blocking_the_loop():
+	executor = CodeCellExecutor({})
+	ticks = 0
+
+	async def tick():
+		nonlocal ticks
+		while True:
+			await asyncio.sleep(0.01)
+			ticks += 1
+
+	ticker = asyncio.create_task(tick())
+	stats = CellExecutionStats()
+	code = 'import time, threading\nstart = time.time()\nwhile time.time() - start < 0.3:\n    pass\nthread = threading.current_thread().name'
+	await executor.run_sync(compile_cell(code), stats)
+	ticker.cancel()
+	executor.close()
+
+	assert executor.namespace['thread'].startswith('code-cell')
+	assert ticks >= 10  # the loop kept running while the cell was busy
+	assert stats.in_worker and stats.cpu_seconds > 0.2 and stats.wall_seconds >= 0.3
+
+
+async def test_async_helpers_are_proxied_to_the_loop_during_sync_cells():
+	loop_thread = threading.get_ident()
+	calls = []
+
+	async def navigate(url: str) -> str:
+		calls.append((url, threading.get_ident()))
+		return f'Navigated to {url}'
+
+	namespace = {'navigate': navigate}
+	executor = CodeCellExecutor(namespace)
+	await executor.run_sync(compile_cell("result = navigate('https://example.com')"), CellExecutionStats())
+	executor.close()
+
+	assert namespace['result'] == 'Navigated to https://example.com'
+	assert calls == [('https://example.com', loop_thread)]
+	assert namespace['navigate'] is navigate  # the helper is restored after the cell
+
+
+async def test_timeout_interrupts_the_cell_and_the_worker_stays_usable():
+	executor = CodeCellExecutor({}, timeout=0.2)
+	stats = CellExecutionStats()
+	worker = executor._worker
+	with pytest.raises(TimeoutError):
+		await executor.run_sync(compile_cell('while True:\n    pass'), stats)
+	assert stats.timed_out
+	# A late interrupt could still hit the old worker thread, it is never reused
+	assert executor._worker is not worker and executor._running_thread is None
+
+	await executor.run_sync(compile_cell('x = 1 + 1'), CellExecutionStats())
+	executor.close()
+	assert executor.namespace['x'] == 2
+
+
+async def test_no_cell_runs_while_an_uninterruptible_cell_is_still_running(monkeypatch):
+	monkeypatch.setattr(executor_module, 'WORKER_STOP_GRACE_PERIOD', 0.1)
+	executor = CodeCellExecutor({}, timeout=0.1)
+	# Blocked in a C call, the interrupt is only raised once the sleep returns
+	with pytest.raises(TimeoutError):
+		await executor.run_sync(compile_cell('import time\ntime.sleep(0.6)\nlate = True'), CellExecutionStats())
+
+	with pytest.raises(RuntimeError, match='still running'):
+		await executor.run_sync(compile_cell('x = 1'), CellExecutionStats())
+
+	async def cell():
+		return {}
+
+	coro = cell()
+	with pytest.raises(RuntimeError, match='still running'):
+		await executor.run_async(coro, CellExecutionStats())
+	assert coro.cr_frame is None  # closed, not left un-awaited
+
+	await asyncio.sleep(0.8)
+	await executor.run_sync(compile_cell('x = 1'), CellExecutionStats())
+	executor.close()
+	assert executor.namespace['x'] == 1 and 'late' not in executor.namespace
+
+
+async def test_output_of_the_cell_is_captured_without_other_tasks_output(capsys):
+	executor = CodeCellExecutor({})
+
+	async def other_task():
+		await asyncio.sleep(0.05)
+		print('from another task')
+
+	other = asyncio.create_task(other_task())
+	buffer, token = executor.capture_output()
+	try:
+		await executor.run_sync(compile_cell("import time\nprint('from the cell')\ntime.sleep(0.1)"), CellExecutionStats())
+	finally:
+		executor.stop_capturing_output(token)
+	await other
+	executor.close()
+
+	assert buffer.getvalue() == 'from the cell\n'
+	assert 'from another task' in capsys.readouterr().out
+
+
+def test_parse_and_compile_are_cached():
+	code = 'total = 0\nfor i in range(3):\n    total += await asyncio.sleep(0, result=i)'
+	parsed = parse_cell(code)
+	assert parsed.has_await and parsed.assigned_names == {'total'}
+	assert parse_cell(code) is parsed
+
+	hits = compile_cell.cache_info().hits
+	assert compile_cell('y = 2') is compile_cell('y = 2')
+	assert compile_cell.cache_info().hits == hits + 1
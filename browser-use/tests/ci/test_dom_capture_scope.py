@@ -0,0 +1,146 @@
+"""Tests for the viewport-scoped DOM capture of DomService (`BrowserProfile.dom_capture_scope`)."""
+
+import logging
+from types import SimpleNamespace
+
+from browser_use.dom.service import DomService
+from browser_use.dom.views import DOMRect, TargetAllTrees
+
+logger = logging.getLogger('test')
+
+
+class _FakeAccessibility:
+	"""Accessibility.getPartialAXTree that records the requested nodes."""
+
+	def __init__(self):
+		self.requested: list[int] = []
+
+	async def getPartialAXTree(self, params: dict, session_id: str) -> dict:
+		backend_node_id = params['backendNodeId']
+		self.requested.append(backend_node_id)
+		if backend_node_id == 13:
+			raise RuntimeError('No node with given id found')
+		return {'nodes': [{'nodeId': f'ax-{backend_node_id}', 'ignored': False, 'backendDOMNodeId': backend_node_id}]}
+
+
+class _OfflineBrowserSession:
+	logger = logger
+
+	async def get_or_create_cdp_session(self, target_id: str | None = None, focus: bool = True) -> SimpleNamespace:
+		return SimpleNamespace(session_id='session-1', target_id=target_id)
+
+
+def _document(layout_nodes: list[tuple[int, list[float]]], content_documents: dict[int, int] | None = None, **kwargs) -> dict:
+	"""Snapshot document of (backend node id, bounds) layout nodes, with iframe node index -> content document index."""
+	content_documents = content_documents or {}
+	return {
+		'nodes': {
+			'backendNodeId': [backend_node_id for backend_node_id, _ in layout_nodes],
+			'contentDocumentIndex': {'index': list(content_documents), 'value': list(content_documents.values())},
+		},
+		'layout': {'nodeIndex': list(range(len(layout_nodes))), 'bounds': [bounds for _, bounds in layout_nodes]},
+		**kwargs,
+	}
+
+
+async def test_only_nodes_in_capture_range_are_fetched():
+	dom_service = DomService(_OfflineBrowserSession(), logger=logger, capture_scope='viewport', viewport_margin=500)  # type: ignore[arg-type]
+	accessibility = _FakeAccessibility()
+	cdp_session = SimpleNamespace(session_id='session-1', cdp_client=SimpleNamespace(send=SimpleNamespace(Accessibility=accessibility)))
+	snapshot = {
+		'strings': [],
+		'documents': [
+			_document(
+				[
+					(1, [0, 0, 1280, 8000]),  # html
+					(2, [10, 3100, 80, 30]),  # button in the viewport
+					(3, [10, 2000, 80, 30]),  # button 1000px above the viewport
+					(4, [0, 3300, 300, 200]),  # iframe in the viewport
+					(5, [0, 6000, 300, 200]),  # iframe far below
+				],
+				{3: 1, 4: 2},
+			),
+			_document(
+				[(10, [0, 0, 300, 2000]), (11, [0, 100, 50, 20]), (12, [0, 1500, 50, 20]), (13, [0, 1000, 50, 20])],
+				{2: 3},
+				scrollOffsetY=1000,
+			),
+			_document([(20, [0, 0, 300, 200]), (21, [0, 50, 300, 100])], {1: 4}),
+			_document([(30, [0, 0, 300, 100])]),
+			_document([(40, [0, 0, 300, 100])]),
+		],
+	}
+
+	ax_tree = await dom_service._get_ax_tree_in_capture_range(
+		cdp_session, snapshot, DOMRect(x=0, y=3000, width=1280, height=720)  # type: ignore[arg-type]
+	)
+
+	# The first frame is scrolled by 1000px: node 11 ends 580px above the viewport, the frame owned by node 12 is at y=800.
+	# The frame of the far iframe and the one nested in it are not requested, node 13 was detached since the snapshot.
+	assert sorted(accessibility.requested) == [1, 2, 4, 10, 12, 13, 30]
+	assert sorted(ax_node['backendDOMNodeId'] for ax_node in ax_tree['nodes']) == [1, 2, 4, 10, 12, 30]
+
+
+def _recorded_trees(capture_viewport: DOMRect | None) -> TargetAllTrees:
+	"""document > html > body > (button at y=100, button at y=5000), both with AX nodes, scrolled to the viewport."""
+	scroll_x, scroll_y = (capture_viewport.x, capture_viewport.y) if capture_viewport else (0, 0)
+
+	def node(node_id: int, node_name: str, node_type: int = 1, **kwargs) -> dict:
+		return {'nodeId': node_id, 'backendNodeId': node_id, 'nodeType': node_type, 'nodeName': node_name, 'nodeValue': '', **kwargs}
+
+	buttons = [node(4, 'BUTTON', parentId=3), node(5, 'BUTTON', parentId=3)]
+	body = node(3, 'BODY', parentId=2, children=buttons)
+	html = node(2, 'HTML', parentId=1, children=[body], frameId='main')
+	document = node(1, '#document', 9, children=[html])
+	layout_nodes = [(1, [0, 0, 1280, 6000]), (2, [0, 0, 1280, 6000]), (3, [0, 0, 1280, 6000]), (4, [10, 100, 80, 30]), (5, [10, 5000, 80, 30])]
+	snapshot = {
+		'strings': ['block', 'visible', '1'],
+		'documents': [
+			{
+				'nodes': {'backendNodeId': [1, 2, 3, 4, 5]},
+				'layout': {
+					'nodeIndex': [backend_node_id - 1 for backend_node_id, _ in layout_nodes],
+					'bounds': [bounds for _, bounds in layout_nodes],
+					'styles': [[0, 1, 2] for _ in layout_nodes],
+					'clientRects': [[0, 0, 1280, 720] if backend_node_id == 2 else [] for backend_node_id, _ in layout_nodes],
+					'scrollRects': [
+						[scroll_x, scroll_y, 1280, 6000] if backend_node_id == 2 else [] for backend_node_id, _ in layout_nodes
+					],
+				},
+			}
+		],
+	}
+	ax_nodes = [
+		{'nodeId': f'ax-{backend_node_id}', 'ignored': False, 'role': {'value': 'button'}, 'backendDOMNodeId': backend_node_id}
+		for backend_node_id in (4, 5)
+	]
+	return TargetAllTrees(
+		snapshot=snapshot,  # type: ignore[arg-type]
+		dom_tree={'root': document},  # type: ignore[typeddict-item]
+		ax_tree={'nodes': ax_nodes},  # type: ignore[typeddict-item]
+		device_pixel_ratio=1.0,
+		cdp_timing={},
+		capture_viewport=capture_viewport,
+	)
+
+
+async def test_elements_outside_capture_range_get_no_accessibility_data():
+	for capture_viewport, expected_ax_roles in [
+		(None, ['button', 'button']),
+		(DOMRect(x=0, y=0, width=1280, height=720), ['button', None]),
+		# Scrolled: the range follows the viewport, the first button is 4400px above it
+		(DOMRect(x=0, y=4500, width=1280, height=720), [None, 'button']),
+		# Scrolled a little: the first button is 600px above the viewport, within the margin
+		(DOMRect(x=0, y=700, width=1280, height=720), ['button', None]),
+	]:
+		dom_service = DomService(_OfflineBrowserSession(), logger=logger, capture_scope='viewport', viewport_margin=1000)  # type: ignore[arg-type]
+
+		async def get_recorded_trees(target_id: str, capture_viewport=capture_viewport) -> TargetAllTrees:
+			return _recorded_trees(capture_viewport)
+
+		dom_service._get_all_trees = get_recorded_trees  # type: ignore[method-assign]
+		root, _ = await dom_service.get_dom_tree('target-1')
+
+		body = root.children_nodes[0].children_nodes[0]  # type: ignore[index]
+		buttons = body.children_nodes or []
+		assert [button.ax_node.role if button.ax_node else None for button in buttons] == expected_ax_roles
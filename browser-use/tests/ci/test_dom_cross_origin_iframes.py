@@ -0,0 +1,142 @@
+"""Tests for the concurrent cross-origin iframe collection of DomService.get_dom_tree."""
+
+import asyncio
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from browser_use.dom.service import DomService
+from browser_use.dom.views import TargetAllTrees
+
+logger = logging.getLogger('test')
+
+
+def _node(node_id: int, node_name: str, node_type: int = 1, **kwargs) -> dict:
+	return {'nodeId': node_id, 'backendNodeId': node_id, 'nodeType': node_type, 'nodeName': node_name, 'nodeValue': '', **kwargs}
+
+
+def _trees(elements: list[dict], bounds: dict[int, list[float]]) -> TargetAllTrees:
+	"""document > html > body > elements, laid out in a 1280x720 viewport."""
+	body = _node(3, 'BODY', parentId=2, children=elements)
+	document = _node(1, '#document', 9, children=[_node(2, 'HTML', parentId=1, children=[body])])
+	layout = {1: [0, 0, 1280, 720], 2: [0, 0, 1280, 720], 3: [0, 0, 1280, 720], **bounds}
+	backend_node_ids = list(layout)
+	snapshot = {
+		'strings': ['block', 'visible', '1'],
+		'documents': [
+			{
+				'nodes': {'backendNodeId': backend_node_ids},
+				'layout': {
+					'nodeIndex': list(range(len(backend_node_ids))),
+					'bounds': list(layout.values()),
+					'styles': [[0, 1, 2] for _ in backend_node_ids],
+					'clientRects': [[0, 0, 1280, 720] if node_id == 2 else [] for node_id in backend_node_ids],
+					'scrollRects': [[0, 0, 1280, 720] if node_id == 2 else [] for node_id in backend_node_ids],
+				},
+			}
+		],
+	}
+	return TargetAllTrees(
+		snapshot=snapshot,  # type: ignore[arg-type]
+		dom_tree={'root': document},  # type: ignore[typeddict-item]
+		ax_tree={'nodes': []},
+		device_pixel_ratio=1.0,
+		cdp_timing={},
+	)
+
+
+class _FakeBrowserSession:
+	"""Main page with cross-origin iframes 'frame-<n>' served by 'target-<n>', optionally each with iframes 'frame-<n>-<m>'."""
+
+	logger = logger
+
+	def __init__(self, iframe_count: int, nested: bool = False):
+		self.iframe_count = iframe_count
+		self.nested = nested
+		self.session_manager = SimpleNamespace(get_target=lambda target_id: SimpleNamespace(target_id=target_id))
+
+	async def get_or_create_cdp_session(self, target_id: str | None = None, focus: bool = True) -> SimpleNamespace:
+		return SimpleNamespace(session_id=f'session-{target_id}', target_id=target_id)
+
+	async def get_all_frames(self) -> tuple[dict, dict]:
+		frames = {f'frame-{i}': {'frameTargetId': f'target-{i}'} for i in range(self.iframe_count)}
+		if self.nested:
+			for i in range(self.iframe_count):
+				frames.update({f'frame-{i}-{j}': {'frameTargetId': f'target-{i}-{j}'} for j in range(2)})
+		return frames, {}
+
+
+def _make_dom_service(iframe_count: int, max_concurrent_iframes: int, failing_target: str | None = None, nested: bool = False):
+	dom_service = DomService(
+		_FakeBrowserSession(iframe_count, nested),  # type: ignore[arg-type]
+		logger=logger,
+		cross_origin_iframes=True,
+		max_concurrent_iframes=max_concurrent_iframes,
+	)
+	stats = {'running': 0, 'max_running': 0}
+
+	async def get_trees(target_id: str) -> TargetAllTrees:
+		if target_id == 'main':
+			iframes = [_node(10 + i, 'IFRAME', parentId=3, frameId=f'frame-{i}') for i in range(iframe_count)]
+			return _trees(iframes, {10 + i: [0, 100 * i, 300, 80] for i in range(iframe_count)})
+
+		stats['running'] += 1
+		stats['max_running'] = max(stats['max_running'], stats['running'])
+		await asyncio.sleep(0.01)
+		stats['running'] -= 1
+		if target_id == failing_target:
+			raise TimeoutError(f'CDP requests failed or timed out: snapshot ({target_id})')
+		elements = [_node(4, 'BUTTON', parentId=3, attributes=['id', target_id])]
+		if nested and target_id.count('-') == 1:
+			frame_prefix = target_id.replace('target', 'frame')
+			elements += [_node(5 + j, 'IFRAME', parentId=3, frameId=f'{frame_prefix}-{j}') for j in range(2)]
+		return _trees(elements, {4: [0, 0, 80, 30], 5: [0, 100, 300, 80], 6: [0, 200, 300, 80]})
+
+	dom_service._get_all_trees = get_trees  # type: ignore[method-assign]
+	return dom_service, stats
+
+
+async def test_iframes_are_fetched_concurrently_and_stitched_in_order():
+	dom_service, stats = _make_dom_service(iframe_count=5, max_concurrent_iframes=2)
+
+	root, timing_info = await dom_service.get_dom_tree('main')
+
+	assert stats['max_running'] == 2
+	iframes = root.children_nodes[0].children_nodes[0].children_nodes  # type: ignore[index]
+	for i, iframe in enumerate(iframes or []):
+		content_document = iframe.content_document
+		assert content_document is not None and content_document.parent_node is iframe
+		button = content_document.children_nodes[0].children_nodes[0].children_nodes[0]  # type: ignore[index]
+		assert button.attributes == {'id': f'target-{i}'}
+		assert f'cross_origin_iframe[frame-{i}]_ms' in timing_info
+	assert dom_service._last_cross_origin_documents == 5
+
+
+async def test_failing_iframe_fails_the_tree_after_other_fetches_finish():
+	dom_service, stats = _make_dom_service(iframe_count=3, max_concurrent_iframes=3, failing_target='target-0')
+
+	with pytest.raises(TimeoutError):
+		await dom_service.get_dom_tree('main')
+	assert stats['running'] == 0
+
+
+@pytest.mark.parametrize('max_concurrent_iframes', [1, 2])
+async def test_nested_iframes_share_the_concurrency_limit(max_concurrent_iframes):
+	dom_service, stats = _make_dom_service(iframe_count=4, max_concurrent_iframes=max_concurrent_iframes, nested=True)
+
+	root, _ = await asyncio.wait_for(dom_service.get_dom_tree('main'), timeout=5)
+
+	# One limit for all levels (a parent releases its slot before its own iframes are fetched)
+	assert stats['max_running'] == max_concurrent_iframes
+	assert dom_service._last_cross_origin_documents == 12
+
+	def body_children(document):
+		return document.children_nodes[0].children_nodes[0].children_nodes
+
+	for i, iframe in enumerate(body_children(root)):
+		button, *nested_iframes = body_children(iframe.content_document)
+		assert button.attributes == {'id': f'target-{i}'}
+		assert [body_children(nested.content_document)[0].attributes for nested in nested_iframes] == [
+			{'id': f'target-{i}-{j}'} for j in range(2)
+		]
@@ -0,0 +1,180 @@
+"""Tests for patching the cached enhanced DOM tree from CDP DOM mutation events (incremental DOM mode)."""
+
+import logging
+from types import SimpleNamespace
+
+from browser_use.dom.incremental import MAX_INCREMENTAL_DIRTY_NODES, DomMutationTracker
+from browser_use.dom.serializer.serializer import DOMTreeSerializer
+from browser_use.dom.service import DomService
+from browser_use.dom.views import EnhancedDOMTreeNode, NodeType, SimplifiedNode
+from tests.ci.conftest import create_dom_node
+
+TARGET_ID = 'target-1'
+SESSION_ID = 'session-1'
+
+
+def _make_tracker(max_dirty_ratio: float = 1.0) -> tuple[DomMutationTracker, dict[int, EnhancedDOMTreeNode]]:
+	"""document > html > body > (div#menu > span text, button)"""
+	document = create_dom_node(1, '#document', node_type=NodeType.DOCUMENT_NODE)
+	html = create_dom_node(2, 'HTML', document)
+	body = create_dom_node(3, 'BODY', html)
+	menu = create_dom_node(4, 'DIV', body, attributes={'id': 'menu'})
+	create_dom_node(5, '#text', menu, node_type=NodeType.TEXT_NODE, node_value='Menu')
+	create_dom_node(6, 'BUTTON', body)
+	lookup = {node.node_id: node for node in (document, html, body, menu, *menu.children_nodes, body.children_nodes[1])}
+
+	tracker = DomMutationTracker(logging.getLogger('test'), max_dirty_ratio=max_dirty_ratio)
+	tracker.attach(TARGET_ID, SESSION_ID, document, lookup, page_metrics=(0, 0, 1280, 720, 1280, 720))
+	return tracker, lookup
+
+
+def _cdp_node(node_id: int, node_name: str, node_type: int = 1, **kwargs) -> dict:
+	return {
+		'nodeId': node_id,
+		'backendNodeId': node_id + 1000,
+		'nodeType': node_type,
+		'nodeName': node_name,
+		'localName': node_name.lower(),
+		'nodeValue': kwargs.pop('nodeValue', ''),
+		**kwargs,
+	}
+
+
+def test_insert_after_previous_sibling_marks_subtree_dirty():
+	tracker, lookup = _make_tracker()
+	inserted = _cdp_node(
+		10, 'UL', attributes=['class', 'dropdown'], childNodeCount=1, children=[_cdp_node(11, 'LI', childNodeCount=0)]
+	)
+
+	tracker.handle_event('childNodeInserted', {'parentNodeId': 3, 'previousNodeId': 4, 'node': inserted})
+
+	body = lookup[3]
+	assert [child.node_id for child in body.children_nodes or []] == [4, 10, 6]
+	new_node = lookup[10]
+	assert new_node.parent_node is body
+	assert new_node.attributes == {'class': 'dropdown'}
+	assert [child.node_id for child in new_node.children_nodes or []] == [11]
+	# The siblings and the content after the inserted node may have moved, the ancestors may have grown
+	assert tracker.dirty_node_ids == {2, 3, 4, 5, 6, 10, 11}
+	assert tracker.get_rebuild_reason(TARGET_ID) is None
+
+
+def test_insert_without_children_requests_child_nodes():
+	tracker, lookup = _make_tracker()
+
+	tracker.handle_event(
+		'childNodeInserted', {'parentNodeId': 3, 'previousNodeId': 0, 'node': _cdp_node(10, 'UL', childNodeCount=3)}
+	)
+	assert tracker.pending_child_requests == {10}
+	assert lookup[3].children_nodes is not None and lookup[3].children_nodes[0].node_id == 10
+
+	tracker.handle_event('setChildNodes', {'parentId': 10, 'nodes': [_cdp_node(11, 'LI'), _cdp_node(12, 'LI')]})
+	assert tracker.pending_child_requests == set()
+	assert [child.node_id for child in lookup[10].children_nodes or []] == [11, 12]
+
+
+def test_remove_drops_subtree_from_tree_and_lookup():
+	tracker, lookup = _make_tracker()
+	tracker.handle_event('attributeModified', {'nodeId': 4, 'name': 'class', 'value': 'open'})
+	assert tracker.dirty_node_ids == {2, 3, 4, 5, 6}
+
+	tracker.handle_event('childNodeRemoved', {'parentNodeId': 3, 'nodeId': 4})
+
+	assert [child.node_id for child in lookup[3].children_nodes or []] == [6]
+	assert 4 not in lookup and 5 not in lookup
+	assert tracker.dirty_node_ids == {2, 3, 6}
+
+
+def test_attribute_and_text_changes_are_patched_in_place():
+	tracker, lookup = _make_tracker()
+
+	tracker.handle_event('attributeModified', {'nodeId': 6, 'name': 'aria-expanded', 'value': 'true'})
+	tracker.handle_event('attributeRemoved', {'nodeId': 4, 'name': 'id'})
+	tracker.handle_event('characterDataModified', {'nodeId': 5, 'characterData': 'Menu (3)'})
+
+	assert lookup[6].attributes == {'aria-expanded': 'true'}
+	assert lookup[4].attributes == {}
+	assert lookup[5].node_value == 'Menu (3)'
+	assert {node.node_id for node in tracker.pop_dirty_nodes()} == {2, 3, 4, 5, 6}
+	assert tracker.dirty_node_ids == set()
+
+
+def test_text_change_dirties_following_content_and_neutral_attributes_only_the_element():
+	tracker, _ = _make_tracker()
+	tracker.handle_event('attributeModified', {'nodeId': 4, 'name': 'title', 'value': 'Open the menu'})
+	assert tracker.dirty_node_ids == {4}
+
+	# The text of the menu can push the button after it down
+	tracker.handle_event('characterDataModified', {'nodeId': 5, 'characterData': 'A much longer menu label'})
+	assert tracker.dirty_node_ids == {2, 3, 4, 5, 6}
+
+
+def test_unpatchable_events_force_full_rebuild():
+	for event_name, event in [
+		('documentUpdated', {}),
+		('detached', {}),
+		('attributeModified', {'nodeId': 999, 'name': 'class', 'value': 'x'}),
+		('childNodeInserted', {'parentNodeId': 3, 'previousNodeId': 0, 'node': _cdp_node(10, 'IFRAME')}),
+	]:
+		tracker, _ = _make_tracker()
+		tracker.handle_event(event_name, event)
+		assert tracker.get_rebuild_reason(TARGET_ID) is not None, event_name
+
+	tracker, _ = _make_tracker()
+	assert tracker.get_rebuild_reason('other-target') == 'different target'
+
+
+def test_dirty_ratio_and_cap_force_full_rebuild():
+	tracker, _ = _make_tracker(max_dirty_ratio=0.3)
+	tracker.handle_event('attributeModified', {'nodeId': 6, 'name': 'title', 'value': 'x'})
+	assert tracker.get_rebuild_reason(TARGET_ID) is None
+
+	# html subtree is everything except the document node
+	tracker.handle_event('attributeModified', {'nodeId': 2, 'name': 'class', 'value': 'dark'})
+	reason = tracker.get_rebuild_reason(TARGET_ID)
+	assert reason is not None and reason.startswith('dirty ratio')
+
+	tracker, _ = _make_tracker()
+	tracker.dirty_node_ids.update(range(100, 101 + MAX_INCREMENTAL_DIRTY_NODES))
+	assert tracker.get_rebuild_reason(TARGET_ID) is not None
+
+
+async def test_dirty_node_refresh_uses_the_configured_viewport_margin():
+	tracker, lookup = _make_tracker()
+	calls: list[dict] = []
+
+	async def resolve_node(params, session_id=None):
+		return {'object': {'objectId': 'object-1'}}
+
+	async def call_function_on(params, session_id=None):
+		calls.append(params)
+		return {'result': {'value': None}}
+
+	async def get_partial_ax_tree(params, session_id=None):
+		return {'nodes': []}
+
+	cdp_session = SimpleNamespace(
+		session_id=SESSION_ID,
+		cdp_client=SimpleNamespace(
+			send=SimpleNamespace(
+				DOM=SimpleNamespace(resolveNode=resolve_node),
+				Runtime=SimpleNamespace(callFunctionOn=call_function_on),
+				Accessibility=SimpleNamespace(getPartialAXTree=get_partial_ax_tree),
+			)
+		),
+	)
+	dom_service = DomService(SimpleNamespace(logger=tracker.logger), viewport_margin=250)  # type: ignore[arg-type]
+
+	await dom_service._refresh_dirty_node(cdp_session, lookup[6])
+
+	assert calls[0]['arguments'][1] == {'value': 250}
+	assert lookup[6].is_visible is False  # detached
+
+
+def test_compound_children_are_not_duplicated_when_a_cached_tree_is_serialized_again():
+	slider = create_dom_node(20, 'INPUT', attributes={'type': 'range', 'min': '0', 'max': '10'})
+	serializer = DOMTreeSerializer(slider)
+
+	for _ in range(3):
+		serializer._add_compound_components(SimplifiedNode(original_node=slider, children=[]), slider)
+	assert len(slider._compound_children) == 1
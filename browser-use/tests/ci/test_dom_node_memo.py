@@ -0,0 +1,127 @@
+"""Tests for the memoized branch path, xpath and hashes of EnhancedDOMTreeNode."""
+
+import hashlib
+import logging
+import random
+
+from browser_use.dom.incremental import DomMutationTracker
+from browser_use.dom.views import STATIC_ATTRIBUTES, EnhancedAXNode, EnhancedDOMTreeNode, NodeType
+from tests.ci.conftest import create_dom_node
+
+
+def _make_random_tree(seed: int, count: int = 300) -> list[EnhancedDOMTreeNode]:
+	"""Random document with repeated sibling tags, text nodes, shadow roots and an iframe."""
+	rng = random.Random(seed)
+	document = create_dom_node(1, '#document', node_type=NodeType.DOCUMENT_NODE)
+	nodes = [document, create_dom_node(2, 'HTML', document)]
+	for node_id in range(3, count):
+		parent = rng.choice([node for node in nodes[1:] if node.node_type != NodeType.TEXT_NODE])
+		kind = rng.random()
+		if kind < 0.1:
+			node = create_dom_node(node_id, '#text', parent, node_type=NodeType.TEXT_NODE)
+		elif kind < 0.13 and not parent.shadow_roots:
+			node = create_dom_node(node_id, '#document-fragment', parent, node_type=NodeType.DOCUMENT_FRAGMENT_NODE)
+		else:
+			name = rng.choice(['DIV', 'SPAN', 'LI', 'A', 'IFRAME'])
+			node = create_dom_node(node_id, name, parent, attributes={'class': rng.choice(['card', 'card hover', 'x'])})
+		nodes.append(node)
+	return nodes
+
+
+def _reference_xpath(node: EnhancedDOMTreeNode) -> str:
+	"""The uncached implementation the memoized xpath must match."""
+
+	def position(element: EnhancedDOMTreeNode) -> int:
+		if not element.parent_node or not element.parent_node.children_nodes:
+			return 0
+		same_tag = [
+			child
+			for child in element.parent_node.children_nodes
+			if child.node_type == NodeType.ELEMENT_NODE and child.node_name.lower() == element.node_name.lower()
+		]
+		if len(same_tag) <= 1:
+			return 0
+		return [id(child) for child in same_tag].index(id(element)) + 1
+
+	segments = []
+	current = node
+	while current and current.node_type in (NodeType.ELEMENT_NODE, NodeType.DOCUMENT_FRAGMENT_NODE):
+		if current.node_type == NodeType.DOCUMENT_FRAGMENT_NODE:
+			current = current.parent_node
+			continue
+		if current.parent_node and current.parent_node.node_name.lower() == 'iframe':
+			break
+		index = position(current)
+		segments.insert(0, f'{current.node_name.lower()}{f"[{index}]" if index > 0 else ""}')
+		current = current.parent_node
+	return '/'.join(segments)
+
+
+def _reference_hash(node: EnhancedDOMTreeNode) -> int:
+	path = []
+	current = node
+	while current is not None:
+		if current.node_type == NodeType.ELEMENT_NODE:
+			path.insert(0, current.tag_name)
+		current = current.parent_node
+	static_attributes = sorted((k, v) for k, v in node.attributes.items() if k in STATIC_ATTRIBUTES)
+	attributes_string = ''.join(f'{k}={v}' for k, v in static_attributes)
+	ax_name = f'|ax_name={node.ax_node.name}' if node.ax_node and node.ax_node.name else ''
+	return int(hashlib.sha256(f'{"/".join(path)}|{attributes_string}{ax_name}'.encode()).hexdigest()[:16], 16)
+
+
+def test_memoized_values_match_uncached_computation():
+	for seed in range(3):
+		nodes = _make_random_tree(seed)
+		# Visit in random order so that memos get filled from arbitrary starting points
+		for node in random.Random(seed).sample(nodes, len(nodes)):
+			assert node.xpath == _reference_xpath(node)
+			assert node.__hash__() == _reference_hash(node)
+			assert node.parent_branch_hash() == int(
+				hashlib.sha256('/'.join(node._get_parent_branch_path()).encode()).hexdigest()[:16], 16
+			)
+		assert all(node._memo is not None and node._memo.xpath is not None for node in nodes)
+
+
+def test_memo_is_not_part_of_equality_or_repr():
+	first, second = create_dom_node(1, 'DIV'), create_dom_node(1, 'DIV')
+	second.uuid = first.uuid
+	hash(first)
+	assert first._memo is not None and second._memo is None
+	assert first == second
+	assert '_memo' not in repr(first)
+
+
+def test_tracker_invalidates_memos_on_mutations():
+	document = create_dom_node(1, '#document', node_type=NodeType.DOCUMENT_NODE)
+	body = create_dom_node(2, 'BODY', document)
+	first = create_dom_node(3, 'DIV', body, attributes={'id': 'a'})
+	link = create_dom_node(4, 'A', first)
+	second = create_dom_node(5, 'DIV', body)
+	lookup = {node.node_id: node for node in (document, body, first, link, second)}
+	tracker = DomMutationTracker(logging.getLogger('test'), max_dirty_ratio=1.0)
+	tracker.attach('target-1', 'session-1', document, lookup, page_metrics=None)
+
+	assert (link.xpath, second.xpath) == ('body/div[1]/a', 'body/div[2]')
+	old_hash = first.__hash__()
+
+	tracker.handle_event('attributeModified', {'nodeId': 3, 'name': 'id', 'value': 'b'})
+	assert first.__hash__() != old_hash and first.__hash__() == _reference_hash(first)
+
+	first.ax_node = EnhancedAXNode('ax-1', False, 'button', 'Open', None, None, None)
+	first.invalidate_memo()
+	assert first.__hash__() == _reference_hash(first)
+
+	tracker.handle_event(
+		'childNodeInserted',
+		{
+			'parentNodeId': 2,
+			'previousNodeId': 0,
+			'node': {'nodeId': 6, 'backendNodeId': 1006, 'nodeType': 1, 'nodeName': 'DIV', 'nodeValue': ''},
+		},
+	)
+	assert (link.xpath, second.xpath, lookup[6].xpath) == ('body/div[2]/a', 'body/div[3]', 'body/div[1]')
+
+	tracker.handle_event('childNodeRemoved', {'parentNodeId': 2, 'nodeId': 6})
+	tracker.handle_event('childNodeRemoved', {'parentNodeId': 2, 'nodeId': 5})
+	assert link.xpath == 'body/div/a'
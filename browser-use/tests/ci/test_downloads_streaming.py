@@ -0,0 +1,154 @@
+"""Tests for the chunked CDP download path of DownloadsWatchdog (no browser needed)."""
+
+import asyncio
+import base64
+from types import SimpleNamespace
+
+import pytest
+
+from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.browser.watchdogs import downloads_watchdog
+from browser_use.browser.watchdogs.downloads_watchdog import DownloadsWatchdog
+
+
+class FakeIOClient:
+	"""Answers the Page/Network/IO commands used by _stream_url_to_file with a canned body."""
+
+	def __init__(self, body: bytes, chunk_size: int, success: bool = True, status: int = 200):
+		self.body = body
+		self.chunk_size = chunk_size
+		self.offset = 0
+		self.closed_handles: list[str] = []
+		self.resource = {
+			'success': success,
+			'httpStatusCode': status,
+			'stream': 'stream-1',
+			'headers': {'Content-Type': 'application/pdf', 'Date': 'Mon, 01 Jan 2024 00:00:00 GMT'},
+		}
+		self.send = SimpleNamespace(
+			Page=SimpleNamespace(getFrameTree=self.get_frame_tree),
+			Network=SimpleNamespace(loadNetworkResource=self.load_network_resource),
+			IO=SimpleNamespace(read=self.read, close=self.close),
+		)
+
+	async def get_frame_tree(self, session_id=None):
+		return {'frameTree': {'frame': {'id': 'frame-1'}}}
+
+	async def load_network_resource(self, params, session_id=None):
+		assert params['options']['includeCredentials']
+		return {'resource': self.resource}
+
+	async def read(self, params, session_id=None):
+		chunk = self.body[self.offset : self.offset + self.chunk_size]
+		self.offset += len(chunk)
+		return {'data': base64.b64encode(chunk).decode(), 'base64Encoded': True, 'eof': self.offset >= len(self.body)}
+
+	async def close(self, params, session_id=None):
+		self.closed_handles.append(params['handle'])
+
+
+def _make_watchdog(tmp_path) -> DownloadsWatchdog:
+	browser_session = BrowserSession(browser_profile=BrowserProfile(headless=True, downloads_path=tmp_path))
+	return DownloadsWatchdog(event_bus=browser_session.event_bus, browser_session=browser_session)
+
+
+async def test_stream_writes_all_chunks_and_closes_the_stream(tmp_path, monkeypatch):
+	monkeypatch.setattr(downloads_watchdog, 'DOWNLOAD_CHUNK_SIZE', 1000)
+	watchdog = _make_watchdog(tmp_path)
+	body = bytes(range(256)) * 20
+	cdp_client = FakeIOClient(body, chunk_size=1000)
+	path = tmp_path / 'report.pdf'
+
+	file_size, content_type, from_cache = await watchdog._stream_url_to_file(
+		SimpleNamespace(cdp_client=cdp_client, session_id='session-1'),  # type: ignore[arg-type]
+		'https://example.com/report.pdf',
+		path,
+	)
+
+	assert (file_size, content_type, from_cache) == (len(body), 'application/pdf', False)
+	assert path.read_bytes() == body
+	assert cdp_client.closed_handles == ['stream-1']
+
+
+async def test_stream_raises_on_http_errors(tmp_path):
+	watchdog = _make_watchdog(tmp_path)
+	cdp_client = FakeIOClient(b'not found', chunk_size=1000, status=404)
+
+	with pytest.raises(RuntimeError, match='status: 404'):
+		await watchdog._stream_url_to_file(
+			SimpleNamespace(cdp_client=cdp_client, session_id='session-1'),  # type: ignore[arg-type]
+			'https://example.com/missing.pdf',
+			tmp_path / 'missing.pdf',
+		)
+	assert cdp_client.closed_handles == ['stream-1']
+
+
+async def test_concurrent_downloads_claim_distinct_file_names(tmp_path):
+	(tmp_path / 'report.pdf').write_bytes(b'previous run')
+
+	paths = await asyncio.gather(
+		*(asyncio.to_thread(DownloadsWatchdog._create_unique_file, tmp_path, 'report.pdf') for _ in range(8))
+	)
+
+	assert len({path.name for path in paths}) == 8
+	assert 'report.pdf' not in {path.name for path in paths}
+	assert (tmp_path / 'report.pdf').read_bytes() == b'previous run'
+
+
+def _fake_streaming(monkeypatch, duration: float) -> dict[str, int]:
+	"""Replace the CDP download by a `duration` long write, and count the started and concurrently running downloads."""
+	counts = {'started': 0, 'running': 0, 'max_running': 0}
+
+	async def get_or_create_cdp_session(self, target_id=None, focus=True):
+		return SimpleNamespace(cdp_client=None, session_id='session-1')
+
+	async def stream_url_to_file(self, cdp_session, url, path):
+		counts['started'] += 1
+		counts['running'] += 1
+		counts['max_running'] = max(counts['max_running'], counts['running'])
+		try:
+			await asyncio.sleep(duration)
+			path.write_bytes(b'%PDF-1.4')
+			return 8, 'application/pdf', False
+		finally:
+			counts['running'] -= 1
+
+	monkeypatch.setattr(BrowserSession, 'get_or_create_cdp_session', get_or_create_cdp_session)
+	monkeypatch.setattr(DownloadsWatchdog, '_stream_url_to_file', stream_url_to_file)
+	return counts
+
+
+async def test_callers_of_the_same_url_share_one_download(tmp_path, monkeypatch):
+	counts = _fake_streaming(monkeypatch, duration=0.2)
+	watchdog = _make_watchdog(tmp_path)
+	url = 'https://example.com/report.pdf'
+
+	first = asyncio.create_task(watchdog.download_file_from_url(url, 'target-1'))
+	await asyncio.sleep(0.05)
+	joiners = [asyncio.create_task(watchdog.download_file_from_url(url, 'target-1')) for _ in range(2)]
+	await asyncio.sleep(0.05)
+	# A joiner giving up must not cancel the download the others wait for
+	joiners[0].cancel()
+
+	path = await first
+	assert path == str(tmp_path / 'report.pdf')
+	assert await joiners[1] == path
+	assert joiners[0].cancelled()
+	assert counts['started'] == 1
+	assert watchdog._in_flight_downloads == {}
+	await watchdog.event_bus.stop(clear=True, timeout=5)
+
+
+async def test_downloads_of_different_urls_are_limited_by_the_semaphore(tmp_path, monkeypatch):
+	monkeypatch.setattr(downloads_watchdog, 'MAX_CONCURRENT_DOWNLOADS', 2)
+	counts = _fake_streaming(monkeypatch, duration=0.1)
+	watchdog = _make_watchdog(tmp_path)
+
+	paths = await asyncio.gather(
+		*(watchdog.download_file_from_url(f'https://example.com/report-{i}.pdf', 'target-1') for i in range(5))
+	)
+
+	assert sorted(paths) == sorted(str(tmp_path / f'report-{i}.pdf') for i in range(5))  # type: ignore[type-var]
+	assert counts['started'] == 5
+	assert counts['max_running'] == 2
+	await watchdog.event_bus.stop(clear=True, timeout=5)
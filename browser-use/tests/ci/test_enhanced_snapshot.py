@@ -0,0 +1,70 @@
+"""Tests for the columnar DOMSnapshot lookup in browser_use.dom.enhanced_snapshot."""
+
+from browser_use.dom.enhanced_snapshot import REQUIRED_COMPUTED_STYLES, build_snapshot_lookup
+from browser_use.dom.views import DOMRect
+
+
+def _make_snapshot(node_count: int) -> dict:
+	"""One document where every even node has a layout box and every third node is clickable."""
+	strings = ['https://example.com', 'block', 'pointer', 'visible']
+	layout_nodes = [i for i in range(node_count) if i % 2 == 0]
+	style_indices = [1, 3, -1, -1, -1, -1, 2, -1, -1, -1]
+	assert len(style_indices) == len(REQUIRED_COMPUTED_STYLES)
+	return {
+		'strings': strings,
+		'documents': [
+			{
+				'documentURL': 0,
+				'nodes': {
+					'backendNodeId': [100 + i for i in range(node_count)],
+					'isClickable': {'index': [i for i in range(node_count) if i % 3 == 0]},
+				},
+				'layout': {
+					# Duplicate entry for node 0 at the end: the first occurrence must win
+					'nodeIndex': layout_nodes + [0],
+					'bounds': [[i * 2.0, i * 4.0, 20.0, 10.0] for i in layout_nodes] + [[999.0, 999.0, 1.0, 1.0]],
+					'styles': [style_indices for _ in layout_nodes] + [style_indices],
+					'paintOrders': [i for i in layout_nodes] + [0],
+					'clientRects': [[0, 0, 20, 10] for _ in layout_nodes] + [[]],
+					'scrollRects': [[0, 5, 20, 100] for _ in layout_nodes] + [[]],
+				},
+			}
+		],
+	}
+
+
+def test_snapshot_lookup_materializes_nodes_lazily_and_caches_them():
+	lookup = build_snapshot_lookup(_make_snapshot(10), device_pixel_ratio=2.0)  # type: ignore[arg-type]
+
+	assert len(lookup) == 10
+	assert 104 in lookup and 999 not in lookup
+	assert lookup.get(999) is None
+	assert lookup._materialized == {}
+
+	node = lookup[104]
+	assert node.is_clickable is False
+	assert node.bounds == DOMRect(x=4.0, y=8.0, width=10.0, height=5.0)
+	assert node.computed_styles == {'display': 'block', 'visibility': 'visible', 'cursor': 'pointer'}
+	assert node.cursor_style == 'pointer'
+	assert node.paint_order == 4
+	assert node.clientRects == DOMRect(x=0, y=0, width=20, height=10)
+	assert node.scrollRects == DOMRect(x=0, y=5, width=20, height=100)
+	# Callers mutate bounds in place, so the same object must come back
+	assert lookup.get(104) is node
+	assert list(lookup._materialized) == [104]
+
+
+def test_snapshot_lookup_matches_rare_data_and_first_layout_occurrence():
+	lookup = build_snapshot_lookup(_make_snapshot(10))  # type: ignore[arg-type]
+
+	assert lookup[100].bounds == DOMRect(x=0.0, y=0.0, width=20.0, height=10.0)
+	assert lookup[103].is_clickable is True
+	assert lookup[103].bounds is None and lookup[103].computed_styles is None
+	assert [backend_node_id for backend_node_id in lookup if lookup[backend_node_id].is_clickable] == [100, 103, 106, 109]
+	assert lookup.count_with_bounds() == 5
+
+
+def test_snapshot_lookup_handles_empty_snapshot():
+	lookup = build_snapshot_lookup({'strings': [], 'documents': []})  # type: ignore[arg-type]
+	assert len(lookup) == 0
+	assert lookup.get(1) is None
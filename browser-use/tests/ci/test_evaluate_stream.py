@@ -0,0 +1,116 @@
+"""Tests for reading large JavaScript results in chunks (fake CDP client, no browser needed)."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from browser_use.code_use.namespace import EvaluateError, create_namespace, evaluate_stream, evaluate_to_file
+from browser_use.filesystem.file_system import FileSystem
+from browser_use.tools.service import Tools
+
+
+class FakeRuntime:
+	"""Runtime domain of a page whose evaluated expressions all return `value`."""
+
+	def __init__(self, value):
+		self.value = value
+		self.transfers: list[int] = []  # number of array items returned by each call
+		self.released: list[str] = []
+
+	async def evaluate(self, params, session_id=None):
+		if isinstance(self.value, list):
+			return {'result': {'type': 'object', 'subtype': 'array', 'objectId': 'array-1'}}
+		if isinstance(self.value, dict):
+			return {'result': {'type': 'object', 'objectId': 'object-1'}}
+		return {'result': {'type': type(self.value).__name__, 'value': self.value}}
+
+	async def callFunctionOn(self, params, session_id=None):
+		declaration = params['functionDeclaration']
+		args = [arg['value'] for arg in params.get('arguments', [])]
+		if 'this.length' in declaration:
+			return {'result': {'type': 'number', 'value': len(self.value)}}
+		if 'slice' in declaration:
+			chunk = self.value[args[0] : args[1]]
+			self.transfers.append(len(chunk))
+			return {'result': {'type': 'object', 'value': chunk}}
+		return {'result': {'type': 'object', 'value': self.value}}
+
+	async def releaseObject(self, params, session_id=None):
+		self.released.append(params['objectId'])
+
+
+def _make_browser_session(value) -> tuple[SimpleNamespace, FakeRuntime]:
+	runtime = FakeRuntime(value)
+	cdp_session = SimpleNamespace(cdp_client=SimpleNamespace(send=SimpleNamespace(Runtime=runtime)), session_id='session-1')
+
+	async def get_or_create_cdp_session():
+		return cdp_session
+
+	return SimpleNamespace(get_or_create_cdp_session=get_or_create_cdp_session), runtime
+
+
+ROWS = [{'id': i, 'name': f'row {i}'} for i in range(2500)]
+
+
+async def test_stream_pages_the_array_out_in_chunks():
+	browser_session, runtime = _make_browser_session(ROWS)
+
+	stream = evaluate_stream('(function(){ return rows })()', browser_session, chunk_size=1000)  # type: ignore[arg-type]
+	rows = [row async for row in stream]
+
+	assert rows == ROWS
+	assert runtime.transfers == [1000, 1000, 500]
+	assert runtime.released == ['array-1']
+
+
+async def test_stream_releases_the_array_when_stopped_early():
+	browser_session, runtime = _make_browser_session(ROWS)
+
+	stream = evaluate_stream('(function(){ return rows })()', browser_session, chunk_size=100)  # type: ignore[arg-type]
+	async for row in stream:
+		if row['id'] == 150:
+			break
+	await stream.aclose()
+
+	assert runtime.transfers == [100, 100]
+	assert runtime.released == ['array-1']
+
+
+async def test_stream_rejects_results_that_are_not_arrays():
+	browser_session, runtime = _make_browser_session({'rows': ROWS})
+
+	with pytest.raises(EvaluateError, match='expects the JavaScript code to return an array'):
+		async for _ in evaluate_stream('(function(){ return {rows} })()', browser_session):  # type: ignore[arg-type]
+			pass
+	assert runtime.released == ['object-1']
+
+
+async def test_evaluate_to_file_writes_jsonl_and_csv(tmp_path):
+	browser_session, runtime = _make_browser_session(ROWS)
+	file_system = FileSystem(tmp_path, create_default_files=False)
+
+	count = await evaluate_to_file('(function(){ return rows })()', browser_session, file_system, 'rows.jsonl', 1000)  # type: ignore[arg-type]
+	assert count == 2500
+	lines = (file_system.get_dir() / 'rows.jsonl').read_text().splitlines()
+	assert [json.loads(line) for line in lines] == ROWS
+
+	namespace = create_namespace(browser_session, file_system=file_system)  # type: ignore[arg-type]
+	assert await namespace['evaluate_to_file']('return rows', 'rows.csv', chunk_size=1000) == 2500
+	lines = (file_system.get_dir() / 'rows.csv').read_text().splitlines()
+	assert lines[0] == 'id,name' and lines[1] == '0,row 0' and len(lines) == 2501
+
+	with pytest.raises(ValueError, match='.jsonl or .csv'):
+		await evaluate_to_file('return rows', browser_session, file_system, 'rows.md')  # type: ignore[arg-type]
+
+
+async def test_evaluate_tool_stops_reading_once_the_result_is_truncated():
+	rows = [{'id': i, 'text': 'x' * 100} for i in range(50_000)]
+	browser_session, runtime = _make_browser_session(rows)
+	cdp_session = await browser_session.get_or_create_cdp_session()
+
+	value = await Tools()._read_evaluate_result(cdp_session, {'type': 'object', 'subtype': 'array', 'objectId': 'array-1'})
+
+	# The first chunk alone is longer than the text shown to the model
+	assert value == rows[:1000]
+	assert runtime.transfers == [1000]
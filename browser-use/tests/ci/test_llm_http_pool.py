@@ -0,0 +1,64 @@
+"""Tests for the shared LLM connection pools (browser_use.llm.http_pool)."""
+
+import httpx
+
+from browser_use import Agent
+from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.llm.http_pool import (
+	aclose_shared_http_clients,
+	get_http_pool_stats,
+	get_shared_http_client,
+	retain_shared_http_clients,
+)
+from tests.ci.conftest import create_mock_llm
+
+
+async def test_clients_are_shared_per_provider_base_url_and_credentials():
+	client = get_shared_http_client('openai', 'https://api.example.com/v1', 'key-1')
+
+	assert get_shared_http_client('openai', httpx.URL('https://api.example.com/v1'), 'key-1') is client
+	assert get_shared_http_client('openai', 'https://api.example.com/v1', 'key-2') is not client
+	assert get_shared_http_client('anthropic', 'https://api.example.com/v1', 'key-1') is not client
+
+	await aclose_shared_http_clients()
+	assert client.is_closed
+	assert get_http_pool_stats() == []
+	new_client = get_shared_http_client('openai', 'https://api.example.com/v1', 'key-1')
+	assert new_client is not client and not new_client.is_closed
+	await aclose_shared_http_clients()
+
+
+async def test_pool_stats_count_requests(monkeypatch):
+	async def respond(self, request: httpx.Request) -> httpx.Response:
+		return httpx.Response(200, json={'ok': True}, request=request)
+
+	monkeypatch.setattr(httpx.AsyncHTTPTransport, 'handle_async_request', respond)
+	client = get_shared_http_client('groq', 'https://api.example.com/openai/v1', 'key-1')
+	for _ in range(3):
+		response = await client.post('https://api.example.com/openai/v1/chat/completions', json={})
+		assert response.json() == {'ok': True}
+
+	[stats] = get_http_pool_stats()
+	assert (stats.provider, stats.base_url) == ('groq', 'https://api.example.com/openai/v1')
+	assert (stats.requests, stats.active_requests, stats.max_active_requests) == (3, 0, 1)
+	assert 'key-1' not in stats.model_dump_json()
+	await aclose_shared_http_clients()
+
+
+async def test_agent_close_releases_the_pools_once_no_agent_uses_them():
+	def make_agent() -> Agent:
+		browser_session = BrowserSession(browser_profile=BrowserProfile(keep_alive=True))
+		return Agent(task='Test task', llm=create_mock_llm(actions=None), browser_session=browser_session)
+
+	first_agent, second_agent = make_agent(), make_agent()
+	retain_shared_http_clients(first_agent)
+	retain_shared_http_clients(second_agent)
+	client = get_shared_http_client('openai', 'https://api.example.com/v1', 'key-1')
+
+	# The second agent is still running on this event loop and keeps using the pool
+	await first_agent.close()
+	assert not client.is_closed and len(get_http_pool_stats()) == 1
+
+	await second_agent.close()
+	assert client.is_closed
+	assert get_http_pool_stats() == []
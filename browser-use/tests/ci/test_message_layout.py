@@ -0,0 +1,120 @@
+"""Tests for the prompt_cache message layout of MessageManager and the prompt cache hit ratio of TokenCost."""
+
+from browser_use.agent.message_manager.service import MessageManager
+from browser_use.agent.views import ActionResult, AgentOutput, AgentStepInfo, MessageManagerState
+from browser_use.browser.views import BrowserStateSummary
+from browser_use.dom.views import SerializedDOMState
+from browser_use.filesystem.file_system import FileSystem
+from browser_use.llm import SystemMessage
+from browser_use.llm.messages import ContentPartTextParam
+from browser_use.llm.views import ChatInvokeUsage
+from browser_use.tokens.service import TokenCost
+
+
+def _make_message_manager(tmp_path, message_layout, max_history_items=None) -> MessageManager:
+	return MessageManager(
+		task='Find the cheapest flight',
+		system_message=SystemMessage(content='You are a browser automation agent', cache=True),
+		file_system=FileSystem(tmp_path),
+		state=MessageManagerState(),
+		sensitive_data={'password': 'secret_pass123'},
+		max_history_items=max_history_items,
+		message_layout=message_layout,
+	)
+
+
+def _run_step(message_manager: MessageManager, step_number: int) -> None:
+	message_manager.create_state_messages(
+		browser_state_summary=BrowserStateSummary(
+			dom_state=SerializedDOMState(_root=None, selector_map={}),
+			url=f'https://example.com/page-{step_number}',
+			title=f'Page {step_number}',
+			tabs=[],
+		),
+		model_output=AgentOutput(
+			evaluation_previous_goal='Success',
+			memory=f'Visited page {step_number}',
+			next_goal='Open the next page',
+			action=[],
+		),
+		result=[ActionResult(long_term_memory=f"Typed 'secret_pass123' on page {step_number}")],
+		step_info=AgentStepInfo(step_number=step_number, max_steps=50),
+		use_vision=False,
+	)
+
+
+def _texts(content) -> list[str]:
+	return [part.text for part in content if isinstance(part, ContentPartTextParam)]
+
+
+def test_prompt_cache_layout_only_appends_to_the_history_prefix(tmp_path):
+	message_manager = _make_message_manager(tmp_path, 'prompt_cache')
+
+	previous_parts: list[str] = []
+	for step_number in range(1, 5):
+		_run_step(message_manager, step_number)
+		system_message, history_message, state_message = message_manager.get_messages()
+
+		parts = _texts(history_message.content)
+		assert parts[: len(previous_parts)] == previous_parts
+		# user request + 'Agent initialized' + step 1, then one entry per step
+		assert len(parts) == (len(previous_parts) + 1 if previous_parts else 3)
+		previous_parts = parts
+
+		assert history_message.cache and not state_message.cache
+		assert 'Find the cheapest flight' in parts[0]
+		assert isinstance(state_message.content, str)
+		assert '<agent_history>' not in state_message.content and '<user_request>' not in state_message.content
+		assert f'Step{step_number + 1} maximum:50' in state_message.content
+
+	assert 'secret_pass123' not in ''.join(previous_parts)
+	assert '<secret>password</secret>' in previous_parts[-1]
+
+
+def test_prompt_cache_layout_omits_history_in_chunks(tmp_path):
+	message_manager = _make_message_manager(tmp_path, 'prompt_cache', max_history_items=6)
+
+	prefix_changes = 0
+	previous_parts: list[str] = []
+	for step_number in range(1, 21):
+		_run_step(message_manager, step_number)
+		parts = _texts(message_manager.get_messages()[1].content)
+		assert len(parts) <= 1 + 6 + 1  # user request, kept history items, omission note
+		if parts[: len(previous_parts)] != previous_parts:
+			prefix_changes += 1
+		previous_parts = parts
+
+	# The omitted window moves 3 steps at a time instead of every step once the limit is reached
+	assert prefix_changes == 5
+	assert '\n<sys>[... 15 previous steps omitted...]</sys>' in previous_parts
+
+
+def test_single_layout_keeps_one_state_message(tmp_path):
+	message_manager = _make_message_manager(tmp_path, 'single')
+	_run_step(message_manager, 1)
+
+	system_message, state_message = message_manager.get_messages()
+	assert isinstance(state_message.content, str)
+	assert state_message.cache
+	assert '<agent_history>' in state_message.content and '<user_request>' in state_message.content
+
+
+async def test_usage_summary_reports_prompt_cache_hit_ratio():
+	token_cost = TokenCost()
+	for prompt_cached_tokens in (None, 3000, 3500):
+		token_cost.add_usage(
+			'claude-sonnet-4-0',
+			ChatInvokeUsage(
+				prompt_tokens=4000,
+				prompt_cached_tokens=prompt_cached_tokens,
+				prompt_cache_creation_tokens=None,
+				prompt_image_tokens=None,
+				completion_tokens=100,
+				total_tokens=4100,
+			),
+		)
+
+	summary = await token_cost.get_usage_summary()
+	assert summary.total_prompt_cached_tokens == 6500
+	assert summary.prompt_cache_hit_ratio == 6500 / 12000
+	assert summary.by_model['claude-sonnet-4-0'].prompt_cached_tokens == 6500
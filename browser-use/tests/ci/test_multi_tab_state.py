@@ -0,0 +1,105 @@
+"""Tests for the concurrent multi-tab state capture of DOMWatchdog (DOM building is replaced, no browser needed)."""
+
+import asyncio
+import base64
+import io
+import time
+from types import SimpleNamespace
+
+from PIL import Image
+
+from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.browser.session import Target
+from browser_use.browser.session_manager import SessionManager
+from browser_use.browser.watchdogs.dom_watchdog import DOMWatchdog
+from browser_use.dom.views import SerializedDOMState
+
+TARGETS = {
+	'target-shop-a': 'https://shop-a.example.com/item',
+	'target-shop-b': 'https://shop-b.example.com/item',
+	'target-blank': 'about:blank',
+}
+
+
+class SlowDOMWatchdog(DOMWatchdog):
+	"""Builds a fake DOM state per target after a delay, and can't reach CDP for page info."""
+
+	async def _build_target_dom_state(self, target_id):
+		await asyncio.sleep(0.2)
+		return SerializedDOMState(_root=None, selector_map={1: target_id})  # type: ignore[dict-item]
+
+	async def _get_page_info(self, target_id=None):
+		raise RuntimeError('no CDP connection')
+
+
+def _make_watchdog(headless: bool = True) -> SlowDOMWatchdog:
+	browser_session = BrowserSession(browser_profile=BrowserProfile(headless=headless))
+	browser_session.session_manager = SessionManager(browser_session)
+	for target_id, url in TARGETS.items():
+		browser_session.session_manager._targets[target_id] = Target(
+			target_id=target_id, target_type='page', url=url, title=target_id
+		)
+	return SlowDOMWatchdog(event_bus=browser_session.event_bus, browser_session=browser_session)
+
+
+async def test_tabs_are_captured_concurrently_with_their_own_selector_maps():
+	watchdog = _make_watchdog()
+
+	start = time.monotonic()
+	summaries = await watchdog.get_browser_state_summaries(list(TARGETS), include_screenshot=False)
+	elapsed = time.monotonic() - start
+
+	assert elapsed < 0.35  # two 0.2s DOM builds overlap
+	assert list(summaries) == list(TARGETS)
+	for target_id in ('target-shop-a', 'target-shop-b'):
+		summary = summaries[target_id]
+		assert summary.url == TARGETS[target_id]
+		assert summary.dom_state.selector_map == {1: target_id}
+		assert summary.page_info is not None and summary.page_info.viewport_width > 0
+		assert len(summary.tabs) == 3
+	assert summaries['target-blank'].title == 'Empty Tab'
+	assert summaries['target-blank'].dom_state.selector_map == {}
+
+	# The agent's own DOM state is not touched
+	assert watchdog.selector_map is None
+	assert watchdog.browser_session._cached_browser_state_summary is None
+
+
+class FakeScreenshotWatchdog:
+	"""Captures visible tabs, stalls on hidden ones like a headful Chrome that doesn't render background tabs."""
+
+	def __init__(self, hidden_target_ids: set[str]):
+		self.hidden_target_ids = hidden_target_ids
+		buffer = io.BytesIO()
+		Image.new('RGB', (64, 36), color=(30, 120, 200)).save(buffer, format='PNG')
+		self.screenshot = base64.b64encode(buffer.getvalue()).decode()
+
+	async def capture_screenshot(self, target_id, **kwargs):
+		if target_id in self.hidden_target_ids:
+			await asyncio.sleep(30)
+		return self.screenshot
+
+
+async def test_background_tabs_are_not_screenshotted_in_headful_mode(monkeypatch):
+	watchdog = _make_watchdog(headless=False)
+	hidden_target_ids = {'target-shop-b'}
+	screenshot_watchdog = FakeScreenshotWatchdog(hidden_target_ids)
+	watchdog.browser_session._screenshot_watchdog = screenshot_watchdog
+
+	async def get_or_create_cdp_session(self, target_id=None, focus=True):
+		assert not focus
+
+		async def evaluate(params, session_id=None):
+			return {'result': {'value': 'hidden' if target_id in hidden_target_ids else 'visible'}}
+
+		return SimpleNamespace(cdp_client=SimpleNamespace(send=SimpleNamespace(Runtime=SimpleNamespace(evaluate=evaluate))), session_id=None)
+
+	monkeypatch.setattr(BrowserSession, 'get_or_create_cdp_session', get_or_create_cdp_session)
+
+	start = time.monotonic()
+	summaries = await watchdog.get_browser_state_summaries(['target-shop-a', 'target-shop-b'])
+
+	assert time.monotonic() - start < 1.0  # not stalled until the 10s screenshot timeout
+	assert summaries['target-shop-a'].screenshot == screenshot_watchdog.screenshot
+	assert summaries['target-shop-b'].screenshot is None
+	assert summaries['target-shop-b'].dom_state.selector_map == {1: 'target-shop-b'}
@@ -0,0 +1,89 @@
+"""Tests for the event-driven page stability tracking of NetworkIdleWatchdog (no browser needed)."""
+
+import asyncio
+import time
+
+from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.browser.session_manager import SessionManager
+from browser_use.browser.watchdogs.network_idle_watchdog import NetworkIdleWatchdog
+
+TARGET_ID = 'target-1'
+SESSION_ID = 'session-1'
+
+
+def _make_watchdog() -> NetworkIdleWatchdog:
+	browser_session = BrowserSession(browser_profile=BrowserProfile(headless=True))
+	browser_session.session_manager = SessionManager(browser_session)
+	browser_session.session_manager._session_to_target[SESSION_ID] = TARGET_ID
+	return NetworkIdleWatchdog(event_bus=browser_session.event_bus, browser_session=browser_session)
+
+
+def _request(watchdog: NetworkIdleWatchdog, request_id: str, url: str, resource_type: str = 'Fetch') -> None:
+	watchdog._on_request_will_be_sent(
+		{'requestId': request_id, 'request': {'url': url, 'method': 'GET'}, 'type': resource_type},  # type: ignore[arg-type]
+		SESSION_ID,
+	)
+
+
+async def test_wait_ends_shortly_after_the_last_request_finishes():
+	watchdog = _make_watchdog()
+	_request(watchdog, '1', 'https://example.com/api/items')
+	assert [request.url for request in watchdog.get_pending_requests(TARGET_ID)] == ['https://example.com/api/items']
+
+	async def finish_request():
+		await asyncio.sleep(0.2)
+		watchdog._on_loading_finished({'requestId': '1'}, SESSION_ID)  # type: ignore[arg-type]
+
+	start = time.monotonic()
+	finisher = asyncio.create_task(finish_request())
+	assert await watchdog.wait_for_stable(TARGET_ID, quiet_time=0.1, timeout=5.0)
+	elapsed = time.monotonic() - start
+	await finisher
+
+	assert 0.3 <= elapsed < 1.0
+	assert watchdog.get_pending_requests(TARGET_ID) == []
+
+
+async def test_tracking_and_long_lived_requests_do_not_block_stability():
+	watchdog = _make_watchdog()
+	_request(watchdog, '1', 'https://www.google-analytics.com/collect')
+	_request(watchdog, '2', 'https://example.com/stream', resource_type='EventSource')
+	await asyncio.sleep(0.1)
+
+	assert watchdog.get_pending_requests(TARGET_ID) == []
+	start = time.monotonic()
+	assert await watchdog.wait_for_stable(TARGET_ID, quiet_time=0.05, timeout=5.0)
+	assert time.monotonic() - start < 0.1
+
+
+async def test_wait_gives_up_at_the_timeout():
+	watchdog = _make_watchdog()
+	_request(watchdog, '1', 'https://example.com/slow', resource_type='Document')
+
+	start = time.monotonic()
+	assert not await watchdog.wait_for_stable(TARGET_ID, quiet_time=0.1, timeout=0.3)
+	assert 0.3 <= time.monotonic() - start < 0.6
+	# Requests of other pages are tracked separately
+	assert await watchdog.wait_for_stable('target-2', quiet_time=0.1, timeout=0.3)
+
+
+async def test_concurrent_waiters_are_all_woken_by_the_same_activity():
+	watchdog = _make_watchdog()
+	_request(watchdog, '1', 'https://example.com/api/items')
+	_request(watchdog, '2', 'https://example.com/api/prices')
+
+	async def finish_requests():
+		await asyncio.sleep(0.1)
+		watchdog._on_loading_finished({'requestId': '1'}, SESSION_ID)  # type: ignore[arg-type]
+		await asyncio.sleep(0)
+		watchdog._on_loading_finished({'requestId': '2'}, SESSION_ID)  # type: ignore[arg-type]
+
+	start = time.monotonic()
+	finisher = asyncio.create_task(finish_requests())
+	results = await asyncio.gather(*(watchdog.wait_for_stable(TARGET_ID, quiet_time=0.05, timeout=5.0) for _ in range(3)))
+	await finisher
+
+	# Every waiter sees the last request finish, none of them waits for the 0.5s busy recheck
+	assert results == [True, True, True]
+	assert time.monotonic() - start < 0.4
+	assert watchdog._activity_waiters == {}
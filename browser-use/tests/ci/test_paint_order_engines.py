@@ -0,0 +1,45 @@
+"""Equivalence tests for the paint order occlusion engines in browser_use.dom.serializer.paint_order."""
+
+import random
+
+import pytest
+
+from browser_use.dom.serializer.paint_order import PAINT_ORDER_ENGINES, PaintOrderRemover, Rect, RectUnionGrid, RectUnionPure
+
+
+def _random_rects(seed: int, count: int) -> list[Rect]:
+	rng = random.Random(seed)
+	rects = []
+	for _ in range(count):
+		# Snap to a coarse grid so that shared edges and cell boundaries are common
+		x = rng.randrange(0, 2000, 8)
+		y = rng.randrange(-200, 6000, 8)
+		width = rng.choice([0, 8, 64, 256, 300, 1920])
+		height = rng.choice([0, 8, 40, 256, 512, 4000])
+		rects.append(Rect(x, y, x + width, y + height))
+	return rects
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_grid_engine_matches_pure_engine(seed: int):
+	pure, grid = RectUnionPure(), RectUnionGrid(cell_size=128)
+	for rect in _random_rects(seed, 400):
+		assert grid.contains(rect) == pure.contains(rect)
+		assert grid.add(rect) == pure.add(rect)
+	# Same disjoint decomposition, in the same order
+	assert grid._rects == pure._rects
+
+
+def test_grid_engine_handles_rects_larger_than_the_index():
+	grid = RectUnionGrid(cell_size=1)
+	huge = Rect(0, 0, 100_000, 100_000)
+	assert grid.add(huge)
+	assert grid.contains(Rect(10, 10, 20, 20))
+	assert not grid.contains(Rect(99_990, 99_990, 100_010, 100_010))
+	assert not grid.add(Rect(50, 50, 60, 60))
+
+
+def test_unknown_engine_is_rejected():
+	assert set(PAINT_ORDER_ENGINES) == {'pure', 'grid'}
+	with pytest.raises(ValueError):
+		PaintOrderRemover(None, engine='rtree')  # type: ignore[arg-type]
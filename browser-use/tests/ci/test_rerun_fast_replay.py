@@ -0,0 +1,79 @@
+"""Tests for the condition-driven fast replay of Agent.rerun_history (no browser needed)."""
+
+import time
+from types import SimpleNamespace
+
+from browser_use.agent.service import Agent
+from browser_use.agent.views import AgentHistory, RerunStepTiming, StepMetadata
+from browser_use.browser import BrowserSession
+from browser_use.browser.views import BrowserStateHistory
+from browser_use.dom.views import DOMInteractedElement, SerializedDOMState
+from tests.ci.conftest import create_dom_node, create_mock_llm
+
+
+def _make_click_step(agent: Agent, historical_elem: DOMInteractedElement) -> AgentHistory:
+	return AgentHistory(
+		model_output=agent.AgentOutput(
+			evaluation_previous_goal=None,
+			memory='Click submit',
+			next_goal=None,
+			action=[{'click': {'index': 1}}],  # type: ignore[arg-type]
+		),
+		result=[],
+		state=BrowserStateHistory(url='https://example.com', title='Test', tabs=[], interacted_element=[historical_elem]),
+		metadata=StepMetadata(step_start_time=0, step_end_time=30, step_number=1, step_interval=30.0),
+	)
+
+
+def _setup(agent: Agent, states_before_ready: int, monkeypatch) -> tuple[DOMInteractedElement, list[list]]:
+	"""Page states: `states_before_ready` captures without the submit button, then captures with it at index 7."""
+	submit = create_dom_node(2, 'BUTTON', attributes={'id': 'submit'})
+	historical_elem = DOMInteractedElement.load_from_enhanced_dom_tree(submit)
+	captures = 0
+
+	async def get_browser_state_summary(browser_session, include_screenshot: bool = True, **kwargs):
+		nonlocal captures
+		captures += 1
+		selector_map = {1: create_dom_node(1, 'INPUT', attributes={'id': 'search'})}
+		if captures > states_before_ready:
+			selector_map[7] = submit
+		return SimpleNamespace(dom_state=SerializedDOMState(_root=None, selector_map=selector_map))
+
+	executed: list[list] = []
+
+	async def multi_act(actions):
+		executed.append([action.get_index() for action in actions])
+		return []
+
+	monkeypatch.setattr(BrowserSession, 'get_browser_state_summary', get_browser_state_summary)
+	agent.multi_act = multi_act  # type: ignore[method-assign]
+	return historical_elem, executed
+
+
+async def test_fast_replay_waits_for_the_step_element_instead_of_the_saved_interval(monkeypatch):
+	agent = Agent(task='Test task', llm=create_mock_llm(actions=None))
+	historical_elem, executed = _setup(agent, states_before_ready=2, monkeypatch=monkeypatch)
+	timing = RerunStepTiming(step_number=1)
+
+	start = time.monotonic()
+	await agent._execute_history_step(_make_click_step(agent, historical_elem), 0.0, ready_timeout=5.0, timing=timing)
+
+	# Ran as soon as the element showed up, on the state that contained it
+	assert time.monotonic() - start < 2.0
+	assert executed == [[7]]
+	assert timing.state_captures == 3
+	assert 0 < timing.wait_seconds < 2.0
+	assert timing.work_seconds >= 0
+
+
+async def test_fast_replay_tries_anyway_after_the_ready_timeout(monkeypatch):
+	agent = Agent(task='Test task', llm=create_mock_llm(actions=None))
+	historical_elem, _ = _setup(agent, states_before_ready=1000, monkeypatch=monkeypatch)
+
+	start = time.monotonic()
+	state, captures = await agent._wait_for_history_elements(
+		_make_click_step(agent, historical_elem), timeout=0.3, poll_interval=0.05
+	)
+	assert 0.3 <= time.monotonic() - start < 1.0
+	assert captures > 1
+	assert 7 not in state.dom_state.selector_map
@@ -0,0 +1,196 @@
+"""Tests for the screenshot pipeline helpers (browser_use.browser.screenshots)."""
+
+import base64
+import io
+import logging
+from types import SimpleNamespace
+
+from PIL import Image, ImageDraw
+
+from browser_use.agent.judge import construct_judge_messages
+from browser_use.agent.message_manager.service import MessageManager
+from browser_use.agent.views import AgentStepInfo, MessageManagerState
+from browser_use.browser.python_highlights import create_highlighted_screenshot
+from browser_use.browser.screenshots import (
+	compute_screenshot_hash,
+	get_capture_scale,
+	get_screenshot_format,
+	get_screenshot_media_type,
+	get_screenshot_size,
+	resize_screenshot,
+	run_image_task,
+)
+from browser_use.browser.views import BrowserStateSummary
+from browser_use.browser.watchdogs.dom_watchdog import DOMWatchdog
+from browser_use.dom.views import SerializedDOMState
+from browser_use.filesystem.file_system import FileSystem
+from browser_use.llm import SystemMessage
+from browser_use.llm.messages import ContentPartImageParam
+from browser_use.screenshots.service import ScreenshotService
+
+
+def _make_screenshot(image_format: str, size: tuple[int, int] = (200, 100), dialog: bool = False) -> str:
+	image = Image.new('RGB', size, color=(30, 120, 200))
+	draw = ImageDraw.Draw(image)
+	draw.rectangle((0, 0, size[0] // 2, size[1] // 4), fill=(240, 240, 240))
+	if dialog:
+		draw.rectangle((size[0] // 4, size[1] // 3, size[0] * 3 // 4, size[1] * 2 // 3), fill=(255, 255, 255))
+	buffer = io.BytesIO()
+	image.save(buffer, format=image_format)
+	return base64.b64encode(buffer.getvalue()).decode('utf-8')
+
+
+def test_capture_scale_renders_the_viewport_at_the_target_size():
+	assert get_capture_scale(1280, 720, 1.0, (640, 360)) == 0.5
+	# The device pixel ratio multiplies the output size, so the scale compensates for it
+	assert get_capture_scale(1280, 720, 2.0, (1280, 720)) == 0.5
+	# Within 1% of the aspect ratio a uniform scale is still used
+	assert get_capture_scale(1280, 720, 1.0, (1280, 723)) == 1.0
+
+
+def test_capture_scale_is_none_for_a_different_aspect_ratio():
+	assert get_capture_scale(1280, 720, 1.0, (1000, 1000)) is None
+	assert get_capture_scale(0, 720, 1.0, (640, 360)) is None
+
+
+def test_screenshot_format_is_sniffed_from_the_base64_signature():
+	for image_format, expected in (('PNG', 'png'), ('JPEG', 'jpeg'), ('WEBP', 'webp')):
+		screenshot = _make_screenshot(image_format)
+		assert get_screenshot_format(screenshot) == expected
+		assert get_screenshot_media_type(screenshot) == f'image/{expected}'
+
+
+async def test_resize_keeps_the_format_and_skips_matching_sizes():
+	for image_format in ('PNG', 'JPEG'):
+		screenshot = _make_screenshot(image_format)
+		resized = await run_image_task(resize_screenshot, screenshot, (100, 50))
+		assert get_screenshot_size(resized) == (100, 50)
+		assert get_screenshot_format(resized) == get_screenshot_format(screenshot)
+		assert resize_screenshot(screenshot, (200, 100)) is screenshot
+
+
+async def test_highlighted_screenshot_is_drawn_in_the_worker_pool():
+	screenshot = _make_screenshot('JPEG')
+	highlighted = await create_highlighted_screenshot(screenshot, {})
+	assert get_screenshot_format(highlighted) == 'png'
+	assert get_screenshot_size(highlighted) == (200, 100)
+
+
+def _make_form_screenshot(checked: bool = False, text: str = '') -> str:
+	"""A 1280x720 page with a text input and a checkbox."""
+	image = Image.new('RGB', (1280, 720), color=(255, 255, 255))
+	draw = ImageDraw.Draw(image)
+	draw.rectangle((40, 300, 400, 330), outline=(120, 120, 120))
+	draw.text((46, 310), text, fill=(0, 0, 0))
+	draw.rectangle((40, 350, 53, 363), outline=(100, 100, 100))
+	if checked:
+		draw.line((42, 356, 46, 361, 52, 351), fill=(0, 0, 0), width=2)
+	buffer = io.BytesIO()
+	image.save(buffer, format='PNG')
+	return base64.b64encode(buffer.getvalue()).decode('utf-8')
+
+
+def test_screenshot_hash_ignores_encoding_but_not_content():
+	screenshot_hash = compute_screenshot_hash(_make_screenshot('PNG', (1280, 720)))
+	assert compute_screenshot_hash(_make_screenshot('JPEG', (1280, 720))) == screenshot_hash
+	assert compute_screenshot_hash(_make_screenshot('PNG', (1280, 720), dialog=True)) != screenshot_hash
+
+	# Small changes count too
+	form_hash = compute_screenshot_hash(_make_form_screenshot())
+	assert compute_screenshot_hash(_make_form_screenshot()) == form_hash
+	assert compute_screenshot_hash(_make_form_screenshot(checked=True)) != form_hash
+	assert compute_screenshot_hash(_make_form_screenshot(text='a')) != form_hash
+
+
+async def test_only_identical_screenshots_reuse_the_stored_file(tmp_path):
+	screenshot_service = ScreenshotService(tmp_path)
+	screenshot = _make_form_screenshot()
+
+	first_path = await screenshot_service.store_screenshot(screenshot, 1)
+	assert await screenshot_service.store_screenshot(screenshot, 2) == first_path
+	assert await screenshot_service.store_screenshot(_make_form_screenshot(checked=True), 3) != first_path
+	assert sorted(path.name for path in (tmp_path / 'screenshots').iterdir()) == ['step_1.png', 'step_3.png']
+
+
+def test_unchanged_screenshot_is_replaced_by_a_marker(tmp_path):
+	message_manager = MessageManager(
+		task='Find the cheapest flight',
+		system_message=SystemMessage(content='You are a browser automation agent'),
+		file_system=FileSystem(tmp_path),
+		state=MessageManagerState(),
+		skip_unchanged_screenshots=True,
+	)
+
+	def state_message(step_number: int, screenshot: str):
+		message_manager.create_state_messages(
+			browser_state_summary=BrowserStateSummary(
+				dom_state=SerializedDOMState(_root=None, selector_map={}),
+				url='https://example.com',
+				title='Example',
+				tabs=[],
+				screenshot=screenshot,
+				screenshot_hash=compute_screenshot_hash(screenshot),
+			),
+			step_info=AgentStepInfo(step_number=step_number, max_steps=10),
+			use_vision=True,
+		)
+		return message_manager.get_messages()[-1]
+
+	assert not isinstance(state_message(1, _make_screenshot('PNG')).content, str)
+	unchanged = state_message(2, _make_screenshot('PNG')).content
+	assert isinstance(unchanged, str)
+	assert 'same as in the screenshot of step 2' in unchanged
+	assert not isinstance(state_message(3, _make_screenshot('PNG', dialog=True)).content, str)
+
+
+async def test_only_the_llm_copy_of_the_screenshot_is_resized(tmp_path):
+	screenshot = _make_screenshot('PNG', size=(1280, 720))
+	watchdog = SimpleNamespace(
+		browser_session=SimpleNamespace(llm_screenshot_size=(640, 360), hash_screenshots=True), logger=logging.getLogger(__name__)
+	)
+	screenshot_hash, llm_screenshot = await DOMWatchdog._process_screenshot(watchdog, screenshot)  # type: ignore[arg-type]
+	assert screenshot_hash == compute_screenshot_hash(screenshot)
+	assert llm_screenshot is not None and get_screenshot_size(llm_screenshot) == (640, 360)
+
+	message_manager = MessageManager(
+		task='Find the cheapest flight',
+		system_message=SystemMessage(content='You are a browser automation agent'),
+		file_system=FileSystem(tmp_path),
+		state=MessageManagerState(),
+	)
+	browser_state_summary = BrowserStateSummary(
+		dom_state=SerializedDOMState(_root=None, selector_map={}),
+		url='https://example.com',
+		title='Example',
+		tabs=[],
+		screenshot=screenshot,
+		llm_screenshot=llm_screenshot,
+		screenshot_hash=screenshot_hash,
+	)
+	message_manager.create_state_messages(browser_state_summary=browser_state_summary, use_vision=True)
+
+	# The LLM gets the resized copy, the summary (stored, replayed in GIFs, synced) keeps the viewport-sized capture
+	images = [part for part in message_manager.get_messages()[-1].content if isinstance(part, ContentPartImageParam)]
+	assert [image.image_url.url.split(',', 1)[1] for image in images] == [llm_screenshot]
+	assert get_screenshot_size(browser_state_summary.screenshot) == (1280, 720)
+
+	watchdog.browser_session.llm_screenshot_size = None
+	assert await DOMWatchdog._process_screenshot(watchdog, screenshot) == (screenshot_hash, None)  # type: ignore[arg-type]
+
+	# Only agents with skip_unchanged_screenshots need the hash
+	watchdog.browser_session.hash_screenshots = False
+	assert await DOMWatchdog._process_screenshot(watchdog, screenshot) == (None, None)  # type: ignore[arg-type]
+
+
+def test_judge_labels_stored_screenshots_with_their_format(tmp_path):
+	paths = []
+	for image_format in ('PNG', 'JPEG', 'WEBP'):
+		path = tmp_path / f'step_{len(paths) + 1}.{image_format.lower()}'
+		path.write_bytes(base64.b64decode(_make_screenshot(image_format)))
+		paths.append(str(path))
+
+	messages = construct_judge_messages(task='Find a flight', final_result='Done', agent_steps=[], screenshot_paths=paths)
+
+	images = [part for part in messages[-1].content if isinstance(part, ContentPartImageParam)]
+	assert [image.image_url.media_type for image in images] == ['image/png', 'image/jpeg', 'image/webp']
+	assert all(image.image_url.url.startswith(f'data:{image.image_url.media_type};base64,') for image in images)
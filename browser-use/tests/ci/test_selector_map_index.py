@@ -0,0 +1,100 @@
+"""Tests for the selector map lookup index used to match historical elements during history rerun (no browser needed)."""
+
+from types import SimpleNamespace
+
+from browser_use.agent.service import Agent
+from browser_use.dom.views import (
+	DOMInteractedElement,
+	EnhancedAXNode,
+	MatchLevel,
+	NodeType,
+	SerializedDOMState,
+)
+from tests.ci.conftest import create_dom_node, create_mock_llm
+
+
+def _ax_node(name: str) -> EnhancedAXNode:
+	return EnhancedAXNode(ax_node_id=name, ignored=False, role=None, name=name, description=None, properties=None, child_ids=None)
+
+
+def _make_dom_state() -> SerializedDOMState:
+	body = create_dom_node(1, 'BODY')
+	buttons = [
+		create_dom_node(2, 'BUTTON', body, attributes={'id': 'save'}, ax_node=_ax_node('Save')),
+		create_dom_node(3, 'BUTTON', body, ax_node=_ax_node('Save')),
+		create_dom_node(4, 'INPUT', body, attributes={'name': 'email', 'aria-label': 'Email'}),
+		create_dom_node(5, 'DIV', body, attributes={'id': 'save'}, ax_node=_ax_node('Save')),
+	]
+	return SerializedDOMState(_root=None, selector_map={10 + i: node for i, node in enumerate(buttons)})
+
+
+def _historical(node_name: str, **kwargs) -> DOMInteractedElement:
+	"""A recorded element whose hash, stable hash and xpath match nothing on the current page."""
+	defaults = dict(
+		node_id=9999,
+		backend_node_id=9999,
+		frame_id=None,
+		node_type=NodeType.ELEMENT_NODE,
+		node_value='',
+		node_name=node_name,
+		attributes=None,
+		bounds=None,
+		x_path='html/body/div[7]',
+		element_hash=123,
+		stable_hash=456,
+		ax_name=None,
+	)
+	return DOMInteractedElement(**{**defaults, **kwargs})
+
+
+def test_index_matches_each_level_in_order():
+	dom_state = _make_dom_state()
+	selector_map = dom_state.selector_map
+	index = dom_state.element_index
+	assert dom_state.element_index is index  # built once per state
+
+	exact = DOMInteractedElement.load_from_enhanced_dom_tree(selector_map[12])
+	assert index.find(exact) == (12, MatchLevel.EXACT)
+	assert index.find(_historical('INPUT', stable_hash=selector_map[12].compute_stable_hash())) == (12, MatchLevel.STABLE)
+	assert index.find(_historical('BUTTON', x_path=selector_map[11].xpath)) == (11, MatchLevel.XPATH)
+
+	# AX_NAME and ATTRIBUTE require the same tag, and the first element of the selector map wins
+	assert index.find(_historical('button', ax_name='Save')) == (10, MatchLevel.AX_NAME)
+	assert index.find(_historical('DIV', ax_name='Save')) == (13, MatchLevel.AX_NAME)
+	assert index.find(_historical('INPUT', attributes={'name': 'other', 'aria-label': 'Email'})) == (12, MatchLevel.ATTRIBUTE)
+	assert index.find(_historical('A', ax_name='Save', attributes={'id': 'save'})) is None
+
+
+
+def test_stable_hash_and_xpath_tables_are_built_on_first_lookup():
+	dom_state = _make_dom_state()
+	index = dom_state.element_index
+	assert 'by_stable_hash' not in vars(index) and 'by_xpath' not in vars(index)
+
+	# An exact match never needs them
+	exact = DOMInteractedElement.load_from_enhanced_dom_tree(dom_state.selector_map[11])
+	assert index.find(exact) == (11, MatchLevel.EXACT)
+	assert 'by_stable_hash' not in vars(index) and 'by_xpath' not in vars(index)
+
+	assert index.find(_historical('BUTTON', x_path=dom_state.selector_map[11].xpath)) == (11, MatchLevel.XPATH)
+	assert 'by_stable_hash' in vars(index) and 'by_xpath' in vars(index)
+
+async def test_update_action_indices_uses_the_index():
+	agent = Agent(task='Test task', llm=create_mock_llm(actions=None))
+	dom_state = _make_dom_state()
+	browser_state_summary = SimpleNamespace(dom_state=dom_state)
+	action = agent.ActionModel(**{'click': {'index': 99}})  # type: ignore[arg-type]
+
+	updated = await agent._update_action_indices(
+		_historical('INPUT', attributes={'aria-label': 'Email'}),
+		action,
+		browser_state_summary,  # type: ignore[arg-type]
+	)
+	assert updated is not None and updated.get_index() == 12
+
+	missing = await agent._update_action_indices(
+		_historical('SELECT', attributes={'name': 'country'}),
+		agent.ActionModel(**{'click': {'index': 99}}),  # type: ignore[arg-type]
+		browser_state_summary,  # type: ignore[arg-type]
+	)
+	assert missing is None
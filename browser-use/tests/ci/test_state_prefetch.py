@@ -0,0 +1,83 @@
+"""Tests for the background browser state prefetch of BrowserSession (state capture is replaced, no browser needed)."""
+
+import asyncio
+import time
+
+from pydantic import PrivateAttr
+
+from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.browser.session import CDPSession, Target
+from browser_use.browser.session_manager import SessionManager
+from browser_use.browser.views import BrowserStateSummary
+from browser_use.dom.views import SerializedDOMState
+
+TARGET_ID = 'target-1'
+SESSION_ID = 'session-1'
+
+
+class CountingBrowserSession(BrowserSession):
+	"""Returns a fresh summary of the focused page after 0.1s, counting the captures."""
+
+	_captures: int = PrivateAttr(default=0)
+
+	async def _request_browser_state_summary(self, include_screenshot, include_recent_events):
+		await asyncio.sleep(0.1)
+		self._captures += 1
+		return BrowserStateSummary(
+			dom_state=SerializedDOMState(_root=None, selector_map={}),
+			url=await self.get_current_page_url(),
+			title=f'capture {self._captures}',
+			tabs=[],
+		)
+
+
+def _make_browser_session() -> CountingBrowserSession:
+	browser_session = CountingBrowserSession(browser_profile=BrowserProfile(headless=True))
+	session_manager = SessionManager(browser_session)
+	browser_session.session_manager = session_manager
+	for target_id, session_id in ((TARGET_ID, SESSION_ID), ('target-2', 'session-2')):
+		session_manager._targets[target_id] = Target(target_id=target_id, target_type='page', url='https://example.com')
+		session_manager._target_sessions[target_id] = {session_id}
+		session_manager._sessions[session_id] = CDPSession.model_construct(
+			cdp_client=None, target_id=target_id, session_id=session_id
+		)
+	browser_session.agent_focus_target_id = TARGET_ID
+	return browser_session
+
+
+async def test_prefetched_state_is_used_when_the_page_is_unchanged():
+	browser_session = _make_browser_session()
+	browser_session.prefetch_browser_state_summary()
+	await asyncio.sleep(0.15)  # e.g. history and callbacks of the previous step
+
+	start = time.monotonic()
+	state = await browser_session.get_browser_state_summary()
+	assert time.monotonic() - start < 0.05
+	assert state.title == 'capture 1'
+	assert browser_session._captures == 1
+
+	# The prefetch is consumed once
+	assert (await browser_session.get_browser_state_summary()).title == 'capture 2'
+
+
+async def test_prefetched_state_is_captured_again_after_changes():
+	browser_session = _make_browser_session()
+
+	# DOM mutation after the capture finished
+	browser_session.prefetch_browser_state_summary()
+	await asyncio.sleep(0.15)
+	browser_session.session_manager._last_dom_mutation[SESSION_ID] = time.monotonic()
+	assert (await browser_session.get_browser_state_summary()).title == 'capture 2'
+
+	# Navigation after the capture finished
+	browser_session.prefetch_browser_state_summary()
+	await asyncio.sleep(0.15)
+	browser_session.session_manager._targets[TARGET_ID].url = 'https://example.com/next'
+	state = await browser_session.get_browser_state_summary()
+	assert state.url == 'https://example.com/next'
+	assert browser_session._captures == 4
+
+	# Another tab got the focus
+	browser_session.prefetch_browser_state_summary()
+	browser_session.agent_focus_target_id = 'target-2'
+	assert (await browser_session.get_browser_state_summary()).title == 'capture 6'
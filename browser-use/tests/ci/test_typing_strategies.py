@@ -0,0 +1,79 @@
+"""Tests for the fast typing strategies of DefaultActionWatchdog against a recording fake CDP client (no browser needed)."""
+
+import asyncio
+from types import SimpleNamespace
+
+from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.browser.watchdogs.default_action_watchdog import PIPELINED_KEY_EVENTS_WINDOW, DefaultActionWatchdog
+
+
+class FakeInput:
+	"""Records the Input commands in the order they are sent, and the most commands that were in flight at once."""
+
+	def __init__(self):
+		self.commands: list[tuple[str, dict]] = []
+		self.in_flight = 0
+		self.max_in_flight = 0
+
+	async def _send(self, method: str, params: dict) -> dict:
+		self.commands.append((method, params))
+		self.in_flight += 1
+		self.max_in_flight = max(self.max_in_flight, self.in_flight)
+		await asyncio.sleep(0.001)
+		self.in_flight -= 1
+		return {}
+
+	async def dispatchKeyEvent(self, params: dict, session_id: str | None = None) -> dict:
+		return await self._send('dispatchKeyEvent', params)
+
+	async def insertText(self, params: dict, session_id: str | None = None) -> dict:
+		return await self._send('insertText', params)
+
+
+def _make_watchdog_and_session() -> tuple[DefaultActionWatchdog, FakeInput, SimpleNamespace]:
+	browser_session = BrowserSession(browser_profile=BrowserProfile(headless=True))
+	watchdog = DefaultActionWatchdog(event_bus=browser_session.event_bus, browser_session=browser_session)
+	fake_input = FakeInput()
+	cdp_session = SimpleNamespace(cdp_client=SimpleNamespace(send=SimpleNamespace(Input=fake_input)), session_id='session-1')
+	return watchdog, fake_input, cdp_session
+
+
+def _typed_text(commands: list[tuple[str, dict]]) -> str:
+	return ''.join(
+		params['text'] if method == 'insertText' else params['text'].replace('\r', '\n')
+		for method, params in commands
+		if method == 'insertText' or params['type'] == 'char'
+	)
+
+
+async def test_pipelined_typing_sends_every_key_event_in_order_with_bounded_concurrency():
+	watchdog, fake_input, cdp_session = _make_watchdog_and_session()
+	text = 'Hello, World!\n' * 10
+
+	await watchdog._type_text_fast(text, cdp_session, 'pipelined')
+
+	assert all(method == 'dispatchKeyEvent' for method, _ in fake_input.commands)
+	assert [params['type'] for _, params in fake_input.commands] == ['keyDown', 'char', 'keyUp'] * len(text)
+	assert _typed_text(fake_input.commands) == text
+	# Same parameters as the human-like typing: shifted characters carry the Shift modifier
+	key_down_h = fake_input.commands[0][1]
+	assert key_down_h['key'] == 'h' and key_down_h['code'] == 'KeyH' and key_down_h['modifiers'] == 8
+	assert 1 < fake_input.max_in_flight <= PIPELINED_KEY_EVENTS_WINDOW
+
+
+async def test_insert_text_typing_inserts_lines_and_presses_enter_between_them():
+	watchdog, fake_input, cdp_session = _make_watchdog_and_session()
+
+	await watchdog._type_text_fast('first line\n\nthird line', cdp_session, 'insert_text')
+
+	assert [(method, params.get('type')) for method, params in fake_input.commands] == [
+		('insertText', None),
+		('dispatchKeyEvent', 'keyDown'),
+		('dispatchKeyEvent', 'char'),
+		('dispatchKeyEvent', 'keyUp'),
+		('dispatchKeyEvent', 'keyDown'),
+		('dispatchKeyEvent', 'char'),
+		('dispatchKeyEvent', 'keyUp'),
+		('insertText', None),
+	]
+	assert _typed_text(fake_input.commands) == 'first line\n\nthird line'
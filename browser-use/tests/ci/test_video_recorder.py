@@ -0,0 +1,74 @@
+"""Tests for the frame pipeline of VideoRecorderService (the encoder is replaced, no imageio/ffmpeg needed)."""
+
+import threading
+import time
+
+from browser_use.browser.profile import ViewportSize
+from browser_use.browser.video_recorder import VideoRecorderService
+
+
+class FakeWriter:
+	def __init__(self):
+		self.frames: list[str] = []
+		self.closed = False
+
+	def append_data(self, frame):
+		self.frames.append(frame)
+
+	def close(self):
+		self.closed = True
+
+
+class GatedRecorder(VideoRecorderService):
+	"""Records the decoded frame data as-is and only decodes while the gate is open, to simulate a slow encoder."""
+
+	def __init__(self, tmp_path, max_queued_frames: int):
+		super().__init__(tmp_path / 'video.mp4', ViewportSize(width=640, height=360), 30, max_queued_frames=max_queued_frames)
+		self.gate = threading.Event()
+		self.decoded: list[str] = []
+		self.writer = FakeWriter()
+		self._writer = self.writer  # type: ignore[assignment]
+		self._is_active = True
+		self._start_encoder_thread()
+
+	def _decode_frame(self, frame_data_b64):
+		self.gate.wait()
+		self.decoded.append(frame_data_b64)
+		return frame_data_b64
+
+
+def test_full_queue_drops_the_oldest_frames(tmp_path):
+	recorder = GatedRecorder(tmp_path, max_queued_frames=3)
+	recorder.add_frame('frame-0')
+	# Wait until the encoder thread took the first frame and blocks on it
+	while recorder.pending_frames:
+		time.sleep(0.001)
+
+	for index in range(1, 8):
+		recorder.add_frame(f'frame-{index}')
+	assert recorder.pending_frames == 3
+
+	recorder.gate.set()
+	recorder.stop_and_save()
+
+	assert recorder.writer.frames == ['frame-0', 'frame-5', 'frame-6', 'frame-7']
+	assert recorder.writer.closed
+	assert recorder.stats.frames_received == 8
+	assert recorder.stats.frames_dropped == 4
+	assert recorder.stats.frames_encoded == 4
+	assert recorder.stats.max_encoder_lag > 0
+
+
+def test_repeated_frames_are_decoded_once(tmp_path):
+	recorder = GatedRecorder(tmp_path, max_queued_frames=8)
+	recorder.gate.set()
+	for frame in ('a', 'a', 'b', 'b', 'b', 'a'):
+		recorder.add_frame(frame)
+	recorder.stop_and_save()
+
+	assert recorder.writer.frames == ['a', 'a', 'b', 'b', 'b', 'a']
+	assert recorder.decoded == ['a', 'b', 'a']
+	assert recorder.stats.frames_deduplicated == 3
+	# Frames added after stopping are ignored
+	recorder.add_frame('c')
+	assert recorder.stats.frames_received == 6
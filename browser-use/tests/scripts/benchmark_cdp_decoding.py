@@ -0,0 +1,104 @@
+"""
+Latency and memory benchmark of the CDP JSON decoders (`BrowserProfile.cdp_json_decoder`).
+
+Every payload of a recording (DOMSnapshot.captureSnapshot, DOM.getDocument and the merged AX tree) is wrapped into a CDP
+response message and decoded the way `DecodingCDPClient` receives it: the standard library from the `str` the websocket
+layer produces, orjson and msgspec straight from the frame bytes, large frames with the garbage collector paused.
+The 'cdp_use' row is the plain `json.loads` of the stock client. Results are checked against the standard library.
+
+Usage:
+	# recordings of tests/scripts/compare_serializer_pipelines.py --record
+	python tests/scripts/benchmark_cdp_decoding.py recordings/*.json
+
+	# synthetic page with N nodes (used when no recordings are given)
+	python tests/scripts/benchmark_cdp_decoding.py --synthetic 20000
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Add parent directory to path to import browser_use modules
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from browser_use.browser.cdp_decoding import CDP_JSON_DECODERS, decode_cdp_message, get_cdp_json_loads
+
+PAYLOADS = ('snapshot', 'dom_tree', 'ax_tree')
+
+
+def make_frame(payload: Any) -> bytes:
+	return json.dumps({'id': 1, 'result': payload, 'sessionId': 'A1B2C3D4E5F6'}).encode()
+
+
+def measure(frame: bytes, decode: Callable[[bytes], Any], repeat: int) -> tuple[float, float, Any]:
+	"""Best decode time in ms, peak traced memory in MB and the decoded message."""
+	timings = []
+	for _ in range(repeat):
+		start = time.perf_counter()
+		decode(frame)
+		timings.append((time.perf_counter() - start) * 1000)
+
+	tracemalloc.start()
+	message = decode(frame)
+	_, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	return min(timings), peak / 1024 / 1024, message
+
+
+def benchmark(name: str, recording: dict[str, Any], repeat: int) -> bool:
+	print(f'{name}:')
+	# websockets hands out a str unless the client asks for bytes
+	decoders: list[tuple[str, Callable[[bytes], Any]]] = [('cdp_use', lambda frame: json.loads(frame.decode()))]
+	for decoder in CDP_JSON_DECODERS[1:]:
+		try:
+			loads, accepts_bytes = get_cdp_json_loads(decoder)
+		except ImportError:
+			print(f'  {decoder:>8}: not installed')
+			continue
+		if accepts_bytes:
+			decoders.append((decoder, lambda frame, loads=loads: decode_cdp_message(frame, loads)))
+		else:
+			decoders.append((decoder, lambda frame, loads=loads: decode_cdp_message(frame.decode(), loads)))
+
+	equivalent = True
+	for payload in PAYLOADS:
+		if payload not in recording:
+			continue
+		frame = make_frame(recording[payload])
+		reference = json.loads(frame)
+		print(f'  {payload} ({len(frame) / 1024 / 1024:.1f}MB frame)')
+		for decoder, decode in decoders:
+			elapsed_ms, peak_mb, message = measure(frame, decode, repeat)
+			same = message == reference
+			equivalent &= same
+			print(f'    {decoder:>8}: best {elapsed_ms:8.2f}ms  peak {peak_mb:7.1f}MB{"" if same else "  MISMATCH"}')
+	return equivalent
+
+
+def main() -> int:
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('recordings', nargs='*', type=Path, help='Recorded page JSON files')
+	parser.add_argument('--synthetic', type=int, default=0, help='Number of nodes of a synthetic page')
+	parser.add_argument('--repeat', type=int, default=3)
+	args = parser.parse_args()
+
+	cases = [(str(path), json.loads(path.read_text())) for path in args.recordings]
+	if args.synthetic or not cases:
+		from compare_serializer_pipelines import make_synthetic_recording
+
+		count = args.synthetic or 20000
+		cases.append((f'synthetic page ({count})', make_synthetic_recording(count)))
+
+	all_equivalent = True
+	for name, recording in cases:
+		all_equivalent &= benchmark(name, recording, args.repeat)
+	return 0 if all_equivalent else 1
+
+
+if __name__ == '__main__':
+	sys.exit(main())
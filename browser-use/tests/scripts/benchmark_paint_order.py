@@ -0,0 +1,115 @@
+"""
+Micro-benchmark for the paint order occlusion engines (`BrowserProfile.paint_order_engine`).
+
+Replays the occlusion pass of `PaintOrderRemover.calculate_paint_order` with every engine, checks that all engines
+flag exactly the same nodes as `ignored_by_paint_order`, and prints the timings.
+
+Usage:
+	# synthetic dashboard with N positioned elements
+	python tests/scripts/benchmark_paint_order.py --synthetic 5000
+
+	# recorded snapshots: JSON files with the raw result of CDP `DOMSnapshot.captureSnapshot`
+	# (called with includePaintOrder=True and the computed styles of `REQUIRED_COMPUTED_STYLES`)
+	python tests/scripts/benchmark_paint_order.py snapshot1.json snapshot2.json
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path to import browser_use modules
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from browser_use.dom.enhanced_snapshot import build_snapshot_lookup
+from browser_use.dom.serializer.paint_order import PAINT_ORDER_ENGINES, PaintOrderRemover
+from browser_use.dom.views import DOMRect, EnhancedSnapshotNode
+
+
+def _fake_simplified_node(snapshot_node: EnhancedSnapshotNode) -> SimpleNamespace:
+	"""Just enough of SimplifiedNode for PaintOrderRemover."""
+	return SimpleNamespace(
+		original_node=SimpleNamespace(snapshot_node=snapshot_node), children=[], ignored_by_paint_order=False
+	)
+
+
+def load_recorded_snapshot(path: Path) -> list[EnhancedSnapshotNode]:
+	snapshot = json.loads(path.read_text())
+	lookup = build_snapshot_lookup(snapshot)
+	snapshot_nodes = (lookup[backend_node_id] for backend_node_id in lookup)
+	return [node for node in snapshot_nodes if node.bounds and node.paint_order is not None]
+
+
+def make_synthetic_dashboard(count: int, seed: int = 0) -> list[EnhancedSnapshotNode]:
+	"""Cards, overlays and text spread over a tall page, a share of them opaque."""
+	rng = random.Random(seed)
+	nodes = []
+	for paint_order in range(count):
+		width = rng.choice([24, 80, 160, 320, 640])
+		height = rng.choice([16, 32, 120, 240])
+		opaque = rng.random() < 0.4
+		nodes.append(
+			EnhancedSnapshotNode(
+				is_clickable=None,
+				cursor_style=None,
+				bounds=DOMRect(x=rng.uniform(0, 1920 - width), y=rng.uniform(0, 20000), width=width, height=height),
+				clientRects=None,
+				scrollRects=None,
+				computed_styles={'background-color': 'rgb(255, 255, 255)' if opaque else 'rgba(0, 0, 0, 0)', 'opacity': '1'},
+				paint_order=paint_order,
+				stacking_contexts=None,
+			)
+		)
+	return nodes
+
+
+def run_engine(snapshot_nodes: list[EnhancedSnapshotNode], engine: str) -> tuple[float, list[bool]]:
+	root = SimpleNamespace(original_node=SimpleNamespace(snapshot_node=None), children=[], ignored_by_paint_order=False)
+	root.children = [_fake_simplified_node(node) for node in snapshot_nodes]
+	start = time.perf_counter()
+	PaintOrderRemover(root, engine=engine).calculate_paint_order()  # type: ignore[arg-type]
+	elapsed_ms = (time.perf_counter() - start) * 1000
+	return elapsed_ms, [child.ignored_by_paint_order for child in root.children]
+
+
+def benchmark(name: str, snapshot_nodes: list[EnhancedSnapshotNode], repeat: int) -> bool:
+	print(f'{name}: {len(snapshot_nodes)} nodes with paint order')
+	reference: list[bool] | None = None
+	equivalent = True
+	for engine in PAINT_ORDER_ENGINES:
+		timings = []
+		for _ in range(repeat):
+			elapsed_ms, ignored = run_engine(snapshot_nodes, engine)
+			timings.append(elapsed_ms)
+		if reference is None:
+			reference = ignored
+		elif ignored != reference:
+			equivalent = False
+		print(f'  {engine:>5}: best {min(timings):8.2f}ms  ({sum(ignored)} ignored)')
+	print(f'  equivalent: {equivalent}')
+	return equivalent
+
+
+def main() -> int:
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('snapshots', nargs='*', type=Path, help='Recorded DOMSnapshot.captureSnapshot JSON files')
+	parser.add_argument('--synthetic', type=int, default=0, help='Number of synthetic dashboard elements')
+	parser.add_argument('--repeat', type=int, default=3)
+	args = parser.parse_args()
+
+	cases = [(str(path), load_recorded_snapshot(path)) for path in args.snapshots]
+	if args.synthetic or not cases:
+		count = args.synthetic or 3000
+		cases.append((f'synthetic dashboard ({count})', make_synthetic_dashboard(count)))
+
+	all_equivalent = True
+	for name, snapshot_nodes in cases:
+		all_equivalent &= benchmark(name, snapshot_nodes, args.repeat)
+	return 0 if all_equivalent else 1
+
+
+if __name__ == '__main__':
+	sys.exit(main())
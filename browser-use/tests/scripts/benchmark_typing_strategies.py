@@ -0,0 +1,123 @@
+"""
+Latency benchmark of the typing strategies (`BrowserProfile.typing_strategy`).
+
+Serves a local page with an <input> and a <textarea>, types the same text into each field with every strategy through
+`TypeTextEvent`, checks the resulting value and the input events the page saw, and prints the timings.
+
+Usage:
+	python tests/scripts/benchmark_typing_strategies.py
+	python tests/scripts/benchmark_typing_strategies.py --length 2000 --repeat 5 --headful
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+# Add parent directory to path to import browser_use modules
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.browser.events import TypeTextEvent
+
+STRATEGIES = ('human', 'pipelined', 'insert_text')
+
+PAGE = b"""<!DOCTYPE html>
+<html><body>
+<input id="single" type="text">
+<textarea id="multi" rows="10" cols="80"></textarea>
+<script>
+window.inputEvents = 0;
+for (const field of document.querySelectorAll('input, textarea')) {
+	field.addEventListener('input', () => { window.inputEvents++; });
+}
+</script>
+</body></html>"""
+
+
+class PageHandler(BaseHTTPRequestHandler):
+	def do_GET(self):
+		self.send_response(200)
+		self.send_header('Content-Type', 'text/html')
+		self.end_headers()
+		self.wfile.write(PAGE)
+
+	def log_message(self, format, *args):
+		pass
+
+
+def make_text(length: int, multiline: bool) -> str:
+	words = 'The quick brown fox jumps over the lazy dog, 123 times! '
+	text = (words * (length // len(words) + 1))[:length]
+	if multiline:
+		text = '\n'.join(text[i : i + 60] for i in range(0, len(text), 60))
+	return text
+
+
+async def evaluate(browser_session: BrowserSession, expression: str):
+	cdp_session = await browser_session.get_or_create_cdp_session()
+	result = await cdp_session.cdp_client.send.Runtime.evaluate(
+		params={'expression': expression, 'returnByValue': True}, session_id=cdp_session.session_id
+	)
+	return result['result'].get('value')
+
+
+async def type_once(browser_session: BrowserSession, field_id: str, text: str, strategy: str) -> tuple[float, bool, int]:
+	"""Type into a freshly cleared field, returns the elapsed ms, whether the value matches and the input events seen."""
+	await evaluate(browser_session, f"document.getElementById('{field_id}').value = ''; window.inputEvents = 0")
+	state = await browser_session.get_browser_state_summary(include_screenshot=False)
+	node = next(node for node in state.dom_state.selector_map.values() if node.attributes.get('id') == field_id)
+
+	start = time.perf_counter()
+	event = browser_session.event_bus.dispatch(TypeTextEvent(node=node, text=text, typing_strategy=strategy))  # type: ignore[arg-type]
+	await event
+	await event.event_result(raise_if_any=True, raise_if_none=False)
+	elapsed_ms = (time.perf_counter() - start) * 1000
+
+	value = await evaluate(browser_session, f"document.getElementById('{field_id}').value")
+	input_events = await evaluate(browser_session, 'window.inputEvents')
+	return elapsed_ms, value == text, input_events
+
+
+async def main(length: int, repeat: int, headless: bool) -> bool:
+	server = HTTPServer(('127.0.0.1', 0), PageHandler)
+	threading.Thread(target=server.serve_forever, daemon=True).start()
+
+	browser_session = BrowserSession(browser_profile=BrowserProfile(headless=headless, user_data_dir=None))
+	await browser_session.start()
+	all_correct = True
+	try:
+		await browser_session.navigate_to(f'http://127.0.0.1:{server.server_port}/')
+		for field_id, multiline in (('single', False), ('multi', True)):
+			text = make_text(length if multiline else min(length, 200), multiline)
+			print(f'{field_id} ({len(text)} characters):')
+			for strategy in STRATEGIES:
+				timings = []
+				correct = True
+				input_events = 0
+				for _ in range(repeat):
+					elapsed_ms, same, input_events = await type_once(browser_session, field_id, text, strategy)
+					timings.append(elapsed_ms)
+					correct &= same
+				all_correct &= correct
+				print(
+					f'  {strategy:>11}: median {statistics.median(timings):9.1f}ms  best {min(timings):9.1f}ms  '
+					f'{input_events:5d} input events{"" if correct else "  MISMATCH"}'
+				)
+	finally:
+		await browser_session.kill()
+		server.shutdown()
+	return all_correct
+
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--length', type=int, default=1000, help='characters typed into the textarea')
+	parser.add_argument('--repeat', type=int, default=3)
+	parser.add_argument('--headful', action='store_true')
+	args = parser.parse_args()
+	sys.exit(0 if asyncio.run(main(args.length, args.repeat, headless=not args.headful)) else 1)
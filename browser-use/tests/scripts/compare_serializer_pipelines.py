@@ -0,0 +1,345 @@
+"""
+Golden-output comparison of the DOM serializer pipelines (`BrowserProfile.dom_serializer_pipeline`).
+
+Every page is serialized by the 'legacy' (one recursion per step) and the 'fused' (two linear passes) pipeline of
+`DOMTreeSerializer`, once without and once with a previous state (to exercise new-element marking). The LLM
+representation, the selector map and the per-node flags must be identical, timings are printed for both.
+
+Usage:
+	# record pages once (raw CDP DOM, DOMSnapshot and AX trees as JSON, needs a browser)
+	python tests/scripts/compare_serializer_pipelines.py --record https://example.com https://news.ycombinator.com --out recordings
+
+	# replay recordings offline
+	python tests/scripts/compare_serializer_pipelines.py recordings/*.json
+
+	# synthetic page with N nodes (used when no recordings are given)
+	python tests/scripts/compare_serializer_pipelines.py --synthetic 5000
+"""
+
+import argparse
+import asyncio
+import copy
+import json
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+# Add parent directory to path to import browser_use modules
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from browser_use.dom.enhanced_snapshot import REQUIRED_COMPUTED_STYLES
+from browser_use.dom.serializer.serializer import SERIALIZER_PIPELINES, DOMTreeSerializer
+from browser_use.dom.service import DomService
+from browser_use.dom.views import EnhancedDOMTreeNode, SerializedDOMState, SimplifiedNode, TargetAllTrees
+
+logger = logging.getLogger('compare_serializer_pipelines')
+
+
+# region - recording
+
+
+async def record_pages(urls: list[str], out_dir: Path) -> None:
+	from browser_use.browser import BrowserProfile, BrowserSession
+
+	out_dir.mkdir(parents=True, exist_ok=True)
+	browser_session = BrowserSession(browser_profile=BrowserProfile(headless=True, user_data_dir=None))
+	await browser_session.start()
+	try:
+		dom_service = DomService(browser_session)
+		for i, url in enumerate(urls):
+			await browser_session.navigate_to(url)
+			await asyncio.sleep(2)
+			assert browser_session.agent_focus_target_id is not None
+			trees = await dom_service._get_all_trees(browser_session.agent_focus_target_id)
+			recording = {
+				'url': url,
+				'snapshot': trees.snapshot,
+				'dom_tree': trees.dom_tree,
+				'ax_tree': trees.ax_tree,
+				'device_pixel_ratio': trees.device_pixel_ratio,
+			}
+			path = out_dir / f'page_{i:02d}.json'
+			path.write_text(json.dumps(recording))
+			print(f'recorded {url} -> {path}')
+	finally:
+		await browser_session.kill()
+
+
+# endregion - recording
+
+# region - offline enhanced tree
+
+
+class _OfflineBrowserSession:
+	"""Just enough of BrowserSession for `DomService.get_dom_tree` on recorded trees."""
+
+	logger = logger
+
+	async def get_or_create_cdp_session(self, target_id: str | None = None, focus: bool = True) -> SimpleNamespace:
+		return SimpleNamespace(session_id='recorded', target_id=target_id)
+
+
+def build_enhanced_tree(recording: dict[str, Any]) -> EnhancedDOMTreeNode:
+	"""Build a fresh enhanced DOM tree (serialization mutates it, so every run needs its own)."""
+	dom_service = DomService(_OfflineBrowserSession(), logger=logger)  # type: ignore[arg-type]
+
+	async def get_recorded_trees(target_id: str) -> TargetAllTrees:
+		return TargetAllTrees(
+			snapshot=copy.deepcopy(recording['snapshot']),
+			dom_tree=copy.deepcopy(recording['dom_tree']),
+			ax_tree=copy.deepcopy(recording['ax_tree']),
+			device_pixel_ratio=recording['device_pixel_ratio'],
+			cdp_timing={},
+		)
+
+	dom_service._get_all_trees = get_recorded_trees  # type: ignore[method-assign]
+	enhanced_tree, _ = asyncio.run(dom_service.get_dom_tree('recorded'))
+	return enhanced_tree
+
+
+def make_synthetic_recording(count: int, seed: int = 0) -> dict[str, Any]:
+	"""Page with nested buttons and links, scroll containers, hidden nodes, shadow roots and same-origin iframes."""
+	rng = random.Random(seed)
+	strings: list[str] = []
+	string_index: dict[str, int] = {}
+
+	def intern(value: str) -> int:
+		if value not in string_index:
+			string_index[value] = len(strings)
+			strings.append(value)
+		return string_index[value]
+
+	next_id = [0]
+	all_nodes: list[dict[str, Any]] = []
+	layouts: dict[int, tuple[list[float], dict[str, str], list[float], list[float]]] = {}
+
+	def make_node(node_name: str, node_type: int = 1, **kwargs: Any) -> dict[str, Any]:
+		next_id[0] += 1
+		node = {
+			'nodeId': next_id[0],
+			'backendNodeId': next_id[0] + 100_000,
+			'nodeType': node_type,
+			'nodeName': node_name,
+			'localName': node_name.lower() if node_type == 1 else '',
+			'nodeValue': kwargs.pop('nodeValue', ''),
+			**kwargs,
+		}
+		all_nodes.append(node)
+		return node
+
+	def add_layout(node: dict[str, Any], bounds: list[float], viewport: list[float] | None = None, **styles: str) -> None:
+		computed = {'display': 'block', 'visibility': 'visible', 'opacity': '1', 'background-color': 'rgba(0, 0, 0, 0)'}
+		computed.update(styles)
+		client_rects: list[float] = []
+		scroll_rects: list[float] = []
+		if viewport is not None:
+			client_rects, scroll_rects = viewport, [0, 0, bounds[2], bounds[3]]
+		elif computed.get('overflow') == 'auto':
+			client_rects = [0, 0, bounds[2], bounds[3]]
+			scroll_rects = [0, 0, bounds[2], bounds[3] * 3]
+		layouts[node['backendNodeId']] = (bounds, computed, client_rects, scroll_rects)
+
+	def populate(parent: dict[str, Any], bounds: list[float], depth: int) -> None:
+		children: list[dict[str, Any]] = []
+		for _ in range(rng.randint(1, 5) if depth < 7 else 0):
+			if next_id[0] >= count:
+				break
+			x, y, width, height = bounds
+			child_bounds = [
+				x + rng.uniform(0, width / 4),
+				y + rng.uniform(0, height / 4),
+				max(1.0, width * rng.uniform(0.3, 1.0)),
+				max(1.0, height * rng.uniform(0.2, 1.0)),
+			]
+			kind = rng.random()
+			if kind < 0.2:
+				child = make_node('#text', 3, nodeValue=rng.choice(['Buy now', 'x', 'Read more about it', '  ']))
+				add_layout(child, child_bounds)
+			elif kind < 0.25 and depth < 5:
+				host = make_node('DIV', attributes=['class', 'host'])
+				shadow_root = make_node('#document-fragment', 11, shadowRootType='open')
+				populate(shadow_root, child_bounds, depth + 1)
+				host['shadowRoots'] = [shadow_root]
+				add_layout(host, child_bounds)
+				child = host
+			elif kind < 0.28 and depth < 4:
+				iframe = make_node('IFRAME', frameId=f'frame-{next_id[0]}')
+				document = make_node('#document', 9)
+				html = make_node('HTML')
+				body = make_node('BODY')
+				populate(body, [0, 0, child_bounds[2], child_bounds[3]], depth + 1)
+				html['children'] = [body]
+				document['children'] = [html]
+				iframe['contentDocument'] = document
+				add_layout(iframe, child_bounds)
+				add_layout(html, [0, 0, child_bounds[2], child_bounds[3]], viewport=[0, 0, child_bounds[2], child_bounds[3]])
+				add_layout(body, [0, 0, child_bounds[2], child_bounds[3]])
+				child = iframe
+			else:
+				tag, attributes = rng.choice(
+					[
+						('DIV', ['class', 'card']),
+						('DIV', ['role', 'button']),
+						('SPAN', ['class', 'label']),
+						('A', ['href', '/item']),
+						('BUTTON', ['type', 'button']),
+						('INPUT', ['type', rng.choice(['text', 'file', 'range', 'checkbox'])]),
+						('SELECT', ['name', 'choice']),
+						('SCRIPT', []),
+						('svg', []),
+						('path', []),
+						('DIV', ['aria-label', 'Close', 'onclick', 'close()']),
+						('DIV', ['data-browser-use-exclude', 'true']),
+					]
+				)
+				child = make_node(tag, attributes=attributes)
+				styles: dict[str, str] = {}
+				if rng.random() < 0.1:
+					styles['display'] = 'none'
+				if rng.random() < 0.1:
+					styles['overflow'] = 'auto'
+				if rng.random() < 0.3:
+					styles['background-color'] = 'rgb(255, 255, 255)'
+				if rng.random() < 0.15:
+					styles['cursor'] = 'pointer'
+				if rng.random() < 0.9:
+					add_layout(child, child_bounds, **styles)
+				populate(child, child_bounds, depth + 1)
+			children.append(child)
+		if children:
+			parent.setdefault('children', []).extend(children)
+
+	document = make_node('#document', 9)
+	html = make_node('HTML', frameId='main')
+	body = make_node('BODY')
+	add_layout(html, [0, 0, 1280, 6000], viewport=[0, 0, 1280, 800])
+	add_layout(body, [0, 0, 1280, 6000])
+	while next_id[0] < count:
+		populate(body, [0, 0, 1280, 6000], 0)
+	html['children'] = [body]
+	document['children'] = [html]
+
+	layout_nodes = [i for i, node in enumerate(all_nodes) if node['backendNodeId'] in layouts]
+	return {
+		'url': f'synthetic://{count}',
+		'snapshot': {
+			'strings': strings,
+			'documents': [
+				{
+					'documentURL': intern('synthetic'),
+					'nodes': {'backendNodeId': [node['backendNodeId'] for node in all_nodes], 'isClickable': {'index': []}},
+					'layout': {
+						'nodeIndex': layout_nodes,
+						'bounds': [layouts[all_nodes[i]['backendNodeId']][0] for i in layout_nodes],
+						'styles': [
+							[
+								intern(layouts[all_nodes[i]['backendNodeId']][1][name])
+								if name in layouts[all_nodes[i]['backendNodeId']][1]
+								else -1
+								for name in REQUIRED_COMPUTED_STYLES
+							]
+							for i in layout_nodes
+						],
+						'paintOrders': [rng.randint(0, len(layout_nodes)) for _ in layout_nodes],
+						'clientRects': [layouts[all_nodes[i]['backendNodeId']][2] for i in layout_nodes],
+						'scrollRects': [layouts[all_nodes[i]['backendNodeId']][3] for i in layout_nodes],
+					},
+				}
+			],
+		},
+		'dom_tree': {'root': document},
+		'ax_tree': {'nodes': []},
+		'device_pixel_ratio': 1.0,
+	}
+
+
+# endregion - offline enhanced tree
+
+# region - comparison
+
+
+def _dump_flags(root: SimplifiedNode | None) -> list[tuple]:
+	flags = []
+	stack = [root] if root else []
+	while stack:
+		node = stack.pop()
+		flags.append(
+			(
+				node.original_node.backend_node_id,
+				node.is_interactive,
+				node.is_new,
+				node.ignored_by_paint_order,
+				node.excluded_by_parent,
+				node.is_shadow_host,
+				node.is_compound_component,
+				len(node.children),
+			)
+		)
+		stack.extend(reversed(node.children))
+	return flags
+
+
+def _serialize(
+	recording: dict[str, Any], pipeline: str, previous_state: SerializedDOMState | None
+) -> tuple[SerializedDOMState, float]:
+	enhanced_tree = build_enhanced_tree(recording)
+	start = time.perf_counter()
+	state, _ = DOMTreeSerializer(enhanced_tree, previous_state, pipeline=pipeline).serialize_accessible_elements()  # type: ignore[arg-type]
+	return state, (time.perf_counter() - start) * 1000
+
+
+def compare(name: str, recording: dict[str, Any], repeat: int) -> bool:
+	print(f'{name}:')
+	equivalent = True
+	reference_state, _ = _serialize(recording, 'legacy', None)
+	# Every other element of the first run counts as "seen before", the rest is marked as new
+	previous_state = SerializedDOMState(_root=None, selector_map=dict(list(reference_state.selector_map.items())[::2]))
+
+	for previous in (None, previous_state):
+		golden: tuple | None = None
+		for pipeline in SERIALIZER_PIPELINES:
+			timings = []
+			for _ in range(repeat):
+				state, elapsed_ms = _serialize(recording, pipeline, previous)
+				timings.append(elapsed_ms)
+			output = (state.llm_representation(), list(state.selector_map), _dump_flags(state._root))
+			if golden is None:
+				golden = output
+			elif output != golden:
+				equivalent = False
+			label = 'with previous state' if previous else 'first step'
+			print(f'  {pipeline:>6} ({label}): best {min(timings):8.2f}ms  ({len(state.selector_map)} interactive)')
+	print(f'  identical output: {equivalent}')
+	return equivalent
+
+
+def main() -> int:
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('recordings', nargs='*', type=Path, help='Recorded pages (JSON written by --record)')
+	parser.add_argument('--record', nargs='+', metavar='URL', help='Record these URLs instead of comparing')
+	parser.add_argument('--out', type=Path, default=Path('recordings'), help='Output directory for --record')
+	parser.add_argument('--synthetic', type=int, default=0, help='Number of nodes of a synthetic page')
+	parser.add_argument('--repeat', type=int, default=3)
+	args = parser.parse_args()
+
+	if args.record:
+		asyncio.run(record_pages(args.record, args.out))
+		return 0
+
+	cases = [(str(path), json.loads(path.read_text())) for path in args.recordings]
+	if args.synthetic or not cases:
+		count = args.synthetic or 3000
+		cases.append((f'synthetic page ({count} nodes)', make_synthetic_recording(count)))
+
+	all_equivalent = True
+	for name, recording in cases:
+		all_equivalent &= compare(name, recording, args.repeat)
+	return 0 if all_equivalent else 1
+
+
+if __name__ == '__main__':
+	sys.exit(main())